@@ -22,6 +22,7 @@ from backend.config.business_rules import (
     BEST_CONTACT_TIMES,
 )
 from backend.core.output_formatter import OutputFormatter, OutputType
+from backend.core.parameter_extraction import extract_parameters
 from backend.core.stage_reasoning import get_stage_reasoning, BEndStage
 
 
@@ -118,10 +119,11 @@ class BEndAgent(EnhancedAgent):
             输出事件
         """
         # 尝试从参数或消息中提取数值
+        params = extract_parameters(message)
         if investment is None:
-            investment = self._extract_amount(message, "投入")
+            investment = params.amount("投入")
         if revenue is None:
-            revenue = self._extract_amount(message, "收入")
+            revenue = params.amount("收入")
 
         # 如果能提取到参数，先计算 ROI
         if investment and revenue:
@@ -22,6 +22,7 @@ from backend.config.business_rules import (
     DECORATION_PROCESS,
 )
 from backend.core.output_formatter import OutputFormatter, OutputType
+from backend.core.parameter_extraction import extract_parameters
 from backend.core.stage_reasoning import get_stage_reasoning, CEndStage
 
 
@@ -114,8 +115,9 @@ class CEndAgent(EnhancedAgent):
             输出事件
         """
         # 尝试提取金额和品类
-        amount = self._extract_amount(message)
-        category = self._extract_category(message)
+        params = extract_parameters(message)
+        amount = params.amount()
+        category = params.category
 
         # 如果能提取到参数，先计算补贴
         if amount and category:
@@ -32,13 +32,73 @@ from backend.core.output_formatter import OutputFormatter, OutputType
 from backend.core.function_calling import get_function_calling_engine, FunctionCallingEngine
 from backend.core.cache import get_knowledge_cache, get_llm_cache
 from backend.knowledge.knowledge_graph import get_knowledge_graph
+from backend.knowledge.graph_answer import GraphAnswerer
 from backend.core.stage_reasoning import (
     get_stage_reasoning, StageAwareReasoning, StageContext, ExpertRole, StageTransition
 )
 from backend.core.logging_config import get_logger
+from backend.core.message_features import analyze_message, get_keyword_engine
+from backend.core.parameter_extraction import get_parameters
 
 logger = get_logger("enhanced_agent")
 
+# 兴趣标签
+INTEREST_KEYWORDS = {
+    "装修风格": ["现代", "北欧", "中式", "轻奢", "简约", "工业风"],
+    "材料": ["瓷砖", "地板", "乳胶漆", "壁纸", "大理石"],
+    "家具": ["沙发", "床", "餐桌", "衣柜", "书桌"],
+    "空间": ["客厅", "卧室", "厨房", "卫生间", "阳台"],
+}
+
+# 装修阶段（按顺序取第一个命中的阶段）
+DECORATION_STAGE_KEYWORDS = {
+    "准备": ["准备装修", "打算装修", "想装修", "要装修", "计划装修", "还没开始", "刚买房"],
+    "设计": ["设计方案", "设计师", "效果图", "量房", "出图", "设计中", "在设计"],
+    "施工": ["施工中", "在装修", "正在装", "水电", "贴砖", "刷漆", "吊顶", "工人"],
+    "软装": ["软装", "买家具", "选家具", "窗帘", "灯具", "快完工", "硬装完"],
+    "入住": ["入住", "搬家", "通风", "甲醛", "装完了", "已经装好"],
+}
+
+# 痛点类型
+PAIN_POINT_PATTERNS = {
+    "预算": {
+        "keywords": ["超预算", "预算不够", "太贵", "花太多", "控制预算", "省钱"],
+        "severity": 0.8
+    },
+    "质量": {
+        "keywords": ["质量差", "有问题", "不满意", "返工", "空鼓", "开裂", "漏水"],
+        "severity": 0.9
+    },
+    "工期": {
+        "keywords": ["太慢", "延期", "拖延", "什么时候完", "等太久"],
+        "severity": 0.6
+    },
+    "选择困难": {
+        "keywords": ["不知道选", "选哪个", "纠结", "怎么选", "哪个好"],
+        "severity": 0.5
+    },
+    "沟通": {
+        "keywords": ["沟通不畅", "不理人", "联系不上", "态度差"],
+        "severity": 0.7
+    },
+}
+
+# 以上词表在关键词特征引擎中的命名空间
+INTEREST_NAMESPACES = get_keyword_engine().register_groups("agent.interest", INTEREST_KEYWORDS)
+DECORATION_STAGE_NAMESPACES = get_keyword_engine().register_groups("agent.stage", DECORATION_STAGE_KEYWORDS)
+PAIN_POINT_NAMESPACES = get_keyword_engine().register_groups(
+    "agent.pain", {pain_type: config["keywords"] for pain_type, config in PAIN_POINT_PATTERNS.items()}
+)
+
+# 规则回退时触发各工具的词（键为工具结果的名称）
+FALLBACK_TOOL_KEYWORDS = {
+    "subsidy": ["补贴", "能补多少", "返多少"],
+    "roi": ["ROI", "投入产出", "回报率"],
+    "price_eval": ["贵不贵", "价格合理", "值不值"],
+    "timeline": ["多久", "工期", "多长时间"],
+}
+FALLBACK_TOOL_NAMESPACES = get_keyword_engine().register_groups("agent.fallback_tool", FALLBACK_TOOL_KEYWORDS)
+
 
 class EnhancedAgent(ABC):
     """增强版智能体基类"""
@@ -58,6 +118,7 @@ class EnhancedAgent(ABC):
         self.knowledge_cache = get_knowledge_cache()
         self.llm_cache = get_llm_cache()
         self.knowledge_graph = get_knowledge_graph()
+        self.graph_answerer = GraphAnswerer(self.knowledge_graph)
         # LLM配置
         self.llm = ChatTongyi(
             model="qwen-plus",
@@ -69,6 +130,7 @@ class EnhancedAgent(ABC):
 
         # 配置选项
         self.enable_search = True
+        self.enable_graph_answer = True  # 结构化问题直接由知识图谱回答，跳过向量检索
         self.enable_reasoning = True
         self.enable_memory = True
         self.enable_llm_function_calling = True  # 启用 LLM 智能工具调用
@@ -120,6 +182,7 @@ class EnhancedAgent(ABC):
         try:
             # 1. 获取用户画像和记忆上下文（用于自适应推理）
             context = await self._prepare_context(user_id, session_id, message)
+            get_parameters(message, context)  # 提取一次消息参数，放入 context["params"] 供后续各步骤读取
 
             # 2. 使用自适应策略选择推理类型
             reasoning_type = self.adaptive_strategy.select_strategy(message, context)
@@ -136,7 +199,16 @@ class EnhancedAgent(ABC):
 
             # 5. 知识检索
             if self.enable_search:
-                docs = await self._retrieve_knowledge(message, context)
+                graph_answer = self.graph_answerer.answer(message) if self.enable_graph_answer else None
+                if graph_answer:
+                    self.reasoning.act(chain, "查询知识图谱", tool="knowledge_graph")
+                    self.reasoning.observe(chain, f"图谱直答（{graph_answer.intent}）: {len(graph_answer.facts)} 条事实")
+                    context["graph_facts"] = graph_answer.facts
+                    docs = None
+                else:
+                    start = time.perf_counter()
+                    docs = await self._retrieve_knowledge(message, context)
+                    self.graph_answerer.record_retrieval((time.perf_counter() - start) * 1000)
                 if docs:
                     self.reasoning.act(chain, "检索知识库", tool="knowledge_search")
                     self.reasoning.observe(chain, f"找到 {len(docs)} 条相关信息")
@@ -474,12 +546,14 @@ class EnhancedAgent(ABC):
                                               chain: ReasoningChain) -> Dict:
         """使用规则匹配调用工具（回退方案）"""
         results = {}
+        params = get_parameters(message, context)
+        features = analyze_message(message)
 
         # 补贴计算检测
-        if any(kw in message for kw in ["补贴", "能补多少", "返多少"]):
+        if features.has(FALLBACK_TOOL_NAMESPACES["subsidy"]):
             # 尝试提取金额和品类
-            amount = self._extract_amount(message)
-            category = self._extract_category(message)
+            amount = params.amount()
+            category = params.category
             if amount and category:
                 self.reasoning.act(chain, f"计算{category}补贴", tool="subsidy_calculator")
                 result = self.tools.call("subsidy_calculator", amount=amount, category=category)
@@ -488,9 +562,9 @@ class EnhancedAgent(ABC):
                     self.reasoning.observe(chain, f"补贴计算结果: {result.data.get('final_amount', 0)}元")
 
         # ROI计算检测
-        if any(kw in message for kw in ["ROI", "投入产出", "回报率"]):
-            investment = self._extract_amount(message, "投入")
-            revenue = self._extract_amount(message, "收入")
+        if features.has(FALLBACK_TOOL_NAMESPACES["roi"]):
+            investment = params.amount("投入")
+            revenue = params.amount("收入")
             if investment and revenue:
                 self.reasoning.act(chain, "计算ROI", tool="roi_calculator")
                 result = self.tools.call("roi_calculator", investment=investment, revenue=revenue)
@@ -499,9 +573,9 @@ class EnhancedAgent(ABC):
                     self.reasoning.observe(chain, f"ROI: {result.data.get('roi_percent', 0)}%")
 
         # 价格评估检测
-        if any(kw in message for kw in ["贵不贵", "价格合理", "值不值"]):
-            price = self._extract_amount(message)
-            category = self._extract_category(message)
+        if features.has(FALLBACK_TOOL_NAMESPACES["price_eval"]):
+            price = params.amount()
+            category = params.category
             if price and category:
                 self.reasoning.act(chain, "评估价格", tool="price_evaluator")
                 result = self.tools.call("price_evaluator", category=category, price=price)
@@ -509,8 +583,8 @@ class EnhancedAgent(ABC):
                     results["price_eval"] = result.data
 
         # 工期估算检测
-        if any(kw in message for kw in ["多久", "工期", "多长时间"]):
-            area = self._extract_area(message)
+        if features.has(FALLBACK_TOOL_NAMESPACES["timeline"]):
+            area = params.area
             if area:
                 self.reasoning.act(chain, "估算工期", tool="decoration_timeline")
                 result = self.tools.call("decoration_timeline", house_area=area)
@@ -668,6 +742,11 @@ class EnhancedAgent(ABC):
             need = context["inferred_need"]
             parts.append(f"可能的需求: {need.get('suggestion', '')}（{need.get('reason', '')}）")
 
+        # 知识图谱直答的事实
+        if context.get("graph_facts"):
+            graph_text = "\n".join(f"- {fact}" for fact in context["graph_facts"])
+            parts.append(f"知识图谱:\n{graph_text}")
+
         # 知识检索结果
         if "knowledge" in context:
             knowledge_text = "\n".join([
@@ -743,61 +822,12 @@ class EnhancedAgent(ABC):
 
     # === 辅助方法 ===
 
-    def _extract_amount(self, text: str, keyword: str = None) -> Optional[float]:
-        """提取金额"""
-        import re
-        patterns = [
-            r'(\d+(?:\.\d+)?)\s*[万w]',  # 万
-            r'(\d+(?:\.\d+)?)\s*元',      # 元
-            r'(\d+(?:\.\d+)?)\s*块',      # 块
-            r'(\d+(?:,\d{3})*(?:\.\d+)?)', # 纯数字
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                amount = float(matches[0].replace(',', ''))
-                if '万' in text or 'w' in text.lower():
-                    amount *= 10000
-                return amount
-        return None
-
-    def _extract_category(self, text: str) -> Optional[str]:
-        """提取品类"""
-        categories = ["家具", "建材", "家电", "软装", "智能家居"]
-        for cat in categories:
-            if cat in text:
-                return cat
-        return None
-
-    def _extract_area(self, text: str) -> Optional[float]:
-        """提取面积"""
-        import re
-        patterns = [
-            r'(\d+(?:\.\d+)?)\s*[平㎡]',
-            r'(\d+(?:\.\d+)?)\s*平米',
-            r'(\d+(?:\.\d+)?)\s*平方',
-        ]
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return float(matches[0])
-        return None
-
     def _extract_interests(self, text: str) -> List[str]:
         """提取兴趣标签"""
-        interest_keywords = {
-            "装修风格": ["现代", "北欧", "中式", "轻奢", "简约", "工业风"],
-            "材料": ["瓷砖", "地板", "乳胶漆", "壁纸", "大理石"],
-            "家具": ["沙发", "床", "餐桌", "衣柜", "书桌"],
-            "空间": ["客厅", "卧室", "厨房", "卫生间", "阳台"],
-        }
-
+        features = analyze_message(text)
         interests = []
-        for category, keywords in interest_keywords.items():
-            for kw in keywords:
-                if kw in text:
-                    interests.append(kw)
+        for namespace in INTEREST_NAMESPACES.values():
+            interests.extend(features.matched(namespace))
         return interests
 
     def _detect_decoration_stage(self, text: str) -> Optional[str]:
@@ -810,18 +840,10 @@ class EnhancedAgent(ABC):
         Returns:
             检测到的装修阶段，如果无法检测则返回None
         """
-        stage_keywords = {
-            "准备": ["准备装修", "打算装修", "想装修", "要装修", "计划装修", "还没开始", "刚买房"],
-            "设计": ["设计方案", "设计师", "效果图", "量房", "出图", "设计中", "在设计"],
-            "施工": ["施工中", "在装修", "正在装", "水电", "贴砖", "刷漆", "吊顶", "工人"],
-            "软装": ["软装", "买家具", "选家具", "窗帘", "灯具", "快完工", "硬装完"],
-            "入住": ["入住", "搬家", "通风", "甲醛", "装完了", "已经装好"],
-        }
-
-        for stage, keywords in stage_keywords.items():
-            for kw in keywords:
-                if kw in text:
-                    return stage
+        features = analyze_message(text)
+        for stage, namespace in DECORATION_STAGE_NAMESPACES.items():
+            if features.has(namespace):
+                return stage
 
         return None
 
@@ -835,39 +857,16 @@ class EnhancedAgent(ABC):
         Returns:
             检测到的痛点列表
         """
-        pain_patterns = {
-            "预算": {
-                "keywords": ["超预算", "预算不够", "太贵", "花太多", "控制预算", "省钱"],
-                "severity": 0.8
-            },
-            "质量": {
-                "keywords": ["质量差", "有问题", "不满意", "返工", "空鼓", "开裂", "漏水"],
-                "severity": 0.9
-            },
-            "工期": {
-                "keywords": ["太慢", "延期", "拖延", "什么时候完", "等太久"],
-                "severity": 0.6
-            },
-            "选择困难": {
-                "keywords": ["不知道选", "选哪个", "纠结", "怎么选", "哪个好"],
-                "severity": 0.5
-            },
-            "沟通": {
-                "keywords": ["沟通不畅", "不理人", "联系不上", "态度差"],
-                "severity": 0.7
-            },
-        }
-
+        features = analyze_message(text)
         detected = []
-        for pain_type, config in pain_patterns.items():
-            for kw in config["keywords"]:
-                if kw in text:
-                    detected.append({
-                        "type": pain_type,
-                        "description": f"用户提到: {kw}",
-                        "severity": config["severity"]
-                    })
-                    break  # 每种类型只记录一次
+        for pain_type, namespace in PAIN_POINT_NAMESPACES.items():
+            kw = features.first(namespace)  # 每种类型只记录一次
+            if kw:
+                detected.append({
+                    "type": pain_type,
+                    "description": f"用户提到: {kw}",
+                    "severity": PAIN_POINT_PATTERNS[pain_type]["severity"]
+                })
 
         return detected
 
@@ -895,7 +894,7 @@ class EnhancedAgent(ABC):
 
         # 保存更新
         if self.memory._profile_store:
-            self.memory._profile_store._dirty = True
+            self.memory._profile_store.mark_dirty(user_id, profile)
 
     # === 工具调用接口 ===
 
@@ -931,6 +930,10 @@ class EnhancedAgent(ABC):
         """获取推理策略统计"""
         return self.adaptive_strategy.get_statistics()
 
+    def get_graph_answer_stats(self) -> Dict:
+        """获取知识图谱直答统计（命中率、图谱耗时、节省的向量检索耗时）"""
+        return self.graph_answerer.get_stats()
+
     def record_user_feedback(self, query: str, reasoning_type: ReasoningType,
                              feedback_score: float):
         """
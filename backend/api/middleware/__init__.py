@@ -8,6 +8,12 @@ from .auth import (
     require_user_type,
 )
 from .rate_limit import limiter, get_rate_limit_handler
+from .request_pipeline import (
+    RequestValidationMiddleware,
+    PerformanceMonitoringMiddleware,
+    PreparsedJSONRoute,
+    get_json_body,
+)
 
 __all__ = [
     "create_access_token",
@@ -16,4 +22,8 @@ __all__ = [
     "require_user_type",
     "limiter",
     "get_rate_limit_handler",
+    "RequestValidationMiddleware",
+    "PerformanceMonitoringMiddleware",
+    "PreparsedJSONRoute",
+    "get_json_body",
 ]
@@ -0,0 +1,267 @@
+"""
+请求处理管线中间件（纯 ASGI 实现）
+
+与 @app.middleware("http")（BaseHTTPMiddleware）不同，这里直接包装 ASGI 的
+receive / send：响应体逐块原样透传，不经过额外的内存流和任务切换，
+长时间的 NDJSON 流式响应不会因中间件产生逐块开销。
+
+- RequestValidationMiddleware: JSON 请求体只读取、解析一次，存入 request.state.json_body，
+  并对 message 字段做输入安全校验；multipart 上传与非 JSON 请求直接放行
+- PerformanceMonitoringMiddleware: 生成请求 ID、添加响应头、记录请求耗时指标
+- PreparsedJSONRoute: 路由读取 JSON 时复用中间件已解析的结果
+"""
+import json
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from backend.core.metrics import UNMATCHED_PATH
+
+try:
+    from backend.core.logging_config import get_logger
+    logger = get_logger("request_pipeline")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+# request.state 中存放已解析 JSON 请求体的键
+JSON_BODY_STATE_KEY = "json_body"
+
+# 慢请求告警阈值（秒）
+SLOW_REQUEST_SECONDS = 5.0
+
+
+def _header(scope: Dict[str, Any], name: bytes) -> str:
+    for key, value in scope.get("headers", ()):
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def route_label(scope: Dict[str, Any]) -> str:
+    """
+    指标使用的路径标签：路由模板（如 /api/v1/knowledge/collections/{collection_name}/stats），
+    未匹配路由的请求归为一类，避免标签数量随请求路径增长
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if not template:
+        return UNMATCHED_PATH
+
+    # include_router 的前缀不一定体现在 route.path 中，按实际路径补齐
+    path = scope.get("path", "")
+    try:
+        rendered = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    if rendered != path and path.endswith(rendered):
+        return path[:-len(rendered)] + template
+    return template
+
+
+async def get_json_body(request: Request) -> Any:
+    """读取 JSON 请求体：优先使用中间件已解析的结果"""
+    state = request.scope.get("state") or {}
+    if JSON_BODY_STATE_KEY in state:
+        return state[JSON_BODY_STATE_KEY]
+    return await request.json()
+
+
+class PreparsedJSONRequest(Request):
+    """json() 优先返回中间件已解析的请求体，避免重复解析"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            state = self.scope.get("state") or {}
+            if JSON_BODY_STATE_KEY in state:
+                self._json = state[JSON_BODY_STATE_KEY]
+            else:
+                self._json = await super().json()
+        return self._json
+
+
+class PreparsedJSONRoute(APIRoute):
+    """使用 PreparsedJSONRequest 的路由类，Pydantic 请求模型直接复用已解析的 JSON"""
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+
+        async def handler(request: Request):
+            return await original_handler(PreparsedJSONRequest(request.scope, request.receive))
+
+        return handler
+
+
+class RequestValidationMiddleware:
+    """
+    请求验证中间件
+
+    对 JSON 类型的 POST 请求：读取完整请求体并解析一次，结果写入 scope["state"]，
+    message 字段命中安全规则时直接返回 400；下游通过重放的 receive 读取原始请求体。
+    """
+
+    def __init__(self, app, sanitizer=None):
+        """
+        Args:
+            app: 下游 ASGI 应用
+            sanitizer: 输入清理器（InputSanitizer），为 None 时只解析不校验
+        """
+        self.app = app
+        self.sanitizer = sanitizer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        logger.debug("收到请求", extra={
+            "path": scope.get("path"),
+            "method": scope["method"],
+            "client": scope["client"][0] if scope.get("client") else "unknown",
+        })
+
+        if scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        content_type = _header(scope, b"content-type")
+        if "application/json" not in content_type:
+            # multipart 上传等非 JSON 请求体不读取，保持流式
+            await self.app(scope, receive, send)
+            return
+
+        # 读取完整请求体
+        chunks = []
+        disconnect: Optional[dict] = None
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                disconnect = message
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+
+        if body and disconnect is None:
+            try:
+                data = json.loads(body)
+            except (ValueError, UnicodeDecodeError):
+                data = None
+            else:
+                scope.setdefault("state", {})[JSON_BODY_STATE_KEY] = data
+
+            if self.sanitizer is not None and isinstance(data, dict) and "message" in data:
+                try:
+                    result = self.sanitizer.sanitize(data["message"])
+                except Exception as e:
+                    logger.error(f"输入验证异常: {e}")
+                    result = None
+                if result and result["blocked"]:
+                    logger.warning("输入验证失败", extra={
+                        "path": scope.get("path"),
+                        "reason": result["block_reason"],
+                        "warnings": result["warnings"],
+                    })
+                    response = JSONResponse(
+                        status_code=400,
+                        content={"detail": result["block_reason"] or "输入内容不合规", "warnings": result["warnings"]}
+                    )
+                    await response(scope, receive, send)
+                    return
+
+        # 重放请求体，之后的 receive 交还原始通道（用于感知客户端断开）
+        replayed = False
+
+        async def replay_receive():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                if disconnect is not None:
+                    return disconnect
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
+
+
+class PerformanceMonitoringMiddleware:
+    """
+    性能监控中间件
+
+    在响应头中加入 X-Request-ID 与 X-Response-Time（到开始发送响应头为止的耗时），
+    响应体发送完毕（流式响应为最后一块）后记录总耗时指标。
+    """
+
+    def __init__(self, app, metrics, slow_threshold: float = SLOW_REQUEST_SECONDS):
+        """
+        Args:
+            app: 下游 ASGI 应用
+            metrics: 指标收集器（RequestMetrics）
+            slow_threshold: 慢请求告警阈值（秒）
+        """
+        self.app = app
+        self.metrics = metrics
+        self.slow_threshold = slow_threshold
+
+    def _finish(self, scope, request_id: str, status_code: int, duration: float) -> None:
+        self.metrics.record_request(
+            path=route_label(scope),
+            method=scope["method"],
+            duration=duration,
+            status_code=status_code,
+            request_id=request_id,
+        )
+        if duration > self.slow_threshold:
+            logger.warning("慢请求检测", extra={
+                "request_id": request_id,
+                "path": scope.get("path"),
+                "duration_ms": duration * 1000,
+            })
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = uuid.uuid4().hex[:8]
+        scope.setdefault("state", {})["request_id"] = request_id
+        start_time = time.perf_counter()
+        status_code = 500
+        finished = False
+        self.metrics.increment_active()
+
+        async def send_wrapper(message):
+            nonlocal status_code, finished
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - start_time
+                headers = list(message.get("headers", ()))
+                headers.append((b"x-request-id", request_id.encode()))
+                headers.append((b"x-response-time", f"{elapsed * 1000:.2f}ms".encode()))
+                message = {**message, "headers": headers}
+            elif message_type == "http.response.body" and not message.get("more_body", False):
+                await send(message)
+                finished = True
+                self._finish(scope, request_id, status_code, time.perf_counter() - start_time)
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            if not finished:
+                finished = True
+                self._finish(scope, request_id, 500, time.perf_counter() - start_time)
+            raise
+        finally:
+            if not finished:
+                # 客户端提前断开等情况：响应未完整发送
+                self._finish(scope, request_id, status_code, time.perf_counter() - start_time)
+            self.metrics.decrement_active()
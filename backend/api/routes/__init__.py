@@ -4,6 +4,13 @@ API路由模块
 from .chat import router as chat_router
 from .knowledge import router as knowledge_router
 from .merchant import router as merchant_router
-from .chat_v2 import router as chat_v2_router
 
 __all__ = ["chat_router", "knowledge_router", "merchant_router", "chat_v2_router"]
+
+
+def __getattr__(name):
+    # V2 路由依赖新框架运行时，按需导入，不增加服务启动耗时
+    if name == "chat_v2_router":
+        from .chat_v2 import router
+        return router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
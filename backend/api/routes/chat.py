@@ -4,7 +4,6 @@
 """
 import os
 import sys
-import json
 import base64
 import tempfile
 import time
@@ -16,20 +15,17 @@ from pydantic import BaseModel
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
-from backend.agents.c_end_agent import CEndAgent
-from backend.agents.b_end_agent import BEndAgent
+from backend.api.middleware.request_pipeline import PreparsedJSONRoute
 from backend.api.middleware.auth import get_current_user, require_user_type
 from backend.core.output_formatter import (
     OutputFormatter, OutputType, Source,
-    QuickReply, create_decoration_process
+    QuickReply, create_decoration_process, coalesce_frames, dumps,
 )
-from backend.core.multimodal import (
-    get_multimodal_manager, MediaContent, MediaType,
-    ImageAnalysisType, ImageAnalysisResult
-)
-from rag import RagService
 
-router = APIRouter(prefix="/chat", tags=["聊天"])
+# 智能体、RAG 服务与多模态模块（LangChain、Chroma、DashScope）在首次使用时导入，
+# 不拖慢服务启动；预热阶段（server.warmup）会提前完成
+
+router = APIRouter(prefix="/chat", tags=["聊天"], route_class=PreparsedJSONRoute)
 
 
 class ChatRequest(BaseModel):
@@ -58,6 +54,7 @@ _rag_service = None
 def get_c_end_agent():
     global _c_end_agent
     if _c_end_agent is None:
+        from backend.agents.c_end_agent import CEndAgent
         _c_end_agent = CEndAgent()
     return _c_end_agent
 
@@ -65,6 +62,7 @@ def get_c_end_agent():
 def get_b_end_agent():
     global _b_end_agent
     if _b_end_agent is None:
+        from backend.agents.b_end_agent import BEndAgent
         _b_end_agent = BEndAgent()
     return _b_end_agent
 
@@ -72,6 +70,7 @@ def get_b_end_agent():
 def get_rag_service(user_type: str = "both"):
     global _rag_service
     if _rag_service is None or _rag_service.user_type != user_type:
+        from rag import RagService
         _rag_service = RagService(user_type=user_type)
     return _rag_service
 
@@ -145,7 +144,7 @@ async def chat_stream(request: ChatRequest):
                 yield formatter.error(str(e), "STREAM_ERROR")
                 yield formatter.stream_end()
 
-        return StreamingResponse(event_generator(), media_type="application/x-ndjson")
+        return StreamingResponse(coalesce_frames(event_generator()), media_type="application/x-ndjson")
 
     # 使用专用智能体
     agent.enable_search = request.enable_search
@@ -160,7 +159,7 @@ async def chat_stream(request: ChatRequest):
             yield formatter.error(str(e), "AGENT_ERROR")
             yield formatter.stream_end()
 
-    return StreamingResponse(agent_event_generator(), media_type="application/x-ndjson")
+    return StreamingResponse(coalesce_frames(agent_event_generator()), media_type="application/x-ndjson")
 
 
 @router.post("/c-end")
@@ -214,6 +213,8 @@ async def analyze_image(
     image_data = await file.read()
 
     # 获取多模态管理器
+    from backend.core.multimodal import get_multimodal_manager, MediaContent, MediaType, ImageAnalysisType
+
     mm_manager = get_multimodal_manager()
 
     # 映射分析类型
@@ -286,6 +287,8 @@ async def analyze_document(
     content = await file.read()
 
     # 获取多模态管理器
+    from backend.core.multimodal import get_multimodal_manager, MediaContent, MediaType
+
     mm_manager = get_multimodal_manager()
 
     # 创建 MediaContent 对象
@@ -354,6 +357,8 @@ async def chat_with_media(
         file_content = await file.read()
 
         # 获取多模态管理器
+        from backend.core.multimodal import get_multimodal_manager, MediaContent, MediaType, ImageAnalysisType
+
         mm_manager = get_multimodal_manager()
 
         # 创建 MediaContent 对象
@@ -411,14 +416,16 @@ async def chat_with_media(
                 async for event in agent.process(enhanced_message, active_id):
                     yield event
             except Exception as e:
-                yield json.dumps({"type": "error", "content": str(e)}, ensure_ascii=False) + "\n"
+                yield dumps({"type": "error", "content": str(e)}) + "\n"
 
-        return StreamingResponse(agent_stream(), media_type="application/x-ndjson")
+        return StreamingResponse(coalesce_frames(agent_stream()), media_type="application/x-ndjson")
     elif filename.endswith(".pdf") or filename.endswith(".txt"):
         # 文档分析
         file_content = await file.read()
 
         # 获取多模态管理器
+        from backend.core.multimodal import get_multimodal_manager, MediaContent, MediaType
+
         mm_manager = get_multimodal_manager()
 
         # 创建 MediaContent 对象
@@ -494,9 +501,9 @@ async def chat_with_media(
                 async for event in agent.process(enhanced_message, active_id):
                     yield event
             except Exception as e:
-                yield json.dumps({"type": "error", "content": str(e)}, ensure_ascii=False) + "\n"
+                yield dumps({"type": "error", "content": str(e)}) + "\n"
 
-        return StreamingResponse(agent_stream(), media_type="application/x-ndjson")
+        return StreamingResponse(coalesce_frames(agent_stream()), media_type="application/x-ndjson")
     else:
         raise HTTPException(
             status_code=400,
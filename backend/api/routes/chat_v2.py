@@ -17,13 +17,14 @@ from pydantic import BaseModel
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
+from backend.api.middleware.request_pipeline import PreparsedJSONRoute
 from backend.framework.integration import (
     get_chat_adapter,
     FrameworkChatAdapter,
 )
 from backend.framework.integration.api_adapter import ChatContext
 
-router = APIRouter(prefix="/chat/v2", tags=["聊天V2"])
+router = APIRouter(prefix="/chat/v2", tags=["聊天V2"], route_class=PreparsedJSONRoute)
 
 
 class ChatRequestV2(BaseModel):
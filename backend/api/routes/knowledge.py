@@ -6,12 +6,12 @@ import os
 import sys
 from typing import Optional, List
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query
 from pydantic import BaseModel
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
-from backend.knowledge.multi_collection_kb import MultiCollectionKB
+from backend.api.middleware.request_pipeline import PreparsedJSONRoute
 
 # 导入异步工具
 try:
@@ -20,7 +20,7 @@ try:
 except ImportError:
     ASYNC_UTILS_AVAILABLE = False
 
-router = APIRouter(prefix="/knowledge", tags=["知识库"])
+router = APIRouter(prefix="/knowledge", tags=["知识库"], route_class=PreparsedJSONRoute)
 
 
 class AddTextRequest(BaseModel):
@@ -58,6 +58,7 @@ _multi_kb = None
 def get_multi_kb():
     global _multi_kb
     if _multi_kb is None:
+        from backend.knowledge.multi_collection_kb import MultiCollectionKB
         _multi_kb = MultiCollectionKB()
     return _multi_kb
 
@@ -271,3 +272,32 @@ async def search(request: SearchRequest):
             for doc, score in results
         ],
     }
+
+
+@router.get("/graph/suggest")
+async def suggest_entities(
+    q: str = "",
+    entity_type: Optional[str] = Query(None, alias="type"),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """
+    知识图谱实体联想（输入框自动补全）
+
+    返回名称或别名包含输入内容的实体，按匹配质量排序（完全匹配 > 前缀匹配 > 包含）。
+    查询走 n-gram 倒排索引，可以每次按键调用。
+    """
+    from backend.knowledge.knowledge_graph import EntityType, get_knowledge_graph
+
+    try:
+        type_filter = EntityType(entity_type) if entity_type else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"未知的实体类型: {entity_type}")
+
+    entities = get_knowledge_graph().search_entities(q, type_filter, limit=limit, rank=True)
+    return {
+        "query": q,
+        "results": [
+            {"name": e.name, "type": e.entity_type.value, "aliases": e.aliases}
+            for e in entities
+        ],
+    }
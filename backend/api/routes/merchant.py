@@ -11,8 +11,7 @@ from pydantic import BaseModel
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
-from backend.agents.c_end_agent import CEndAgent
-from backend.agents.b_end_agent import BEndAgent
+from backend.api.middleware.request_pipeline import PreparsedJSONRoute
 from backend.config.business_rules import SUBSIDY_RULES
 from backend.core.output_formatter import (
     SubsidyResult, MerchantCard, TableData,
@@ -26,7 +25,7 @@ try:
 except ImportError:
     ASYNC_UTILS_AVAILABLE = False
 
-router = APIRouter(prefix="/merchant", tags=["商家服务"])
+router = APIRouter(prefix="/merchant", tags=["商家服务"], route_class=PreparsedJSONRoute)
 
 
 class SubsidyCalcRequest(BaseModel):
@@ -75,6 +74,7 @@ _b_end_agent = None
 def get_c_end_agent():
     global _c_end_agent
     if _c_end_agent is None:
+        from backend.agents.c_end_agent import CEndAgent
         _c_end_agent = CEndAgent()
     return _c_end_agent
 
@@ -82,6 +82,7 @@ def get_c_end_agent():
 def get_b_end_agent():
     global _b_end_agent
     if _b_end_agent is None:
+        from backend.agents.b_end_agent import BEndAgent
         _b_end_agent = BEndAgent()
     return _b_end_agent
 
@@ -9,6 +9,7 @@ from .security import (
     InjectionDetector,
     DataMasker,
     InputSanitizer,
+    SanitizerEngine,
     sanitize_input,
     validate_input,
 )
@@ -23,6 +24,7 @@ __all__ = [
     "InjectionDetector",
     "DataMasker",
     "InputSanitizer",
+    "SanitizerEngine",
     "sanitize_input",
     "validate_input",
 ]
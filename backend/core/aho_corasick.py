@@ -0,0 +1,190 @@
+"""
+多模式字符串匹配（Aho-Corasick 自动机）
+
+一次扫描文本即可找出全部模式串的出现位置，耗时与文本长度和匹配数成正比，与模式串数量无关。
+"""
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# 匹配结果：(起始下标, 结束下标（不含）, 模式串对应的值)
+Match = Tuple[int, int, Any]
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick 自动机
+
+    模式串先插入字典树；失败链接与输出链接在首次匹配时一次广度优先遍历计算。
+    之后新增模式串只扩展字典树（已有节点不变），并使链接表失效，
+    下一次匹配时重新计算一次，批量新增只触发一次重算。
+    匹配使用计算好的链接表快照，与并发的新增互不干扰。
+    """
+
+    def __init__(self, ignore_case: bool = True):
+        """
+        Args:
+            ignore_case: 是否忽略大小写（模式串与文本都转为小写后匹配）
+        """
+        self.ignore_case = ignore_case
+        self._children: List[Dict[str, int]] = [{}]
+        self._values: List[Any] = [None]
+        self._depth: List[int] = [0]
+        self._terminal: List[bool] = [False]
+        self._count = 0
+        self._tables: Optional[tuple] = None
+        self._lock = threading.Lock()
+        self.build_count = 0  # 链接表计算次数
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, pattern: str) -> bool:
+        node = 0
+        for ch in self._normalize(pattern):
+            node = self._children[node].get(ch)
+            if node is None:
+                return False
+        return self._terminal[node]
+
+    def _normalize(self, text: str) -> str:
+        if not self.ignore_case:
+            return text
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        # 个别字符小写后长度变化（如 "İ"），保留原字符以保持下标与原文对应
+        return "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+    def add(self, pattern: str, value: Any = None) -> bool:
+        """
+        添加模式串
+
+        Args:
+            pattern: 模式串（空串忽略）
+            value: 匹配时返回的值，默认为（规范化后的）模式串本身；重复添加时覆盖
+
+        Returns:
+            是否为新的模式串
+        """
+        if not pattern:
+            return False
+        key = self._normalize(pattern)
+        with self._lock:
+            node = 0
+            for ch in key:
+                child = self._children[node].get(ch)
+                if child is None:
+                    child = len(self._children)
+                    self._children[node][ch] = child
+                    self._children.append({})
+                    self._values.append(None)
+                    self._depth.append(self._depth[node] + 1)
+                    self._terminal.append(False)
+                node = child
+
+            is_new = not self._terminal[node]
+            self._terminal[node] = True
+            self._values[node] = key if value is None else value
+            if is_new:
+                self._count += 1
+            self._tables = None
+            return is_new
+
+    def build(self) -> tuple:
+        """计算失败链接与输出链接（已是最新时直接返回）"""
+        with self._lock:
+            if self._tables is not None:
+                return self._tables
+
+            children = [dict(c) for c in self._children]
+            terminal = list(self._terminal)
+            fail = [0] * len(children)
+            output = [-1] * len(children)  # 沿失败链接可达的最近终止节点，-1 表示没有
+
+            queue = deque(children[0].values())
+            while queue:
+                node = queue.popleft()
+                for ch, child in children[node].items():
+                    if node:
+                        state = fail[node]
+                        while state and ch not in children[state]:
+                            state = fail[state]
+                        target = children[state].get(ch, 0)
+                        fail[child] = target
+                        output[child] = target if terminal[target] else output[target]
+                    queue.append(child)
+
+            self._tables = (children, fail, output, list(self._values), list(self._depth), terminal)
+            self.build_count += 1
+            return self._tables
+
+    def iter_matches(self, text: str) -> Iterator[Match]:
+        """全部匹配（可重叠），按结束位置递增输出，同一结束位置先长后短"""
+        children, fail, output, values, depth, terminal = self._tables or self.build()
+        state = 0
+        for i, ch in enumerate(self._normalize(text)):
+            while state and ch not in children[state]:
+                state = fail[state]
+            state = children[state].get(ch, 0)
+            node = state if terminal[state] else output[state]
+            while node > 0:
+                yield i + 1 - depth[node], i + 1, values[node]
+                node = output[node]
+
+    def distinct_values(self, text: str) -> List[Any]:
+        """文本中出现过的模式串对应的值（每个模式串一次，不计位置），相当于对每个模式串做 `in` 判断"""
+        children, fail, output, values, depth, terminal = self._tables or self.build()
+        state = 0
+        seen = set()
+        for ch in self._normalize(text):
+            while state and ch not in children[state]:
+                state = fail[state]
+            state = children[state].get(ch, 0)
+            node = state if terminal[state] else output[state]
+            # 某节点已记录时，其输出链接上的节点也都已记录
+            while node > 0 and node not in seen:
+                seen.add(node)
+                node = output[node]
+        return [values[node] for node in seen]
+
+    def find_longest(self, text: str,
+                     accept: Callable[[str, Match], bool] = None) -> List[Match]:
+        """
+        不重叠的匹配
+
+        重叠时保留较长的匹配，等长时保留靠前的，结果按起始位置排序。
+
+        Args:
+            text: 文本
+            accept: 过滤函数 (text, match) -> bool，在消解重叠之前调用
+
+        Returns:
+            匹配列表
+        """
+        matches = [m for m in self.iter_matches(text) if accept is None or accept(text, m)]
+        return select_longest(matches, len(text))
+
+
+def select_longest(matches: List[Match], length: int) -> List[Match]:
+    """
+    从可能重叠的匹配中选出不重叠的：重叠时保留较长的，等长时保留靠前的，结果按起始位置排序
+
+    Args:
+        matches: 匹配列表（可来自多个自动机，重复的匹配只保留一个）
+        length: 文本长度
+    """
+    if len(matches) <= 1:
+        return matches
+
+    matches.sort(key=lambda m: (m[0] - m[1], m[0]))
+    taken = bytearray(length)
+    selected = []
+    for match in matches:
+        start, end = match[0], match[1]
+        if taken.find(1, start, end) != -1:
+            continue
+        taken[start:end] = b"\x01" * (end - start)
+        selected.append(match)
+    selected.sort(key=lambda m: m[0])
+    return selected
@@ -200,6 +200,48 @@ class CircularBuffer(Generic[V]):
         return self.size()
 
 
+class FrozenDict(dict):
+    """
+    只读字典
+
+    用于多个调用方共享的缓存结果：任何修改操作都抛出 TypeError。
+    仍是 dict 的子类，可直接 JSON 序列化；需要修改时用 thaw() 或 dict() 复制。
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("FrozenDict 是只读的，修改前请先用 thaw() 复制")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def freeze(value: Any) -> Any:
+    """把 dict/list 结构递归转换为只读形式（FrozenDict / tuple / frozenset）"""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """freeze 的逆操作：得到可修改的 dict/list 副本"""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    if isinstance(value, frozenset):
+        return set(value)
+    return value
+
+
 def lru_cache_method(max_size: int = 128, ttl: Optional[float] = None):
     """
     方法级 LRU 缓存装饰器
@@ -675,9 +717,84 @@ class LLMResponseCache:
         return self._cache.stats()
 
 
+class EmbeddingCache:
+    """
+    文本向量缓存
+
+    包装 LangChain Embeddings（embed_query / embed_documents），
+    相同文本只调用一次嵌入模型，批量接口只对未命中的文本发起请求
+    """
+
+    def __init__(self, embeddings: Any = None, max_size: int = 20000,
+                 ttl: Optional[float] = None, model_name: str = None):
+        """
+        初始化向量缓存
+
+        Args:
+            embeddings: 嵌入模型实例，None 时首次使用时创建 DashScopeEmbeddings
+            max_size: 最大缓存条目数
+            ttl: 缓存过期时间（秒），None 表示永不过期
+            model_name: 模型名称，参与缓存键计算
+        """
+        self._embeddings = embeddings
+        self.model_name = model_name or getattr(embeddings, "model", None) or ""
+        self._cache = LRUCache[str, Tuple[float, ...]](max_size=max_size, ttl=ttl)
+        self._lock = threading.RLock()
+
+        # 注册到缓存管理器
+        get_cache_manager().register("embedding", self._cache)
+
+    @property
+    def embeddings(self) -> Any:
+        """嵌入模型（懒加载）"""
+        if self._embeddings is None:
+            with self._lock:
+                if self._embeddings is None:
+                    import config_data as config
+                    from langchain_community.embeddings import DashScopeEmbeddings
+                    self._embeddings = DashScopeEmbeddings(model=config.embedding_model_name)
+                    self.model_name = config.embedding_model_name
+        return self._embeddings
+
+    def _cache_key(self, text: str) -> str:
+        """生成缓存键"""
+        import hashlib
+        return hashlib.md5(f"{self.model_name}:{text}".encode("utf-8")).hexdigest()
+
+    def embed_query(self, text: str) -> List[float]:
+        """获取单条文本向量"""
+        key = self._cache_key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        vector = self.embeddings.embed_query(text)
+        self._cache.set(key, tuple(vector))
+        return list(vector)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """批量获取文本向量，只对未命中缓存的文本调用模型"""
+        keys = [self._cache_key(text) for text in texts]
+        results: List[Optional[Tuple[float, ...]]] = [self._cache.get(key) for key in keys]
+
+        missing = [i for i, vec in enumerate(results) if vec is None]
+        if missing:
+            vectors = self.embeddings.embed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, vectors):
+                results[i] = tuple(vector)
+                self._cache.set(keys[i], results[i])
+
+        return [list(vec) for vec in results]
+
+    def stats(self) -> Dict[str, Any]:
+        """获取缓存统计"""
+        return self._cache.stats()
+
+
 # 全局缓存实例
 _knowledge_cache: Optional[KnowledgeQueryCache] = None
 _llm_cache: Optional[LLMResponseCache] = None
+_embedding_cache: Optional[EmbeddingCache] = None
 _cache_lock = threading.Lock()
 
 
@@ -699,3 +816,13 @@ def get_llm_cache() -> LLMResponseCache:
             if _llm_cache is None:
                 _llm_cache = LLMResponseCache()
     return _llm_cache
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """获取文本向量缓存单例"""
+    global _embedding_cache
+    if _embedding_cache is None:
+        with _cache_lock:
+            if _embedding_cache is None:
+                _embedding_cache = EmbeddingCache()
+    return _embedding_cache
@@ -11,6 +11,9 @@ from dataclasses import dataclass, field
 
 from backend.core.tools import get_tool_registry, ToolResult, ToolDefinition
 from backend.core.logging_config import get_logger
+from backend.core.message_features import analyze_message, get_keyword_engine
+from backend.core import parameter_extraction
+from backend.core.parameter_extraction import MessageParameters, extract_parameters, get_parameters
 
 logger = get_logger("function_calling")
 
@@ -51,43 +54,16 @@ class FunctionCallingResult:
 
 
 class ParameterExtractor:
-    """智能参数提取器"""
-
-    # 金额提取模式
-    AMOUNT_PATTERNS = [
-        (r'(\d+(?:\.\d+)?)\s*万\s*[元块]?', 10000),  # X万
-        (r'(\d+(?:\.\d+)?)\s*[元块]', 1),            # X元/块
-        (r'(\d{4,}(?:\.\d+)?)', 1),                   # 4位以上数字
-        (r'(\d+(?:,\d{3})+(?:\.\d+)?)', 1),          # 带逗号的数字
-    ]
-
-    # 面积提取模式
-    AREA_PATTERNS = [
-        r'(\d+(?:\.\d+)?)\s*[平㎡]',
-        r'(\d+(?:\.\d+)?)\s*平米',
-        r'(\d+(?:\.\d+)?)\s*平方',
-        r'(\d+(?:\.\d+)?)\s*m2',
-    ]
-
-    # 品类映射
-    CATEGORY_MAPPING = {
-        # 家具类
-        "沙发": "家具", "床": "家具", "餐桌": "家具", "椅子": "家具",
-        "衣柜": "家具", "书桌": "家具", "茶几": "家具", "电视柜": "家具",
-        # 建材类
-        "瓷砖": "建材", "地板": "建材", "乳胶漆": "建材", "涂料": "建材",
-        "水泥": "建材", "木材": "建材", "石材": "建材", "大理石": "建材",
-        # 家电类
-        "空调": "家电", "冰箱": "家电", "洗衣机": "家电", "电视": "家电",
-        "热水器": "家电", "油烟机": "家电", "燃气灶": "家电",
-        # 软装类
-        "窗帘": "软装", "地毯": "软装", "灯具": "软装", "装饰画": "软装",
-        # 智能家居
-        "智能锁": "智能家居", "智能音箱": "智能家居", "智能开关": "智能家居",
-    }
-
-    # 装修风格
-    STYLES = ["现代简约", "北欧", "新中式", "轻奢", "欧式", "美式", "日式", "工业风", "地中海"]
+    """
+    智能参数提取器
+
+    提取逻辑在 backend.core.parameter_extraction 中，按消息缓存；这里保留原有的类方法接口。
+    """
+
+    AMOUNT_PATTERNS = parameter_extraction.AMOUNT_PATTERNS
+    AREA_PATTERNS = parameter_extraction.AREA_PATTERNS
+    CATEGORY_MAPPING = parameter_extraction.CATEGORY_MAPPING
+    STYLES = parameter_extraction.STYLES
 
     @classmethod
     def extract_amount(cls, text: str, context_keyword: str = None) -> Optional[float]:
@@ -101,108 +77,57 @@ class ParameterExtractor:
         Returns:
             提取的金额（元）
         """
-        # 如果有上下文关键词，优先在关键词附近提取
-        if context_keyword and context_keyword in text:
-            # 在关键词后20个字符内查找
-            idx = text.find(context_keyword)
-            search_text = text[idx:idx+30]
-        else:
-            search_text = text
-
-        for pattern, multiplier in cls.AMOUNT_PATTERNS:
-            matches = re.findall(pattern, search_text)
-            if matches:
-                amount_str = matches[0].replace(',', '')
-                return float(amount_str) * multiplier
-
-        # 回退到全文搜索
-        if context_keyword:
-            for pattern, multiplier in cls.AMOUNT_PATTERNS:
-                matches = re.findall(pattern, text)
-                if matches:
-                    amount_str = matches[0].replace(',', '')
-                    return float(amount_str) * multiplier
-
-        return None
+        return extract_parameters(text).amount(context_keyword)
 
     @classmethod
     def extract_multiple_amounts(cls, text: str) -> List[float]:
         """提取文本中的所有金额"""
-        amounts = []
-        for pattern, multiplier in cls.AMOUNT_PATTERNS:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                amount_str = match.replace(',', '')
-                amounts.append(float(amount_str) * multiplier)
-        return sorted(set(amounts))
+        return list(extract_parameters(text).amount_values)
 
     @classmethod
     def extract_area(cls, text: str) -> Optional[float]:
         """提取面积"""
-        for pattern in cls.AREA_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return float(matches[0])
-        return None
+        return extract_parameters(text).area
 
     @classmethod
     def extract_category(cls, text: str) -> Optional[str]:
         """提取商品品类"""
-        # 首先检查具体商品
-        for item, category in cls.CATEGORY_MAPPING.items():
-            if item in text:
-                return category
-
-        # 然后检查大类
-        main_categories = ["家具", "建材", "家电", "软装", "智能家居"]
-        for cat in main_categories:
-            if cat in text:
-                return cat
-
-        return None
+        return extract_parameters(text).category
 
     @classmethod
     def extract_specific_item(cls, text: str) -> Optional[str]:
         """提取具体商品名称"""
-        for item in cls.CATEGORY_MAPPING.keys():
-            if item in text:
-                return item
-        return None
+        return extract_parameters(text).item
 
     @classmethod
     def extract_style(cls, text: str) -> Optional[str]:
         """提取装修风格"""
-        for style in cls.STYLES:
-            if style in text:
-                return style
-        # 简化匹配
-        style_keywords = {
-            "现代": "现代简约", "简约": "现代简约",
-            "北欧": "北欧", "欧式": "欧式",
-            "中式": "新中式", "中国风": "新中式",
-            "轻奢": "轻奢", "奢华": "轻奢",
-            "日式": "日式", "和风": "日式",
-            "工业": "工业风", "loft": "工业风",
-        }
-        for keyword, style in style_keywords.items():
-            if keyword in text.lower():
-                return style
-        return "现代简约"  # 默认风格
+        return extract_parameters(text).style
 
     @classmethod
     def extract_period_days(cls, text: str) -> int:
         """提取统计周期（天数）"""
-        patterns = [
-            (r'(\d+)\s*天', 1),
-            (r'(\d+)\s*周', 7),
-            (r'(\d+)\s*[个]?月', 30),
-            (r'(\d+)\s*年', 365),
-        ]
-        for pattern, multiplier in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return int(matches[0]) * multiplier
-        return 30  # 默认30天
+        return extract_parameters(text).period_days
+
+
+# 规则回退时各工具的意图关键词
+TOOL_INTENT_KEYWORDS = {
+    "subsidy_calculator": ["补贴", "能补多少", "返多少", "优惠", "返现", "补贴金额"],
+    "roi_calculator": ["ROI", "投入产出", "回报率", "收益率", "投资回报"],
+    "price_evaluator": ["贵不贵", "价格合理", "值不值", "性价比", "划算", "便宜", "价格怎么样"],
+    "decoration_timeline": ["多久", "工期", "多长时间", "装修时间", "需要几天", "几个月能装完"],
+    "budget_planner": ["预算", "怎么分配", "预算规划", "预算分配", "钱怎么花"],
+    "material_calculator": ["需要多少", "用量", "要买多少", "材料计算"],
+    "merchant_score_calculator": ["店铺评分", "商家评分", "我的评分", "评分多少"],
+    "conversion_rate_analyzer": ["转化率", "转化分析", "成交率", "咨询转化"],
+}
+
+# 材料用量计算支持的材料
+MATERIAL_TYPES = ["瓷砖", "地板", "乳胶漆", "墙纸", "水泥", "沙子", "电线", "水管"]
+
+TOOL_INTENT_NAMESPACES = get_keyword_engine().register_groups("tool_intent", TOOL_INTENT_KEYWORDS)
+MATERIAL_TYPES_NAMESPACE = "tool_intent.material_types"
+get_keyword_engine().register(MATERIAL_TYPES_NAMESPACE, MATERIAL_TYPES)
 
 
 class FunctionCallingEngine:
@@ -343,7 +268,7 @@ class FunctionCallingEngine:
             return self.process_with_tools_sync(message, context, allowed_tools)
 
         # 首先尝试规则匹配（快速路径）
-        detected_tools = self._detect_tool_intent(message)
+        detected_tools = self._detect_tool_intent(message, get_parameters(message, context))
         if detected_tools:
             result.thinking.append(f"规则匹配检测到工具: {[t['name'] for t in detected_tools]}")
 
@@ -478,7 +403,7 @@ class FunctionCallingEngine:
         result = FunctionCallingResult()
 
         # 1. 使用规则匹配检测工具调用意图
-        detected_tools = self._detect_tool_intent(message)
+        detected_tools = self._detect_tool_intent(message, get_parameters(message, context))
 
         if detected_tools:
             result.thinking.append(f"检测到工具调用意图: {[t['name'] for t in detected_tools]}")
@@ -509,19 +434,22 @@ class FunctionCallingEngine:
 
         return result
 
-    def _detect_tool_intent(self, message: str) -> List[Dict]:
+    def _detect_tool_intent(self, message: str, params: MessageParameters = None) -> List[Dict]:
         """
         使用智能参数提取器检测工具调用意图
 
-        使用 ParameterExtractor 进行更准确的参数提取
+        Args:
+            message: 用户消息
+            params: 已提取的消息参数（通常来自请求上下文），不传时按消息提取
         """
         detected = []
+        features = analyze_message(message)
+        params = params or extract_parameters(message)
 
         # 补贴计算检测
-        subsidy_keywords = ["补贴", "能补多少", "返多少", "优惠", "返现", "补贴金额"]
-        if any(kw in message for kw in subsidy_keywords):
-            amount = ParameterExtractor.extract_amount(message)
-            category = ParameterExtractor.extract_category(message)
+        if features.has(TOOL_INTENT_NAMESPACES["subsidy_calculator"]):
+            amount = params.amount()
+            category = params.category
 
             if amount and category:
                 detected.append({
@@ -530,30 +458,29 @@ class FunctionCallingEngine:
                 })
 
         # ROI 计算检测
-        roi_keywords = ["ROI", "投入产出", "回报率", "收益率", "投资回报"]
-        if any(kw in message for kw in roi_keywords):
+        if features.has(TOOL_INTENT_NAMESPACES["roi_calculator"]):
             # 尝试提取投入和收入
-            investment = ParameterExtractor.extract_amount(message, "投入")
+            investment = params.amount("投入")
             if not investment:
-                investment = ParameterExtractor.extract_amount(message, "花")
+                investment = params.amount("花")
             if not investment:
-                investment = ParameterExtractor.extract_amount(message, "成本")
+                investment = params.amount("成本")
 
-            revenue = ParameterExtractor.extract_amount(message, "收入")
+            revenue = params.amount("收入")
             if not revenue:
-                revenue = ParameterExtractor.extract_amount(message, "赚")
+                revenue = params.amount("赚")
             if not revenue:
-                revenue = ParameterExtractor.extract_amount(message, "营收")
+                revenue = params.amount("营收")
 
             # 如果只找到一个金额，尝试提取所有金额
             if not (investment and revenue):
-                amounts = ParameterExtractor.extract_multiple_amounts(message)
+                amounts = params.amount_values
                 if len(amounts) >= 2:
                     investment = amounts[0]
                     revenue = amounts[1]
 
             if investment and revenue:
-                period_days = ParameterExtractor.extract_period_days(message)
+                period_days = params.period_days
                 detected.append({
                     "name": "roi_calculator",
                     "arguments": {
@@ -564,13 +491,12 @@ class FunctionCallingEngine:
                 })
 
         # 价格评估检测
-        price_keywords = ["贵不贵", "价格合理", "值不值", "性价比", "划算", "便宜", "价格怎么样"]
-        if any(kw in message for kw in price_keywords):
-            price = ParameterExtractor.extract_amount(message)
-            item = ParameterExtractor.extract_specific_item(message)
+        if features.has(TOOL_INTENT_NAMESPACES["price_evaluator"]):
+            price = params.amount()
+            item = params.item
 
             if price and item:
-                area = ParameterExtractor.extract_area(message)
+                area = params.area
                 detected.append({
                     "name": "price_evaluator",
                     "arguments": {
@@ -581,25 +507,23 @@ class FunctionCallingEngine:
                 })
 
         # 工期估算检测
-        timeline_keywords = ["多久", "工期", "多长时间", "装修时间", "需要几天", "几个月能装完"]
-        if any(kw in message for kw in timeline_keywords):
-            area = ParameterExtractor.extract_area(message)
+        if features.has(TOOL_INTENT_NAMESPACES["decoration_timeline"]):
+            area = params.area
 
             if area:
-                style = ParameterExtractor.extract_style(message)
+                style = params.style
                 detected.append({
                     "name": "decoration_timeline",
                     "arguments": {"house_area": area, "style": style}
                 })
 
         # 预算规划检测
-        budget_keywords = ["预算", "怎么分配", "预算规划", "预算分配", "钱怎么花"]
-        if any(kw in message for kw in budget_keywords):
-            budget = ParameterExtractor.extract_amount(message)
-            area = ParameterExtractor.extract_area(message)
+        if features.has(TOOL_INTENT_NAMESPACES["budget_planner"]):
+            budget = params.amount()
+            area = params.area
 
             if budget and area:
-                style = ParameterExtractor.extract_style(message)
+                style = params.style
                 detected.append({
                     "name": "budget_planner",
                     "arguments": {
@@ -610,15 +534,9 @@ class FunctionCallingEngine:
                 })
 
         # 材料用量计算检测
-        material_keywords = ["需要多少", "用量", "要买多少", "材料计算"]
-        material_types = ["瓷砖", "地板", "乳胶漆", "墙纸", "水泥", "沙子", "电线", "水管"]
-        if any(kw in message for kw in material_keywords):
-            area = ParameterExtractor.extract_area(message)
-            material_type = None
-            for mt in material_types:
-                if mt in message:
-                    material_type = mt
-                    break
+        if features.has(TOOL_INTENT_NAMESPACES["material_calculator"]):
+            area = params.area
+            material_type = features.first(MATERIAL_TYPES_NAMESPACE)
 
             if area and material_type:
                 detected.append({
@@ -630,10 +548,9 @@ class FunctionCallingEngine:
                 })
 
         # 商家评分计算检测（B端）
-        merchant_score_keywords = ["店铺评分", "商家评分", "我的评分", "评分多少"]
-        if any(kw in message for kw in merchant_score_keywords):
+        if features.has(TOOL_INTENT_NAMESPACES["merchant_score_calculator"]):
             # 尝试从消息中提取数据
-            amounts = ParameterExtractor.extract_multiple_amounts(message)
+            amounts = params.amount_values
             if len(amounts) >= 2:
                 detected.append({
                     "name": "merchant_score_calculator",
@@ -645,9 +562,8 @@ class FunctionCallingEngine:
                 })
 
         # 转化率分析检测（B端）
-        conversion_keywords = ["转化率", "转化分析", "成交率", "咨询转化"]
-        if any(kw in message for kw in conversion_keywords):
-            amounts = ParameterExtractor.extract_multiple_amounts(message)
+        if features.has(TOOL_INTENT_NAMESPACES["conversion_rate_analyzer"]):
+            amounts = params.amount_values
             if len(amounts) >= 3:
                 detected.append({
                     "name": "conversion_rate_analyzer",
@@ -13,6 +13,7 @@ from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 from enum import Enum
 from abc import ABC, abstractmethod
+import heapq
 import threading
 from collections import OrderedDict
 from pathlib import Path
@@ -20,6 +21,13 @@ from contextlib import contextmanager
 
 from backend.core.logging_config import get_logger
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 logger = get_logger("memory")
 
 
@@ -250,6 +258,63 @@ class UserProfile:
 
         return stage_needs.get(stage, {"type": "general", "suggestion": "装修咨询", "reason": "通用建议"})
 
+    def to_dict(self) -> Dict:
+        """序列化为可 JSON 化的字典（交互历史保留最近100条）"""
+        return {
+            "user_id": self.user_id,
+            "user_type": self.user_type,
+            "name": self.name,
+            "city": self.city,
+            "budget_range": list(self.budget_range) if self.budget_range else None,
+            "preferred_styles": self.preferred_styles,
+            "house_area": self.house_area,
+            "decoration_stage": self.decoration_stage,
+            "decoration_journey": asdict(self.decoration_journey) if self.decoration_journey else None,
+            "decision_factors": asdict(self.decision_factors) if self.decision_factors else None,
+            "pain_points": self.pain_points,
+            "shop_name": self.shop_name,
+            "shop_category": self.shop_category,
+            "monthly_orders": self.monthly_orders,
+            "interests": self.interests,
+            "interaction_history": self.interaction_history[-100:],
+            "communication_style": self.communication_style,
+            "response_detail_level": self.response_detail_level,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "total_sessions": self.total_sessions,
+            "total_messages": self.total_messages,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "UserProfile":
+        """从字典恢复用户画像"""
+        journey = data.get("decoration_journey")
+        factors = data.get("decision_factors")
+        return cls(
+            user_id=data["user_id"],
+            user_type=data.get("user_type", "c_end"),
+            name=data.get("name"),
+            city=data.get("city"),
+            budget_range=tuple(data["budget_range"]) if data.get("budget_range") else None,
+            preferred_styles=data.get("preferred_styles", []),
+            house_area=data.get("house_area"),
+            decoration_stage=data.get("decoration_stage"),
+            decoration_journey=DecorationJourney(**journey) if journey else None,
+            decision_factors=DecisionFactors(**factors) if factors else None,
+            pain_points=data.get("pain_points", []),
+            shop_name=data.get("shop_name"),
+            shop_category=data.get("shop_category"),
+            monthly_orders=data.get("monthly_orders"),
+            interests=data.get("interests", {}),
+            interaction_history=data.get("interaction_history", [])[-100:],
+            communication_style=data.get("communication_style", "friendly"),
+            response_detail_level=data.get("response_detail_level", "medium"),
+            created_at=data.get("created_at", time.time()),
+            updated_at=data.get("updated_at", time.time()),
+            total_sessions=data.get("total_sessions", 0),
+            total_messages=data.get("total_messages", 0),
+        )
+
 
 @dataclass
 class ConversationSummary:
@@ -273,6 +338,206 @@ class ConversationSummary:
     summary_text: str = ""
 
 
+class MinHashLSH:
+    """
+    近似重复检测引擎（字符 n-gram + MinHash + LSH 分桶）
+
+    - 按字符 n-gram 切片，中文等无空格文本同样适用
+    - 单次哈希 MinHash（one permutation hashing + 旋转致密化），
+      每条记忆的签名只需 O(切片数) 次计算
+    - LSH 分段分桶查找候选对，整体近似线性
+    - 签名按记忆 ID + 内容指纹缓存，重复维护时只计算新增或变化的记忆
+    """
+
+    _HASH_BITS = 64
+    _MAX_HASH = (1 << 64) - 1
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, ngram: int = 2,
+                 max_cache_size: int = 200000):
+        """
+        初始化近似重复检测引擎
+
+        Args:
+            num_perm: 签名长度（分桶数）
+            bands: LSH 分段数，须整除 num_perm；默认 16 段 × 8 行，
+                候选阈值约 0.7，与默认合并阈值 0.8 匹配
+            ngram: 字符切片长度
+            max_cache_size: 签名缓存的最大条目数
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm 必须能被 bands 整除")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.ngram = ngram
+        self.max_cache_size = max_cache_size
+
+        # 每个签名位对应的哈希区间宽度
+        self._bin_width = (self._MAX_HASH + 1) // num_perm
+
+        # 缓存: item_id -> (内容指纹, 切片哈希集合, 签名)
+        self._cache: OrderedDict[str, Tuple[int, frozenset, Tuple[int, ...]]] = OrderedDict()
+        self._lock = threading.RLock()
+
+        # 统计信息
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @staticmethod
+    def normalize(content: Any) -> str:
+        """归一化记忆内容为检测文本"""
+        return "".join(str(content).lower().split())
+
+    def shingles(self, text: str) -> frozenset:
+        """将文本切分为字符 n-gram 并哈希为 64 位整数集合"""
+        if not text:
+            return frozenset()
+        n = self.ngram
+        if len(text) <= n:
+            grams = {text}
+        else:
+            grams = {text[i:i + n] for i in range(len(text) - n + 1)}
+        return frozenset(
+            int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "little")
+            for g in grams
+        )
+
+    def signature(self, shingle_hashes: frozenset) -> Tuple[int, ...]:
+        """
+        计算 MinHash 签名
+
+        按哈希值所在区间分桶，每个桶取最小值；空桶向右借用
+        最近的非空桶并加偏移（旋转致密化），保证签名位置对齐。
+        """
+        k = self.num_perm
+        if not shingle_hashes:
+            return tuple([self._MAX_HASH] * k)
+
+        width = self._bin_width
+        bins: List[Optional[int]] = [None] * k
+        for h in shingle_hashes:
+            j = min(h // width, k - 1)
+            offset = h - j * width
+            if bins[j] is None or offset < bins[j]:
+                bins[j] = offset
+
+        sig = [0] * k
+        for j in range(k):
+            step = 0
+            idx = j
+            while bins[idx] is None:
+                step += 1
+                idx = (idx + 1) % k
+            sig[j] = bins[idx] + step * width
+        return tuple(sig)
+
+    def _get_entry(self, item_id: str, text: str) -> Tuple[frozenset, Tuple[int, ...]]:
+        """获取（必要时计算）记忆的切片集合与签名"""
+        fingerprint = hash(text)
+        with self._lock:
+            cached = self._cache.get(item_id)
+            if cached is not None and cached[0] == fingerprint:
+                self._cache.move_to_end(item_id)
+                self._cache_hits += 1
+                return cached[1], cached[2]
+
+        shingle_hashes = self.shingles(text)
+        sig = self.signature(shingle_hashes)
+
+        with self._lock:
+            self._cache_misses += 1
+            self._cache[item_id] = (fingerprint, shingle_hashes, sig)
+            self._cache.move_to_end(item_id)
+            while len(self._cache) > self.max_cache_size:
+                self._cache.popitem(last=False)
+        return shingle_hashes, sig
+
+    @staticmethod
+    def jaccard(a: frozenset, b: frozenset) -> float:
+        """精确 Jaccard 相似度"""
+        if not a or not b:
+            return 0.0
+        inter = len(a & b)
+        return inter / (len(a) + len(b) - inter)
+
+    def find_similar_groups(self, memories: List[MemoryItem],
+                            threshold: float) -> List[List[int]]:
+        """
+        查找相似记忆分组
+
+        与逐对比较的贪心语义一致：按顺序遍历，每条未分组的记忆
+        吸收其后所有与它相似且未分组的记忆。
+
+        Args:
+            memories: 记忆项列表
+            threshold: Jaccard 相似度阈值
+
+        Returns:
+            分组列表，每组为记忆下标（升序），覆盖所有记忆
+        """
+        entries = [self._get_entry(m.id, self.normalize(m.content)) for m in memories]
+
+        # LSH 分桶
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        rows = self.rows
+        for idx, (shingle_hashes, sig) in enumerate(entries):
+            if not shingle_hashes:
+                continue
+            for b in range(self.bands):
+                key = (b, sig[b * rows:(b + 1) * rows])
+                buckets.setdefault(key, []).append(idx)
+
+        groups = []
+        used = set()
+        for i, (shingles_i, sig_i) in enumerate(entries):
+            if i in used:
+                continue
+            used.add(i)
+            group = [i]
+
+            if shingles_i:
+                candidates = set()
+                for b in range(self.bands):
+                    bucket = buckets.get((b, sig_i[b * rows:(b + 1) * rows]))
+                    if bucket and len(bucket) > 1:
+                        candidates.update(bucket)
+
+                size_i = len(shingles_i)
+                for j in sorted(candidates):
+                    if j <= i or j in used:
+                        continue
+                    shingles_j = entries[j][0]
+                    # 集合大小相差过大时 Jaccard 不可能达到阈值
+                    size_j = len(shingles_j)
+                    if min(size_i, size_j) < threshold * max(size_i, size_j):
+                        continue
+                    if self.jaccard(shingles_i, shingles_j) >= threshold:
+                        group.append(j)
+                        used.add(j)
+
+            groups.append(group)
+        return groups
+
+    def invalidate(self, item_id: str):
+        """移除某条记忆的签名缓存"""
+        with self._lock:
+            self._cache.pop(item_id, None)
+
+    def stats(self) -> Dict:
+        """获取统计信息"""
+        total = self._cache_hits + self._cache_misses
+        return {
+            "cached_signatures": len(self._cache),
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "cache_hit_rate": self._cache_hits / total if total > 0 else 0,
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "ngram": self.ngram,
+        }
+
+
 class MemoryCompressor:
     """
     记忆压缩器
@@ -290,14 +555,17 @@ class MemoryCompressor:
         (60, 0.1),     # 60天后保留10%
     ]
 
-    def __init__(self, importance_threshold: float = 0.3):
+    def __init__(self, importance_threshold: float = 0.3,
+                 similarity_index: MinHashLSH = None):
         """
         初始化记忆压缩器
 
         Args:
             importance_threshold: 重要性阈值，低于此值的记忆会被清理
+            similarity_index: 近似重复检测引擎，默认新建 MinHashLSH
         """
         self.importance_threshold = importance_threshold
+        self.similarity_index = similarity_index or MinHashLSH()
 
     def compress_session(self, memories: List[MemoryItem], max_items: int = 10) -> Dict:
         """
@@ -434,7 +702,7 @@ class MemoryCompressor:
 
         Args:
             memories: 记忆项列表
-            similarity_threshold: 相似度阈值
+            similarity_threshold: 相似度阈值（字符 n-gram Jaccard）
 
         Returns:
             合并后的记忆列表
@@ -442,50 +710,25 @@ class MemoryCompressor:
         if len(memories) <= 1:
             return memories
 
-        merged = []
-        used = set()
-
-        for i, mem1 in enumerate(memories):
-            if i in used:
-                continue
+        # LSH 查找候选对后精确校验，避免 O(n²) 逐对比较
+        groups = self.similarity_index.find_similar_groups(memories, similarity_threshold)
 
-            # 找到所有相似的记忆
-            similar_group = [mem1]
-            for j, mem2 in enumerate(memories[i+1:], i+1):
-                if j in used:
-                    continue
-                if self._is_similar(mem1, mem2, similarity_threshold):
-                    similar_group.append(mem2)
-                    used.add(j)
-
-            # 合并相似记忆
-            if len(similar_group) > 1:
-                merged_mem = self._merge_group(similar_group)
-                merged.append(merged_mem)
+        merged = []
+        for group in groups:
+            if len(group) > 1:
+                merged.append(self._merge_group([memories[idx] for idx in group]))
             else:
-                merged.append(mem1)
-
-            used.add(i)
+                merged.append(memories[group[0]])
 
         return merged
 
     def _is_similar(self, mem1: MemoryItem, mem2: MemoryItem,
                     threshold: float) -> bool:
-        """简单的相似度判断"""
-        content1 = str(mem1.content).lower()
-        content2 = str(mem2.content).lower()
-
-        # 使用简单的词重叠率
-        words1 = set(content1.split())
-        words2 = set(content2.split())
-
-        if not words1 or not words2:
-            return False
-
-        overlap = len(words1 & words2)
-        similarity = overlap / max(len(words1), len(words2))
-
-        return similarity >= threshold
+        """基于字符 n-gram Jaccard 的相似度判断"""
+        index = self.similarity_index
+        shingles1 = index.shingles(index.normalize(mem1.content))
+        shingles2 = index.shingles(index.normalize(mem2.content))
+        return index.jaccard(shingles1, shingles2) >= threshold
 
     def _merge_group(self, group: List[MemoryItem]) -> MemoryItem:
         """合并一组相似记忆"""
@@ -544,6 +787,10 @@ class MemoryStore(ABC):
     def get(self, item_id: str) -> Optional[MemoryItem]:
         pass
 
+    def peek(self, item_id: str) -> Optional[MemoryItem]:
+        """读取记忆项，不计入访问统计"""
+        return self.store.get(item_id)
+
     @abstractmethod
     def search(self, query: str, limit: int = 10) -> List[MemoryItem]:
         pass
@@ -557,15 +804,36 @@ class InMemoryStore(MemoryStore):
     """
     内存存储实现
 
-    使用 OrderedDict 实现 LRU 淘汰策略
-    支持基于重要性的加权淘汰
+    使用 OrderedDict 维护访问顺序，支持基于评分的加权淘汰
+
+    淘汰评分 = 重要性 * 0.4 + 访问频率 * 0.3 + 时间新鲜度 * 0.3，
+    其中新鲜度随时间线性衰减、7 天后归零。评分可改写为
+    max(静态分, 线性键 - c * now)，因此：
+    - 新鲜度未归零的条目按线性键放入一个最小堆，彼此的顺序不随时间变化
+    - 新鲜度已归零的条目按静态分放入另一个最小堆
+    - 按到期时间维护第三个堆，每个重评分周期（epoch）只迁移新到期的条目
+    堆中条目懒删除（版本号失效），淘汰摊还 O(log n)，无需全量重算评分。
     """
 
+    # 淘汰评分参数
+    MAX_AGE = 86400 * 7          # 新鲜度归零时间（秒）
+    MAX_ACCESS = 100             # 访问次数归一化上限
+    RESCORE_INTERVAL = 60.0      # 重评分周期（秒）
+
     def __init__(self, max_size: int = 10000):
         self.max_size = max_size
         self._store: OrderedDict[str, MemoryItem] = OrderedDict()
         self._lock = threading.RLock()
 
+        # 淘汰索引
+        self._fresh_heap: List[Tuple[float, int, str]] = []    # (线性键, 版本, id)
+        self._decayed_heap: List[Tuple[float, int, str]] = []  # (静态分, 版本, id)
+        self._expiry_heap: List[Tuple[float, int, str]] = []   # (到期时间, 版本, id)
+        self._versions: Dict[str, int] = {}                    # id -> 当前有效版本
+        self._index_keys: Dict[str, Tuple[float, float]] = {}  # id -> 入堆时的 (静态分, 时间戳)
+        self._seq = 0
+        self._next_epoch = 0.0
+
         # 统计信息
         self._hits = 0
         self._misses = 0
@@ -576,12 +844,18 @@ class InMemoryStore(MemoryStore):
         """兼容旧代码的属性访问"""
         return dict(self._store)
 
+    def peek(self, item_id: str) -> Optional[MemoryItem]:
+        """读取记忆项，不计入访问统计"""
+        with self._lock:
+            return self._store.get(item_id)
+
     def save(self, item: MemoryItem) -> bool:
         with self._lock:
             # 如果已存在，更新并移到末尾
             if item.id in self._store:
                 self._store[item.id] = item
                 self._store.move_to_end(item.id)
+                self._index_item(item)
                 return True
 
             # 检查容量，需要淘汰时使用加权策略
@@ -589,6 +863,7 @@ class InMemoryStore(MemoryStore):
                 self._evict_by_score()
 
             self._store[item.id] = item
+            self._index_item(item)
             return True
 
     def get(self, item_id: str) -> Optional[MemoryItem]:
@@ -604,6 +879,10 @@ class InMemoryStore(MemoryStore):
             # 移到末尾（最近使用）
             self._store.move_to_end(item_id)
 
+            # 访问次数达到上限后评分不再变化，无需重新入堆
+            if item.access_count <= self.MAX_ACCESS:
+                self._index_item(item)
+
             self._hits += 1
             return item
 
@@ -626,9 +905,94 @@ class InMemoryStore(MemoryStore):
         with self._lock:
             if item_id in self._store:
                 del self._store[item_id]
+                # 堆中的旧条目懒删除
+                self._versions.pop(item_id, None)
+                self._index_keys.pop(item_id, None)
                 return True
             return False
 
+    # === 淘汰索引 ===
+
+    def _static_score(self, item: MemoryItem) -> float:
+        """与时间无关的评分部分（重要性 + 访问频率）"""
+        access_score = min(1, item.access_count / self.MAX_ACCESS)
+        return item.importance * 0.4 + access_score * 0.3
+
+    def _score(self, item: MemoryItem, now: float) -> float:
+        """完整评分（与旧实现一致）"""
+        freshness = max(0, 1 - (now - item.timestamp) / self.MAX_AGE)
+        return self._static_score(item) + freshness * 0.3
+
+    def _linear_key(self, static: float, timestamp: float) -> float:
+        """新鲜度未归零时：评分 = 线性键 - 0.3 * now / MAX_AGE"""
+        return static + 0.3 + 0.3 * timestamp / self.MAX_AGE
+
+    def _index_item(self, item: MemoryItem, now: float = None):
+        """为条目生成新版本并放入对应的堆（旧版本自动失效）"""
+        if now is None:
+            now = time.time()
+        self._seq += 1
+        seq = self._seq
+        static = self._static_score(item)
+        self._versions[item.id] = seq
+        self._index_keys[item.id] = (static, item.timestamp)
+
+        deadline = item.timestamp + self.MAX_AGE
+        if deadline <= now:
+            heapq.heappush(self._decayed_heap, (static, seq, item.id))
+        else:
+            heapq.heappush(self._fresh_heap, (self._linear_key(static, item.timestamp), seq, item.id))
+            heapq.heappush(self._expiry_heap, (deadline, seq, item.id))
+
+        self._maybe_compact()
+
+    def _advance_epoch(self, now: float):
+        """重评分周期：把新鲜度已归零的条目迁移到静态分堆"""
+        if now < self._next_epoch:
+            return
+        self._next_epoch = now + self.RESCORE_INTERVAL
+
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, seq, item_id = heapq.heappop(self._expiry_heap)
+            if self._versions.get(item_id) != seq:
+                continue
+            self._index_item(self._store[item_id], now)
+
+    def _peek_valid(self, heap: List[Tuple[float, int, str]]) -> Optional[Tuple[float, int, str]]:
+        """弹出失效条目，返回堆顶有效条目"""
+        while heap:
+            key, seq, item_id = heap[0]
+            if self._versions.get(item_id) == seq:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def _maybe_compact(self):
+        """失效条目过多时重建索引"""
+        limit = 4 * len(self._store) + 64
+        if len(self._fresh_heap) + len(self._decayed_heap) + len(self._expiry_heap) <= limit:
+            return
+
+        now = time.time()
+        self._fresh_heap = []
+        self._decayed_heap = []
+        self._expiry_heap = []
+        for item_id, item in self._store.items():
+            static = self._static_score(item)
+            self._seq += 1
+            seq = self._seq
+            self._versions[item_id] = seq
+            self._index_keys[item_id] = (static, item.timestamp)
+            deadline = item.timestamp + self.MAX_AGE
+            if deadline <= now:
+                self._decayed_heap.append((static, seq, item_id))
+            else:
+                self._fresh_heap.append((self._linear_key(static, item.timestamp), seq, item_id))
+                self._expiry_heap.append((deadline, seq, item_id))
+        heapq.heapify(self._fresh_heap)
+        heapq.heapify(self._decayed_heap)
+        heapq.heapify(self._expiry_heap)
+
     def _evict_by_score(self):
         """
         基于评分的淘汰策略
@@ -640,36 +1004,34 @@ class InMemoryStore(MemoryStore):
             return
 
         now = time.time()
-        min_score = float('inf')
-        min_key = None
-
-        # 只检查前 20% 的条目（最旧的）
-        check_count = max(1, len(self._store) // 5)
-        checked = 0
-
-        for key, item in self._store.items():
-            if checked >= check_count:
-                break
-
-            # 计算评分
-            age = now - item.timestamp
-            max_age = 86400 * 7  # 7天
-            freshness = max(0, 1 - age / max_age)
-
-            max_access = 100
-            access_score = min(1, item.access_count / max_access)
-
-            score = item.importance * 0.4 + access_score * 0.3 + freshness * 0.3
-
-            if score < min_score:
-                min_score = score
-                min_key = key
-
-            checked += 1
+        self._advance_epoch(now)
+        decay = 0.3 * now / self.MAX_AGE
+
+        while True:
+            fresh = self._peek_valid(self._fresh_heap)
+            decayed = self._peek_valid(self._decayed_heap)
+            if fresh is None and decayed is None:
+                # 索引为空（不应发生），回退为淘汰最旧条目
+                self._store.popitem(last=False)
+                self._evictions += 1
+                return
+
+            fresh_score = fresh[0] - decay if fresh else float("inf")
+            decayed_score = decayed[0] if decayed else float("inf")
+            heap = self._fresh_heap if fresh_score <= decayed_score else self._decayed_heap
+            _, _, item_id = heapq.heappop(heap)
+
+            # 条目在外部被修改（如重要性被调整）时懒更新后重新比较
+            item = self._store[item_id]
+            if self._index_keys.get(item_id) != (self._static_score(item), item.timestamp):
+                self._index_item(item, now)
+                continue
 
-        if min_key:
-            del self._store[min_key]
+            del self._store[item_id]
+            self._versions.pop(item_id, None)
+            self._index_keys.pop(item_id, None)
             self._evictions += 1
+            return
 
     def stats(self) -> Dict:
         """获取统计信息"""
@@ -681,12 +1043,18 @@ class InMemoryStore(MemoryStore):
             "misses": self._misses,
             "hit_rate": self._hits / total if total > 0 else 0,
             "evictions": self._evictions,
+            "index_entries": len(self._fresh_heap) + len(self._decayed_heap),
         }
 
     def clear(self):
         """清空存储"""
         with self._lock:
             self._store.clear()
+            self._fresh_heap = []
+            self._decayed_heap = []
+            self._expiry_heap = []
+            self._versions.clear()
+            self._index_keys.clear()
             self._hits = 0
             self._misses = 0
             self._evictions = 0
@@ -697,25 +1065,39 @@ class PersistentMemoryStore(MemoryStore):
     持久化记忆存储实现
 
     支持 JSON 文件持久化，可选 Redis 后端
+
+    只同步自上次保存以来新增、修改或删除的条目（脏键集合）：
+    - Redis 模式按固定大小分块流水线写入
+    - 文件模式追加写入 JSONL 日志，日志过长时压缩为快照
     """
 
+    # 每个 Redis 流水线最多包含的条目数
+    REDIS_CHUNK_SIZE = 500
+    # Redis 键过期时间（7天）
+    REDIS_TTL = 7 * 24 * 3600
+    # 日志条数超过 max(该值, 2 * 当前条目数) 时压缩为快照
+    JOURNAL_COMPACT_MIN = 1000
+
     def __init__(self, storage_path: str, max_size: int = 10000,
                  use_redis: bool = False, redis_config: Dict = None):
         """
         初始化持久化存储
 
         Args:
-            storage_path: JSON 文件存储路径
+            storage_path: JSON 快照文件路径（日志文件为 storage_path + ".journal"）
             max_size: 最大条目数
             use_redis: 是否使用 Redis
             redis_config: Redis 配置 {"host": "localhost", "port": 6379, "db": 0}
         """
         self.storage_path = storage_path
+        self.journal_path = storage_path + ".journal"
         self.max_size = max_size
         self.use_redis = use_redis
         self._store: OrderedDict[str, MemoryItem] = OrderedDict()
         self._lock = threading.RLock()
-        self._dirty = False
+        self._dirty_keys: set = set()    # 自上次保存以来新增/修改的条目
+        self._deleted_keys: set = set()  # 自上次保存以来删除的条目
+        self._journal_entries = 0
         self._last_save = time.time()
         self._save_interval = 60  # 自动保存间隔（秒）
 
@@ -739,6 +1121,7 @@ class PersistentMemoryStore(MemoryStore):
         # 统计信息
         self._hits = 0
         self._misses = 0
+        self._items_written = 0
 
         # 加载已有数据
         self._load()
@@ -746,6 +1129,19 @@ class PersistentMemoryStore(MemoryStore):
         # 启动自动保存线程
         self._start_auto_save()
 
+    @property
+    def _dirty(self) -> bool:
+        """是否存在未保存的修改"""
+        return bool(self._dirty_keys or self._deleted_keys)
+
+    def _mark_dirty(self, item_id: str):
+        self._dirty_keys.add(item_id)
+        self._deleted_keys.discard(item_id)
+
+    def _mark_deleted(self, item_id: str):
+        self._dirty_keys.discard(item_id)
+        self._deleted_keys.add(item_id)
+
     def _load(self):
         """从存储加载数据"""
         if self._redis:
@@ -753,40 +1149,84 @@ class PersistentMemoryStore(MemoryStore):
         else:
             self._load_from_file()
 
+    @staticmethod
+    def _item_from_dict(item_data: Dict) -> MemoryItem:
+        return MemoryItem(
+            id=item_data["id"],
+            content=item_data["content"],
+            memory_type=MemoryType(item_data["memory_type"]),
+            importance=item_data.get("importance", 0.5),
+            timestamp=item_data.get("timestamp", time.time()),
+            access_count=item_data.get("access_count", 0),
+            last_access=item_data.get("last_access", time.time()),
+            metadata=item_data.get("metadata", {}),
+        )
+
     def _load_from_file(self):
-        """从 JSON 文件加载"""
-        if not os.path.exists(self.storage_path):
+        """从 JSON 快照加载，再重放日志"""
+        if os.path.exists(self.storage_path):
+            try:
+                with open(self.storage_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+
+                for item_data in data.get("items", []):
+                    item = self._item_from_dict(item_data)
+                    self._store[item.id] = item
+
+                logger.info(f"从文件加载 {len(self._store)} 条记忆")
+            except Exception as e:
+                logger.error(f"加载记忆文件失败: {e}")
+        elif not os.path.exists(self.journal_path):
             logger.info(f"存储文件不存在，将创建新文件: {self.storage_path}")
             return
 
-        try:
-            with open(self.storage_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        self._replay_journal()
 
-            for item_data in data.get("items", []):
-                item = MemoryItem(
-                    id=item_data["id"],
-                    content=item_data["content"],
-                    memory_type=MemoryType(item_data["memory_type"]),
-                    importance=item_data.get("importance", 0.5),
-                    timestamp=item_data.get("timestamp", time.time()),
-                    access_count=item_data.get("access_count", 0),
-                    last_access=item_data.get("last_access", time.time()),
-                    metadata=item_data.get("metadata", {}),
-                )
-                self._store[item.id] = item
+    def _replay_journal(self):
+        """重放追加日志（忽略崩溃时写了一半的末行）"""
+        if not os.path.exists(self.journal_path):
+            return
 
-            logger.info(f"从文件加载 {len(self._store)} 条记忆")
+        replayed = 0
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("跳过损坏的记忆日志行")
+                        continue
+                    if entry.get("op") == "put":
+                        item = self._item_from_dict(entry["item"])
+                        self._store[item.id] = item
+                        self._store.move_to_end(item.id)
+                    elif entry.get("op") == "del":
+                        self._store.pop(entry["id"], None)
+                    replayed += 1
         except Exception as e:
-            logger.error(f"加载记忆文件失败: {e}")
+            logger.error(f"重放记忆日志失败: {e}")
+
+        self._journal_entries = replayed
+        # 日志可能使条目数超过上限
+        while len(self._store) > self.max_size:
+            self._store.popitem(last=False)
+        if replayed:
+            logger.info(f"重放 {replayed} 条记忆日志，当前 {len(self._store)} 条记忆")
 
     def _load_from_redis(self):
-        """从 Redis 加载"""
+        """从 Redis 加载（SCAN + 分块流水线，避免 KEYS 阻塞服务端）"""
         try:
-            keys = self._redis.keys("memory:*")
-            for key in keys:
-                data = self._redis.hgetall(key)
-                if data:
+            keys = list(self._redis.scan_iter(match="memory:*", count=self.REDIS_CHUNK_SIZE))
+            for start in range(0, len(keys), self.REDIS_CHUNK_SIZE):
+                pipe = self._redis.pipeline(transaction=False)
+                for key in keys[start:start + self.REDIS_CHUNK_SIZE]:
+                    pipe.hgetall(key)
+                for data in pipe.execute():
+                    if not data:
+                        continue
                     item = MemoryItem(
                         id=data["id"],
                         content=json.loads(data.get("content", "{}")),
@@ -804,58 +1244,102 @@ class PersistentMemoryStore(MemoryStore):
             logger.error(f"从 Redis 加载失败: {e}")
 
     def _save(self):
-        """保存数据到存储"""
+        """保存自上次保存以来的修改"""
         if self._redis:
-            self._save_to_redis()
+            ok = self._save_to_redis()
         else:
-            self._save_to_file()
-        self._dirty = False
+            ok = self._save_to_file()
+        if ok:
+            self._dirty_keys.clear()
+            self._deleted_keys.clear()
         self._last_save = time.time()
 
-    def _save_to_file(self):
-        """保存到 JSON 文件"""
+    def _save_to_file(self) -> bool:
+        """追加写入日志，日志过长时压缩为快照"""
+        if not self._dirty:
+            return True
         try:
-            # 确保目录存在
-            os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
-
-            data = {
-                "version": "1.0",
-                "saved_at": datetime.now().isoformat(),
-                "items": [item.to_dict() for item in self._store.values()]
-            }
+            os.makedirs(os.path.dirname(self.storage_path) or ".", exist_ok=True)
 
-            # 写入临时文件后重命名，确保原子性
-            temp_path = self.storage_path + ".tmp"
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            pending = len(self._dirty_keys) + len(self._deleted_keys)
+            if self._journal_entries + pending > max(self.JOURNAL_COMPACT_MIN, 2 * len(self._store)):
+                # 日志过长：直接写快照，摊还到每次修改仍为 O(1)
+                self._write_snapshot()
+                self._items_written += len(self._store)
+                return True
 
-            os.replace(temp_path, self.storage_path)
-            logger.debug(f"保存 {len(self._store)} 条记忆到文件")
+            lines = []
+            for item_id in self._deleted_keys:
+                lines.append(json.dumps({"op": "del", "id": item_id}, ensure_ascii=False))
+            for item_id in self._dirty_keys:
+                item = self._store.get(item_id)
+                if item is not None:
+                    lines.append(json.dumps({"op": "put", "item": item.to_dict()}, ensure_ascii=False))
+
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self._journal_entries += len(lines)
+            self._items_written += len(lines)
+            logger.debug(f"追加 {len(lines)} 条记忆日志")
+            return True
         except Exception as e:
             logger.error(f"保存记忆文件失败: {e}")
+            return False
+
+    def _write_snapshot(self):
+        """写入全量快照并截断日志"""
+        data = {
+            "version": "1.0",
+            "saved_at": datetime.now().isoformat(),
+            "items": [item.to_dict() for item in self._store.values()]
+        }
+
+        # 写入临时文件后重命名，确保原子性
+        temp_path = self.storage_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, self.storage_path)
+
+        # 快照已包含全部日志内容
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self._journal_entries = 0
+        logger.debug(f"记忆快照压缩完成: {len(self._store)} 条")
 
-    def _save_to_redis(self):
-        """保存到 Redis"""
+    def _save_to_redis(self) -> bool:
+        """分块流水线写入有修改的条目到 Redis"""
         try:
-            pipe = self._redis.pipeline()
-            for item in self._store.values():
-                key = f"memory:{item.id}"
-                pipe.hset(key, mapping={
-                    "id": item.id,
-                    "content": json.dumps(item.content, ensure_ascii=False),
-                    "memory_type": item.memory_type.value,
-                    "importance": str(item.importance),
-                    "timestamp": str(item.timestamp),
-                    "access_count": str(item.access_count),
-                    "last_access": str(item.last_access),
-                    "metadata": json.dumps(item.metadata, ensure_ascii=False),
-                })
-                # 设置过期时间（7天）
-                pipe.expire(key, 7 * 24 * 3600)
-            pipe.execute()
-            logger.debug(f"保存 {len(self._store)} 条记忆到 Redis")
+            dirty = [self._store[item_id] for item_id in self._dirty_keys if item_id in self._store]
+            deleted = list(self._deleted_keys)
+            chunk = self.REDIS_CHUNK_SIZE
+
+            for start in range(0, len(dirty), chunk):
+                pipe = self._redis.pipeline(transaction=False)
+                for item in dirty[start:start + chunk]:
+                    key = f"memory:{item.id}"
+                    pipe.hset(key, mapping={
+                        "id": item.id,
+                        "content": json.dumps(item.content, ensure_ascii=False),
+                        "memory_type": item.memory_type.value,
+                        "importance": str(item.importance),
+                        "timestamp": str(item.timestamp),
+                        "access_count": str(item.access_count),
+                        "last_access": str(item.last_access),
+                        "metadata": json.dumps(item.metadata, ensure_ascii=False),
+                    })
+                    # 设置过期时间（7天）
+                    pipe.expire(key, self.REDIS_TTL)
+                pipe.execute()
+
+            for start in range(0, len(deleted), chunk):
+                self._redis.delete(*[f"memory:{item_id}" for item_id in deleted[start:start + chunk]])
+
+            self._items_written += len(dirty) + len(deleted)
+            logger.debug(f"同步 {len(dirty)} 条修改、{len(deleted)} 条删除到 Redis")
+            return True
         except Exception as e:
             logger.error(f"保存到 Redis 失败: {e}")
+            return False
 
     def _start_auto_save(self):
         """启动自动保存线程"""
@@ -874,18 +1358,23 @@ class PersistentMemoryStore(MemoryStore):
         """兼容旧代码的属性访问"""
         return dict(self._store)
 
+    def peek(self, item_id: str) -> Optional[MemoryItem]:
+        """读取记忆项，不计入访问统计"""
+        with self._lock:
+            return self._store.get(item_id)
+
     def save(self, item: MemoryItem) -> bool:
         """保存记忆项"""
         with self._lock:
             # 检查容量
-            while len(self._store) >= self.max_size:
+            while item.id not in self._store and len(self._store) >= self.max_size:
                 # 删除最旧的
-                oldest_key = next(iter(self._store))
-                del self._store[oldest_key]
+                oldest_key, _ = self._store.popitem(last=False)
+                self._mark_deleted(oldest_key)
 
             self._store[item.id] = item
             self._store.move_to_end(item.id)
-            self._dirty = True
+            self._mark_dirty(item.id)
 
             # 如果距离上次保存超过间隔，立即保存
             if time.time() - self._last_save > self._save_interval:
@@ -905,7 +1394,7 @@ class PersistentMemoryStore(MemoryStore):
             item.last_access = time.time()
             self._store.move_to_end(item_id)
             self._hits += 1
-            self._dirty = True
+            self._mark_dirty(item_id)
             return item
 
     def search(self, query: str, limit: int = 10) -> List[MemoryItem]:
@@ -923,19 +1412,11 @@ class PersistentMemoryStore(MemoryStore):
             return results[:limit]
 
     def delete(self, item_id: str) -> bool:
-        """删除记忆项"""
+        """删除记忆项（下次保存时同步）"""
         with self._lock:
             if item_id in self._store:
                 del self._store[item_id]
-                self._dirty = True
-
-                # 从 Redis 删除
-                if self._redis:
-                    try:
-                        self._redis.delete(f"memory:{item_id}")
-                    except Exception:
-                        pass
-
+                self._mark_deleted(item_id)
                 return True
             return False
 
@@ -944,6 +1425,13 @@ class PersistentMemoryStore(MemoryStore):
         with self._lock:
             self._save()
 
+    def compact(self):
+        """立即将日志压缩为快照（文件模式）"""
+        with self._lock:
+            if not self._redis:
+                self._save()
+                self._write_snapshot()
+
     def stats(self) -> Dict:
         """获取统计信息"""
         total = self._hits + self._misses
@@ -955,6 +1443,9 @@ class PersistentMemoryStore(MemoryStore):
             "hit_rate": self._hits / total if total > 0 else 0,
             "storage_type": "redis" if self._redis else "file",
             "dirty": self._dirty,
+            "pending_writes": len(self._dirty_keys) + len(self._deleted_keys),
+            "items_written": self._items_written,
+            "journal_entries": self._journal_entries,
         }
 
 
@@ -1093,6 +1584,19 @@ class SQLiteMemoryStore(MemoryStore):
                 logger.error(f"SQLite 保存失败: {e}")
                 return False
 
+    def peek(self, item_id: str) -> Optional[MemoryItem]:
+        """读取记忆项，不计入访问统计"""
+        with self._lock:
+            try:
+                with self._get_connection() as conn:
+                    row = conn.execute(
+                        "SELECT * FROM memories WHERE id = ?", (item_id,)
+                    ).fetchone()
+                    return self._row_to_item(row) if row else None
+            except Exception as e:
+                logger.error(f"SQLite 获取失败: {e}")
+                return None
+
     def get(self, item_id: str) -> Optional[MemoryItem]:
         """获取记忆项"""
         with self._lock:
@@ -1211,6 +1715,36 @@ class SQLiteMemoryStore(MemoryStore):
                 logger.error(f"SQLite 会话删除失败: {e}")
                 return 0
 
+    def iter_items(self, user_id: str = None,
+                   batch_size: int = 1000):
+        """分批遍历全部记忆（按 rowid 翻页，不一次性载入内存）"""
+        last_rowid = 0
+        while True:
+            with self._lock:
+                try:
+                    with self._get_connection() as conn:
+                        if user_id:
+                            cursor = conn.execute("""
+                                SELECT rowid, * FROM memories
+                                WHERE rowid > ? AND user_id = ?
+                                ORDER BY rowid LIMIT ?
+                            """, (last_rowid, user_id, batch_size))
+                        else:
+                            cursor = conn.execute("""
+                                SELECT rowid, * FROM memories
+                                WHERE rowid > ?
+                                ORDER BY rowid LIMIT ?
+                            """, (last_rowid, batch_size))
+                        rows = cursor.fetchall()
+                except Exception as e:
+                    logger.error(f"SQLite 遍历失败: {e}")
+                    return
+            if not rows:
+                return
+            last_rowid = rows[-1]["rowid"]
+            for row in rows:
+                yield self._row_to_item(row)
+
     def _row_to_item(self, row: sqlite3.Row) -> MemoryItem:
         """将数据库行转换为 MemoryItem"""
         return MemoryItem(
@@ -1279,6 +1813,272 @@ class SQLiteMemoryStore(MemoryStore):
             self._local.conn = None
 
 
+def memory_text(content: Any) -> str:
+    """提取记忆内容中用于检索/嵌入的文本"""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, dict):
+        for key in ("content", "summary_text", "summary"):
+            value = content.get(key)
+            if isinstance(value, str) and value:
+                return value
+        return json.dumps(content, ensure_ascii=False)
+    return str(content)
+
+
+class _UserVectors:
+    """单个用户的向量矩阵（按行存储，容量倍增）"""
+
+    __slots__ = ("ids", "rows", "matrix", "size", "dirty")
+
+    def __init__(self, dim: int, capacity: int = 64):
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self.size = 0
+        self.dirty = False
+
+    def upsert(self, item_id: str, vector: "np.ndarray"):
+        row = self.rows.get(item_id)
+        if row is None:
+            if self.size >= self.matrix.shape[0]:
+                grown = np.zeros((self.matrix.shape[0] * 2, self.matrix.shape[1]), dtype=np.float32)
+                grown[:self.size] = self.matrix[:self.size]
+                self.matrix = grown
+            row = self.size
+            self.size += 1
+            self.ids.append(item_id)
+            self.rows[item_id] = row
+        self.matrix[row] = vector
+        self.dirty = True
+
+    def remove(self, item_id: str) -> bool:
+        row = self.rows.pop(item_id, None)
+        if row is None:
+            return False
+        last = self.size - 1
+        if row != last:
+            # 与最后一行交换，保持矩阵紧凑
+            moved_id = self.ids[last]
+            self.matrix[row] = self.matrix[last]
+            self.ids[row] = moved_id
+            self.rows[moved_id] = row
+        self.ids.pop()
+        self.size -= 1
+        self.dirty = True
+        return True
+
+
+class VectorMemoryIndex:
+    """
+    长期记忆向量索引
+
+    - 每个用户一个紧凑的 float32 NumPy 矩阵（行向量已归一化）
+    - 写入时经 EmbeddingCache 嵌入一次，检索时一次矩阵乘法 + argpartition 取 top-k
+    - 持久化为 memory.db 旁 vectors/ 目录下的每用户 .npz 文件，首次访问时懒加载
+    - 内存中最多保留 max_users 个用户（LRU），淘汰前先写盘；仅内存模式不淘汰
+    """
+
+    def __init__(self, storage_dir: Optional[str] = None, embedder: Any = None,
+                 max_users: int = 1000):
+        """
+        初始化向量索引
+
+        Args:
+            storage_dir: 向量文件目录，None 表示仅内存
+            embedder: 嵌入器（embed_query / embed_documents），默认使用全局 EmbeddingCache
+            max_users: 内存中保留的用户数上限（有 storage_dir 时生效）
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("向量召回需要安装 numpy")
+
+        self.storage_dir = storage_dir
+        self._embedder = embedder
+        self._users: OrderedDict[str, _UserVectors] = OrderedDict()
+        self.max_users = max_users
+        self._evictions = 0
+        self._dim: Optional[int] = None
+        self._lock = threading.RLock()
+
+        if storage_dir:
+            os.makedirs(storage_dir, exist_ok=True)
+
+    @property
+    def embedder(self) -> Any:
+        """嵌入器（懒加载全局缓存）"""
+        if self._embedder is None:
+            from backend.core.cache import get_embedding_cache
+            self._embedder = get_embedding_cache()
+        return self._embedder
+
+    def _user_path(self, user_id: str) -> str:
+        digest = hashlib.md5(user_id.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.storage_dir, f"{digest}.npz")
+
+    def _normalize(self, vectors: List[List[float]]) -> "np.ndarray":
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix[None, :]
+        if self._dim is None:
+            self._dim = matrix.shape[1]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def embed_query(self, query: str) -> "np.ndarray":
+        """嵌入并归一化查询文本"""
+        return self._normalize(self.embedder.embed_query(query))[0]
+
+    def _remember(self, user_id: str, vectors: _UserVectors):
+        """放入内存并按 LRU 淘汰（调用方持有锁）"""
+        self._users[user_id] = vectors
+        self._users.move_to_end(user_id)
+        if not self.storage_dir:
+            return
+        while len(self._users) > self.max_users:
+            oldest_id, oldest = next(iter(self._users.items()))
+            if oldest_id == user_id or (oldest.dirty and not self._write_user(oldest_id, oldest)):
+                break
+            del self._users[oldest_id]
+            self._evictions += 1
+
+    def _get_user(self, user_id: str, create: bool = False) -> Optional[_UserVectors]:
+        """获取用户向量（调用方持有锁），必要时从磁盘懒加载"""
+        vectors = self._users.get(user_id)
+        if vectors is not None:
+            self._users.move_to_end(user_id)
+            return vectors
+
+        if self.storage_dir:
+            path = self._user_path(user_id)
+            if os.path.exists(path):
+                try:
+                    with np.load(path, allow_pickle=False) as data:
+                        ids = [str(x) for x in data["ids"]]
+                        matrix = data["matrix"].astype(np.float32, copy=False)
+                    if self._dim is None:
+                        self._dim = matrix.shape[1]
+                    vectors = _UserVectors(matrix.shape[1], capacity=max(64, len(ids)))
+                    vectors.matrix[:len(ids)] = matrix
+                    vectors.ids = ids
+                    vectors.rows = {item_id: i for i, item_id in enumerate(ids)}
+                    vectors.size = len(ids)
+                    self._remember(user_id, vectors)
+                    return vectors
+                except Exception as e:
+                    logger.error(f"加载用户向量失败: {e}")
+
+        if create and self._dim is not None:
+            vectors = _UserVectors(self._dim)
+            self._remember(user_id, vectors)
+        return vectors
+
+    def add(self, user_id: str, item_id: str, text: str):
+        """嵌入并写入一条记忆"""
+        self.add_many(user_id, [(item_id, text)])
+
+    def add_many(self, user_id: str, items: List[Tuple[str, str]]) -> int:
+        """批量嵌入并写入记忆，返回写入条数"""
+        if not items:
+            return 0
+        matrix = self._normalize(self.embedder.embed_documents([text for _, text in items]))
+        with self._lock:
+            vectors = self._get_user(user_id, create=True)
+            for (item_id, _), vector in zip(items, matrix):
+                vectors.upsert(item_id, vector)
+        return len(items)
+
+    def remove(self, user_id: str, item_id: str) -> bool:
+        """删除一条记忆的向量"""
+        with self._lock:
+            vectors = self._get_user(user_id)
+            return vectors.remove(item_id) if vectors else False
+
+    def contains(self, user_id: str, item_id: str) -> bool:
+        """是否已有该记忆的向量"""
+        with self._lock:
+            vectors = self._get_user(user_id)
+            return bool(vectors) and item_id in vectors.rows
+
+    def count(self, user_id: str) -> int:
+        """用户的向量条数"""
+        with self._lock:
+            vectors = self._get_user(user_id)
+            return vectors.size if vectors else 0
+
+    def search(self, user_id: str, query: str, k: int = 5,
+               min_score: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        余弦相似度 top-k 检索
+
+        Returns:
+            [(item_id, score)]，按相似度降序
+        """
+        with self._lock:
+            vectors = self._get_user(user_id)
+            if not vectors or vectors.size == 0:
+                return []
+        query_vec = self.embed_query(query)
+        return self.search_vector(user_id, query_vec, k, min_score)
+
+    def search_vector(self, user_id: str, query_vec: "np.ndarray", k: int = 5,
+                      min_score: float = 0.0) -> List[Tuple[str, float]]:
+        """用已归一化的查询向量检索"""
+        with self._lock:
+            vectors = self._get_user(user_id)
+            if not vectors or vectors.size == 0:
+                return []
+            scores = vectors.matrix[:vectors.size] @ query_vec
+            k = min(k, vectors.size)
+            if k < vectors.size:
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(vectors.size)
+            top = top[np.argsort(-scores[top])]
+            return [
+                (vectors.ids[i], float(scores[i]))
+                for i in top if scores[i] >= min_score
+            ]
+
+    def _write_user(self, user_id: str, vectors: _UserVectors) -> bool:
+        """将一个用户的向量写入磁盘（调用方持有锁）"""
+        path = self._user_path(user_id)
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                np.savez(
+                    f,
+                    ids=np.array(vectors.ids, dtype=str),
+                    matrix=vectors.matrix[:vectors.size],
+                )
+            os.replace(temp_path, path)
+            vectors.dirty = False
+            return True
+        except Exception as e:
+            logger.error(f"保存用户向量失败: {e}")
+            return False
+
+    def flush(self) -> int:
+        """将有修改的用户向量写入磁盘，返回写入的用户数"""
+        if not self.storage_dir:
+            return 0
+        with self._lock:
+            return sum(
+                1 for user_id, vectors in self._users.items()
+                if vectors.dirty and self._write_user(user_id, vectors)
+            )
+
+    def stats(self) -> Dict:
+        """获取统计信息"""
+        with self._lock:
+            return {
+                "loaded_users": len(self._users),
+                "vectors": sum(v.size for v in self._users.values()),
+                "dim": self._dim,
+                "evictions": self._evictions,
+            }
+
+
 class UserProfileStore:
     """
     用户画像持久化存储
@@ -1301,27 +2101,7 @@ class UserProfileStore:
                 data = json.load(f)
 
             for user_id, profile_data in data.get("profiles", {}).items():
-                profile = UserProfile(
-                    user_id=profile_data["user_id"],
-                    user_type=profile_data.get("user_type", "c_end"),
-                    name=profile_data.get("name"),
-                    city=profile_data.get("city"),
-                    budget_range=tuple(profile_data["budget_range"]) if profile_data.get("budget_range") else None,
-                    preferred_styles=profile_data.get("preferred_styles", []),
-                    house_area=profile_data.get("house_area"),
-                    decoration_stage=profile_data.get("decoration_stage"),
-                    shop_name=profile_data.get("shop_name"),
-                    shop_category=profile_data.get("shop_category"),
-                    monthly_orders=profile_data.get("monthly_orders"),
-                    interests=profile_data.get("interests", {}),
-                    interaction_history=profile_data.get("interaction_history", [])[-100:],
-                    communication_style=profile_data.get("communication_style", "friendly"),
-                    response_detail_level=profile_data.get("response_detail_level", "medium"),
-                    created_at=profile_data.get("created_at", time.time()),
-                    updated_at=profile_data.get("updated_at", time.time()),
-                    total_sessions=profile_data.get("total_sessions", 0),
-                    total_messages=profile_data.get("total_messages", 0),
-                )
+                profile = UserProfile.from_dict(profile_data)
                 self._profiles[user_id] = profile
 
             logger.info(f"加载 {len(self._profiles)} 个用户画像")
@@ -1340,27 +2120,7 @@ class UserProfileStore:
             }
 
             for user_id, profile in self._profiles.items():
-                data["profiles"][user_id] = {
-                    "user_id": profile.user_id,
-                    "user_type": profile.user_type,
-                    "name": profile.name,
-                    "city": profile.city,
-                    "budget_range": list(profile.budget_range) if profile.budget_range else None,
-                    "preferred_styles": profile.preferred_styles,
-                    "house_area": profile.house_area,
-                    "decoration_stage": profile.decoration_stage,
-                    "shop_name": profile.shop_name,
-                    "shop_category": profile.shop_category,
-                    "monthly_orders": profile.monthly_orders,
-                    "interests": profile.interests,
-                    "interaction_history": profile.interaction_history[-100:],
-                    "communication_style": profile.communication_style,
-                    "response_detail_level": profile.response_detail_level,
-                    "created_at": profile.created_at,
-                    "updated_at": profile.updated_at,
-                    "total_sessions": profile.total_sessions,
-                    "total_messages": profile.total_messages,
-                }
+                data["profiles"][user_id] = profile.to_dict()
 
             temp_path = self.storage_path + ".tmp"
             with open(temp_path, "w", encoding="utf-8") as f:
@@ -1398,6 +2158,14 @@ class UserProfileStore:
             profile.updated_at = time.time()
             self._dirty = True
 
+    def mark_dirty(self, user_id: str, profile: UserProfile = None):
+        """标记用户画像已修改"""
+        self._dirty = True
+
+    def count(self) -> int:
+        """用户画像总数"""
+        return len(self._profiles)
+
     def save_if_dirty(self):
         """如果有修改则保存"""
         with self._lock:
@@ -1409,6 +2177,380 @@ class UserProfileStore:
         with self._lock:
             self._save()
 
+    def close(self):
+        """关闭存储"""
+        self.save_if_dirty()
+
+
+# 三方合并中表示"键不存在"
+_MISSING = object()
+
+
+class SQLiteProfileStore:
+    """
+    用户画像 SQLite 增量存储
+
+    - 每个画像一行，只写入有修改的画像（脏集合；修改画像后须调用 update 或 mark_dirty）
+    - 首次访问时按主键懒加载，启动时不读取全部画像
+    - 已加载的画像按 LRU 缓存，超出 cache_size 时淘汰最久未访问的已落盘画像（未落盘的不淘汰）
+    - 后台线程按间隔批量刷盘，刷盘成本只与修改量有关
+    - 首次启动时自动迁移旧版 user_profiles.json
+
+    多进程（多 worker）共享同一个数据库文件：
+    - 写入时以加载时的 updated_at 作为版本做条件更新，行已被其他进程改过时
+      重新读取并与本进程的修改三方合并（计数累加、字典按键合并、列表合并新增项）后再写入
+    - 未修改的缓存画像超过 revalidate_interval 秒后，读取时检查行版本，变化则原地重新加载
+
+    与 UserProfileStore 接口兼容，_profiles 仅包含已加载的画像。
+    """
+
+    # 合并时按增量累加的计数字段
+    COUNTER_FIELDS = ("total_sessions", "total_messages")
+
+    CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS user_profiles (
+        user_id TEXT PRIMARY KEY,
+        user_type TEXT NOT NULL,
+        data TEXT NOT NULL,
+        updated_at REAL NOT NULL
+    );
+    """
+
+    def __init__(self, db_path: str, flush_interval: float = 30.0,
+                 legacy_json_path: str = None, cache_size: int = 10000,
+                 revalidate_interval: float = 5.0):
+        """
+        初始化画像存储
+
+        Args:
+            db_path: 数据库文件路径
+            flush_interval: 后台刷盘间隔（秒），<=0 时不启动后台线程
+            legacy_json_path: 旧版 JSON 画像文件路径，存在时迁移一次
+            cache_size: 内存中缓存的画像数量上限
+            revalidate_interval: 缓存画像的版本检查间隔（秒），<0 时不检查
+        """
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.cache_size = cache_size
+        self.revalidate_interval = revalidate_interval
+        self._profiles: "OrderedDict[str, UserProfile]" = OrderedDict()
+        self._persisted_at: Dict[str, float] = {}  # 已加载画像对应数据库行的 updated_at（版本）
+        self._base_data: Dict[str, str] = {}       # 对应数据库行的 data，合并时作为共同祖先
+        self._checked_at: Dict[str, float] = {}    # 最近一次确认与数据库一致的时间
+        self._dirty_ids: set = set()
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+
+        # 统计信息
+        self._loads = 0
+        self._evictions = 0
+        self._flushes = 0
+        self._rows_written = 0
+        self._reloads = 0
+        self._merges = 0
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.CREATE_TABLE_SQL)
+        self._conn.commit()
+
+        if legacy_json_path:
+            self._migrate_legacy_json(legacy_json_path)
+
+        self._flush_thread = None
+        if flush_interval > 0:
+            self._start_auto_flush()
+
+    def _migrate_legacy_json(self, json_path: str):
+        """从旧版 JSON 文件迁移画像（仅在表为空时执行一次）"""
+        if not os.path.exists(json_path):
+            return
+
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM user_profiles LIMIT 1").fetchone():
+                return
+            try:
+                with open(json_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                rows = []
+                for profile_data in data.get("profiles", {}).values():
+                    profile = UserProfile.from_dict(profile_data)
+                    rows.append(self._to_row(profile))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO user_profiles VALUES (?, ?, ?, ?)", rows
+                )
+                self._conn.commit()
+                os.replace(json_path, json_path + ".migrated")
+                logger.info(f"迁移 {len(rows)} 个用户画像到 SQLite")
+            except Exception as e:
+                self._conn.rollback()
+                logger.error(f"迁移用户画像失败: {e}")
+
+    @staticmethod
+    def _to_row(profile: UserProfile) -> Tuple[str, str, str, float]:
+        return (
+            profile.user_id,
+            profile.user_type,
+            json.dumps(profile.to_dict(), ensure_ascii=False, separators=(",", ":")),
+            profile.updated_at,
+        )
+
+    def _read_row(self, user_id: str) -> Optional[Tuple[str, float]]:
+        """读取数据库中的 (data, updated_at)"""
+        return self._conn.execute(
+            "SELECT data, updated_at FROM user_profiles WHERE user_id = ?", (user_id,)
+        ).fetchone()
+
+    def _set_base(self, user_id: str, data: str, updated_at: float):
+        """记录画像对应的数据库行版本（调用方持有锁）"""
+        self._persisted_at[user_id] = updated_at
+        self._base_data[user_id] = data
+        self._checked_at[user_id] = time.time()
+
+    def _load_one(self, user_id: str) -> Optional[UserProfile]:
+        """按需从数据库加载单个画像（调用方持有锁）"""
+        try:
+            row = self._read_row(user_id)
+        except Exception as e:
+            logger.error(f"加载用户画像失败: {e}")
+            return None
+        if not row:
+            return None
+
+        profile = UserProfile.from_dict(json.loads(row[0]))
+        self._set_base(user_id, row[0], row[1])
+        self._remember(user_id, profile)
+        self._loads += 1
+        return profile
+
+    def _revalidate(self, user_id: str, profile: UserProfile):
+        """未修改的缓存画像过期后检查行版本，被其他进程改过时原地重新加载（调用方持有锁）"""
+        if self.revalidate_interval < 0 or user_id in self._dirty_ids:
+            return
+        now = time.time()
+        if now - self._checked_at.get(user_id, 0.0) < self.revalidate_interval:
+            return
+        try:
+            row = self._conn.execute(
+                "SELECT updated_at FROM user_profiles WHERE user_id = ?", (user_id,)
+            ).fetchone()
+            if row and row[0] != self._persisted_at.get(user_id):
+                row = self._read_row(user_id)
+                profile.__dict__.update(UserProfile.from_dict(json.loads(row[0])).__dict__)
+                self._set_base(user_id, row[0], row[1])
+                self._reloads += 1
+        except Exception as e:
+            logger.error(f"检查用户画像版本失败: {e}")
+            return
+        self._checked_at[user_id] = now
+
+    def _remember(self, user_id: str, profile: UserProfile):
+        """放入缓存并淘汰超出上限的已落盘画像（调用方持有锁）"""
+        self._profiles[user_id] = profile
+        self._profiles.move_to_end(user_id)
+        if len(self._profiles) <= self.cache_size:
+            return
+        for old_id in list(self._profiles):
+            if len(self._profiles) <= self.cache_size:
+                break
+            if old_id == user_id or old_id in self._dirty_ids:
+                continue
+            del self._profiles[old_id]
+            self._persisted_at.pop(old_id, None)
+            self._base_data.pop(old_id, None)
+            self._checked_at.pop(old_id, None)
+            self._evictions += 1
+
+    def get(self, user_id: str) -> Optional[UserProfile]:
+        """获取用户画像"""
+        with self._lock:
+            profile = self._profiles.get(user_id)
+            if profile is None:
+                profile = self._load_one(user_id)
+            else:
+                self._profiles.move_to_end(user_id)
+                self._revalidate(user_id, profile)
+            return profile
+
+    def get_or_create(self, user_id: str, user_type: str = "c_end") -> UserProfile:
+        """获取或创建用户画像"""
+        with self._lock:
+            profile = self.get(user_id)
+            if profile is None:
+                profile = UserProfile(user_id=user_id, user_type=user_type)
+                self._dirty_ids.add(user_id)
+                self._remember(user_id, profile)
+            return profile
+
+    def update(self, user_id: str, **kwargs):
+        """更新用户画像"""
+        with self._lock:
+            profile = self.get_or_create(user_id)
+            for key, value in kwargs.items():
+                if hasattr(profile, key):
+                    setattr(profile, key, value)
+            profile.updated_at = time.time()
+            self._dirty_ids.add(user_id)
+
+    def mark_dirty(self, user_id: str, profile: UserProfile = None):
+        """
+        标记用户画像已修改
+
+        Args:
+            user_id: 用户ID
+            profile: 被修改的画像对象；画像已被淘汰出缓存时用它重新放入，避免修改丢失
+        """
+        with self._lock:
+            if user_id in self._profiles:
+                self._dirty_ids.add(user_id)
+            elif profile is not None:
+                self._dirty_ids.add(user_id)
+                self._remember(user_id, profile)
+
+    def count(self) -> int:
+        """用户画像总数（含未加载和未落盘的）"""
+        with self._lock:
+            try:
+                persisted = self._conn.execute("SELECT COUNT(*) FROM user_profiles").fetchone()[0]
+            except Exception:
+                persisted = 0
+            unsaved = sum(1 for uid in self._profiles if uid not in self._persisted_at)
+            return persisted + unsaved
+
+    def _collect_dirty(self) -> List[UserProfile]:
+        """收集需要落盘的画像（只看脏集合，与已加载的画像总数无关）"""
+        return [self._profiles[uid] for uid in self._dirty_ids if uid in self._profiles]
+
+    @classmethod
+    def _merge_value(cls, key: Optional[str], base: Any, local: Any, remote: Any) -> Any:
+        """三方合并单个值：只有一方修改时取修改方，双方都修改时按类型合并（_MISSING 表示不存在）"""
+        if local == base or remote == local:
+            return remote
+        if remote == base:
+            return local
+        if key in cls.COUNTER_FIELDS and all(isinstance(v, int) for v in (base, local, remote)):
+            return remote + local - base
+        if isinstance(local, dict) and isinstance(remote, dict):
+            return cls._merge_dict(base if isinstance(base, dict) else {}, local, remote)
+        if isinstance(local, list) and isinstance(remote, list):
+            base = base if isinstance(base, list) else []
+            return remote + [item for item in local if item not in base and item not in remote]
+        # 其余冲突以本进程为准；本进程删除而对方修改时保留对方的值
+        return remote if local is _MISSING else local
+
+    @classmethod
+    def _merge_dict(cls, base: Dict, local: Dict, remote: Dict) -> Dict:
+        merged = {}
+        for key in {**base, **remote, **local}:
+            value = cls._merge_value(key, base.get(key, _MISSING), local.get(key, _MISSING),
+                                     remote.get(key, _MISSING))
+            if value is not _MISSING:
+                merged[key] = value
+        return merged
+
+    def _merge(self, user_id: str, profile: UserProfile, row: Tuple[str, float]):
+        """与其他进程写入的行三方合并，结果原地写回画像对象（调用方持有锁）"""
+        base = json.loads(self._base_data.get(user_id, "{}"))
+        remote = json.loads(row[0])
+        local = json.loads(json.dumps(profile.to_dict(), ensure_ascii=False))
+        merged = self._merge_dict(base, local, remote)
+        merged["created_at"] = min(local["created_at"], remote.get("created_at", local["created_at"]))
+        profile.__dict__.update(UserProfile.from_dict(merged).__dict__)
+        self._merges += 1
+
+    def _write(self, profile: UserProfile):
+        """按版本条件写入一个画像，版本不一致时合并后写入（调用方持有锁并已开启写事务）"""
+        user_id = profile.user_id
+        expected = self._persisted_at.get(user_id)
+        # 版本号必须随每次写入变化，否则其他进程无法察觉
+        if expected is not None and profile.updated_at <= expected:
+            profile.updated_at = max(time.time(), expected + 1e-6)
+        row = self._to_row(profile)
+        if expected is None:
+            cursor = self._conn.execute("INSERT OR IGNORE INTO user_profiles VALUES (?, ?, ?, ?)", row)
+        else:
+            cursor = self._conn.execute(
+                "UPDATE user_profiles SET user_type = ?, data = ?, updated_at = ? "
+                "WHERE user_id = ? AND updated_at = ?",
+                (row[1], row[2], row[3], user_id, expected),
+            )
+        if cursor.rowcount == 0:
+            current = self._read_row(user_id)
+            if current is None:
+                self._conn.execute("INSERT INTO user_profiles VALUES (?, ?, ?, ?)", row)
+            else:
+                self._merge(user_id, profile, current)
+                profile.updated_at = max(time.time(), current[1] + 1e-6, profile.updated_at)
+                row = self._to_row(profile)
+                self._conn.execute(
+                    "UPDATE user_profiles SET user_type = ?, data = ?, updated_at = ? WHERE user_id = ?",
+                    (row[1], row[2], row[3], user_id),
+                )
+        return row
+
+    def save_if_dirty(self) -> int:
+        """只保存有修改的画像，返回写入条数"""
+        with self._lock:
+            profiles = self._collect_dirty()
+            if not profiles:
+                return 0
+            try:
+                # 立即获取写锁，版本检查、合并与写入在同一事务内完成
+                self._conn.execute("BEGIN IMMEDIATE")
+                rows = [self._write(p) for p in profiles]
+                self._conn.commit()
+            except Exception as e:
+                self._conn.rollback()
+                logger.error(f"保存用户画像失败: {e}")
+                return 0
+
+            for row in rows:
+                self._set_base(row[0], row[2], row[3])
+            self._dirty_ids.clear()
+            self._flushes += 1
+            self._rows_written += len(profiles)
+            logger.debug(f"增量保存 {len(profiles)} 个用户画像")
+            return len(profiles)
+
+    def flush(self) -> int:
+        """强制保存（仍只写入有修改的画像）"""
+        return self.save_if_dirty()
+
+    def _start_auto_flush(self):
+        """启动后台刷盘线程"""
+        def auto_flush_worker():
+            while not self._stop_event.wait(self.flush_interval):
+                self.save_if_dirty()
+
+        self._flush_thread = threading.Thread(target=auto_flush_worker, daemon=True)
+        self._flush_thread.start()
+
+    def close(self):
+        """停止后台线程，保存并关闭连接"""
+        self._stop_event.set()
+        if self._flush_thread:
+            self._flush_thread.join(timeout=5)
+        with self._lock:
+            self.save_if_dirty()
+            self._conn.close()
+
+    def stats(self) -> Dict:
+        """获取统计信息"""
+        with self._lock:
+            return {
+                "loaded": len(self._profiles),
+                "pending": len(self._dirty_ids),
+                "lazy_loads": self._loads,
+                "evictions": self._evictions,
+                "flushes": self._flushes,
+                "rows_written": self._rows_written,
+                "reloads": self._reloads,
+                "merges": self._merges,
+                "storage_type": "sqlite",
+            }
+
 
 class MemoryManager:
     """记忆管理器"""
@@ -1422,9 +2564,14 @@ class MemoryManager:
     BACKEND_SQLITE = "sqlite"
     BACKEND_REDIS = "redis"
 
+    # 用户画像存储类型
+    PROFILE_BACKEND_SQLITE = "sqlite"
+    PROFILE_BACKEND_JSON = "json"
+
     def __init__(self, storage_dir: str = None, use_persistence: bool = True,
                  backend: str = "sqlite", redis_config: Dict = None,
-                 use_redis: bool = False):
+                 use_redis: bool = False, profile_backend: str = "sqlite",
+                 semantic_recall: bool = False, embedder: Any = None):
         """
         初始化记忆管理器
 
@@ -1434,9 +2581,13 @@ class MemoryManager:
             backend: 存储后端类型 ("memory", "file", "sqlite", "redis")
             redis_config: Redis 配置
             use_redis: 是否使用 Redis（兼容旧参数）
+            profile_backend: 用户画像存储类型 ("sqlite" 增量存储, "json" 整文件)
+            semantic_recall: 是否启用长期记忆向量召回（需要 numpy）
+            embedder: 向量召回使用的嵌入器，默认使用全局 EmbeddingCache
         """
         self.storage_dir = storage_dir or self.DEFAULT_STORAGE_DIR
         self.use_persistence = use_persistence
+        self.profile_backend = profile_backend
 
         # 兼容旧参数
         if use_redis:
@@ -1454,6 +2605,12 @@ class MemoryManager:
         # 初始化记忆压缩器
         self.compressor = MemoryCompressor(importance_threshold=0.3)
 
+        # 长期记忆向量索引（可选）
+        self.vector_index: Optional[VectorMemoryIndex] = None
+        if semantic_recall:
+            self._init_vector_index(embedder)
+
+        # 仅在没有画像存储（纯内存模式）时保存全部画像；有画像存储时通过 _profile_store 读写
         self.user_profiles: Dict[str, UserProfile] = {}
         self.conversation_summaries: Dict[str, ConversationSummary] = {}
 
@@ -1463,10 +2620,6 @@ class MemoryManager:
 
         self._lock = threading.Lock()
 
-        # 如果有持久化存储，加载用户画像到内存
-        if self._profile_store:
-            self.user_profiles = self._profile_store._profiles
-
         logger.info(f"记忆管理器初始化完成，后端: {backend}")
 
     def _init_stores(self, backend: str, redis_config: Dict = None):
@@ -1486,9 +2639,7 @@ class MemoryManager:
                 db_path=os.path.join(self.storage_dir, "memory.db"),
                 max_size=100000
             )
-            self._profile_store = UserProfileStore(
-                storage_path=os.path.join(self.storage_dir, "user_profiles.json")
-            )
+            self._profile_store = self._create_profile_store()
 
         elif backend == self.BACKEND_REDIS:
             # Redis 模式
@@ -1498,9 +2649,7 @@ class MemoryManager:
                 use_redis=True,
                 redis_config=redis_config
             )
-            self._profile_store = UserProfileStore(
-                storage_path=os.path.join(self.storage_dir, "user_profiles.json")
-            )
+            self._profile_store = self._create_profile_store()
 
         else:
             # 文件模式（默认回退）
@@ -1509,9 +2658,25 @@ class MemoryManager:
                 max_size=100000,
                 use_redis=False
             )
-            self._profile_store = UserProfileStore(
-                storage_path=os.path.join(self.storage_dir, "user_profiles.json")
-            )
+            self._profile_store = self._create_profile_store()
+
+    def _init_vector_index(self, embedder: Any = None):
+        """初始化长期记忆向量索引，依赖缺失时回退到关键词检索"""
+        if not NUMPY_AVAILABLE:
+            logger.warning("未安装 numpy，长期记忆向量召回已禁用")
+            return
+        vector_dir = os.path.join(self.storage_dir, "vectors") if self.use_persistence else None
+        self.vector_index = VectorMemoryIndex(storage_dir=vector_dir, embedder=embedder)
+
+    def _create_profile_store(self):
+        """创建用户画像存储"""
+        json_path = os.path.join(self.storage_dir, "user_profiles.json")
+        if self.profile_backend == self.PROFILE_BACKEND_JSON:
+            return UserProfileStore(storage_path=json_path)
+        return SQLiteProfileStore(
+            db_path=os.path.join(self.storage_dir, "user_profiles.db"),
+            legacy_json_path=json_path,
+        )
 
     # === 短期记忆操作 ===
 
@@ -1554,18 +2719,119 @@ class MemoryManager:
             metadata={"user_id": user_id, **(metadata or {})}
         )
         self.long_term.save(item)
+
+        # 写入时嵌入一次
+        if self.vector_index:
+            try:
+                self.vector_index.add(user_id, item_id, memory_text(content))
+            except Exception as e:
+                logger.warning(f"长期记忆嵌入失败，仅支持关键词检索: {e}")
         return item_id
 
     def search_long_term(self, user_id: str, query: str,
-                         limit: int = 5) -> List[MemoryItem]:
-        """搜索长期记忆"""
+                         limit: int = 5, semantic: bool = None) -> List[MemoryItem]:
+        """
+        搜索长期记忆
+
+        Args:
+            user_id: 用户ID
+            query: 查询文本
+            limit: 返回条数
+            semantic: 是否使用向量召回，None 表示启用索引时自动使用
+
+        Returns:
+            记忆列表；向量召回时关键词命中优先，其余按余弦相似度补足
+        """
         results = []
         for item in self.long_term.store.values():
             if item.metadata.get("user_id") == user_id:
                 if query.lower() in str(item.content).lower():
                     results.append(item)
         results.sort(key=lambda x: (x.importance, x.last_access), reverse=True)
-        return results[:limit]
+        results = results[:limit]
+
+        if semantic is None:
+            semantic = self.vector_index is not None
+        if not semantic or not self.vector_index or len(results) >= limit:
+            return results
+
+        try:
+            query_vec = self.vector_index.embed_query(query)
+        except Exception as e:
+            logger.warning(f"长期记忆向量召回失败: {e}")
+            return results
+
+        # 关键词命中与失效向量都会占用 top-k 名额，不足时扩大 k 继续取
+        seen = {item.id for item in results}
+        k = limit + len(results)
+        while len(results) < limit:
+            hits = self.vector_index.search_vector(user_id, query_vec, k=k)
+            for item_id, _score in hits:
+                if len(results) >= limit:
+                    break
+                if item_id in seen:
+                    continue
+                seen.add(item_id)
+                # 向量补足的条目不计入访问统计
+                item = self.long_term.peek(item_id)
+                if item is None:
+                    # 存储中已淘汰，清理失效向量
+                    self.vector_index.remove(user_id, item_id)
+                    continue
+                results.append(item)
+            if len(hits) < k:
+                break
+            k *= 2
+        return results
+
+    def _delete_long_term(self, item: MemoryItem):
+        """删除长期记忆及其向量"""
+        self.long_term.delete(item.id)
+        if self.vector_index:
+            uid = item.metadata.get("user_id")
+            if uid:
+                self.vector_index.remove(uid, item.id)
+
+    def backfill_vectors(self, user_id: str = None, batch_size: int = 64) -> int:
+        """
+        为尚未嵌入的长期记忆批量补建向量
+
+        Args:
+            user_id: 可选，只处理指定用户
+            batch_size: 每批嵌入条数
+
+        Returns:
+            新写入的向量条数
+        """
+        if not self.vector_index:
+            raise RuntimeError("未启用长期记忆向量召回")
+
+        if isinstance(self.long_term, SQLiteMemoryStore):
+            items = self.long_term.iter_items(user_id=user_id)
+        else:
+            items = (
+                item for item in self.long_term.store.values()
+                if user_id is None or item.metadata.get("user_id") == user_id
+            )
+
+        pending: Dict[str, List[Tuple[str, str]]] = {}
+        written = 0
+        for item in items:
+            uid = item.metadata.get("user_id")
+            if not uid or self.vector_index.contains(uid, item.id):
+                continue
+            batch = pending.setdefault(uid, [])
+            batch.append((item.id, memory_text(item.content)))
+            if len(batch) >= batch_size:
+                written += self.vector_index.add_many(uid, batch)
+                pending[uid] = []
+
+        for uid, batch in pending.items():
+            written += self.vector_index.add_many(uid, batch)
+
+        self.vector_index.flush()
+        logger.info(f"长期记忆向量补建完成: {written} 条")
+        return written
 
     # === 工作记忆操作 ===
 
@@ -1614,9 +2880,7 @@ class MemoryManager:
                                user_type: str = "c_end") -> UserProfile:
         """获取或创建用户画像"""
         if self._profile_store:
-            profile = self._profile_store.get_or_create(user_id, user_type)
-            self.user_profiles[user_id] = profile
-            return profile
+            return self._profile_store.get_or_create(user_id, user_type)
         else:
             if user_id not in self.user_profiles:
                 self.user_profiles[user_id] = UserProfile(
@@ -1633,7 +2897,7 @@ class MemoryManager:
                 setattr(profile, key, value)
         profile.updated_at = time.time()
         if self._profile_store:
-            self._profile_store._dirty = True
+            self._profile_store.mark_dirty(user_id, profile)
 
     def record_interaction(self, user_id: str, interaction_type: str,
                            content: str, metadata: Dict = None):
@@ -1651,7 +2915,7 @@ class MemoryManager:
         profile.total_messages += 1
         profile.updated_at = time.time()
         if self._profile_store:
-            self._profile_store._dirty = True
+            self._profile_store.mark_dirty(user_id, profile)
 
     # === 对话摘要操作 ===
 
@@ -1772,8 +3036,11 @@ class MemoryManager:
         }
 
         # 用户画像
-        if user_id in self.user_profiles:
-            profile = self.user_profiles[user_id]
+        if self._profile_store:
+            profile = self._profile_store.get(user_id)
+        else:
+            profile = self.user_profiles.get(user_id)
+        if profile:
             context["user_profile"] = {
                 "user_type": profile.user_type,
                 "interests": profile.interests,
@@ -1873,7 +3140,7 @@ class MemoryManager:
         deleted_count = 0
         for mem in all_memories:
             if mem.id not in retained_ids:
-                self.long_term.delete(mem.id)
+                self._delete_long_term(mem)
                 deleted_count += 1
 
         logger.info(f"遗忘曲线应用完成: 删除 {deleted_count} 条记忆")
@@ -1897,15 +3164,21 @@ class MemoryManager:
         # 合并相似记忆
         merged = self.compressor.merge_memories(user_memories)
 
-        # 如果有合并发生，更新存储
+        # 如果有合并发生，只更新受影响的记忆
         if len(merged) < len(user_memories):
-            # 删除旧记忆
+            merged_ids = {mem.id for mem in merged}
+            original = {id(mem) for mem in user_memories}
+
+            # 删除被合并掉的记忆
             for mem in user_memories:
-                self.long_term.delete(mem.id)
+                if mem.id not in merged_ids:
+                    self._delete_long_term(mem)
+                    self.compressor.similarity_index.invalidate(mem.id)
 
             # 保存合并后的记忆
             for mem in merged:
-                self.long_term.save(mem)
+                if id(mem) not in original:
+                    self.long_term.save(mem)
 
             logger.info(f"用户 {user_id} 记忆合并: {len(user_memories)} -> {len(merged)}")
 
@@ -1942,11 +3215,15 @@ class MemoryManager:
             self.long_term.flush()
         if self._profile_store:
             self._profile_store.flush()
+        if self.vector_index:
+            self.vector_index.flush()
         logger.info("记忆系统数据已保存")
 
     def shutdown(self):
         """关闭记忆管理器，保存所有数据"""
         self.flush()
+        if self._profile_store:
+            self._profile_store.close()
         logger.info("记忆管理器已关闭")
 
     def get_stats(self) -> Dict:
@@ -1955,11 +3232,16 @@ class MemoryManager:
             "short_term": self.short_term.stats(),
             "long_term": self.long_term.stats(),
             "working": self.working.stats(),
-            "user_profiles_count": len(self.user_profiles),
+            "user_profiles_count": (
+                self._profile_store.count() if self._profile_store else len(self.user_profiles)
+            ),
             "conversation_summaries_count": len(self.conversation_summaries),
             "kg_nodes_count": len(self.kg_nodes),
             "kg_edges_count": len(self.kg_edges),
+            "similarity_index": self.compressor.similarity_index.stats(),
         }
+        if self.vector_index:
+            stats["vector_index"] = self.vector_index.stats()
         return stats
 
 
@@ -1975,6 +3257,8 @@ def get_memory_manager() -> MemoryManager:
     从环境变量读取配置：
     - MEMORY_PERSIST: 是否持久化 (true/false)
     - MEMORY_BACKEND: 后端类型 (memory/file/sqlite/redis)
+    - MEMORY_PROFILE_BACKEND: 用户画像存储类型 (sqlite/json)
+    - MEMORY_SEMANTIC_RECALL: 是否启用长期记忆向量召回 (true/false)
     """
     global _memory_manager
     if _memory_manager is None:
@@ -1983,6 +3267,8 @@ def get_memory_manager() -> MemoryManager:
                 # 从环境变量读取配置
                 use_persistence = os.environ.get("MEMORY_PERSIST", "true").lower() == "true"
                 backend = os.environ.get("MEMORY_BACKEND", "sqlite")
+                profile_backend = os.environ.get("MEMORY_PROFILE_BACKEND", "sqlite")
+                semantic_recall = os.environ.get("MEMORY_SEMANTIC_RECALL", "false").lower() == "true"
 
                 # Redis 配置
                 redis_config = None
@@ -1997,5 +3283,7 @@ def get_memory_manager() -> MemoryManager:
                     use_persistence=use_persistence,
                     backend=backend,
                     redis_config=redis_config,
+                    profile_backend=profile_backend,
+                    semantic_recall=semantic_recall,
                 )
     return _memory_manager
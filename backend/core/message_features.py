@@ -0,0 +1,189 @@
+"""
+消息关键词特征
+
+各规则检测器（任务复杂度、阶段识别、工具意图、兴趣/痛点、问题聚类等）原本各自对消息逐个执行
+`kw in text`，同一条消息被扫描几十遍。这里把所有检测器的词表注册到同一个 Aho-Corasick 自动机，
+每条消息只扫描一次，得到 MessageFeatures，各检测器从中读取自己词表的命中结果。
+
+- 词表按命名空间注册（如 "task.complex"、"stage.c_end.施工.explicit"），通常在模块导入时注册
+- matched(namespace) 按词表中的顺序返回命中的关键词，与逐个 `kw in text` 的结果与顺序一致
+- 同一条消息的特征缓存在 LRU 中，一次请求内多个检测器共用一次扫描；
+  检测器拿到的通常是同一个字符串对象，最近一条消息按对象身份直接命中，不加锁
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from backend.core.aho_corasick import AhoCorasick
+
+DEFAULT_CACHE_SIZE = 256
+
+
+class MessageFeatures:
+    """一条消息的关键词命中结果"""
+
+    __slots__ = ("text", "_hits", "_vocabularies")
+
+    def __init__(self, text: str, hits: Dict[str, List[int]], vocabularies: Dict[str, Tuple[str, ...]]):
+        self.text = text
+        self._hits = hits                  # 命名空间 -> 命中关键词在词表中的下标（递增）
+        self._vocabularies = vocabularies
+
+    def matched(self, namespace: str) -> List[str]:
+        """命中的关键词（按词表顺序）"""
+        indexes = self._hits.get(namespace)
+        if not indexes:
+            return []
+        vocabulary = self._vocabularies[namespace]
+        return [vocabulary[i] for i in indexes]
+
+    def has(self, namespace: str) -> bool:
+        """是否命中词表中任一关键词"""
+        return namespace in self._hits
+
+    def first(self, namespace: str) -> Optional[str]:
+        """词表中第一个命中的关键词"""
+        indexes = self._hits.get(namespace)
+        return self._vocabularies[namespace][indexes[0]] if indexes else None
+
+    @property
+    def namespaces(self) -> List[str]:
+        """有命中的命名空间（词表多时只遍历命中的部分）"""
+        return list(self._hits)
+
+
+class KeywordEngine:
+    """
+    关键词特征引擎
+
+    注册或替换词表后，自动机在下一次分析时重新构建一次（批量注册只构建一次），
+    并清空特征缓存。分析使用构建好的快照，与并发注册互不干扰。
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._vocabularies: Dict[str, Tuple[str, ...]] = {}
+        self._compiled: Optional[tuple] = None
+        self._cache: "OrderedDict[str, MessageFeatures]" = OrderedDict()
+        self._last: Optional[tuple] = None  # (编译结果, 最近一条消息的特征)
+        self._lock = threading.Lock()
+        self._scans = 0
+        self._cache_hits = 0
+
+    def register(self, namespace: str, keywords: Iterable[str]) -> None:
+        """
+        注册词表（同名命名空间覆盖）
+
+        Args:
+            namespace: 命名空间
+            keywords: 关键词（保持顺序；传入字典时取键）
+        """
+        with self._lock:
+            self._vocabularies[namespace] = tuple(keywords)
+            self._compiled = None
+            self._cache.clear()
+            self._last = None
+
+    def register_groups(self, prefix: str, groups: Mapping[str, Iterable[str]]) -> Dict[str, str]:
+        """
+        按分组注册词表，命名空间为 "{prefix}.{分组名}"
+
+        Returns:
+            {分组名: 命名空间}（按分组顺序），供检测器直接查询
+        """
+        namespaces = {}
+        for name, keywords in groups.items():
+            namespaces[name] = f"{prefix}.{name}"
+            self.register(namespaces[name], keywords)
+        return namespaces
+
+    def _compile(self) -> tuple:
+        with self._lock:
+            if self._compiled is not None:
+                return self._compiled
+            vocabularies = dict(self._vocabularies)
+            # 关键词 -> [(命名空间, 词表下标)]，作为自动机中该模式串的值
+            tags: Dict[str, List[Tuple[str, int]]] = {}
+            for namespace, keywords in vocabularies.items():
+                for index, keyword in enumerate(keywords):
+                    tags.setdefault(keyword, []).append((namespace, index))
+            automaton = AhoCorasick(ignore_case=False)
+            for keyword, keyword_tags in tags.items():
+                automaton.add(keyword, tuple(keyword_tags))
+            automaton.build()
+            self._compiled = (automaton, vocabularies)
+            return self._compiled
+
+    def analyze(self, text: str) -> MessageFeatures:
+        """
+        分析消息（同一文本命中缓存）
+
+        Args:
+            text: 消息文本
+
+        Returns:
+            MessageFeatures
+        """
+        compiled = self._compiled or self._compile()
+        last = self._last
+        if last is not None and last[1].text is text and last[0] is compiled:
+            return last[1]
+
+        with self._lock:
+            features = self._cache.get(text)
+            if features is not None and self._compiled is compiled:
+                self._cache.move_to_end(text)
+                self._cache_hits += 1
+                self._last = (compiled, features)
+                return features
+
+        automaton, vocabularies = compiled
+        hits: Dict[str, List[int]] = {}
+        for keyword_tags in automaton.distinct_values(text):
+            for namespace, index in keyword_tags:
+                indexes = hits.get(namespace)
+                if indexes is None:
+                    hits[namespace] = [index]
+                else:
+                    indexes.append(index)
+                    indexes.sort()
+        features = MessageFeatures(text, hits, vocabularies)
+
+        with self._lock:
+            self._scans += 1
+            # 扫描期间有新注册时不缓存过期结果
+            if self._compiled is compiled:
+                self._cache[text] = features
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+                self._last = (compiled, features)
+        return features
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "namespaces": len(self._vocabularies),
+                "keywords": len(self._compiled[0]) if self._compiled else 0,
+                "scans": self._scans,
+                "cache_hits": self._cache_hits,
+                "cached": len(self._cache),
+            }
+
+
+_keyword_engine: Optional[KeywordEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_keyword_engine() -> KeywordEngine:
+    """获取全局关键词特征引擎"""
+    global _keyword_engine
+    if _keyword_engine is None:
+        with _engine_lock:
+            if _keyword_engine is None:
+                _keyword_engine = KeywordEngine()
+    return _keyword_engine
+
+
+def analyze_message(text: str) -> MessageFeatures:
+    """用全局引擎分析消息"""
+    return get_keyword_engine().analyze(text)
@@ -0,0 +1,382 @@
+"""
+请求指标模块
+基于固定分桶直方图的请求耗时统计：
+
+- 按 (方法, 路由, 状态码类别) 分序列，每个序列独立加锁（分片锁），记录为 O(log 桶数)
+- 桶边界固定（每个数量级 10 个对数间隔桶），直方图可直接相加，多 worker 精确合并
+- 环形时间槽保存最近 5 分钟的分桶计数，输出 1m / 5m 滑动窗口的 p50 / p95 / p99
+- 快照为纯 JSON 结构，可跨进程汇总并渲染为 Prometheus 文本格式
+"""
+import bisect
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+# 桶上界（秒）：0.1ms ~ 100s，每个数量级 10 个桶，相邻边界比约 1.26
+_MANTISSAS = (1.0, 1.25, 1.6, 2.0, 2.5, 3.2, 4.0, 5.0, 6.4, 8.0)
+BUCKET_BOUNDS: Tuple[float, ...] = tuple(
+    round(m * 10 ** e, 6) for e in range(-4, 2) for m in _MANTISSAS
+) + (100.0,)
+
+# Prometheus 输出使用的粗粒度边界（均为 BUCKET_BOUNDS 的子集，累计值精确）
+PROMETHEUS_BOUNDS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0,
+)
+
+# 滑动窗口：时间槽长度与窗口定义（窗口名 -> 时间槽个数）
+SLOT_SECONDS = 10
+WINDOWS: Dict[str, int] = {"1m": 6, "5m": 30}
+_NUM_SLOTS = max(WINDOWS.values())
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# 未匹配到路由的请求统一归到该路径，避免路径标签无限增长
+UNMATCHED_PATH = "<unmatched>"
+
+
+def status_class(status_code: int) -> str:
+    """状态码类别，如 200 -> "2xx" """
+    return f"{status_code // 100}xx"
+
+
+def bucket_index(duration: float) -> int:
+    """耗时所在桶的下标（最后一个桶为 +Inf）"""
+    return bisect.bisect_left(BUCKET_BOUNDS, duration)
+
+
+def quantile_from_buckets(counts: List[int], q: float) -> float:
+    """
+    由分桶计数估算分位数（秒）
+
+    在目标桶内按线性插值，相对误差不超过相邻桶边界比（约 26%），
+    落在 +Inf 桶时返回最大边界。
+    """
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+    rank = q * total
+    seen = 0
+    for i, c in enumerate(counts):
+        if c and seen + c >= rank:
+            if i >= len(BUCKET_BOUNDS):
+                return BUCKET_BOUNDS[-1]
+            lower = BUCKET_BOUNDS[i - 1] if i > 0 else 0.0
+            upper = BUCKET_BOUNDS[i]
+            return lower + (upper - lower) * (rank - seen) / c
+        seen += c
+    return BUCKET_BOUNDS[-1]
+
+
+class _Series:
+    """单个 (方法, 路由, 状态码类别) 的耗时直方图"""
+
+    __slots__ = ("lock", "counts", "count", "sum", "min", "max", "slot_ids", "slot_counts")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        n = len(BUCKET_BOUNDS) + 1
+        self.counts = [0] * n
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.slot_ids = [-1] * _NUM_SLOTS
+        self.slot_counts = [[0] * n for _ in range(_NUM_SLOTS)]
+
+    def observe(self, duration: float, now: float) -> None:
+        b = bucket_index(duration)
+        slot_id = int(now // SLOT_SECONDS)
+        i = slot_id % _NUM_SLOTS
+        with self.lock:
+            if self.slot_ids[i] != slot_id:
+                self.slot_ids[i] = slot_id
+                self.slot_counts[i] = [0] * len(self.counts)
+            self.slot_counts[i][b] += 1
+            self.counts[b] += 1
+            self.count += 1
+            self.sum += duration
+            if duration < self.min:
+                self.min = duration
+            if duration > self.max:
+                self.max = duration
+
+    def window_counts(self, now: float, slots: int) -> List[int]:
+        """最近 slots 个时间槽（含当前槽）的分桶计数"""
+        current = int(now // SLOT_SECONDS)
+        merged = [0] * len(self.counts)
+        with self.lock:
+            for slot_id, counts in zip(self.slot_ids, self.slot_counts):
+                if current - slots < slot_id <= current:
+                    for b, c in enumerate(counts):
+                        if c:
+                            merged[b] += c
+        return merged
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        with self.lock:
+            data = {
+                "count": self.count,
+                "sum": self.sum,
+                "min": self.min if self.count else 0.0,
+                "max": self.max,
+                "buckets": list(self.counts),
+            }
+        data["windows"] = {name: self.window_counts(now, slots) for name, slots in WINDOWS.items()}
+        return data
+
+
+class RequestMetrics:
+    """
+    请求性能指标收集器
+
+    每个序列独立加锁，只有首次出现新序列时才获取全局锁；
+    get_stats() / snapshot() 不阻塞记录路径上的其他序列。
+    """
+
+    def __init__(self):
+        self._series: Dict[Tuple[str, str, str], _Series] = {}
+        self._series_lock = threading.Lock()
+        self._active = 0
+        self._active_lock = threading.Lock()
+
+    def _get_series(self, key: Tuple[str, str, str]) -> _Series:
+        series = self._series.get(key)
+        if series is None:
+            with self._series_lock:
+                series = self._series.get(key)
+                if series is None:
+                    series = _Series()
+                    self._series[key] = series
+        return series
+
+    def record_request(self, path: str, method: str, duration: float,
+                       status_code: int, request_id: str = None):
+        """记录请求指标"""
+        key = (method, path, status_class(status_code))
+        self._get_series(key).observe(duration, time.time())
+
+    def increment_active(self):
+        """增加活跃请求数"""
+        with self._active_lock:
+            self._active += 1
+
+    def decrement_active(self):
+        """减少活跃请求数"""
+        with self._active_lock:
+            self._active -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """可序列化、可跨进程合并的指标快照"""
+        now = time.time()
+        series = [
+            {"method": method, "path": path, "status": status, **s.snapshot(now)}
+            for (method, path, status), s in list(self._series.items())
+        ]
+        return {
+            "bounds": list(BUCKET_BOUNDS),
+            "generated_at": now,
+            "active_requests": self._active,
+            "series": series,
+        }
+
+    def get_stats(self) -> dict:
+        """获取统计信息"""
+        return stats_from_snapshot(self.snapshot())
+
+
+# === 快照合并与输出 ===
+
+def _add_into(target: List[int], source: Iterable[int]) -> None:
+    for i, c in enumerate(source):
+        target[i] += c
+
+
+def merge_snapshots(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    合并多个进程的快照
+
+    计数、分桶逐项相加，最小/最大值取极值；桶边界不一致的快照被忽略。
+    """
+    bounds = list(BUCKET_BOUNDS)
+    merged: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    active = 0
+    generated_at = 0.0
+
+    for snapshot in snapshots:
+        if not snapshot or snapshot.get("bounds") != bounds:
+            continue
+        active += snapshot.get("active_requests", 0)
+        generated_at = max(generated_at, snapshot.get("generated_at", 0.0))
+        for s in snapshot.get("series", []):
+            key = (s["method"], s["path"], s["status"])
+            target = merged.get(key)
+            if target is None:
+                merged[key] = {
+                    **s,
+                    "buckets": list(s["buckets"]),
+                    "windows": {name: list(c) for name, c in s["windows"].items()},
+                }
+                continue
+            target["count"] += s["count"]
+            target["sum"] += s["sum"]
+            target["min"] = min(target["min"], s["min"])
+            target["max"] = max(target["max"], s["max"])
+            _add_into(target["buckets"], s["buckets"])
+            for name, counts in s["windows"].items():
+                if name in target["windows"]:
+                    _add_into(target["windows"][name], counts)
+                else:
+                    target["windows"][name] = list(counts)
+
+    return {
+        "bounds": bounds,
+        "generated_at": generated_at,
+        "active_requests": active,
+        "series": list(merged.values()),
+    }
+
+
+def _quantiles_ms(counts: List[int]) -> Dict[str, float]:
+    return {
+        f"p{int(q * 100)}": quantile_from_buckets(counts, q) * 1000
+        for q in QUANTILES
+    }
+
+
+def stats_from_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    由快照生成 JSON 统计
+
+    全局与各端点的 p50/p95/p99 基于 5m 滑动窗口，另附各窗口的请求数与分位数；
+    计数、均值、最小/最大值为进程启动以来的累计值。
+    """
+    n = len(BUCKET_BOUNDS) + 1
+    total_requests = 0
+    total_errors = 0
+    total_time = 0.0
+    overall_windows = {name: [0] * n for name in WINDOWS}
+    endpoints: Dict[str, Dict[str, Any]] = {}
+
+    for s in snapshot.get("series", []):
+        is_error = s["status"] in ("4xx", "5xx")
+        total_requests += s["count"]
+        total_errors += s["count"] if is_error else 0
+        total_time += s["sum"]
+        for name, counts in s["windows"].items():
+            if name in overall_windows:
+                _add_into(overall_windows[name], counts)
+
+        key = f"{s['method']}:{s['path']}"
+        ep = endpoints.get(key)
+        if ep is None:
+            ep = endpoints[key] = {
+                "count": 0,
+                "errors": 0,
+                "total_time": 0.0,
+                "min_time": float("inf"),
+                "max_time": 0.0,
+                "status_classes": {},
+                "_window": [0] * n,
+            }
+        ep["count"] += s["count"]
+        ep["errors"] += s["count"] if is_error else 0
+        ep["total_time"] += s["sum"]
+        if s["count"]:
+            ep["min_time"] = min(ep["min_time"], s["min"])
+        ep["max_time"] = max(ep["max_time"], s["max"])
+        ep["status_classes"][s["status"]] = ep["status_classes"].get(s["status"], 0) + s["count"]
+        _add_into(ep["_window"], s["windows"].get("5m", []))
+
+    endpoint_stats = {}
+    for key, ep in endpoints.items():
+        window = ep.pop("_window")
+        ep["avg_time_ms"] = ep["total_time"] / ep["count"] * 1000 if ep["count"] else 0
+        ep["min_time_ms"] = ep["min_time"] * 1000 if ep["min_time"] != float("inf") else 0
+        ep["max_time_ms"] = ep["max_time"] * 1000
+        ep["min_time"] = ep["min_time"] if ep["min_time"] != float("inf") else 0
+        for name, value in _quantiles_ms(window).items():
+            ep[f"{name}_ms"] = value
+        endpoint_stats[key] = ep
+
+    overall = _quantiles_ms(overall_windows["5m"])
+    return {
+        "total_requests": total_requests,
+        "total_errors": total_errors,
+        "error_rate": total_errors / total_requests if total_requests > 0 else 0,
+        "active_requests": snapshot.get("active_requests", 0),
+        "avg_response_time_ms": total_time / total_requests * 1000 if total_requests > 0 else 0,
+        "p50_response_time_ms": overall["p50"],
+        "p95_response_time_ms": overall["p95"],
+        "p99_response_time_ms": overall["p99"],
+        "windows": {
+            name: {"count": sum(counts), **{f"{k}_ms": v for k, v in _quantiles_ms(counts).items()}}
+            for name, counts in overall_windows.items()
+        },
+        "endpoint_stats": endpoint_stats,
+    }
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_float(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def render_prometheus(snapshot: Dict[str, Any], prefix: str = "decopilot") -> str:
+    """
+    将快照渲染为 Prometheus 文本格式（0.0.4）
+
+    - <prefix>_http_request_duration_seconds: 累计直方图（粗粒度 le 边界）
+    - <prefix>_http_request_duration_window_seconds: 滑动窗口分位数（gauge）
+    - <prefix>_http_requests_in_flight: 进行中的请求数
+    """
+    name = f"{prefix}_http_request_duration_seconds"
+    window_name = f"{prefix}_http_request_duration_window_seconds"
+    lines = [
+        f"# HELP {name} HTTP request latency in seconds.",
+        f"# TYPE {name} histogram",
+    ]
+
+    # 粗粒度边界在细粒度桶中的下标（边界相同，累计值精确）
+    cut_points = [BUCKET_BOUNDS.index(b) for b in PROMETHEUS_BOUNDS]
+    series = sorted(snapshot.get("series", []), key=lambda s: (s["path"], s["method"], s["status"]))
+
+    for s in series:
+        labels = (f'method="{_escape_label(s["method"])}",path="{_escape_label(s["path"])}",'
+                  f'status="{s["status"]}"')
+        cumulative = 0
+        position = 0
+        buckets = s["buckets"]
+        for bound, cut in zip(PROMETHEUS_BOUNDS, cut_points):
+            while position <= cut:
+                cumulative += buckets[position]
+                position += 1
+            lines.append(f'{name}_bucket{{{labels},le="{_format_float(bound)}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {s["count"]}')
+        lines.append(f"{name}_sum{{{labels}}} {_format_float(s['sum'])}")
+        lines.append(f"{name}_count{{{labels}}} {s['count']}")
+
+    lines.append(f"# HELP {window_name} HTTP request latency quantiles over sliding windows.")
+    lines.append(f"# TYPE {window_name} gauge")
+    for s in series:
+        labels = (f'method="{_escape_label(s["method"])}",path="{_escape_label(s["path"])}",'
+                  f'status="{s["status"]}"')
+        for window, counts in sorted(s["windows"].items()):
+            if not sum(counts):
+                continue
+            for q in QUANTILES:
+                value = quantile_from_buckets(counts, q)
+                lines.append(
+                    f'{window_name}{{{labels},window="{window}",quantile="{q}"}} {_format_float(value)}'
+                )
+
+    lines.append(f"# HELP {prefix}_http_requests_in_flight HTTP requests currently being served.")
+    lines.append(f"# TYPE {prefix}_http_requests_in_flight gauge")
+    lines.append(f"{prefix}_http_requests_in_flight {snapshot.get('active_requests', 0)}")
+    return "\n".join(lines) + "\n"
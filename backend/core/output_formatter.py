@@ -1,13 +1,30 @@
 """
 输出格式化器
 统一管理智能体的输出格式，支持多种结构化输出类型
+
+流式输出按 NDJSON 逐帧生成：帧的固定前缀预先渲染，只序列化变化的部分；
+安装了 orjson 时用其编码。coalesce_frames() 在很短的时间/大小窗口内把连续的
+answer 帧合并成一帧，减少逐 token 的序列化与 HTTP 分块。
 """
+import asyncio
 import json
+import os
 import time
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Union
 from dataclasses import dataclass, asdict
-from datetime import datetime
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# answer 帧合并窗口：首个待发送片段最多等待的毫秒数（0 表示不合并）
+STREAM_COALESCE_MS = float(os.getenv("STREAM_COALESCE_MS", "20"))
+# 合并后的 answer 内容达到该字符数时立即发送
+STREAM_COALESCE_BYTES = int(os.getenv("STREAM_COALESCE_BYTES", "2048"))
 
 
 class OutputType(str, Enum):
@@ -138,6 +155,140 @@ class StreamMeta:
     total_tokens: Optional[int] = None
 
 
+# === NDJSON 帧渲染 ===
+
+def dumps(obj: Any) -> str:
+    """序列化为紧凑 JSON 字符串（保留中文等非 ASCII 字符）"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # 超出 64 位的整数等 orjson 不支持的值
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# 预渲染的帧前缀
+ANSWER_FRAME_PREFIX = '{"type":"answer","content":'
+_ANSWER_OPEN = ANSWER_FRAME_PREFIX + '"'
+_ANSWER_CLOSE = '"}\n'
+_DATA_FRAME_PREFIXES = {t: f'{{"type":"{t.value}","data":' for t in OutputType}
+
+
+def render_answer(content: str) -> str:
+    """渲染 answer 帧：{"type":"answer","content":"..."}"""
+    return ANSWER_FRAME_PREFIX + dumps(content) + "}\n"
+
+
+def _is_answer_frame(frame: str) -> bool:
+    return frame.startswith(_ANSWER_OPEN) and frame.endswith(_ANSWER_CLOSE)
+
+
+async def coalesce_frames(
+    frames: AsyncIterable[str],
+    window_ms: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+) -> AsyncIterator[str]:
+    """
+    合并连续的 answer 帧
+
+    第一个 answer 帧立即发送（不影响首字延迟）；之后的 answer 片段到达时开始计时，
+    window_ms 内到达的片段拼成一帧发送；内容达到 max_bytes 或遇到其他类型的帧时提前发送。
+    其他帧与之前缓冲的 answer 帧作为一个分块发送，顺序不变。
+    JSON 字符串转义是逐字符的，合并时直接拼接已编码的内容，不重新序列化。
+
+    上游由一个读取任务驱动，计时用 loop.call_later，不为每一帧创建任务。
+
+    Args:
+        frames: 上游 NDJSON 帧（answer 帧需由 render_answer/OutputFormatter.answer 生成）
+        window_ms: 合并窗口（毫秒），默认 STREAM_COALESCE_MS，0 表示原样透传
+        max_bytes: 单帧内容上限（字符），默认 STREAM_COALESCE_BYTES
+    """
+    window = (STREAM_COALESCE_MS if window_ms is None else window_ms) / 1000
+    limit = STREAM_COALESCE_BYTES if max_bytes is None else max_bytes
+
+    if window <= 0:
+        async for frame in frames:
+            yield frame
+        return
+
+    loop = asyncio.get_running_loop()
+    ready: List[str] = []   # 可发送的完整帧
+    parts: List[str] = []   # 合并中的 answer 内容（已转义）
+    size = 0
+    timer: Optional[asyncio.TimerHandle] = None
+    finished = False
+    error: Optional[BaseException] = None
+    wake = asyncio.Event()      # 有内容需要发送
+    drained = asyncio.Event()   # 缓冲已被取走（读取任务的背压）
+
+    def take() -> str:
+        nonlocal parts, size, timer
+        if timer is not None:
+            timer.cancel()
+            timer = None
+        if parts:
+            ready.append(_ANSWER_OPEN + "".join(parts) + _ANSWER_CLOSE)
+            parts, size = [], 0
+        chunk = "".join(ready)
+        ready.clear()
+        return chunk
+
+    async def pump():
+        nonlocal size, timer, finished, error
+        first_answer = True
+        try:
+            async for frame in frames:
+                if not _is_answer_frame(frame):
+                    if parts:
+                        ready.append(_ANSWER_OPEN + "".join(parts) + _ANSWER_CLOSE)
+                        parts.clear()
+                        size = 0
+                    ready.append(frame)
+                    wake.set()
+                elif first_answer:
+                    first_answer = False
+                    ready.append(frame)
+                    wake.set()
+                else:
+                    body = frame[len(_ANSWER_OPEN):-len(_ANSWER_CLOSE)]
+                    if not parts and timer is None:
+                        timer = loop.call_later(window, wake.set)
+                    parts.append(body)
+                    size += len(body)
+                    if size >= limit:
+                        wake.set()
+
+                if size >= limit or len(ready) >= 64:
+                    drained.clear()
+                    await drained.wait()
+        except Exception as e:
+            error = e
+        finally:
+            finished = True
+            wake.set()
+
+    reader = asyncio.ensure_future(pump())
+    try:
+        while True:
+            await wake.wait()
+            wake.clear()
+            done = finished
+            chunk = take()
+            drained.set()
+            if chunk:
+                yield chunk
+            if done:
+                break
+        if error is not None:
+            raise error
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if not reader.done():
+            reader.cancel()
+
+
 class OutputFormatter:
     """输出格式化器"""
 
@@ -149,13 +300,8 @@ class OutputFormatter:
         self.collections_used: List[str] = []
 
     def format(self, output_type: OutputType, data: Any) -> str:
-        """格式化输出为JSON字符串"""
-        output = {
-            "type": output_type.value,
-            "data": self._serialize(data),
-            "timestamp": datetime.now().isoformat(),
-        }
-        return json.dumps(output, ensure_ascii=False) + "\n"
+        """格式化输出为JSON字符串（{"type":...,"data":...}）"""
+        return _DATA_FRAME_PREFIXES[output_type] + dumps(self._serialize(data)) + "}\n"
 
     def _serialize(self, data: Any) -> Any:
         """序列化数据"""
@@ -182,16 +328,12 @@ class OutputFormatter:
         }
         if reasoning_type:
             output["reasoning_type"] = reasoning_type
-        return json.dumps(output, ensure_ascii=False) + "\n"
+        return dumps(output) + "\n"
 
     def answer(self, content: str) -> str:
         """回答内容输出（流式，兼容前端格式）"""
         # 前端期望: {"type": "answer", "content": "..."}
-        output = {
-            "type": "answer",
-            "content": content,
-        }
-        return json.dumps(output, ensure_ascii=False) + "\n"
+        return render_answer(content)
 
     def error(self, message: str, code: str = "UNKNOWN") -> str:
         """错误输出"""
@@ -240,7 +382,7 @@ class OutputFormatter:
             "type": "expert_debug",
             "data": data,
         }
-        return json.dumps(output, ensure_ascii=False) + "\n"
+        return dumps(output) + "\n"
 
     # === 结构化数据输出方法 ===
 
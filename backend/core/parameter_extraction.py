@@ -0,0 +1,267 @@
+"""
+消息参数提取
+
+金额、面积、品类、风格、统计周期的提取原先在 EnhancedAgent._extract_* 与 function_calling.ParameterExtractor
+中各有一份，智能体的版本每次调用都在函数内 import re 并重新编译模式；同一条消息还会被工具回退路径与
+Function Calling 路径各解析一遍。这里集中为一个模块：
+- 正则在导入时编译；品类、商品、风格词表走关键词特征引擎，与规则检测器共用一次扫描
+- 每条消息只提取一次：MessageParameters 的各字段在首次访问时计算并缓存，对象按文本缓存在 LRU 中
+- 智能体把结果放在请求上下文 context["params"] 中，各使用方通过 get_parameters 读取
+"""
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Optional
+
+from backend.core.message_features import analyze_message, get_keyword_engine
+
+# 金额提取模式：(模式, 倍数)，按优先级排列
+AMOUNT_PATTERNS = [
+    (r'(\d+(?:\.\d+)?)\s*[万wW]\s*[元块]?', 10000),  # X万 / Xw
+    (r'(\d+(?:\.\d+)?)\s*[元块]', 1),            # X元/块
+    (r'(\d{4,}(?:\.\d+)?)', 1),                   # 4位以上数字
+    (r'(\d+(?:,\d{3})+(?:\.\d+)?)', 1),          # 带逗号的数字
+]
+
+# 面积提取模式（忽略大小写）
+AREA_PATTERNS = [
+    r'(\d+(?:\.\d+)?)\s*[平㎡]',
+    r'(\d+(?:\.\d+)?)\s*平米',
+    r'(\d+(?:\.\d+)?)\s*平方',
+    r'(\d+(?:\.\d+)?)\s*m2',
+]
+
+# 统计周期：(模式, 天数)
+PERIOD_PATTERNS = [
+    (r'(\d+)\s*天', 1),
+    (r'(\d+)\s*周', 7),
+    (r'(\d+)\s*[个]?月', 30),
+    (r'(\d+)\s*年', 365),
+]
+DEFAULT_PERIOD_DAYS = 30
+
+# 金额的上下文关键词：关键词之后 CONTEXT_WINDOW 个字符内的金额归属该关键词
+AMOUNT_CONTEXT_KEYWORDS = ["投入", "花", "成本", "收入", "赚", "营收", "预算", "补贴", "价格", "报价"]
+CONTEXT_WINDOW = 30
+
+# 品类映射
+CATEGORY_MAPPING = {
+    # 家具类
+    "沙发": "家具", "床": "家具", "餐桌": "家具", "椅子": "家具",
+    "衣柜": "家具", "书桌": "家具", "茶几": "家具", "电视柜": "家具",
+    # 建材类
+    "瓷砖": "建材", "地板": "建材", "乳胶漆": "建材", "涂料": "建材",
+    "水泥": "建材", "木材": "建材", "石材": "建材", "大理石": "建材",
+    # 家电类
+    "空调": "家电", "冰箱": "家电", "洗衣机": "家电", "电视": "家电",
+    "热水器": "家电", "油烟机": "家电", "燃气灶": "家电",
+    # 软装类
+    "窗帘": "软装", "地毯": "软装", "灯具": "软装", "装饰画": "软装",
+    # 智能家居
+    "智能锁": "智能家居", "智能音箱": "智能家居", "智能开关": "智能家居",
+}
+MAIN_CATEGORIES = ["家具", "建材", "家电", "软装", "智能家居"]
+
+# 装修风格：先找完整风格名，再按简称匹配（忽略大小写），都没有时取默认风格
+STYLES = ["现代简约", "北欧", "新中式", "轻奢", "欧式", "美式", "日式", "工业风", "地中海"]
+STYLE_KEYWORDS = {
+    "现代": "现代简约", "简约": "现代简约",
+    "北欧": "北欧", "欧式": "欧式",
+    "中式": "新中式", "中国风": "新中式",
+    "轻奢": "轻奢", "奢华": "轻奢",
+    "日式": "日式", "和风": "日式",
+    "工业": "工业风", "loft": "工业风",
+}
+DEFAULT_STYLE = "现代简约"
+
+# 请求上下文中存放参数的键
+CONTEXT_KEY = "params"
+
+_AMOUNT_REGEXES = [(re.compile(pattern), multiplier) for pattern, multiplier in AMOUNT_PATTERNS]
+_AREA_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in AREA_PATTERNS]
+_PERIOD_REGEXES = [(re.compile(pattern), days) for pattern, days in PERIOD_PATTERNS]
+_CONTEXT_REGEX = re.compile("|".join(map(re.escape, AMOUNT_CONTEXT_KEYWORDS)))
+
+_engine = get_keyword_engine()
+_engine.register("params.items", CATEGORY_MAPPING)
+_engine.register("params.categories", MAIN_CATEGORIES)
+_engine.register("params.styles", STYLES)
+_engine.register("params.style_keywords", STYLE_KEYWORDS)
+
+
+@dataclass(frozen=True)
+class Amount:
+    """消息中的一个金额"""
+    value: float                   # 金额（元）
+    text: str                      # 原文，如 "5万"、"3000元"
+    unit: str                      # 万 / 元 / 块，纯数字为空串
+    start: int
+    end: int
+    context: Optional[str] = None  # 所属的上下文关键词（如 "投入"、"收入"）
+
+
+def _first_amount(text: str) -> Optional[float]:
+    """按模式优先级取第一个金额"""
+    for regex, multiplier in _AMOUNT_REGEXES:
+        match = regex.search(text)
+        if match:
+            return float(match.group(1).replace(',', '')) * multiplier
+    return None
+
+
+class MessageParameters:
+    """
+    一条消息的参数
+
+    各字段在首次访问时计算并缓存；语义与原 ParameterExtractor 各方法一致。
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._amount_by_keyword: Dict[Optional[str], Optional[float]] = {}
+
+    def amount(self, context_keyword: str = None) -> Optional[float]:
+        """
+        金额（元）
+
+        Args:
+            context_keyword: 上下文关键词（如 "投入"、"收入"），优先取关键词之后窗口内的金额，没有时取全文的
+
+        Returns:
+            金额，没有时返回 None
+        """
+        if context_keyword not in self._amount_by_keyword:
+            value = None
+            if context_keyword and context_keyword in self.text:
+                start = self.text.find(context_keyword)
+                value = _first_amount(self.text[start:start + CONTEXT_WINDOW])
+            if value is None:
+                value = self.amount() if context_keyword else _first_amount(self.text)
+            self._amount_by_keyword[context_keyword] = value
+        return self._amount_by_keyword[context_keyword]
+
+    @cached_property
+    def amount_values(self) -> List[float]:
+        """各模式匹配到的全部金额（去重、升序）"""
+        values = set()
+        for regex, multiplier in _AMOUNT_REGEXES:
+            for number in regex.findall(self.text):
+                values.add(float(number.replace(',', '')) * multiplier)
+        return sorted(values)
+
+    @cached_property
+    def amounts(self) -> List[Amount]:
+        """金额列表（按出现顺序，重叠时取优先级高的模式），附带单位与上下文关键词"""
+        contexts = [(m.start(), m.end(), m.group()) for m in _CONTEXT_REGEX.finditer(self.text)]
+        taken = []
+        for regex, multiplier in _AMOUNT_REGEXES:
+            for match in regex.finditer(self.text):
+                start, end = match.span()
+                if any(start < t_end and t_start < end for t_start, t_end, _ in taken):
+                    continue
+                raw = match.group().strip()
+                if multiplier == 10000:
+                    unit = "万"
+                else:
+                    unit = raw[-1] if raw[-1] in "元块" else ""
+                context = None
+                for k_start, k_end, keyword in contexts:
+                    if k_end <= start < k_start + CONTEXT_WINDOW:
+                        context = keyword  # 取最近的
+                taken.append((start, end, Amount(
+                    value=float(match.group(1).replace(',', '')) * multiplier,
+                    text=raw,
+                    unit=unit,
+                    start=start,
+                    end=end,
+                    context=context,
+                )))
+        return [amount for _, _, amount in sorted(taken, key=lambda t: t[0])]
+
+    @cached_property
+    def area(self) -> Optional[float]:
+        """面积（平方米）"""
+        for regex in _AREA_REGEXES:
+            match = regex.search(self.text)
+            if match:
+                return float(match.group(1))
+        return None
+
+    @cached_property
+    def period_days(self) -> int:
+        """统计周期（天），默认 30 天"""
+        for regex, days in _PERIOD_REGEXES:
+            match = regex.search(self.text)
+            if match:
+                return int(match.group(1)) * days
+        return DEFAULT_PERIOD_DAYS
+
+    @cached_property
+    def item(self) -> Optional[str]:
+        """具体商品名称"""
+        return analyze_message(self.text).first("params.items")
+
+    @cached_property
+    def category(self) -> Optional[str]:
+        """商品品类：先看具体商品，再看大类"""
+        if self.item:
+            return CATEGORY_MAPPING[self.item]
+        return analyze_message(self.text).first("params.categories")
+
+    @cached_property
+    def style(self) -> str:
+        """装修风格"""
+        style = analyze_message(self.text).first("params.styles")
+        if style:
+            return style
+        # 简称忽略大小写匹配；小写后与原文相同时直接复用原文的特征
+        lowered = self.text.lower()
+        keyword = analyze_message(self.text if lowered == self.text else lowered).first("params.style_keywords")
+        return STYLE_KEYWORDS[keyword] if keyword else DEFAULT_STYLE
+
+
+_cache: "OrderedDict[str, MessageParameters]" = OrderedDict()
+_cache_lock = threading.Lock()
+CACHE_SIZE = 256
+
+
+def extract_parameters(text: str) -> MessageParameters:
+    """
+    提取消息参数（同一文本返回同一个对象）
+
+    Args:
+        text: 消息文本
+
+    Returns:
+        MessageParameters
+    """
+    with _cache_lock:
+        params = _cache.get(text)
+        if params is not None:
+            _cache.move_to_end(text)
+            return params
+        params = _cache[text] = MessageParameters(text)
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+        return params
+
+
+def get_parameters(message: str, context: Optional[Dict] = None) -> MessageParameters:
+    """
+    读取请求上下文中的参数，没有时提取并放入上下文
+
+    Args:
+        message: 用户消息
+        context: 请求上下文
+
+    Returns:
+        MessageParameters
+    """
+    params = context.get(CONTEXT_KEY) if context is not None else None
+    if params is None or params.text != message:
+        params = extract_parameters(message)
+        if context is not None:
+            context[CONTEXT_KEY] = params
+    return params
@@ -11,6 +11,8 @@ from enum import Enum
 from abc import ABC, abstractmethod
 import threading
 
+from backend.core.message_features import analyze_message, get_keyword_engine
+
 
 class ReasoningType(str, Enum):
     """推理类型"""
@@ -255,6 +257,28 @@ class TaskAnalyzer:
         "预算": 1, "费用": 1, "成本": 1,
     }
 
+    # 问题结构指标：并列、条件、金额单位、时间范围
+    CONJUNCTIONS = ["和", "以及", "还有", "另外", "同时", "并且"]
+    CONDITIONALS = ["如果", "假设", "假如", "要是", "万一"]
+    AMOUNT_UNITS = ["万", "元", "块", "平米", "㎡"]
+    TIME_WORDS = ["多久", "什么时候", "几天", "几个月", "多长时间"]
+
+    # 工具 -> 关键词特征命名空间（register_keywords 时填充）
+    TOOL_NAMESPACES: Dict[str, str] = {}
+
+    @classmethod
+    def register_keywords(cls) -> None:
+        """把各词表注册到关键词特征引擎（各方法从一次扫描的结果中读取命中）"""
+        engine = get_keyword_engine()
+        engine.register("task.complex", cls.COMPLEX_KEYWORDS)
+        engine.register("task.simple", cls.SIMPLE_KEYWORDS)
+        engine.register("task.domain", cls.DOMAIN_COMPLEXITY)
+        engine.register("task.conjunctions", cls.CONJUNCTIONS)
+        engine.register("task.conditionals", cls.CONDITIONALS)
+        engine.register("task.units", cls.AMOUNT_UNITS)
+        engine.register("task.time_words", cls.TIME_WORDS)
+        cls.TOOL_NAMESPACES = engine.register_groups("task.tools", cls.TOOL_KEYWORDS)
+
     @classmethod
     def analyze_complexity(cls, query: str) -> TaskComplexity:
         """
@@ -272,17 +296,16 @@ class TaskAnalyzer:
         Returns:
             TaskComplexity: 任务复杂度等级
         """
+        features = analyze_message(query)
         score = 0.0
 
         # 1. 复杂关键词匹配（带权重）
-        for keyword, weight in cls.COMPLEX_KEYWORDS.items():
-            if keyword in query:
-                score += weight
+        for keyword in features.matched("task.complex"):
+            score += cls.COMPLEX_KEYWORDS[keyword]
 
         # 2. 简单关键词匹配（负权重）
-        for keyword, weight in cls.SIMPLE_KEYWORDS.items():
-            if keyword in query:
-                score += weight  # weight 已经是负数
+        for keyword in features.matched("task.simple"):
+            score += cls.SIMPLE_KEYWORDS[keyword]  # weight 已经是负数
 
         # 3. 问题结构分析
         # 3.1 问题长度因子（长问题通常更复杂）
@@ -302,31 +325,27 @@ class TaskAnalyzer:
             score += 1
 
         # 3.3 并列结构检测（包含"和"、"以及"、"还有"等）
-        conjunctions = ["和", "以及", "还有", "另外", "同时", "并且"]
-        conjunction_count = sum(1 for c in conjunctions if c in query)
+        conjunction_count = len(features.matched("task.conjunctions"))
         score += conjunction_count * 0.5
 
         # 3.4 条件结构检测（包含"如果"、"假设"等）
-        conditionals = ["如果", "假设", "假如", "要是", "万一"]
-        if any(c in query for c in conditionals):
+        if features.has("task.conditionals"):
             score += 1.5
 
         # 4. 领域复杂度评估
-        for domain, weight in cls.DOMAIN_COMPLEXITY.items():
-            if domain in query:
-                score += weight
+        for domain in features.matched("task.domain"):
+            score += cls.DOMAIN_COMPLEXITY[domain]
 
         # 5. 数字和金额检测（通常需要计算）
         import re
         numbers = re.findall(r'\d+(?:\.\d+)?', query)
         if len(numbers) >= 2:
             score += 1  # 多个数字可能需要比较或计算
-        if any(unit in query for unit in ["万", "元", "块", "平米", "㎡"]):
+        if features.has("task.units"):
             score += 0.5
 
         # 6. 时间范围检测（涉及规划）
-        time_words = ["多久", "什么时候", "几天", "几个月", "多长时间"]
-        if any(tw in query for tw in time_words):
+        if features.has("task.time_words"):
             score += 0.5
 
         # 根据综合评分确定复杂度
@@ -366,18 +385,19 @@ class TaskAnalyzer:
             "total_score": 0,
             "complexity": None,
         }
+        features = analyze_message(query)
 
         # 复杂关键词
-        for keyword, weight in cls.COMPLEX_KEYWORDS.items():
-            if keyword in query:
-                details["scores"]["complex_keywords"] += weight
-                details["matched_keywords"].append(f"+{keyword}({weight})")
+        for keyword in features.matched("task.complex"):
+            weight = cls.COMPLEX_KEYWORDS[keyword]
+            details["scores"]["complex_keywords"] += weight
+            details["matched_keywords"].append(f"+{keyword}({weight})")
 
         # 简单关键词
-        for keyword, weight in cls.SIMPLE_KEYWORDS.items():
-            if keyword in query:
-                details["scores"]["simple_keywords"] += weight
-                details["matched_keywords"].append(f"{keyword}({weight})")
+        for keyword in features.matched("task.simple"):
+            weight = cls.SIMPLE_KEYWORDS[keyword]
+            details["scores"]["simple_keywords"] += weight
+            details["matched_keywords"].append(f"{keyword}({weight})")
 
         # 长度
         length = len(query)
@@ -396,25 +416,22 @@ class TaskAnalyzer:
             details["scores"]["questions"] = 1
 
         # 并列结构
-        conjunctions = ["和", "以及", "还有", "另外", "同时", "并且"]
-        details["scores"]["conjunctions"] = sum(0.5 for c in conjunctions if c in query)
+        details["scores"]["conjunctions"] = sum(0.5 for _ in features.matched("task.conjunctions"))
 
         # 条件结构
-        conditionals = ["如果", "假设", "假如", "要是", "万一"]
-        if any(c in query for c in conditionals):
+        if features.has("task.conditionals"):
             details["scores"]["conditionals"] = 1.5
 
         # 领域复杂度
-        for domain, weight in cls.DOMAIN_COMPLEXITY.items():
-            if domain in query:
-                details["scores"]["domain"] += weight
+        for domain in features.matched("task.domain"):
+            details["scores"]["domain"] += cls.DOMAIN_COMPLEXITY[domain]
 
         # 数字
         import re
         numbers = re.findall(r'\d+(?:\.\d+)?', query)
         if len(numbers) >= 2:
             details["scores"]["numbers"] += 1
-        if any(unit in query for unit in ["万", "元", "块", "平米", "㎡"]):
+        if features.has("task.units"):
             details["scores"]["numbers"] += 0.5
 
         # 计算总分
@@ -464,9 +481,8 @@ class TaskAnalyzer:
                                complexity: TaskComplexity) -> ReasoningType:
         """选择推理类型"""
         # 检查是否需要工具（使用 ReAct 模式）
-        for tool, keywords in cls.TOOL_KEYWORDS.items():
-            if any(kw in query for kw in keywords):
-                return ReasoningType.REACT
+        if cls.detect_required_tools(query):
+            return ReasoningType.REACT
 
         if complexity == TaskComplexity.SIMPLE:
             return ReasoningType.DIRECT
@@ -480,11 +496,8 @@ class TaskAnalyzer:
     @classmethod
     def detect_required_tools(cls, query: str) -> List[str]:
         """检测问题需要的工具"""
-        required_tools = []
-        for tool, keywords in cls.TOOL_KEYWORDS.items():
-            if any(kw in query for kw in keywords):
-                required_tools.append(tool)
-        return required_tools
+        features = analyze_message(query)
+        return [tool for tool, namespace in cls.TOOL_NAMESPACES.items() if features.has(namespace)]
 
     @classmethod
     def extract_sub_questions(cls, query: str) -> List[str]:
@@ -509,6 +522,9 @@ class TaskAnalyzer:
         return sub_questions if len(sub_questions) > 1 else [query]
 
 
+TaskAnalyzer.register_keywords()
+
+
 class ReasoningEngine:
     """推理引擎"""
 
@@ -3,6 +3,8 @@
 提供输入验证、敏感词过滤、提示词注入防护等功能
 """
 import re
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 
@@ -41,6 +43,9 @@ ID_CARD_PATTERN = re.compile(r"\d{17}[\dXx]")
 # 银行卡号正则
 BANK_CARD_PATTERN = re.compile(r"\d{16,19}")
 
+# 以上三类都只由数字（身份证末位可为 X）组成且至少 11 位：只有这样的连续片段需要脱敏
+PII_CANDIDATE_PATTERN = re.compile(r"[\dXx]{11,}")
+
 
 class InputValidator:
     """输入验证器"""
@@ -166,38 +171,151 @@ class DataMasker:
 
     @classmethod
     def mask_all(cls, text: str) -> str:
-        """脱敏所有敏感信息"""
-        text = cls.mask_phone(text)
-        text = cls.mask_id_card(text)
-        text = cls.mask_bank_card(text)
-        return text
-
-
-class InputSanitizer:
-    """输入清洗器 - 整合所有安全检查"""
-
-    def __init__(self):
-        self.validator = InputValidator()
-        self.sensitive_filter = SensitiveWordFilter()
-        self.injection_detector = InjectionDetector()
-        self.masker = DataMasker()
-
-    def sanitize(self, text: str) -> dict:
         """
-        清洗输入文本
+        脱敏所有敏感信息
 
-        Args:
-            text: 原始输入
+        一次扫描找出候选片段，只在片段内依次做手机号、身份证号、银行卡号脱敏。
+        三种模式的匹配都不会跨出片段，结果与对全文依次脱敏相同。
+        """
+        def replace(match):
+            return cls.mask_bank_card(cls.mask_id_card(cls.mask_phone(match.group())))
+        return PII_CANDIDATE_PATTERN.sub(replace, text)
+
+
+# 忽略大小写匹配时，re 认为与 ASCII 字母相同、lower() 后却不相同的字符：ı、ſ，
+# 以及 İ（lower() 后为 "i" 加组合点 U+0307）。预筛在小写文本上进行，遇到这些字符时改为执行全部规则
+_CASE_EXCEPTIONS = "ıſ\u0307"
+_CASE_EXCEPTION_PATTERN = re.compile(f"[{_CASE_EXCEPTIONS}]")
+
+_REGEX_META = set(".^$*+?{}[]|()\\")
+
+
+def _required_literals(pattern: str) -> Optional[tuple]:
+    """
+    正则（忽略大小写）匹配时必须出现的字面量片段（小写）
+
+    只识别由字面量与 .* / \\s* 间隔组成、字母均为 ASCII 的模式（如 "忽略.*指令"、"system\\s*:"），
+    其他写法返回 None，表示没有可用的预筛条件。
+    """
+    pieces, current, i = [], [], 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if pattern.startswith((".*", "\\s*"), i):
+            pieces.append("".join(current))
+            current = []
+            i += 2 if ch == "." else 3
+            continue
+        if ch == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            literal = pattern[i + 1]
+            i += 2
+        elif ch in _REGEX_META:
+            return None
+        else:
+            literal = ch
+            i += 1
+        if i < len(pattern) and pattern[i] in "*+?{":
+            return None
+        if not literal.isascii() and literal.lower() != literal.upper():
+            return None  # 非 ASCII 的大小写字母，忽略大小写的规则较复杂，不做预筛
+        current.append(literal.lower())
+    pieces.append("".join(current))
+    pieces = tuple(piece for piece in pieces if piece)
+    return pieces or None
+
+
+class SanitizerEngine:
+    """
+    编译后的输入检查引擎
+
+    InputSanitizer 原先对每条消息：注入检测先 detect 一遍、命中后 get_risk_level 再把全部注入正则跑一遍，
+    敏感词再跑一遍分支正则，脱敏再跑三遍正则。这里：
+    - 敏感词与注入模式中的字面量片段合并为一个预筛正则，在小写文本上扫描一次；普通消息到此为止
+    - 预筛命中时，只执行字面量片段全部出现的注入正则（无法提取片段的模式照常执行）；
+      敏感词有命中时才用原正则取出敏感词列表，结果与原实现一致
+    - 脱敏一次扫描（见 DataMasker.mask_all）
+    - 相同消息的结论按文本缓存（LRU）
+    """
+
+    def __init__(self, validator: InputValidator = None,
+                 sensitive_filter: SensitiveWordFilter = None,
+                 injection_detector: InjectionDetector = None,
+                 cache_size: int = 256):
+        self.validator = validator or InputValidator()
+        self.sensitive_filter = sensitive_filter or SensitiveWordFilter()
+        self.injection_detector = injection_detector or InjectionDetector()
+        self.cache_size = cache_size
+
+        self._injection_rules = []  # (正则, 必须出现的片段)
+        self._always_rules = []     # 没有预筛条件、每条消息都要执行的正则
+        literals = set()
+        keys = set()                # 预筛只需每条规则最长的片段：它不出现时规则不可能命中
+        for regex in self.injection_detector.patterns:
+            pieces = _required_literals(regex.pattern)
+            if pieces is None:
+                self._always_rules.append(regex)
+            else:
+                self._injection_rules.append((regex, pieces))
+                literals.update(pieces)
+                keys.add(max(pieces, key=len))
+        self._sensitive_words = []
+        self._always_check_sensitive = False
+        for word in self.sensitive_filter.word_list:
+            pieces = _required_literals(re.escape(word))
+            if pieces is None:
+                self._always_check_sensitive = True
+            else:
+                self._sensitive_words.extend(pieces)
+                literals.update(pieces)
+                keys.update(pieces)
+        self._literals = tuple(sorted(literals))
+        self._prefilter = re.compile("|".join(
+            re.escape(key) for key in sorted(keys | set(_CASE_EXCEPTIONS), key=len, reverse=True)
+        ))
+
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"checks": 0, "cache_hits": 0, "regex_runs": 0}
+
+    def _literal_hits(self, text: str) -> Optional[set]:
+        """
+        文本（忽略大小写）中出现的字面量片段
 
         Returns:
-            {
-                "valid": bool,
-                "sanitized_text": str,
-                "warnings": list[str],
-                "blocked": bool,
-                "block_reason": str
-            }
+            片段集合；预筛未命中（没有规则可能命中）时为空集合；文本含特殊大小写字符时为 None，表示需要执行全部规则
         """
+        lowered = text.lower()
+        if not self._prefilter.search(lowered):
+            return set()
+        if _CASE_EXCEPTION_PATTERN.search(lowered):
+            return None
+        return {literal for literal in self._literals if literal in lowered}
+
+    def injection_matches(self, text: str) -> int:
+        """命中的注入模式数量（与 InjectionDetector.get_risk_level 的计数一致）"""
+        return self._count_injections(text, self._literal_hits(text))
+
+    def _count_regex_runs(self, runs: int):
+        if runs:
+            with self._lock:
+                self._stats["regex_runs"] += runs
+
+    def _count_injections(self, text: str, hits: Optional[set]) -> int:
+        count = runs = 0
+        if hits is None or hits:
+            for regex, pieces in self._injection_rules:
+                if hits is not None and not hits.issuperset(pieces):
+                    continue
+                runs += 1
+                if regex.search(text):
+                    count += 1
+        for regex in self._always_rules:
+            runs += 1
+            if regex.search(text):
+                count += 1
+        self._count_regex_runs(runs)
+        return count
+
+    def _check(self, text: str) -> dict:
         result = {
             "valid": True,
             "sanitized_text": text,
@@ -214,27 +332,92 @@ class InputSanitizer:
             result["block_reason"] = error
             return result
 
-        # 2. 注入检测
-        if self.injection_detector.detect(text):
-            risk_level = self.injection_detector.get_risk_level(text)
-            if risk_level in ["medium", "high"]:
-                result["blocked"] = True
-                result["block_reason"] = "检测到潜在的提示词注入攻击"
-                return result
-            else:
-                result["warnings"].append("输入包含可疑内容，已记录")
+        hits = self._literal_hits(text)
+
+        # 2. 注入检测：命中 3 个及以上模式（medium / high）时阻止
+        matches = self._count_injections(text, hits)
+        if matches > 2:
+            result["blocked"] = True
+            result["block_reason"] = "检测到潜在的提示词注入攻击"
+            return result
+        if matches:
+            result["warnings"].append("输入包含可疑内容，已记录")
 
         # 3. 敏感词检查
-        if self.sensitive_filter.contains_sensitive(text):
+        if self._always_check_sensitive or hits is None or not hits.isdisjoint(self._sensitive_words):
+            self._count_regex_runs(1)
             sensitive_words = self.sensitive_filter.get_sensitive_words(text)
-            result["warnings"].append(f"输入包含敏感词: {sensitive_words}")
-            # 不阻止，但记录
+            if sensitive_words:
+                result["warnings"].append(f"输入包含敏感词: {sensitive_words}")
 
         # 4. 数据脱敏
-        result["sanitized_text"] = self.masker.mask_all(text)
-
+        result["sanitized_text"] = DataMasker.mask_all(text)
         return result
 
+    def sanitize(self, text: str) -> dict:
+        """
+        检查输入文本（返回格式同 InputSanitizer.sanitize）
+
+        相同文本直接返回缓存的结论（每次返回新的字典，调用方修改不影响缓存）。
+        """
+        if not isinstance(text, str):
+            with self._lock:
+                self._stats["checks"] += 1
+            return self._check(text)
+
+        with self._lock:
+            self._stats["checks"] += 1
+            result = self._cache.get(text)
+            if result is not None:
+                self._cache.move_to_end(text)
+                self._stats["cache_hits"] += 1
+        if result is None:
+            result = self._check(text)
+            with self._lock:
+                self._cache[text] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return {**result, "warnings": list(result["warnings"])}
+
+    def get_stats(self) -> dict:
+        """获取统计信息"""
+        with self._lock:
+            checks = self._stats["checks"]
+            return {
+                **self._stats,
+                "cache_size": len(self._cache),
+                "hit_rate": self._stats["cache_hits"] / checks if checks else 0.0,
+            }
+
+
+class InputSanitizer:
+    """输入清洗器 - 整合所有安全检查"""
+
+    def __init__(self):
+        self.validator = InputValidator()
+        self.sensitive_filter = SensitiveWordFilter()
+        self.injection_detector = InjectionDetector()
+        self.masker = DataMasker()
+        self.engine = SanitizerEngine(self.validator, self.sensitive_filter, self.injection_detector)
+
+    def sanitize(self, text: str) -> dict:
+        """
+        清洗输入文本
+
+        Args:
+            text: 原始输入
+
+        Returns:
+            {
+                "valid": bool,
+                "sanitized_text": str,
+                "warnings": list[str],
+                "blocked": bool,
+                "block_reason": str
+            }
+        """
+        return self.engine.sanitize(text)
+
 
 # 全局实例
 input_sanitizer = InputSanitizer()
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from backend.core.logging_config import get_logger
+from backend.core.message_features import analyze_message, get_keyword_engine
 
 logger = get_logger("stage_reasoning")
 
@@ -388,6 +389,30 @@ B_END_STAGE_KEYWORDS = {
     },
 }
 
+# 关键词类型及其权重（显式 > 隐式 > 问题类型）
+STAGE_KEYWORD_KINDS = (("explicit", "显式", 3.0), ("implicit", "隐式", 2.0), ("questions", "问题", 1.5))
+
+
+def _register_stage_keywords() -> Dict[str, Dict[str, Tuple[str, str, float]]]:
+    """
+    注册到关键词特征引擎，命名空间为 stage.{用户类型}.{阶段}.{关键词类型}
+
+    Returns:
+        {用户类型: {命名空间: (阶段, 关键词类型名, 权重)}}
+    """
+    engine = get_keyword_engine()
+    kinds = {kind: (label, weight) for kind, label, weight in STAGE_KEYWORD_KINDS}
+    targets = {}
+    for user_type, keywords_map in (("c_end", C_END_STAGE_KEYWORDS), ("b_end", B_END_STAGE_KEYWORDS)):
+        targets[user_type] = {}
+        for stage, keywords in keywords_map.items():
+            for kind, namespace in engine.register_groups(f"stage.{user_type}.{stage}", keywords).items():
+                targets[user_type][namespace] = (stage, *kinds[kind])
+    return targets
+
+
+STAGE_KEYWORD_TARGETS = _register_stage_keywords()
+
 
 # ============ 阶段转换引导 ============
 
@@ -485,34 +510,28 @@ class StageUnderstanding:
         Returns:
             (阶段, 置信度)
         """
-        keywords_map = C_END_STAGE_KEYWORDS if user_type == "c_end" else B_END_STAGE_KEYWORDS
-        default_stage = "准备" if user_type == "c_end" else "入驻"
+        if user_type == "c_end":
+            keywords_map, default_stage, targets = C_END_STAGE_KEYWORDS, "准备", STAGE_KEYWORD_TARGETS["c_end"]
+        else:
+            keywords_map, default_stage, targets = B_END_STAGE_KEYWORDS, "入驻", STAGE_KEYWORD_TARGETS["b_end"]
+        features = analyze_message(query)
 
         best_stage = default_stage
         best_score = 0.0
         matched_keywords = []
 
-        for stage, keywords in keywords_map.items():
-            score = 0.0
-
-            # 显式关键词权重最高
-            for kw in keywords.get("explicit", []):
-                if kw in query:
-                    score += 3.0
-                    matched_keywords.append(f"[显式]{kw}→{stage}")
-
-            # 隐式关键词次之
-            for kw in keywords.get("implicit", []):
-                if kw in query:
-                    score += 2.0
-                    matched_keywords.append(f"[隐式]{kw}→{stage}")
-
-            # 问题类型关键词
-            for kw in keywords.get("questions", []):
-                if kw in query:
-                    score += 1.5
-                    matched_keywords.append(f"[问题]{kw}→{stage}")
-
+        # 只遍历命中的词表：显式关键词权重最高，隐式次之，问题类型最低
+        scores = dict.fromkeys(keywords_map, 0.0)
+        for namespace in features.namespaces:
+            target = targets.get(namespace)
+            if target is None:
+                continue
+            stage, label, weight = target
+            for kw in features.matched(namespace):
+                scores[stage] += weight
+                matched_keywords.append(f"[{label}]{kw}→{stage}")
+
+        for stage, score in scores.items():
             if score > best_score:
                 best_score = score
                 best_stage = stage
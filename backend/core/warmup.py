@@ -0,0 +1,106 @@
+"""
+启动预热模块
+服务进程启动后在后台依次初始化重量级组件（记忆系统、知识图谱、智能体等）。
+预热期间 /health 正常响应，/ready 返回 503，编排系统据此决定何时把流量导入该进程；
+首个聊天请求不再承担智能体构建的开销。
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from backend.core.logging_config import get_logger
+    logger = get_logger("warmup")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+class Warmup:
+    """
+    预热执行器
+
+    按注册顺序执行各步骤，记录每步耗时；单个步骤失败只记录错误，不影响后续步骤，
+    对应组件会在首次使用时按原有的延迟加载逻辑再次初始化。
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    READY = "ready"
+
+    def __init__(self):
+        self.steps: List[Tuple[str, Callable[[], Any]]] = []
+        self.status = self.PENDING
+        self.timings_ms: Dict[str, Optional[float]] = {}
+        self.errors: Dict[str, str] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def add_step(self, name: str, func: Callable[[], Any]) -> None:
+        """注册预热步骤（同步函数，在线程中执行）"""
+        self.steps.append((name, func))
+
+    @property
+    def ready(self) -> bool:
+        return self.status == self.READY
+
+    def _run_step(self, name: str, func: Callable[[], Any]) -> None:
+        start = time.perf_counter()
+        try:
+            func()
+            self.timings_ms[name] = round((time.perf_counter() - start) * 1000, 1)
+        except Exception as e:
+            self.timings_ms[name] = None
+            self.errors[name] = str(e)
+            logger.warning(f"预热步骤失败: {name}: {e}")
+
+    def _begin(self) -> None:
+        self.status = self.RUNNING
+        self.started_at = time.time()
+        self.timings_ms = {}
+        self.errors = {}
+
+    def _finish(self) -> None:
+        self.finished_at = time.time()
+        self.status = self.READY
+        logger.info("预热完成", extra={
+            "timings_ms": self.timings_ms,
+            "duration_ms": round((self.finished_at - self.started_at) * 1000, 1),
+        })
+
+    def run_sync(self) -> Dict[str, Optional[float]]:
+        """
+        在当前线程中依次执行全部步骤
+
+        Returns:
+            各步骤耗时（毫秒），失败的步骤记为 None
+        """
+        self._begin()
+        for name, func in self.steps:
+            self._run_step(name, func)
+        self._finish()
+        return self.timings_ms
+
+    async def run(self) -> Dict[str, Optional[float]]:
+        """异步执行：每个步骤放到线程中运行，事件循环在预热期间继续处理请求"""
+        self._begin()
+        for name, func in self.steps:
+            await asyncio.to_thread(self._run_step, name, func)
+        self._finish()
+        return self.timings_ms
+
+    def skip(self) -> None:
+        """不预热，直接标记为就绪（组件在首次使用时加载）"""
+        self.status = self.READY
+        self.finished_at = time.time()
+
+    def get_status(self) -> Dict[str, Any]:
+        """预热状态（/ready 接口返回）"""
+        return {
+            "status": self.status,
+            "steps": [name for name, _ in self.steps],
+            "timings_ms": dict(self.timings_ms),
+            "errors": dict(self.errors),
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
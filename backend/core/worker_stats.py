@@ -0,0 +1,182 @@
+"""
+多进程统计汇总模块
+多 worker 部署时，请求指标与缓存统计分散在各进程内存中。
+每个 worker 定期把自己的快照写入共享目录，查询接口读取全部快照后显式合并，
+避免只看到处理当前请求的那个进程的数据。
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.core.metrics import merge_snapshots, stats_from_snapshot
+
+try:
+    from backend.core.logging_config import get_logger
+    logger = get_logger("worker_stats")
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+SNAPSHOT_PREFIX = "worker-"
+SNAPSHOT_SUFFIX = ".json"
+
+
+def _pid_alive(pid: int) -> bool:
+    """判断进程是否存活"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+class WorkerStatsPublisher:
+    """
+    worker 统计快照发布器
+
+    后台线程每 interval 秒调用 collect() 并原子写入 <directory>/worker-<pid>.json，
+    stop() 时删除自己的快照文件。
+    """
+
+    def __init__(self, directory: str, collect: Callable[[], Dict[str, Any]],
+                 interval: float = 5.0):
+        """
+        Args:
+            directory: 快照目录（所有 worker 共享）
+            collect: 返回当前进程统计的回调
+            interval: 发布间隔（秒）
+        """
+        self.directory = directory
+        self.collect = collect
+        self.interval = interval
+        self.pid = os.getpid()
+        self.path = os.path.join(directory, f"{SNAPSHOT_PREFIX}{self.pid}{SNAPSHOT_SUFFIX}")
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def publish(self) -> None:
+        """立即写入一次快照"""
+        try:
+            snapshot = {
+                "pid": self.pid,
+                "timestamp": time.time(),
+                "stats": self.collect(),
+            }
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"写入 worker 统计快照失败: {e}")
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.publish()
+
+    def start(self) -> None:
+        """启动后台发布线程"""
+        if self._thread is not None:
+            return
+        self.publish()
+        self._thread = threading.Thread(
+            target=self._run, name="worker-stats", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止发布并删除快照文件"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval)
+            self._thread = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def collect_worker_snapshots(directory: str, max_age: float = 30.0,
+                             current: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    """
+    读取所有存活 worker 的快照
+
+    Args:
+        directory: 快照目录
+        max_age: 超过该时长未更新的快照视为失效
+        current: 当前进程的实时统计，替换其（可能过时的）快照
+
+    Returns:
+        快照列表，每项包含 pid、timestamp、stats
+    """
+    snapshots = []
+    own_pid = os.getpid()
+    now = time.time()
+
+    if os.path.isdir(directory):
+        for filename in os.listdir(directory):
+            if not (filename.startswith(SNAPSHOT_PREFIX) and filename.endswith(SNAPSHOT_SUFFIX)):
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+
+            pid = snapshot.get("pid")
+            if pid == own_pid and current is not None:
+                continue
+            if not isinstance(pid, int) or not _pid_alive(pid):
+                # 异常退出的 worker 留下的快照
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            if now - snapshot.get("timestamp", 0) > max_age:
+                continue
+            snapshots.append(snapshot)
+
+    if current is not None:
+        snapshots.append({"pid": own_pid, "timestamp": now, "stats": current})
+
+    snapshots.sort(key=lambda s: s["pid"])
+    return snapshots
+
+
+def aggregate_request_metrics(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    合并多个 RequestMetrics.snapshot() 结果并生成统计
+
+    各 worker 的耗时直方图桶边界相同，逐桶相加后重新计算分位数，
+    得到的 p50/p95/p99 与单进程统计同样精确。
+    """
+    return stats_from_snapshot(merge_snapshots(snapshots))
+
+
+def aggregate_cache_stats(caches: List[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    合并多个 CacheManager.get_all_stats() 结果
+
+    缓存内容本身按进程独立（各自预热、各自淘汰），这里只合并容量与命中计数，
+    命中率按合并后的计数重算。
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for stats_by_name in caches:
+        for name, stats in stats_by_name.items():
+            target = merged.setdefault(name, {"size": 0, "max_size": 0, "hits": 0, "misses": 0})
+            for field in ("size", "max_size", "hits", "misses"):
+                target[field] += stats.get(field, 0) or 0
+
+    for target in merged.values():
+        total = target["hits"] + target["misses"]
+        target["hit_rate"] = target["hits"] / total if total > 0 else 0
+    return merged
@@ -14,12 +14,22 @@ import json
 from pathlib import Path
 from collections import defaultdict
 
+from backend.core.message_features import analyze_message, get_keyword_engine
 from ..events import Event, EventType, get_event_bus
 from ..config import LearningConfig
 from .feedback import FeedbackCollector, Feedback, FeedbackType
 
 logger = logging.getLogger(__name__)
 
+# 问题聚类关键词
+CLUSTER_KEYWORDS = {
+    "decoration": ["装修", "风格", "材料", "施工", "设计", "预算", "报价"],  # 装修相关
+    "subsidy": ["补贴", "优惠", "折扣", "省钱", "活动"],                     # 补贴相关
+    "merchant": ["商家", "入驻", "店铺", "获客", "转化"],                    # 商家相关
+}
+
+CLUSTER_NAMESPACES = get_keyword_engine().register_groups("distill.cluster", CLUSTER_KEYWORDS)
+
 
 class KnowledgeType(str, Enum):
     """知识类型"""
@@ -180,25 +190,10 @@ class KnowledgeDistiller:
     def _get_cluster_key(self, query: str) -> str:
         """获取问题的聚类键"""
         # 简单的关键词提取
+        features = analyze_message(query)
         keywords = []
-
-        # 装修相关关键词
-        decoration_keywords = ["装修", "风格", "材料", "施工", "设计", "预算", "报价"]
-        for kw in decoration_keywords:
-            if kw in query:
-                keywords.append(kw)
-
-        # 补贴相关关键词
-        subsidy_keywords = ["补贴", "优惠", "折扣", "省钱", "活动"]
-        for kw in subsidy_keywords:
-            if kw in query:
-                keywords.append(kw)
-
-        # 商家相关关键词
-        merchant_keywords = ["商家", "入驻", "店铺", "获客", "转化"]
-        for kw in merchant_keywords:
-            if kw in query:
-                keywords.append(kw)
+        for namespace in CLUSTER_NAMESPACES.values():
+            keywords.extend(features.matched(namespace))
 
         return "_".join(sorted(keywords)) if keywords else "general"
 
@@ -1,6 +1,13 @@
 """
 知识库模块
 """
-from .multi_collection_kb import MultiCollectionKB
 
 __all__ = ["MultiCollectionKB"]
+
+
+def __getattr__(name):
+    # 向量库依赖（chromadb 等）导入较慢，按需导入；只用知识图谱时不加载
+    if name == "MultiCollectionKB":
+        from .multi_collection_kb import MultiCollectionKB
+        return MultiCollectionKB
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,142 @@
+"""
+知识图谱实体链接
+
+把图谱中全部实体名称与别名编译为 Aho-Corasick 自动机，
+一次扫描找出用户消息中提及的全部实体，重叠时取最长匹配。
+"""
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, List, Optional, Set, Tuple
+
+from backend.core.aho_corasick import AhoCorasick, Match, select_longest
+from backend.knowledge.knowledge_graph import Entity, EntityType
+
+if TYPE_CHECKING:
+    from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph
+
+
+@dataclass
+class EntityMention:
+    """消息中的一次实体提及"""
+    entity: Entity
+    text: str        # 原文片段
+    start: int       # 在原文中的起始下标
+    end: int         # 结束下标（不含）
+    matched: str     # 命中的名称或别名（小写）
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.entity.name,
+            "type": self.entity.entity_type.value,
+            "text": self.text,
+            "start": self.start,
+            "end": self.end,
+        }
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _on_word_boundary(text: str, start: int, end: int) -> bool:
+    """英文/数字名称（如 "hay"、"erv"）要求两侧不是英文字母或数字，避免命中单词内部"""
+    if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+
+class EntityLinker:
+    """
+    实体链接器
+
+    自动机中只保存名称/别名的小写形式，命中后通过图谱的名称映射解析为实体，
+    名称改指向其他实体时无需重建。图谱每个版本各有一个链接器（见 get_entity_linker），
+    发布后不再改动。
+
+    新版本的链接器由上一版本派生（见 extend）：主自动机与上一版本共享，
+    新增的名称放入一个只含新增部分的小自动机，累计超过 PENDING_LIMIT 个时才整体重新编译，
+    每次新增的成本与新增部分有关，而不是与全部名称数量成正比。
+    """
+
+    # 新增名称累计超过该数量时重新编译主自动机
+    PENDING_LIMIT = 128
+
+    def __init__(self, graph: "DecorationKnowledgeGraph"):
+        self.graph = graph
+        self.automaton = AhoCorasick(ignore_case=True)
+        for key in graph._name_to_id:
+            self.automaton.add(key)
+        for key in graph._alias_to_id:
+            self.automaton.add(key)
+        self.automaton.build()  # 构建时就算好链接表，首次链接不再等待
+        self.pending_names: Tuple[str, ...] = ()
+        self.pending: Optional[AhoCorasick] = None
+
+    def extend(self, names: Iterable[str]) -> "EntityLinker":
+        """
+        派生新版本的链接器（本链接器不变；需要整体重新编译时读取调用方固定的图谱版本）
+
+        Args:
+            names: 新版本中新增的名称或别名
+        """
+        added = tuple(dict.fromkeys(
+            key for key in (name.lower() for name in names)
+            if key not in self.automaton and key not in self.pending_names
+        ))
+        if len(self.pending_names) + len(added) > self.PENDING_LIMIT:
+            return EntityLinker(self.graph)
+
+        linker = object.__new__(EntityLinker)
+        linker.graph = self.graph
+        linker.automaton = self.automaton
+        linker.pending_names = self.pending_names + added
+        linker.pending = self.pending
+        if added:
+            linker.pending = AhoCorasick(ignore_case=True)
+            for key in linker.pending_names:
+                linker.pending.add(key)
+            linker.pending.build()
+        return linker
+
+    def link(self, text: str, entity_types: Iterable[EntityType] = None) -> List[EntityMention]:
+        """
+        找出文本中提及的实体
+
+        Args:
+            text: 用户消息
+            entity_types: 只保留这些类型的实体（在消解重叠之前过滤，
+                          被过滤掉的长匹配不会遮住其中符合类型的短匹配）
+
+        Returns:
+            按出现位置排序、互不重叠的实体提及
+        """
+        if not text:
+            return []
+
+        types: Optional[Set[EntityType]] = set(entity_types) if entity_types else None
+        snapshot = self.graph.snapshot
+        resolved = {}
+
+        def accept(source: str, match: Match) -> bool:
+            start, end, key = match
+            if not _on_word_boundary(source, start, end):
+                return False
+            if key not in resolved:
+                entity_id = snapshot.resolve(key)
+                resolved[key] = snapshot.entities.get(entity_id) if entity_id else None
+            entity = resolved[key]
+            return entity is not None and (types is None or entity.entity_type in types)
+
+        if self.pending is None:
+            matches = self.automaton.find_longest(text, accept)
+        else:
+            matches = select_longest(
+                [m for automaton in (self.automaton, self.pending)
+                 for m in automaton.iter_matches(text) if accept(text, m)],
+                len(text),
+            )
+        return [
+            EntityMention(entity=resolved[key], text=text[start:end], start=start, end=end, matched=key)
+            for start, end, key in matches
+        ]
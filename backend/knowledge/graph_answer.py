@@ -0,0 +1,272 @@
+"""
+知识图谱直答
+
+"客厅用什么地砖"、"北欧风格用什么材料"这类结构化问题完全可以由知识图谱回答。
+链接消息中的实体后按意图模板匹配到图谱查询：
+- 空间方案：空间 + "用什么/铺什么/怎么选" 等 → get_space_solution
+- 风格材料：风格 + 同上 → find_style_materials
+- 替代品：  一个产品 + "替代/代替/平替" 等 → find_alternatives
+- 产品对比：两个产品 + "区别/哪个好/还是" 等 → get_product_comparison
+命中且图谱给出事实时，把结果整理为简短的事实列表注入上下文，不再做向量检索；
+其余消息（价格、施工做法、问题诊断、长叙述等）仍走向量检索。
+"""
+import time
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from backend.core.message_features import MessageFeatures, analyze_message, get_keyword_engine
+from backend.knowledge.knowledge_graph import PRODUCT_TYPES, EntityType
+
+if TYPE_CHECKING:
+    from backend.knowledge.entity_linker import EntityMention
+    from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph
+
+# 超过该长度的消息多为叙述或多个问题，模板覆盖不全，交给向量检索
+MAX_MESSAGE_CHARS = 40
+# 注入上下文的事实条数与每类列出的名称数
+MAX_FACTS = 8
+MAX_NAMES = 6
+
+# 图谱回答不了的问题：价格预算、施工做法、问题诊断、品牌商家、政策等
+BLOCKING_CUES = ("多少钱", "价格", "价位", "报价", "预算", "便宜", "贵", "补贴", "品牌", "哪家", "牌子",
+                 "怎么做", "怎么办", "为什么", "步骤", "流程", "工序", "施工", "验收", "甲醛", "环保",
+                 "漏水", "开裂", "空鼓", "发霉")
+SOLUTION_CUES = ("用什么", "选什么", "铺什么", "装什么", "贴什么", "刷什么", "买什么", "配什么", "放什么",
+                 "怎么选", "如何选", "怎么搭", "推荐", "适合", "搭配", "哪些", "哪种")
+ALTERNATIVE_CUES = ("替代", "代替", "替换", "平替", "换成", "换什么")
+COMPARISON_CUES = ("区别", "对比", "比较", "哪个好", "哪种好", "哪个更", "还是", "差别", "不同", "优缺点", "vs")
+
+# 空间方案的分类（get_space_solution 的键）及消息中指向该分类的词
+SECTIONS = {
+    "floor": ("地面", ("地面", "地砖", "瓷砖", "地板", "石材")),
+    "wall": ("墙面", ("墙", "涂料", "乳胶漆", "壁纸", "护墙板")),
+    "ceiling": ("吊顶", ("吊顶", "顶面")),
+    "furniture": ("家具", ("家具", "沙发", "床", "桌", "椅", "柜")),
+    "lighting": ("灯具", ("灯", "照明")),
+    "soft_decoration": ("软装", ("软装", "窗帘", "地毯", "绿植", "摆件")),
+    "smart_home": ("智能家居", ("智能",)),
+}
+
+# 以上词表在关键词特征引擎中的命名空间
+CUE_NAMESPACES = get_keyword_engine().register_groups("graph_answer.cue", {
+    "blocking": BLOCKING_CUES,
+    "solution": SOLUTION_CUES,
+    "alternative": ALTERNATIVE_CUES,
+    "comparison": COMPARISON_CUES,
+})
+SECTION_NAMESPACES = get_keyword_engine().register_groups(
+    "graph_answer.section", {key: words for key, (_, words) in SECTIONS.items()}
+)
+
+
+@dataclass
+class GraphAnswer:
+    """图谱直答结果"""
+    intent: str            # space_solution / style_materials / alternatives / comparison
+    entities: List[str]    # 参与回答的实体名称
+    facts: List[str]       # 注入上下文的事实（每条一行）
+    elapsed_ms: float = 0.0
+
+
+def _summarize(properties: Mapping, limit: int = 3) -> str:
+    """实体属性的简短描述：前几个属性，列表取前几项，字典只取键"""
+    parts = []
+    for key, value in properties.items():
+        if isinstance(value, Mapping):
+            value = "/".join(str(k) for k in list(value)[:4])
+        elif isinstance(value, (list, tuple)):
+            value = "/".join(str(v) for v in value[:4])
+        parts.append(f"{key}: {value}")
+        if len(parts) == limit:
+            break
+    return "; ".join(parts)
+
+
+def _join(names: List[str]) -> str:
+    return "、".join(dict.fromkeys(names[:MAX_NAMES]))
+
+
+class GraphAnswerer:
+    """
+    图谱直答
+
+    只在有把握时作答：消息不长、没有图谱回答不了的问题信号、实体与意图词都匹配模板、
+    且图谱查询给出了事实；否则返回 None，由调用方照常做向量检索。
+    同时统计直答命中率，以及按向量检索的实测平均耗时估算节省的时间。
+    """
+
+    def __init__(self, graph: "DecorationKnowledgeGraph"):
+        self.graph = graph
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._by_intent: Dict[str, int] = {}
+        self._graph_ms = 0.0        # 全部请求的图谱阶段耗时
+        self._answered_ms = 0.0     # 命中请求的图谱阶段耗时
+        self._retrievals = 0
+        self._retrieval_ms = 0.0    # 未命中时向量检索的耗时
+
+    def answer(self, message: str) -> Optional[GraphAnswer]:
+        """
+        尝试用知识图谱回答
+
+        Args:
+            message: 用户消息
+
+        Returns:
+            图谱事实，没有把握时返回 None
+        """
+        start = time.perf_counter()
+        result = self._answer(message)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            self._requests += 1
+            self._graph_ms += elapsed
+            if result:
+                self._by_intent[result.intent] = self._by_intent.get(result.intent, 0) + 1
+                self._answered_ms += elapsed
+        if result:
+            result.elapsed_ms = round(elapsed, 3)
+        return result
+
+    def _answer(self, message: str) -> Optional[GraphAnswer]:
+        text = message.strip()
+        if not text or len(text) > MAX_MESSAGE_CHARS:
+            return None
+        features = analyze_message(text)
+        if features.has(CUE_NAMESPACES["blocking"]):
+            return None
+
+        # 同一版本内完成链接与查询
+        with self.graph.read_snapshot():
+            mentions = self.graph.link_entities(text)
+            spaces = self._distinct(mentions, (EntityType.SPACE,))
+            styles = self._distinct(mentions, (EntityType.STYLE,))
+            products = self._distinct(mentions, PRODUCT_TYPES)
+
+            if len(products) == 2 and not spaces and features.has(CUE_NAMESPACES["comparison"]):
+                answer = self._comparison(products)
+            elif len(products) == 1 and not spaces and features.has(CUE_NAMESPACES["alternative"]):
+                answer = self._alternatives(products[0])
+            elif (len(spaces) == 1 and len(styles) <= 1 and features.has(CUE_NAMESPACES["solution"])
+                  and (styles or "风格" not in text)):
+                # "客厅适合什么风格"问的是风格，不是空间方案
+                answer = self._space_solution(features, spaces[0], styles[0] if styles else None, products)
+            elif len(styles) == 1 and not spaces and not products and features.has(CUE_NAMESPACES["solution"]):
+                answer = self._style_materials(styles[0])
+            else:
+                answer = None
+
+        if answer is None or not answer.facts:
+            return None
+        answer.facts = answer.facts[:MAX_FACTS]
+        return answer
+
+    @staticmethod
+    def _distinct(mentions: List["EntityMention"], types) -> List[Any]:
+        """指定类型的实体（去重，按出现顺序）"""
+        entities = {m.entity.id: m.entity for m in mentions if m.entity.entity_type in types}
+        return list(entities.values())
+
+    # === 意图模板 ===
+
+    def _space_solution(self, features: MessageFeatures, space, style, products) -> GraphAnswer:
+        solution = self.graph.get_space_solution(space.name, style.name if style else None)
+        sections = [key for key in SECTIONS if features.has(SECTION_NAMESPACES[key])] or list(SECTIONS)
+
+        facts = []
+        for key in sections:
+            items = list(solution[key])
+            if not items:
+                continue
+            if style:
+                items.sort(key=lambda item: item.get("style_match") or 0, reverse=True)
+            names = []
+            for item in items:
+                note = item.get("usage") or item.get("reason")
+                if item.get("style_match"):
+                    note = f"{style.name}匹配度{item['style_match']}" + (f"，{note}" if note else "")
+                names.append(f"{item['name']}（{note}）" if note else item["name"])
+            facts.append(f"{space.name}{SECTIONS[key][0]}推荐: {_join(names)}")
+
+        # 消息中提到的具体产品附上要点（空间没有对应推荐时不作答）
+        for product in products if facts else ():
+            if product.properties:
+                facts.append(f"{product.name}: {_summarize(product.properties)}")
+
+        names = [space.name] + ([style.name] if style else []) + [p.name for p in products]
+        return GraphAnswer("space_solution", names, facts)
+
+    def _style_materials(self, style) -> GraphAnswer:
+        materials = self.graph.find_style_materials(style.name)
+        facts = []
+        if materials:
+            facts.append(f"{style.name}风格推荐材料与产品: "
+                         + _join([f"{m['name']}（匹配度{m['match_score']}）" for m in materials]))
+        if facts and style.properties:
+            facts.append(f"{style.name}风格特点: {_summarize(style.properties)}")
+        compatible = self.graph.find_compatible_styles(style.name)
+        if facts and compatible:
+            facts.append(f"可与{style.name}混搭的风格: {_join([s['name'] for s in compatible])}")
+        return GraphAnswer("style_materials", [style.name], facts)
+
+    def _alternatives(self, product) -> GraphAnswer:
+        alternatives = self.graph.find_alternatives(product.name)
+        facts = []
+        if alternatives:
+            names = [a["name"] if a["scenario"] == "通用" else f"{a['name']}（{a['scenario']}）"
+                     for a in alternatives]
+            facts.append(f"{product.name}的替代选择: {_join(names)}")
+            if product.properties:
+                facts.append(f"{product.name}: {_summarize(product.properties)}")
+        return GraphAnswer("alternatives", [product.name], facts)
+
+    def _comparison(self, products) -> GraphAnswer:
+        first, second = products
+        comparison = self.graph.get_product_comparison(first.name, second.name)
+        if "product1" not in comparison:
+            return GraphAnswer("comparison", [first.name, second.name], [])
+
+        facts = []
+        for key in ("product1", "product2"):
+            product = comparison[key]
+            details = []
+            if product["suitable_spaces"]:
+                details.append(f"适用空间 {_join(product['suitable_spaces'])}")
+            if product["suitable_styles"]:
+                details.append(f"适合风格 {_join([s['name'] for s in product['suitable_styles']])}")
+            if product["properties"]:
+                details.append(_summarize(product["properties"]))
+            if details:
+                facts.append(f"{product['name']}: " + "; ".join(details))
+        if comparison["common_spaces"]:
+            facts.append(f"都适用的空间: {_join(comparison['common_spaces'])}")
+        if comparison["is_alternative"]:
+            scenario = comparison.get("alternative_scenario")
+            facts.append(f"{first.name}与{second.name}可相互替代" + (f"（{scenario}）" if scenario else ""))
+        return GraphAnswer("comparison", [first.name, second.name], facts)
+
+    # === 统计 ===
+
+    def record_retrieval(self, elapsed_ms: float) -> None:
+        """记录一次向量检索的耗时（未命中直答时由调用方记录，用于估算直答节省的时间）"""
+        with self._lock:
+            self._retrievals += 1
+            self._retrieval_ms += elapsed_ms
+
+    def get_stats(self) -> Dict[str, Any]:
+        """直答命中率与节省的检索耗时（按未命中请求的向量检索平均耗时估算）"""
+        with self._lock:
+            answered = sum(self._by_intent.values())
+            avg_retrieval = self._retrieval_ms / self._retrievals if self._retrievals else 0.0
+            return {
+                "requests": self._requests,
+                "answered": answered,
+                "hit_rate": round(answered / self._requests, 4) if self._requests else 0.0,
+                "by_intent": dict(self._by_intent),
+                "avg_graph_ms": round(self._graph_ms / self._requests, 3) if self._requests else 0.0,
+                "avg_retrieval_ms": round(avg_retrieval, 3),
+                "saved_ms": round(max(answered * avg_retrieval - self._answered_ms, 0.0), 1),
+            }
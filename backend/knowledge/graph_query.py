@@ -0,0 +1,401 @@
+"""
+知识图谱多跳查询
+
+在邻接索引上做路径遍历：
+- 按关系类型序列逐跳展开（如 空间 ←适用于− 材料 ←生产商− 品牌）
+- 限定深度的广度优先邻域查询
+- 两点间最短路径：不加权时双向广度优先，加权时按 Relation.weight 做 Dijkstra
+查询结果按 (图谱版本, 参数) 缓存（LRU），图谱发布新版本后旧结果不再命中。
+"""
+import heapq
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import (TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, Iterator, List,
+                    Optional, Tuple, Union)
+
+from backend.knowledge.knowledge_graph import Entity, EntityType, Relation, RelationType
+
+if TYPE_CHECKING:
+    from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph
+
+DIRECTIONS = ("outgoing", "incoming", "both")
+_REVERSED = {"outgoing": "incoming", "incoming": "outgoing", "both": "both"}
+
+# 缓存中的路径：(实体ID 序列, 关系下标序列, 代价)
+_RawPath = Tuple[Tuple[str, ...], Tuple[int, ...], float]
+
+
+def _frozen(value) -> Optional[FrozenSet]:
+    if value is None:
+        return None
+    if isinstance(value, (RelationType, EntityType)):
+        return frozenset((value,))
+    return frozenset(value) or None
+
+
+@dataclass(frozen=True)
+class PathStep:
+    """路径中的一跳：关系类型（None 表示任意）、方向、到达实体的类型（None 表示任意）"""
+    relation_types: Optional[FrozenSet[RelationType]] = None
+    direction: str = "outgoing"
+    entity_types: Optional[FrozenSet[EntityType]] = None
+
+    @classmethod
+    def of(cls, relation: Union[RelationType, Iterable[RelationType], None] = None,
+           direction: str = "outgoing",
+           entity_type: Union[EntityType, Iterable[EntityType], None] = None) -> "PathStep":
+        """由单个或多个关系类型/实体类型构造"""
+        if direction not in DIRECTIONS:
+            raise ValueError(f"未知的方向: {direction}")
+        return cls(_frozen(relation), direction, _frozen(entity_type))
+
+
+StepSpec = Union[PathStep, RelationType, Tuple]
+
+
+def _as_step(spec: StepSpec) -> PathStep:
+    """PathStep、关系类型或 (关系类型, 方向[, 实体类型]) 元组"""
+    if isinstance(spec, PathStep):
+        return spec
+    if isinstance(spec, RelationType):
+        return PathStep.of(spec)
+    return PathStep.of(*spec)
+
+
+@dataclass
+class GraphPath:
+    """一条路径：entities[i] 经 relations[i] 到达 entities[i + 1]"""
+    entities: List[Entity]
+    relations: List[Relation] = field(default_factory=list)
+    cost: float = 0.0
+
+    @property
+    def start(self) -> Entity:
+        return self.entities[0]
+
+    @property
+    def end(self) -> Entity:
+        return self.entities[-1]
+
+    @property
+    def length(self) -> int:
+        return len(self.relations)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "nodes": [e.name for e in self.entities],
+            "relations": [r.relation_type.value for r in self.relations],
+            "length": self.length,
+            "cost": self.cost,
+        }
+
+
+class PathQueryEngine:
+    """
+    多跳查询引擎
+
+    只通过邻接索引访问关系，每一跳的开销与该实体的度数成正比；
+    相同参数的查询命中 LRU 缓存，缓存键中含图谱版本号。
+    """
+
+    def __init__(self, graph: "DecorationKnowledgeGraph", cache_size: int = 256):
+        self.graph = graph
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # === 缓存 ===
+
+    def _memoized(self, key: tuple, compute):
+        # 计算期间固定读取同一个图谱版本，版本号作为键的一部分：
+        # 读旧版本的线程与读新版本的线程互不干扰；批量更新中的草稿（版本为 None）不缓存
+        with self.graph.read_snapshot() as snapshot:
+            if snapshot.version is None:
+                return compute()
+            key = (snapshot.version, key)
+            with self._lock:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return self._cache[key]
+                self.misses += 1
+
+            value = compute()
+            with self._lock:
+                self._cache[key] = value
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return value
+
+    def cache_info(self) -> Dict[str, int]:
+        """缓存命中统计"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
+
+    # === 基础操作 ===
+
+    def _neighbors(self, entity_id: str, relation_types: Optional[FrozenSet[RelationType]],
+                   direction: str) -> Iterator[Tuple[str, int]]:
+        """相邻实体：(实体ID, 关系下标)"""
+        snapshot = self.graph.snapshot
+        table = snapshot.relations
+        ids = table.entity_ids
+        if direction in ("outgoing", "both"):
+            targets = table.targets
+            for relation_type, indices in snapshot.outgoing.get(entity_id, {}).items():
+                if relation_types is None or relation_type in relation_types:
+                    for i in indices:
+                        yield ids[targets[i]], i
+        if direction in ("incoming", "both"):
+            sources = table.sources
+            for relation_type, indices in snapshot.incoming.get(entity_id, {}).items():
+                if relation_types is None or relation_type in relation_types:
+                    for i in indices:
+                        yield ids[sources[i]], i
+
+    def _materialize(self, raw: _RawPath) -> GraphPath:
+        ids, relation_indices, cost = raw
+        snapshot = self.graph.snapshot
+        entities, relations = snapshot.entities, snapshot.relations
+        return GraphPath(
+            entities=[entities[i] for i in ids],
+            relations=[relations[i] for i in relation_indices],
+            cost=cost,
+        )
+
+    # === 按关系类型序列展开 ===
+
+    def follow(self, start: str, steps: List[StepSpec], limit: int = None) -> List[GraphPath]:
+        """
+        按关系类型序列逐跳展开
+
+        Args:
+            start: 起点实体名称或别名
+            steps: 每一跳的 PathStep、关系类型（出边）或 (关系类型, 方向[, 实体类型]) 元组
+            limit: 最多返回的完整路径数
+
+        Returns:
+            走完全部步骤的路径（路径内不重复经过同一实体）
+        """
+        start_id = self.graph._resolve_entity_id(start)
+        if not start_id or not steps:
+            return []
+        steps = tuple(_as_step(s) for s in steps)
+        raw = self._memoized(("follow", start_id, steps, limit),
+                             lambda: self._follow(start_id, steps, limit))
+        return [self._materialize(p) for p in raw]
+
+    def _follow(self, start_id: str, steps: Tuple[PathStep, ...], limit: Optional[int]) -> Tuple[_RawPath, ...]:
+        entities = self.graph.entities
+        frontier = [((start_id,), ())]
+        for depth, step in enumerate(steps):
+            last = depth == len(steps) - 1
+            expanded = []
+            for ids, relation_indices in frontier:
+                for neighbor, i in self._neighbors(ids[-1], step.relation_types, step.direction):
+                    if neighbor in ids:
+                        continue
+                    if step.entity_types and entities[neighbor].entity_type not in step.entity_types:
+                        continue
+                    expanded.append((ids + (neighbor,), relation_indices + (i,)))
+                    if last and limit and len(expanded) >= limit:
+                        break
+                if last and limit and len(expanded) >= limit:
+                    break
+            frontier = expanded
+            if not frontier:
+                break
+        return tuple((ids, relation_indices, float(len(relation_indices))) for ids, relation_indices in frontier)
+
+    # === 邻域（广度优先） ===
+
+    def neighborhood(self, start: str, max_depth: int = 2,
+                     relation_types: Iterable[RelationType] = None, direction: str = "both",
+                     entity_types: Iterable[EntityType] = None, limit: int = None) -> List[GraphPath]:
+        """
+        广度优先查找 max_depth 跳以内可达的实体
+
+        Args:
+            start: 起点实体名称或别名
+            max_depth: 最大跳数
+            relation_types: 允许经过的关系类型（可选）
+            direction: 方向
+            entity_types: 只返回这些类型的实体（遍历时仍经过其他类型）
+            limit: 最多返回的实体数
+
+        Returns:
+            到每个可达实体的最短（跳数）路径，按距离由近到远
+        """
+        start_id = self.graph._resolve_entity_id(start)
+        if not start_id:
+            return []
+        step = PathStep.of(relation_types, direction, entity_types)
+        raw = self._memoized(("neighborhood", start_id, step, max_depth, limit),
+                             lambda: self._neighborhood(start_id, step, max_depth, limit))
+        return [self._materialize(p) for p in raw]
+
+    def _neighborhood(self, start_id: str, step: PathStep, max_depth: int,
+                      limit: Optional[int]) -> Tuple[_RawPath, ...]:
+        entities = self.graph.entities
+        parents: Dict[str, Optional[Tuple[str, int]]] = {start_id: None}
+        found = []
+        frontier = [start_id]
+        for _ in range(max_depth):
+            expanded = []
+            for entity_id in frontier:
+                for neighbor, i in self._neighbors(entity_id, step.relation_types, step.direction):
+                    if neighbor in parents:
+                        continue
+                    parents[neighbor] = (entity_id, i)
+                    expanded.append(neighbor)
+                    if not step.entity_types or entities[neighbor].entity_type in step.entity_types:
+                        found.append(neighbor)
+                        if limit and len(found) >= limit:
+                            return tuple(self._trace(parents, n) for n in found)
+            frontier = expanded
+            if not frontier:
+                break
+        return tuple(self._trace(parents, n) for n in found)
+
+    @staticmethod
+    def _trace(parents: Dict[str, Optional[Tuple[str, int]]], entity_id: str) -> _RawPath:
+        """沿父指针回溯到起点"""
+        ids = [entity_id]
+        relation_indices = []
+        while parents[ids[-1]] is not None:
+            previous, i = parents[ids[-1]]
+            ids.append(previous)
+            relation_indices.append(i)
+        ids.reverse()
+        relation_indices.reverse()
+        return tuple(ids), tuple(relation_indices), float(len(relation_indices))
+
+    # === 最短路径 ===
+
+    def shortest_path(self, source: str, target: str, max_depth: int = 4,
+                      relation_types: Iterable[RelationType] = None, direction: str = "both",
+                      weighted: bool = False) -> Optional[GraphPath]:
+        """
+        两点间最短路径
+
+        Args:
+            source: 起点实体名称或别名
+            target: 终点实体名称或别名
+            max_depth: 最大跳数
+            relation_types: 允许经过的关系类型（可选）
+            direction: 方向（从起点看）
+            weighted: False 时按跳数（双向广度优先）；True 时以 Relation.weight 为边长（需非负）
+
+        Returns:
+            路径，不可达时返回 None
+        """
+        source_id = self.graph._resolve_entity_id(source)
+        target_id = self.graph._resolve_entity_id(target)
+        if not source_id or not target_id:
+            return None
+        step = PathStep.of(relation_types, direction)
+        if weighted:
+            compute = lambda: self._dijkstra(source_id, target_id, step, max_depth)
+        else:
+            compute = lambda: self._bidirectional(source_id, target_id, step, max_depth)
+        raw = self._memoized(("shortest", source_id, target_id, step, max_depth, weighted), compute)
+        return self._materialize(raw) if raw else None
+
+    def _bidirectional(self, source_id: str, target_id: str, step: PathStep,
+                       max_depth: int) -> Optional[_RawPath]:
+        """双向广度优先：每轮展开较小的一侧的一整层，两侧相遇时取总跳数最少的相遇点"""
+        if source_id == target_id:
+            return (source_id,), (), 0.0
+
+        forward = {source_id: None}
+        backward = {target_id: None}
+        forward_depth = {source_id: 0}
+        backward_depth = {target_id: 0}
+        forward_frontier = [source_id]
+        backward_frontier = [target_id]
+
+        for _ in range(max_depth):
+            if not forward_frontier or not backward_frontier:
+                return None
+            if len(forward_frontier) <= len(backward_frontier):
+                parents, depth, other, direction = forward, forward_depth, backward_depth, step.direction
+                frontier = forward_frontier
+            else:
+                parents, depth, other, direction = backward, backward_depth, forward_depth, _REVERSED[step.direction]
+                frontier = backward_frontier
+
+            expanded = []
+            meet = None
+            for entity_id in frontier:
+                for neighbor, i in self._neighbors(entity_id, step.relation_types, direction):
+                    if neighbor in parents:
+                        continue
+                    parents[neighbor] = (entity_id, i)
+                    depth[neighbor] = depth[entity_id] + 1
+                    expanded.append(neighbor)
+                    if neighbor in other:
+                        total = depth[neighbor] + other[neighbor]
+                        if meet is None or total < meet[0]:
+                            meet = (total, neighbor)
+
+            if frontier is forward_frontier:
+                forward_frontier = expanded
+            else:
+                backward_frontier = expanded
+
+            if meet:
+                head_ids, head_relations, _ = self._trace(forward, meet[1])
+                tail_ids, tail_relations, _ = self._trace(backward, meet[1])
+                ids = head_ids + tuple(reversed(tail_ids[:-1]))
+                relation_indices = head_relations + tuple(reversed(tail_relations))
+                return ids, relation_indices, float(len(relation_indices))
+        return None
+
+    def _dijkstra(self, source_id: str, target_id: str, step: PathStep,
+                  max_depth: int) -> Optional[_RawPath]:
+        """
+        按权重的最短路径（限制跳数）
+
+        状态为 (实体, 跳数)：代价更低但跳数超限的路径不会挡住跳数内的次优路径。
+        """
+        weights = self.graph.relations.weights
+        heap = [(0.0, 0, source_id)]
+        parents: Dict[Tuple[str, int], Optional[Tuple[str, int, int]]] = {(source_id, 0): None}
+        costs = {(source_id, 0): 0.0}
+        settled_hops: Dict[str, int] = {}
+
+        while heap:
+            cost, hops, entity_id = heapq.heappop(heap)
+            if cost > costs.get((entity_id, hops), float("inf")):
+                continue
+            # 已有代价不更高、跳数不更多的状态时，该状态不可能更优
+            if settled_hops.get(entity_id, max_depth + 1) <= hops:
+                continue
+            settled_hops[entity_id] = hops
+
+            if entity_id == target_id:
+                ids = [entity_id]
+                relation_indices = []
+                state = (entity_id, hops)
+                while parents[state] is not None:
+                    previous, previous_hops, i = parents[state]
+                    ids.append(previous)
+                    relation_indices.append(i)
+                    state = (previous, previous_hops)
+                return tuple(reversed(ids)), tuple(reversed(relation_indices)), cost
+
+            if hops == max_depth:
+                continue
+            for neighbor, i in self._neighbors(entity_id, step.relation_types, step.direction):
+                weight = weights[i]
+                if weight < 0:
+                    raise ValueError(f"关系权重不能为负: {weight}")
+                state = (neighbor, hops + 1)
+                new_cost = cost + weight
+                if new_cost < costs.get(state, float("inf")):
+                    costs[state] = new_cost
+                    parents[state] = (entity_id, hops, i)
+                    heapq.heappush(heap, (new_cost, hops + 1, neighbor))
+        return None
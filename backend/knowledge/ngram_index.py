@@ -0,0 +1,144 @@
+"""
+知识图谱实体搜索索引
+
+实体名称与别名的字符 n-gram 倒排索引（小写形式在建索引时一次算好），
+子串查询变为倒排表求交集加少量校验，不再逐个实体、逐个别名扫描。
+"""
+import copy
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.knowledge.knowledge_graph import Entity, EntityType
+
+# 索引的最大 n-gram 长度：查询不超过该长度时倒排表命中即匹配，更长的查询需要校验
+MAX_GRAM = 3
+
+
+class NGramIndex:
+    """
+    实体名称/别名的 n-gram 倒排索引
+
+    每个名称或别名是一个词条，为其全部 1~3 字的子串建立倒排表（gram -> 词条ID 集合）：
+    - 查询长度 1~3：直接取该 gram 的倒排表
+    - 查询长度大于 3：查询中全部三元组的倒排表求交集，再对候选词条做子串校验
+    实体类型过滤同样是与该类型词条集合求交集。
+
+    词条与倒排表只追加：新版本的索引由 extend() 派生，与上一版本共享这些数据，
+    各版本只看到自己的词条数与实体数以内的部分，旧版本的查询结果不变。
+    """
+
+    def __init__(self):
+        self._terms: List[str] = []             # 词条（小写）
+        self._term_entity: List[int] = []       # 词条 -> 实体序号
+        self._term_is_alias: List[bool] = []
+        self._entity_ids: List[str] = []        # 实体序号 -> 实体ID（按加入顺序）
+        self._entity_types: List[EntityType] = []
+        self._ordinals: Dict[str, int] = {}
+        self._entity_terms: List[Set[str]] = []  # 每个实体已建索引的词条，重复加入时跳过
+        self._postings: Dict[str, Set[int]] = {}
+        self._type_terms: Dict[EntityType, Set[int]] = {}
+        self._term_limit = 0     # 本版本可见的词条数
+        self._entity_limit = 0   # 本版本可见的实体数
+
+    def __len__(self) -> int:
+        return self._entity_limit
+
+    def extend(self, entities: Iterable[Entity]) -> Optional["NGramIndex"]:
+        """
+        派生加入新增实体（或新增别名）后的新版本索引，本索引不变
+
+        Returns:
+            新索引；本索引之后已派生过其他版本（共享数据已追加）时返回 None，需要重新构建
+        """
+        if self._term_limit != len(self._terms):
+            return None
+        index = copy.copy(self)
+        for entity in entities:
+            index.add(entity)
+        return index
+
+    def add(self, entity: Entity) -> None:
+        """加入实体（已存在时只补充新增的别名）"""
+        ordinal = self._ordinals.get(entity.id)
+        if ordinal is None:
+            ordinal = self._ordinals[entity.id] = len(self._entity_ids)
+            self._entity_ids.append(entity.id)
+            self._entity_types.append(entity.entity_type)
+            self._entity_terms.append(set())
+
+        self._add_term(ordinal, entity.name.lower(), False)
+        for alias in entity.aliases:
+            self._add_term(ordinal, alias.lower(), True)
+        self._term_limit = len(self._terms)
+        self._entity_limit = len(self._entity_ids)
+
+    def _add_term(self, ordinal: int, term: str, is_alias: bool) -> None:
+        if term in self._entity_terms[ordinal]:
+            return
+        self._entity_terms[ordinal].add(term)
+
+        term_id = len(self._terms)
+        self._terms.append(term)
+        self._term_entity.append(ordinal)
+        self._term_is_alias.append(is_alias)
+        self._type_terms.setdefault(self._entity_types[ordinal], set()).add(term_id)
+        for n in range(1, MAX_GRAM + 1):
+            for i in range(len(term) - n + 1):
+                self._postings.setdefault(term[i:i + n], set()).add(term_id)
+
+    def _candidates(self, query: str, entity_type: Optional[EntityType]) -> Set[int]:
+        """包含查询串的词条ID集合"""
+        n = min(len(query), MAX_GRAM)
+        sets = []
+        for gram in {query[i:i + n] for i in range(len(query) - n + 1)}:
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            sets.append(posting)
+        if entity_type is not None:
+            sets.append(self._type_terms.get(entity_type, set()))
+
+        # 从最小的集合开始求交集
+        sets.sort(key=len)
+        terms = sets[0].intersection(*sets[1:])
+        if self._term_limit < len(self._terms):
+            terms = {t for t in terms if t < self._term_limit}
+        if len(query) > MAX_GRAM:
+            terms = {t for t in terms if query in self._terms[t]}
+        return terms
+
+    def search(self, query: str, entity_type: EntityType = None,
+               limit: int = 10, rank: bool = False) -> List[str]:
+        """
+        子串搜索
+
+        Args:
+            query: 搜索关键词（不区分大小写）
+            entity_type: 实体类型（可选）
+            limit: 返回数量限制
+            rank: 是否按匹配质量排序（完全匹配 > 前缀匹配 > 包含；名称优先于别名，较短的优先），
+                  否则按实体加入顺序
+
+        Returns:
+            实体ID列表
+        """
+        query = query.lower()
+        if not query:
+            ordinals = (i for i, t in enumerate(self._entity_types[:self._entity_limit])
+                        if entity_type is None or t == entity_type)
+            return [self._entity_ids[i] for i, _ in zip(ordinals, range(limit))]
+
+        terms = self._candidates(query, entity_type)
+        if not rank:
+            ordinals = sorted({self._term_entity[t] for t in terms})
+            return [self._entity_ids[i] for i in ordinals[:limit]]
+
+        best: Dict[int, Tuple] = {}
+        for t in terms:
+            term = self._terms[t]
+            level = 0 if term == query else 1 if term.startswith(query) else 2
+            ordinal = self._term_entity[t]
+            key = (level, self._term_is_alias[t], len(term), ordinal)
+            if ordinal not in best or key < best[ordinal]:
+                best[ordinal] = key
+        ranked = sorted(best.values())[:limit]
+        return [self._entity_ids[key[-1]] for key in ranked]
@@ -0,0 +1,58 @@
+"""
+长期记忆向量补建脚本
+为启用向量召回之前写入的长期记忆批量生成向量
+"""
+import os
+import sys
+import time
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.core.memory import MemoryManager
+
+
+def backfill(storage_dir: str = None, backend: str = "sqlite",
+             user_id: str = None, batch_size: int = 64) -> int:
+    """
+    补建长期记忆向量
+
+    Args:
+        storage_dir: 记忆存储目录，默认与服务相同
+        backend: 存储后端类型
+        user_id: 可选，只处理指定用户
+        batch_size: 每批嵌入条数
+
+    Returns:
+        新写入的向量条数
+    """
+    manager = MemoryManager(
+        storage_dir=storage_dir,
+        backend=backend,
+        semantic_recall=True,
+    )
+    if manager.vector_index is None:
+        print("[错误] 向量召回不可用（需要安装 numpy）")
+        return 0
+
+    start = time.perf_counter()
+    written = manager.backfill_vectors(user_id=user_id, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    print(f"补建完成: {written} 条向量，耗时 {elapsed:.1f}s")
+    print(f"索引状态: {manager.vector_index.stats()}")
+    manager.shutdown()
+    return written
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="DecoPilot 长期记忆向量补建")
+    parser.add_argument("--storage-dir", default=None, help="记忆存储目录")
+    parser.add_argument("--backend", default=os.environ.get("MEMORY_BACKEND", "sqlite"),
+                        help="存储后端类型")
+    parser.add_argument("--user-id", default=None, help="只处理指定用户")
+    parser.add_argument("--batch-size", type=int, default=64, help="每批嵌入条数")
+    args = parser.parse_args()
+
+    backfill(args.storage_dir, args.backend, args.user_id, args.batch_size)
@@ -2,17 +2,29 @@
 会话历史存储模块
 支持文件存储和 Redis 分布式存储
 """
+import asyncio
+import functools
 import json
 import os
 import time
 import threading
-from typing import Sequence, Optional, Dict
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence, Optional, Dict, List
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
 
+# 文件锁（仅 POSIX，用于多进程追加与压缩互斥）
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
 # 尝试导入 Redis
 try:
     import redis
+    import redis.asyncio as aioredis
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
@@ -24,6 +36,136 @@ REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_DB = int(os.getenv("REDIS_DB", "0"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", None)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))     # 连接池上限
+REDIS_HISTORY_TTL = int(os.getenv("REDIS_HISTORY_TTL", str(86400 * 7)))  # 会话过期时间（秒）
+
+# 文件存储配置
+HISTORY_STORAGE_PATH = "./chat_history"
+HISTORY_WINDOW = int(os.getenv("HISTORY_WINDOW", "100"))                    # 读取的最近消息条数
+HISTORY_COMPACT_BYTES = int(os.getenv("HISTORY_COMPACT_BYTES", str(1024 * 1024)))  # 超过该大小时压缩
+HISTORY_KEEP_MESSAGES = int(os.getenv("HISTORY_KEEP_MESSAGES", "500"))      # 压缩后保留的消息条数
+HISTORY_IO_WORKERS = int(os.getenv("HISTORY_IO_WORKERS", "4"))              # 异步文件 I/O 线程数
+
+
+# 文件历史的异步 I/O 专用线程池（不占用事件循环默认线程池）
+_history_io_executor: Optional[ThreadPoolExecutor] = None
+_history_io_lock = threading.Lock()
+
+
+def get_history_io_executor() -> ThreadPoolExecutor:
+    """获取文件历史异步 I/O 线程池单例"""
+    global _history_io_executor
+    if _history_io_executor is None:
+        with _history_io_lock:
+            if _history_io_executor is None:
+                _history_io_executor = ThreadPoolExecutor(
+                    max_workers=HISTORY_IO_WORKERS,
+                    thread_name_prefix="history-io",
+                )
+    return _history_io_executor
+
+
+async def _run_history_io(func, *args):
+    """在专用线程池中执行阻塞的文件操作"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_history_io_executor(), functools.partial(func, *args))
+
+
+# Redis 连接池（模块级共享，按连接参数区分）
+_redis_pools: Dict[tuple, "redis.ConnectionPool"] = {}
+_redis_pool_lock = threading.Lock()
+
+# redis.asyncio 连接绑定事件循环，连接池按事件循环隔离，循环销毁后自动释放
+_async_redis_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, aioredis.ConnectionPool]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _redis_key(host: str = None, port: int = None, db: int = None,
+               password: str = None) -> tuple:
+    """连接参数（未指定的取环境配置）"""
+    return (
+        host or REDIS_HOST,
+        port if port is not None else REDIS_PORT,
+        db if db is not None else REDIS_DB,
+        password if password is not None else REDIS_PASSWORD,
+    )
+
+
+def get_redis_pool(host: str = None, port: int = None, db: int = None,
+                   password: str = None) -> "redis.ConnectionPool":
+    """
+    获取共享的 Redis 连接池
+
+    连接按需建立并复用，不在每次请求时 ping；
+    失效连接由 health_check_interval 在取用时检测并重连。
+    """
+    if not REDIS_AVAILABLE:
+        raise ImportError("Redis 未安装，请运行: pip install redis")
+
+    key = _redis_key(host, port, db, password)
+    pool = _redis_pools.get(key)
+    if pool is None:
+        with _redis_pool_lock:
+            pool = _redis_pools.get(key)
+            if pool is None:
+                pool = redis.ConnectionPool(
+                    host=key[0],
+                    port=key[1],
+                    db=key[2],
+                    password=key[3],
+                    max_connections=REDIS_MAX_CONNECTIONS,
+                    decode_responses=True,
+                    health_check_interval=30,
+                )
+                _redis_pools[key] = pool
+    return pool
+
+
+def get_redis_client(host: str = None, port: int = None, db: int = None,
+                     password: str = None) -> "redis.Redis":
+    """获取基于共享连接池的 Redis 客户端（创建开销很小）"""
+    return redis.Redis(connection_pool=get_redis_pool(host, port, db, password))
+
+
+def close_redis_pools() -> None:
+    """断开所有共享连接池（进程退出或测试清理时调用）"""
+    with _redis_pool_lock:
+        for pool in _redis_pools.values():
+            pool.disconnect()
+        _redis_pools.clear()
+
+
+def get_async_redis_client(host: str = None, port: int = None, db: int = None,
+                           password: str = None) -> "aioredis.Redis":
+    """获取当前事件循环共享连接池上的 redis.asyncio 客户端"""
+    if not REDIS_AVAILABLE:
+        raise ImportError("Redis 未安装，请运行: pip install redis")
+
+    loop = asyncio.get_running_loop()
+    key = _redis_key(host, port, db, password)
+    with _redis_pool_lock:
+        pools = _async_redis_pools.setdefault(loop, {})
+        pool = pools.get(key)
+        if pool is None:
+            pool = aioredis.ConnectionPool(
+                host=key[0],
+                port=key[1],
+                db=key[2],
+                password=key[3],
+                max_connections=REDIS_MAX_CONNECTIONS,
+                decode_responses=True,
+                health_check_interval=30,
+            )
+            pools[key] = pool
+    return aioredis.Redis(connection_pool=pool)
+
+
+async def aclose_redis_pools() -> None:
+    """断开当前事件循环上的异步连接池"""
+    with _redis_pool_lock:
+        pools = _async_redis_pools.pop(asyncio.get_running_loop(), {})
+    for pool in pools.values():
+        await pool.disconnect()
 
 
 def get_history(session_id: str) -> BaseChatMessageHistory:
@@ -33,15 +175,9 @@ def get_history(session_id: str) -> BaseChatMessageHistory:
     根据环境配置自动选择存储后端
     """
     if STORAGE_BACKEND == "redis" and REDIS_AVAILABLE:
-        return RedisChatMessageHistory(
-            session_id=session_id,
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            db=REDIS_DB,
-            password=REDIS_PASSWORD,
-        )
+        return RedisListChatMessageHistory(session_id, get_redis_client())
     else:
-        return FileChatMessageHistory(session_id, "./chat_history")
+        return JSONLChatMessageHistory(session_id, HISTORY_STORAGE_PATH)
 
 
 class FileChatMessageHistory(BaseChatMessageHistory):
@@ -88,6 +224,176 @@ class FileChatMessageHistory(BaseChatMessageHistory):
             json.dump([], f)
 
 
+class JSONLChatMessageHistory(BaseChatMessageHistory):
+    """
+    追加写入的 JSONL 会话历史
+
+    - 每条消息一行，add_messages 只追加新消息
+    - messages 从文件末尾反向分块读取最近 window 条，不解析整个文件
+    - 文件超过 compact_bytes 时压缩为最近 keep_messages 条
+    - 首次访问时自动迁移旧版 JSON 数组格式的会话文件
+    - aget_messages / aadd_messages 在专用 I/O 线程池中执行，异步调用链不阻塞事件循环
+    """
+
+    SUFFIX = ".jsonl"
+    READ_BLOCK = 8192
+
+    # 同一进程内按文件路径互斥
+    _path_locks: Dict[str, threading.Lock] = {}
+    _path_locks_guard = threading.Lock()
+
+    def __init__(self, session_id: str, storage_path: str,
+                 window: int = None, compact_bytes: int = None,
+                 keep_messages: int = None):
+        """
+        初始化 JSONL 会话历史
+
+        Args:
+            session_id: 会话 ID
+            storage_path: 会话文件所在目录
+            window: 读取的最近消息条数，默认 HISTORY_WINDOW
+            compact_bytes: 触发压缩的文件大小，默认 HISTORY_COMPACT_BYTES
+            keep_messages: 压缩后保留的消息条数，默认 HISTORY_KEEP_MESSAGES
+        """
+        self.session_id = session_id
+        self.storage_path = storage_path
+        self.window = window or HISTORY_WINDOW
+        self.compact_bytes = compact_bytes or HISTORY_COMPACT_BYTES
+        self.keep_messages = max(keep_messages or HISTORY_KEEP_MESSAGES, self.window)
+
+        self.file_path = os.path.join(storage_path, session_id + self.SUFFIX)
+        self.legacy_path = os.path.join(storage_path, session_id)
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+
+        with self._path_locks_guard:
+            self._lock = self._path_locks.setdefault(self.file_path, threading.Lock())
+
+        self._migrate_legacy()
+
+    def _migrate_legacy(self):
+        """迁移旧版 JSON 数组文件（只执行一次）"""
+        if not os.path.isfile(self.legacy_path) or os.path.exists(self.file_path):
+            return
+        with self._lock:
+            try:
+                with open(self.legacy_path, "r", encoding="utf-8") as f:
+                    messages_data = json.load(f)
+                self._write_lines(self._encode_lines(messages_data))
+                os.remove(self.legacy_path)
+            except Exception:
+                # 迁移失败时保留旧文件，不影响新消息写入
+                pass
+
+    @staticmethod
+    def _encode_lines(messages_data: List[Dict]) -> List[str]:
+        return [json.dumps(d, ensure_ascii=False) for d in messages_data]
+
+    def _write_lines(self, lines: List[str]):
+        """原子地重写整个文件"""
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            if lines:
+                f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, self.file_path)
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """只追加新消息"""
+        if not messages:
+            return
+        payload = "\n".join(self._encode_lines([message_to_dict(m) for m in messages])) + "\n"
+        data = payload.encode("utf-8")
+
+        with self._lock:
+            while True:
+                with open(self.file_path, "ab") as f:
+                    if FCNTL_AVAILABLE:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                    try:
+                        # 等锁期间文件可能已被其他进程压缩替换，需重新打开
+                        if FCNTL_AVAILABLE and os.fstat(f.fileno()).st_ino != os.stat(self.file_path).st_ino:
+                            continue
+                        f.write(data)
+                        f.flush()
+                        size = f.tell()
+                        break
+                    finally:
+                        if FCNTL_AVAILABLE:
+                            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+            if size > self.compact_bytes:
+                self.compact()
+
+    def _read_tail_lines(self, count: int) -> List[bytes]:
+        """从文件末尾反向读取最后 count 行"""
+        try:
+            f = open(self.file_path, "rb")
+        except FileNotFoundError:
+            return []
+
+        with f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            buffer = b""
+            # 需要 count 个完整行：末尾换行 + count 个分隔换行
+            while pos > 0 and buffer.count(b"\n") <= count:
+                step = min(self.READ_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                buffer = f.read(step) + buffer
+
+        lines = [line for line in buffer.split(b"\n") if line.strip()]
+        if pos > 0:
+            # 首行可能不完整
+            lines = lines[1:]
+        return lines[-count:]
+
+    def _parse_lines(self, lines: List[bytes]) -> List[BaseMessage]:
+        messages_data = []
+        for line in lines:
+            try:
+                messages_data.append(json.loads(line))
+            except json.JSONDecodeError:
+                # 跳过并发写入时的残行
+                continue
+        return messages_from_dict(messages_data)
+
+    @property
+    def messages(self) -> list[BaseMessage]:
+        """最近 window 条消息"""
+        return self._parse_lines(self._read_tail_lines(self.window))
+
+    def get_messages(self, limit: int) -> list[BaseMessage]:
+        """读取最近 limit 条消息"""
+        return self._parse_lines(self._read_tail_lines(limit))
+
+    def compact(self) -> None:
+        """压缩文件，只保留最近 keep_messages 条消息"""
+        with open(self.file_path, "ab") as lock_file:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                lines = self._read_tail_lines(self.keep_messages)
+                self._write_lines([line.decode("utf-8") for line in lines])
+            finally:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._write_lines([])
+
+    async def aget_messages(self) -> List[BaseMessage]:
+        """异步读取最近 window 条消息"""
+        return await _run_history_io(self.get_messages, self.window)
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """异步追加消息"""
+        await _run_history_io(self.add_messages, messages)
+
+    async def aclear(self) -> None:
+        await _run_history_io(self.clear)
+
+
 class RedisChatMessageHistory(BaseChatMessageHistory):
     """
     Redis 分布式会话历史存储
@@ -175,6 +481,218 @@ class RedisChatMessageHistory(BaseChatMessageHistory):
         }
 
 
+class RedisListChatMessageHistory(BaseChatMessageHistory):
+    """
+    基于 Redis 列表的会话历史存储
+
+    每条消息是列表中的一个 JSON 元素:
+    - 写入: RPUSH + LTRIM（保留最近 max_messages 条）+ EXPIRE，在同一个事务流水线中完成，
+      每轮只传输新增消息，并发写同一会话不会互相覆盖
+    - 读取: LRANGE 只取最近 window 条
+    - 连接来自模块级共享连接池，不做每次请求的 ping
+    - aget_messages / aadd_messages 走 redis.asyncio，异步调用链（astream_events）不阻塞事件循环
+
+    兼容 RedisChatMessageHistory 写入的整块 JSON 字符串键：首次访问时在 WATCH/MULTI 下转换为列表，
+    并发转换时只有一个生效，键已是列表则视为已转换。
+    """
+
+    def __init__(self, session_id: str, client: "redis.Redis" = None,
+                 ttl: int = None, key_prefix: str = "chat_history:",
+                 window: int = None, max_messages: int = None,
+                 async_client: "aioredis.Redis" = None):
+        """
+        Args:
+            session_id: 会话 ID
+            client: Redis 客户端，默认使用共享连接池
+            async_client: redis.asyncio 客户端，默认按 client 的连接参数取当前事件循环的共享连接池
+            ttl: 会话过期时间（秒），每次写入时刷新
+            key_prefix: Redis 键前缀
+            window: 读取的最近消息条数
+            max_messages: 列表最多保留的消息条数
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError("Redis 未安装，请运行: pip install redis")
+
+        self.session_id = session_id
+        self.key = f"{key_prefix}{session_id}"
+        self.ttl = ttl if ttl is not None else REDIS_HISTORY_TTL
+        self.window = window if window is not None else HISTORY_WINDOW
+        self.max_messages = max(
+            max_messages if max_messages is not None else HISTORY_KEEP_MESSAGES,
+            self.window,
+        )
+        self._redis = client if client is not None else get_redis_client()
+        self._aredis = async_client
+
+    @staticmethod
+    def _is_wrong_type(error: Exception) -> bool:
+        return "WRONGTYPE" in str(error)
+
+    def _legacy_items(self, data: Optional[str]) -> List[str]:
+        """旧版整块 JSON 字符串拆分为列表元素"""
+        items = [json.dumps(d, ensure_ascii=False) for d in json.loads(data)] if data else []
+        return items[-self.max_messages:]
+
+    @staticmethod
+    def _is_string(key_type) -> bool:
+        return key_type in ("string", b"string")
+
+    def _migrate_legacy(self) -> None:
+        """将旧版整块 JSON 字符串转换为列表（WATCH 期间键被改动则重试）"""
+        with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    pipe.watch(self.key)
+                    if not self._is_string(pipe.type(self.key)):
+                        # 已被其他请求转换（或已删除）
+                        pipe.unwatch()
+                        return
+                    items = self._legacy_items(pipe.get(self.key))
+                    pipe.multi()
+                    pipe.delete(self.key)
+                    if items:
+                        pipe.rpush(self.key, *items)
+                        pipe.expire(self.key, self.ttl)
+                    pipe.execute()
+                    return
+                except redis.WatchError:
+                    continue
+
+    def _append(self, items: List[str]) -> None:
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.rpush(self.key, *items)
+        pipe.ltrim(self.key, -self.max_messages, -1)
+        pipe.expire(self.key, self.ttl)
+        pipe.execute()
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """追加消息，只传输新增部分"""
+        if not messages:
+            return
+        items = [json.dumps(message_to_dict(m), ensure_ascii=False) for m in messages]
+        try:
+            self._append(items)
+        except redis.ResponseError as e:
+            if not self._is_wrong_type(e):
+                raise
+            self._migrate_legacy()
+            self._append(items)
+
+    def get_messages(self, limit: Optional[int] = None) -> List[BaseMessage]:
+        """读取最近 limit 条消息（None 表示列表中保留的全部）"""
+        if limit is not None and limit <= 0:
+            return []
+        start = -limit if limit else 0
+        try:
+            raw = self._redis.lrange(self.key, start, -1)
+        except redis.ResponseError as e:
+            if not self._is_wrong_type(e):
+                raise
+            self._migrate_legacy()
+            raw = self._redis.lrange(self.key, start, -1)
+        return self._decode(raw)
+
+    @staticmethod
+    def _decode(raw: List[str]) -> List[BaseMessage]:
+        data = []
+        for item in raw:
+            try:
+                data.append(json.loads(item))
+            except json.JSONDecodeError:
+                continue
+        return messages_from_dict(data)
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """最近 window 条消息"""
+        return self.get_messages(self.window)
+
+    def clear(self) -> None:
+        """清空会话历史"""
+        self._redis.delete(self.key)
+
+    # ---------- 异步接口（流式链路使用，不阻塞事件循环） ----------
+
+    def _async_client(self) -> "aioredis.Redis":
+        if self._aredis is not None:
+            return self._aredis
+        kwargs = self._redis.connection_pool.connection_kwargs
+        return get_async_redis_client(
+            kwargs.get("host"), kwargs.get("port"), kwargs.get("db"), kwargs.get("password")
+        )
+
+    async def _amigrate_legacy(self, client: "aioredis.Redis") -> None:
+        async with client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(self.key)
+                    if not self._is_string(await pipe.type(self.key)):
+                        await pipe.unwatch()
+                        return
+                    items = self._legacy_items(await pipe.get(self.key))
+                    pipe.multi()
+                    pipe.delete(self.key)
+                    if items:
+                        pipe.rpush(self.key, *items)
+                        pipe.expire(self.key, self.ttl)
+                    await pipe.execute()
+                    return
+                except redis.WatchError:
+                    continue
+
+    async def _aappend(self, client: "aioredis.Redis", items: List[str]) -> None:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.rpush(self.key, *items)
+            pipe.ltrim(self.key, -self.max_messages, -1)
+            pipe.expire(self.key, self.ttl)
+            await pipe.execute()
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """异步追加消息"""
+        if not messages:
+            return
+        items = [json.dumps(message_to_dict(m), ensure_ascii=False) for m in messages]
+        client = self._async_client()
+        try:
+            await self._aappend(client, items)
+        except redis.ResponseError as e:
+            if not self._is_wrong_type(e):
+                raise
+            await self._amigrate_legacy(client)
+            await self._aappend(client, items)
+
+    async def aget_messages(self) -> List[BaseMessage]:
+        """异步读取最近 window 条消息"""
+        client = self._async_client()
+        try:
+            raw = await client.lrange(self.key, -self.window, -1)
+        except redis.ResponseError as e:
+            if not self._is_wrong_type(e):
+                raise
+            await self._amigrate_legacy(client)
+            raw = await client.lrange(self.key, -self.window, -1)
+        return self._decode(raw)
+
+    async def aclear(self) -> None:
+        await self._async_client().delete(self.key)
+
+    def get_session_info(self) -> Dict:
+        """获取会话信息"""
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.type(self.key)
+        pipe.llen(self.key)
+        pipe.ttl(self.key)
+        key_type, count, ttl = pipe.execute(raise_on_error=False)
+        if key_type == "string" or isinstance(count, Exception):
+            count = len(self.get_messages())
+        return {
+            "session_id": self.session_id,
+            "message_count": count,
+            "ttl_seconds": ttl,
+            "storage_type": "redis",
+        }
+
+
 class SessionManager:
     """
     会话管理器
@@ -199,13 +717,7 @@ class SessionManager:
         """初始化 Redis 连接（如果可用）"""
         if STORAGE_BACKEND == "redis" and REDIS_AVAILABLE:
             try:
-                self._redis = redis.Redis(
-                    host=REDIS_HOST,
-                    port=REDIS_PORT,
-                    db=REDIS_DB,
-                    password=REDIS_PASSWORD,
-                    decode_responses=True,
-                )
+                self._redis = get_redis_client()
                 self._redis.ping()
             except Exception:
                 self._redis = None
@@ -220,13 +732,21 @@ class SessionManager:
         """列出所有会话 ID"""
         if self._redis:
             # 从 Redis 获取所有会话键
-            keys = self._redis.keys("chat_history:*")
-            return [k.replace("chat_history:", "") for k in keys]
+            prefix = "chat_history:"
+            return [k[len(prefix):] for k in self._redis.scan_iter(match=prefix + "*", count=1000)]
         else:
-            # 从文件系统获取
-            storage_path = "./chat_history"
+            # 从文件系统获取（兼容旧版无后缀文件）
+            storage_path = HISTORY_STORAGE_PATH
             if os.path.exists(storage_path):
-                return os.listdir(storage_path)
+                suffix = JSONLChatMessageHistory.SUFFIX
+                sessions = set()
+                for filename in os.listdir(storage_path):
+                    if filename.endswith(".tmp"):
+                        continue
+                    if filename.endswith(suffix):
+                        filename = filename[:-len(suffix)]
+                    sessions.add(filename)
+                return sorted(sessions)
             return []
 
     def delete_session(self, session_id: str) -> bool:
@@ -246,7 +766,7 @@ class SessionManager:
             # Redis 自动处理过期
             return 0
 
-        storage_path = "./chat_history"
+        storage_path = HISTORY_STORAGE_PATH
         if not os.path.exists(storage_path):
             return 0
 
@@ -2,24 +2,33 @@
 DecoPilot API 服务器
 家居行业智能体API服务
 """
-import uvicorn
+import time
+
+# 模块导入耗时（冷启动指标，见 /ready 与启动日志）
+_IMPORT_STARTED = time.perf_counter()
+
+import asyncio
 import sys
 import os
-import time
-import uuid
-from typing import List
+from typing import List, Optional
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-import json
 
 # 添加backend目录到路径
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
 
-from rag import RagService
+from backend.core.metrics import (
+    RequestMetrics, merge_snapshots, stats_from_snapshot, render_prometheus,
+)
+from backend.api.middleware.request_pipeline import (
+    RequestValidationMiddleware, PerformanceMonitoringMiddleware, get_json_body,
+)
+from backend.core.output_formatter import dumps, render_answer, coalesce_frames
+from backend.core.warmup import Warmup
 
 # 导入日志系统
 try:
@@ -82,124 +91,164 @@ if ENV == "production" and CORS_ORIGINS == ["*"]:
 # 可信主机
 TRUSTED_HOSTS = os.getenv("TRUSTED_HOSTS", "*").split(",")
 
+# 服务进程配置
+API_HOST = os.getenv("API_HOST", "0.0.0.0")
+API_PORT = int(os.getenv("API_PORT", "8000"))
+# worker 进程数：生产环境默认按 CPU 核数，开发环境单进程（支持热重载）
+WORKERS = int(os.getenv("WORKERS") or ((os.cpu_count() or 1) if ENV == "production" else 1))
+# 优雅关闭等待时间（秒），超时后中断仍在进行的流式响应
+GRACEFUL_TIMEOUT = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+# 启动时预热重量级单例（记忆系统、知识图谱等），生产环境默认开启
+PRELOAD = os.getenv("PRELOAD", "true" if ENV == "production" else "false").lower() == "true"
+# 多 worker 统计快照目录与发布间隔
+WORKER_STATS_DIR = os.getenv("WORKER_STATS_DIR", "data/workers")
+WORKER_STATS_INTERVAL = float(os.getenv("WORKER_STATS_INTERVAL", "5"))
 
-# === 性能监控 ===
 
-class RequestMetrics:
-    """请求性能指标收集器"""
+# === 性能监控 ===
 
-    def __init__(self):
-        self._metrics = {
-            "total_requests": 0,
-            "total_errors": 0,
-            "endpoint_stats": {},
-            "response_times": [],
-            "active_requests": 0,
-        }
-        self._lock = __import__("threading").Lock()
-        self._max_response_times = 1000  # 保留最近1000个响应时间
-
-    def record_request(self, path: str, method: str, duration: float,
-                       status_code: int, request_id: str = None):
-        """记录请求指标"""
-        with self._lock:
-            self._metrics["total_requests"] += 1
-
-            if status_code >= 400:
-                self._metrics["total_errors"] += 1
-
-            # 端点统计
-            endpoint_key = f"{method}:{path}"
-            if endpoint_key not in self._metrics["endpoint_stats"]:
-                self._metrics["endpoint_stats"][endpoint_key] = {
-                    "count": 0,
-                    "errors": 0,
-                    "total_time": 0,
-                    "min_time": float("inf"),
-                    "max_time": 0,
-                }
-
-            stats = self._metrics["endpoint_stats"][endpoint_key]
-            stats["count"] += 1
-            stats["total_time"] += duration
-            stats["min_time"] = min(stats["min_time"], duration)
-            stats["max_time"] = max(stats["max_time"], duration)
-
-            if status_code >= 400:
-                stats["errors"] += 1
-
-            # 响应时间记录
-            self._metrics["response_times"].append({
-                "path": path,
-                "duration": duration,
-                "status": status_code,
-                "timestamp": time.time(),
-            })
-
-            # 限制响应时间记录数量
-            if len(self._metrics["response_times"]) > self._max_response_times:
-                self._metrics["response_times"] = self._metrics["response_times"][-self._max_response_times:]
-
-    def increment_active(self):
-        """增加活跃请求数"""
-        with self._lock:
-            self._metrics["active_requests"] += 1
-
-    def decrement_active(self):
-        """减少活跃请求数"""
-        with self._lock:
-            self._metrics["active_requests"] -= 1
-
-    def get_stats(self) -> dict:
-        """获取统计信息"""
-        with self._lock:
-            # 计算平均响应时间
-            recent_times = [r["duration"] for r in self._metrics["response_times"][-100:]]
-            avg_response_time = sum(recent_times) / len(recent_times) if recent_times else 0
-
-            # 计算 P95 响应时间
-            sorted_times = sorted(recent_times)
-            p95_index = int(len(sorted_times) * 0.95)
-            p95_response_time = sorted_times[p95_index] if sorted_times else 0
-
-            return {
-                "total_requests": self._metrics["total_requests"],
-                "total_errors": self._metrics["total_errors"],
-                "error_rate": self._metrics["total_errors"] / self._metrics["total_requests"]
-                              if self._metrics["total_requests"] > 0 else 0,
-                "active_requests": self._metrics["active_requests"],
-                "avg_response_time_ms": avg_response_time * 1000,
-                "p95_response_time_ms": p95_response_time * 1000,
-                "endpoint_stats": {
-                    k: {
-                        **v,
-                        "avg_time_ms": (v["total_time"] / v["count"] * 1000) if v["count"] > 0 else 0,
-                        "min_time_ms": v["min_time"] * 1000 if v["min_time"] != float("inf") else 0,
-                        "max_time_ms": v["max_time"] * 1000,
-                    }
-                    for k, v in self._metrics["endpoint_stats"].items()
-                },
-            }
+# Prometheus 文本格式的 /metrics 输出（生产环境也可用，JSON 详情仍仅开发环境）
+PROMETHEUS_ENABLED = os.getenv("PROMETHEUS_ENABLED", "true").lower() == "true"
 
 
 # 全局指标收集器
 request_metrics = RequestMetrics()
 
 
+# === 多 worker 统计汇总 ===
+
+_stats_publisher = None
+
+
+def _collect_worker_stats() -> dict:
+    """当前 worker 需要跨进程汇总的统计"""
+    stats = {"request_metrics": request_metrics.snapshot()}
+    try:
+        from backend.core.cache import get_cache_manager
+        stats["cache"] = get_cache_manager().get_all_stats()
+    except ImportError:
+        pass
+    return stats
+
+
+def get_worker_stats() -> Optional[dict]:
+    """
+    汇总所有 worker 的统计（单进程模式返回 None）
+
+    每个 worker 只持有自己的指标，这里显式读取各进程的快照并合并，
+    当前进程使用实时数据。
+    """
+    if WORKERS <= 1:
+        return None
+
+    from backend.core.worker_stats import collect_worker_snapshots, aggregate_cache_stats
+    snapshots = collect_worker_snapshots(
+        WORKER_STATS_DIR,
+        max_age=WORKER_STATS_INTERVAL * 3,
+        current=_collect_worker_stats(),
+    )
+    return {
+        "worker_count": len(snapshots),
+        "pids": [s["pid"] for s in snapshots],
+        "request_snapshot": merge_snapshots(
+            [s["stats"].get("request_metrics", {}) for s in snapshots]
+        ),
+        "cache": aggregate_cache_stats(
+            [s["stats"].get("cache", {}) for s in snapshots]
+        ),
+    }
+
+
+def get_request_snapshot() -> dict:
+    """请求指标快照：多 worker 时为所有进程直方图的合并结果"""
+    worker_stats = get_worker_stats()
+    if worker_stats is not None:
+        return worker_stats["request_snapshot"]
+    return request_metrics.snapshot()
+
+
+def _build_warmup() -> Warmup:
+    """注册预热步骤：记忆系统、知识图谱、输入清理器、RAG 服务与聊天智能体"""
+    runner = Warmup()
+    if MEMORY_AVAILABLE:
+        runner.add_step("memory", get_memory_manager)
+
+    def load_knowledge_graph():
+        from backend.knowledge.knowledge_graph import get_knowledge_graph
+        graph = get_knowledge_graph()
+        graph.ensure_loaded()
+        graph.get_search_index()
+
+    runner.add_step("knowledge_graph", load_knowledge_graph)
+    if SECURITY_AVAILABLE and sanitizer:
+        runner.add_step("sanitizer", lambda: sanitizer.sanitize("预热"))
+    runner.add_step("rag_service", lambda: get_rag_service())
+
+    if NEW_API_AVAILABLE:
+        def load_agents():
+            from backend.api.routes.chat import get_c_end_agent, get_b_end_agent
+            get_c_end_agent()
+            get_b_end_agent()
+
+        runner.add_step("agents", load_agents)
+    return runner
+
+
+warmup_runner = _build_warmup()
+_warmup_task: Optional[asyncio.Task] = None
+
+
+def warmup() -> dict:
+    """
+    同步预热：依次初始化重量级单例
+
+    Returns:
+        各步骤耗时（毫秒），失败的步骤记为 None
+    """
+    return warmup_runner.run_sync()
+
+
 # === 应用生命周期 ===
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
+    global _stats_publisher, _warmup_task
+
     # 启动时
     logger.info(f"DecoPilot 服务启动", extra={
         "env": ENV,
         "debug": DEBUG,
         "cors_origins": CORS_ORIGINS,
+        "pid": os.getpid(),
+        "workers": WORKERS,
+        "import_ms": round(IMPORT_SECONDS * 1000, 1),
     })
+
+    # 预热在后台进行，/health 立即可用，/ready 在预热完成后返回 200
+    if PRELOAD:
+        _warmup_task = asyncio.create_task(warmup_runner.run())
+    else:
+        warmup_runner.skip()
+
+    if WORKERS > 1:
+        from backend.core.worker_stats import WorkerStatsPublisher
+        _stats_publisher = WorkerStatsPublisher(
+            WORKER_STATS_DIR, _collect_worker_stats, interval=WORKER_STATS_INTERVAL
+        )
+        _stats_publisher.start()
+
     yield
     # 关闭时
-    logger.info("DecoPilot 服务关闭")
+    logger.info("DecoPilot 服务关闭", extra={"pid": os.getpid()})
+
+    if _warmup_task is not None and not _warmup_task.done():
+        _warmup_task.cancel()
+    _warmup_task = None
+
+    if _stats_publisher is not None:
+        _stats_publisher.stop()
+        _stats_publisher = None
 
     # 保存记忆系统数据
     if MEMORY_AVAILABLE:
@@ -219,6 +268,15 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"关闭异步执行器失败: {e}")
 
+    # 断开会话历史的 Redis 连接池
+    try:
+        from file_history_store import close_redis_pools, aclose_redis_pools, REDIS_AVAILABLE
+        if REDIS_AVAILABLE:
+            close_redis_pools()
+            await aclose_redis_pools()
+    except Exception as e:
+        logger.error(f"关闭 Redis 连接池失败: {e}")
+
 
 # === 创建应用 ===
 
@@ -283,100 +341,14 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-# === 请求验证中间件 ===
+# === 请求处理中间件（纯 ASGI，流式响应逐块透传） ===
+# 后添加的在外层：性能监控包住请求验证，与原 @app.middleware 的顺序一致
 
-@app.middleware("http")
-async def validate_request(request: Request, call_next):
-    """请求验证中间件"""
-    # 记录请求
-    logger.debug(f"收到请求", extra={
-        "path": request.url.path,
-        "method": request.method,
-        "client": request.client.host if request.client else "unknown",
-    })
-
-    # 对 POST 请求进行输入验证
-    if request.method == "POST" and SECURITY_AVAILABLE and sanitizer:
-        content_type = request.headers.get("content-type", "")
-        if "application/json" in content_type:
-            try:
-                body = await request.body()
-                if body:
-                    data = json.loads(body)
-                    # 验证 message 字段
-                    if "message" in data:
-                        result = sanitizer.sanitize(data["message"])
-                        if result["blocked"]:
-                            logger.warning(f"输入验证失败", extra={
-                                "path": request.url.path,
-                                "reason": result["block_reason"],
-                                "warnings": result["warnings"],
-                            })
-                            return JSONResponse(
-                                status_code=400,
-                                content={"detail": result["block_reason"] or "输入内容不合规", "warnings": result["warnings"]}
-                            )
-            except json.JSONDecodeError:
-                pass
-            except Exception as e:
-                logger.error(f"输入验证异常: {e}")
-
-    response = await call_next(request)
-    return response
-
-
-# === 性能监控中间件 ===
-
-@app.middleware("http")
-async def performance_monitoring(request: Request, call_next):
-    """性能监控中间件"""
-    # 生成请求 ID
-    request_id = str(uuid.uuid4())[:8]
-    request.state.request_id = request_id
-
-    # 记录开始时间
-    start_time = time.time()
-    request_metrics.increment_active()
-
-    try:
-        response = await call_next(request)
-        duration = time.time() - start_time
-
-        # 记录指标
-        request_metrics.record_request(
-            path=request.url.path,
-            method=request.method,
-            duration=duration,
-            status_code=response.status_code,
-            request_id=request_id,
-        )
-
-        # 添加响应头
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Response-Time"] = f"{duration * 1000:.2f}ms"
-
-        # 慢请求警告
-        if duration > 5.0:
-            logger.warning(f"慢请求检测", extra={
-                "request_id": request_id,
-                "path": request.url.path,
-                "duration_ms": duration * 1000,
-            })
-
-        return response
-
-    except Exception as e:
-        duration = time.time() - start_time
-        request_metrics.record_request(
-            path=request.url.path,
-            method=request.method,
-            duration=duration,
-            status_code=500,
-            request_id=request_id,
-        )
-        raise
-    finally:
-        request_metrics.decrement_active()
+app.add_middleware(
+    RequestValidationMiddleware,
+    sanitizer=sanitizer if SECURITY_AVAILABLE else None,
+)
+app.add_middleware(PerformanceMonitoringMiddleware, metrics=request_metrics)
 
 
 # === 注册路由 ===
@@ -395,6 +367,7 @@ _rag_service = None
 def get_rag_service():
     global _rag_service
     if _rag_service is None:
+        from rag import RagService
         _rag_service = RagService()
     return _rag_service
 
@@ -405,7 +378,7 @@ def get_rag_service():
 @log_execution("chat_stream")
 async def chat_stream(request: Request):
     """原有聊天接口（向后兼容）"""
-    data = await request.json()
+    data = await get_json_body(request)
     message = data.get("message")
 
     if not message:
@@ -430,18 +403,18 @@ async def chat_stream(request: Request):
                             first_doc = docs[0]
                             if hasattr(first_doc, "metadata") and "thinking_log" in first_doc.metadata:
                                 logs = first_doc.metadata["thinking_log"]
-                                yield json.dumps({"type": "thinking", "content": logs}, ensure_ascii=False) + "\n"
+                                yield dumps({"type": "thinking", "content": logs}) + "\n"
 
                 elif kind == "on_chat_model_stream":
                     chunk = event["data"]["chunk"]
                     if hasattr(chunk, "content") and chunk.content:
-                        yield json.dumps({"type": "answer", "content": chunk.content}, ensure_ascii=False) + "\n"
+                        yield render_answer(chunk.content)
 
         except Exception as e:
             logger.error(f"聊天流异常: {e}", exc_info=True)
-            yield json.dumps({"type": "error", "content": str(e)}, ensure_ascii=False) + "\n"
+            yield dumps({"type": "error", "content": str(e)}) + "\n"
 
-    return StreamingResponse(event_generator(), media_type="application/x-ndjson")
+    return StreamingResponse(coalesce_frames(event_generator()), media_type="application/x-ndjson")
 
 
 # === 系统接口 ===
@@ -475,7 +448,7 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """健康检查接口"""
+    """健康检查接口（存活探针：进程可响应即返回）"""
     return {
         "status": "healthy",
         "service": "DecoPilot",
@@ -484,16 +457,54 @@ async def health_check():
     }
 
 
+@app.get("/ready")
+async def readiness_check():
+    """就绪检查接口（就绪探针：预热完成前返回 503）"""
+    content = warmup_runner.get_status()
+    content["import_ms"] = round(IMPORT_SECONDS * 1000, 1)
+    return JSONResponse(status_code=200 if warmup_runner.ready else 503, content=content)
+
+
+def _wants_prometheus(request: Request) -> bool:
+    """Prometheus 抓取（Accept 为 text/plain 或 OpenMetrics）或显式 ?format=prometheus"""
+    if request.query_params.get("format") == "prometheus":
+        return True
+    accept = request.headers.get("accept", "")
+    return "openmetrics" in accept or accept.startswith("text/plain")
+
+
 @app.get("/metrics")
-async def metrics():
-    """性能指标接口（仅开发环境）"""
+async def metrics(request: Request):
+    """
+    性能指标接口
+
+    - Prometheus 抓取：返回文本格式的请求耗时直方图（所有环境可用，多 worker 时为合并结果）
+    - 其他请求：返回 JSON 详情（仅开发环境）
+    """
+    if PROMETHEUS_ENABLED and _wants_prometheus(request):
+        return PlainTextResponse(
+            render_prometheus(get_request_snapshot()),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
     if ENV == "production":
         raise HTTPException(status_code=404, detail="Not Found")
 
     result = {
         "request_metrics": request_metrics.get_stats(),
+        "worker_pid": os.getpid(),
     }
 
+    # 多 worker：汇总所有进程的请求指标与缓存统计
+    worker_stats = get_worker_stats()
+    if worker_stats is not None:
+        result["workers"] = {
+            "worker_count": worker_stats["worker_count"],
+            "pids": worker_stats["pids"],
+            "request_metrics": stats_from_snapshot(worker_stats["request_snapshot"]),
+            "cache": worker_stats["cache"],
+        }
+
     try:
         from backend.core.logging_config import get_perf_tracker
         result["performance"] = get_perf_tracker().get_all_stats()
@@ -541,18 +552,61 @@ async def request_metrics_endpoint():
     if ENV == "production":
         raise HTTPException(status_code=404, detail="Not Found")
 
+    worker_stats = get_worker_stats()
+    if worker_stats is not None:
+        return {
+            **stats_from_snapshot(worker_stats["request_snapshot"]),
+            "worker_count": worker_stats["worker_count"],
+        }
     return request_metrics.get_stats()
 
 
+# 导入 server 模块（创建应用、注册路由）的耗时
+IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
+
 # === 启动入口 ===
 
-if __name__ == "__main__":
-    logger.info(f"Server running at http://localhost:8000")
-    logger.info(f"API文档: http://localhost:8000/docs")
+def run_server():
+    """
+    启动服务
+
+    - WORKERS > 1：多进程模式，每个 worker 独立预热、独立关闭（关闭时各自刷写记忆系统），
+      请求指标与缓存统计通过 WORKER_STATS_DIR 下的快照汇总
+    - WORKERS == 1：单进程模式，开发环境支持热重载
+    """
+    import uvicorn
+
+    log_level = "info" if DEBUG else "warning"
+
+    if WORKERS > 1:
+        memory_backend = os.getenv("MEMORY_BACKEND", "sqlite")
+        if memory_backend == "file":
+            logger.warning("多 worker 模式下 file 记忆后端会互相覆盖，建议使用 sqlite 或 redis")
+        if os.getenv("MEMORY_PROFILE_BACKEND", "sqlite") == "json":
+            logger.warning("多 worker 模式下 json 用户画像存储会互相覆盖，建议使用 sqlite")
+        logger.info(f"Server running at http://{API_HOST}:{API_PORT} with {WORKERS} workers")
+        uvicorn.run(
+            "server:app",
+            host=API_HOST,
+            port=API_PORT,
+            workers=WORKERS,
+            timeout_graceful_shutdown=GRACEFUL_TIMEOUT,
+            log_level=log_level,
+        )
+        return
+
+    logger.info(f"Server running at http://localhost:{API_PORT}")
+    logger.info(f"API文档: http://localhost:{API_PORT}/docs")
     uvicorn.run(
         "server:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=DEBUG,
-        log_level="info" if DEBUG else "warning",
+        host=API_HOST,
+        port=API_PORT,
+        reload=DEBUG and ENV != "production",
+        timeout_graceful_shutdown=GRACEFUL_TIMEOUT,
+        log_level=log_level,
     )
+
+
+if __name__ == "__main__":
+    run_server()
@@ -0,0 +1,112 @@
+"""
+服务冷启动基准
+
+1. 导入耗时：子进程中 `python -X importtime -c "import server"`，输出总耗时与累计耗时最高的模块
+2. 启动耗时：以子进程启动 server.py，记录 /health 首次响应（存活）与 /ready 返回 200（预热完成）的时间
+
+用法:
+    python tests/bench_cold_start.py
+    python tests/bench_cold_start.py --top 15 --preload true
+"""
+import os
+import sys
+import time
+import socket
+import signal
+import argparse
+import subprocess
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(top: int) -> None:
+    """导入耗时（-X importtime 的累计列，单位微秒）"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), name.strip()))
+
+    total = next((us for us, name in rows if name == "server"), 0)
+    print(f"import server: {total / 1000:.0f}ms")
+    for us, name in sorted(rows, reverse=True)[1:top + 1]:
+        print(f"  {us / 1000:8.1f}ms  {name}")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for(url: str, deadline: float) -> float:
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(url, timeout=1).status_code == 200:
+                return time.perf_counter()
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.05)
+    raise RuntimeError(f"等待超时: {url}")
+
+
+def startup(preload: bool, timeout: float) -> None:
+    port = free_port()
+    env = dict(os.environ)
+    env.update({
+        "ENV": "development",
+        "DEBUG": "false",
+        "WORKERS": "1",
+        "API_PORT": str(port),
+        "API_HOST": "127.0.0.1",
+        "PRELOAD": "true" if preload else "false",
+        "MEMORY_PERSIST": "false",
+    })
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "server.py"], cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = start + timeout
+        health = wait_for(base_url + "/health", deadline) - start
+        print(f"[preload={preload}] /health 可用: {health * 1000:.0f}ms")
+        try:
+            ready = wait_for(base_url + "/ready", deadline) - start
+            status = httpx.get(base_url + "/ready", timeout=5).json()
+            print(f"[preload={preload}] /ready 就绪: {ready * 1000:.0f}ms  "
+                  f"预热步骤: {status.get('timings_ms')}")
+        except RuntimeError:
+            print(f"[preload={preload}] /ready 不可用")
+    finally:
+        proc.send_signal(signal.SIGINT)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="服务冷启动基准")
+    parser.add_argument("--top", type=int, default=10, help="输出累计导入耗时最高的模块数")
+    parser.add_argument("--preload", choices=["true", "false", "both"], default="both",
+                        help="是否启用预热")
+    parser.add_argument("--timeout", type=float, default=120.0, help="等待超时（秒）")
+    args = parser.parse_args()
+
+    import_profile(args.top)
+    modes = [True, False] if args.preload == "both" else [args.preload == "true"]
+    for preload in modes:
+        startup(preload, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
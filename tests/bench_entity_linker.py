@@ -0,0 +1,92 @@
+"""
+实体链接基准 — 逐个名称子串查找 vs Aho-Corasick 自动机
+
+在完整的预定义图谱上，对一组模拟用户消息找出提及的实体：
+  - naive: 遍历全部名称与别名，逐个做 `key in message`（与按候选调用 search_entities 同为全量扫描）
+  - automaton: EntityLinker 一次扫描
+另外输出自动机的构建耗时与新增实体后的增量重建耗时。
+
+用法:
+    python tests/bench_entity_linker.py
+    python tests/bench_entity_linker.py --rounds 2000
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph, EntityType
+from backend.knowledge.entity_linker import EntityLinker
+
+TEMPLATES = [
+    "{0}适合用{1}吗？预算不太多",
+    "我家{0}想做{2}风格，{1}和{3}哪个好",
+    "请问{1}的价格大概多少，{0}需要多少平米",
+    "{2}风格的{0}配什么颜色的{1}比较好看，有没有推荐的品牌",
+    "刚交房，准备装修，先做水电还是先做防水？{0}要不要铺{1}",
+]
+
+
+def make_messages(graph: DecorationKnowledgeGraph, count: int):
+    rng = random.Random(0)
+    spaces = [e.name for e in graph.entities_of_type(EntityType.SPACE)]
+    styles = [e.name for e in graph.entities_of_type(EntityType.STYLE)]
+    products = [e.name for e in graph.entities.values() if e.entity_type not in
+                (EntityType.SPACE, EntityType.STYLE)]
+    return [
+        rng.choice(TEMPLATES).format(rng.choice(spaces), rng.choice(products),
+                                     rng.choice(styles), rng.choice(products))
+        for _ in range(count)
+    ]
+
+
+def naive_link(graph: DecorationKnowledgeGraph, keys, message: str):
+    lowered = message.lower()
+    return [graph._resolve_entity_id(key) for key in keys if key in lowered]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="实体链接基准")
+    parser.add_argument("--rounds", type=int, default=1000, help="消息条数")
+    args = parser.parse_args()
+
+    graph = DecorationKnowledgeGraph(snapshot_path="")
+    messages = make_messages(graph, args.rounds)
+    keys = list(graph._name_to_id) + list(graph._alias_to_id)
+    print(f"图谱: {len(graph.entities)} 实体, {len(keys)} 个名称/别名  消息 {len(messages)} 条, "
+          f"平均 {sum(map(len, messages)) / len(messages):.0f} 字")
+
+    start = time.perf_counter()
+    linker = EntityLinker(graph)
+    linker.automaton.build()
+    print(f"自动机构建: {(time.perf_counter() - start) * 1000:.1f}ms  "
+          f"({len(linker.automaton._children)} 个节点)")
+
+    start = time.perf_counter()
+    for message in messages:
+        naive_link(graph, keys, message)
+    naive = (time.perf_counter() - start) / len(messages)
+
+    start = time.perf_counter()
+    mentions = 0
+    for message in messages:
+        mentions += len(linker.link(message))
+    automaton = (time.perf_counter() - start) / len(messages)
+    print(f"naive:     {naive * 1e6:8.1f}µs/条")
+    print(f"automaton: {automaton * 1e6:8.1f}µs/条  ({naive / automaton:.1f}x, 平均 {mentions / len(messages):.1f} 个实体)")
+
+    graph._linker = linker
+    start = time.perf_counter()
+    for i in range(20):
+        graph.add_entity(f"测试材料{i}", EntityType.MATERIAL, aliases=[f"test material {i}"])
+    added = time.perf_counter()
+    linker.link(messages[0])
+    print(f"新增 20 个实体: 插入 {(added - start) * 1000:.2f}ms, 下次链接时重建 "
+          f"{(time.perf_counter() - added) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
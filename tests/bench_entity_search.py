@@ -0,0 +1,76 @@
+"""
+实体搜索基准 — 逐个扫描 vs n-gram 倒排索引
+
+模拟输入框自动补全：对抽样的实体名称逐字输入，每次按键调用一次 search_entities。
+  - scan:  原实现，遍历全部实体与别名做 `query in name.lower()`
+  - index: 当前实现（n-gram 倒排表求交集 + 校验），分别统计默认顺序与按匹配质量排序
+
+用法:
+    python tests/bench_entity_search.py
+    python tests/bench_entity_search.py --names 300
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph, EntityType
+
+
+def scan_search(graph, query, entity_type=None, limit=10):
+    """原 search_entities 实现"""
+    query_lower = query.lower()
+    results = []
+    candidates = graph.entities_of_type(entity_type) if entity_type else graph.entities.values()
+    for entity in candidates:
+        if query_lower in entity.name.lower():
+            results.append(entity)
+            continue
+        for alias in entity.aliases:
+            if query_lower in alias.lower():
+                results.append(entity)
+                break
+    return results[:limit]
+
+
+def time_queries(func, queries) -> float:
+    start = time.perf_counter()
+    for query, entity_type in queries:
+        func(query, entity_type)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="实体搜索基准")
+    parser.add_argument("--names", type=int, default=200, help="抽样的实体名称数")
+    args = parser.parse_args()
+
+    graph = DecorationKnowledgeGraph(snapshot_path="")
+    rng = random.Random(0)
+    names = rng.sample([e.name for e in graph.entities.values()], args.names)
+    keystrokes = [name[:i] for name in names for i in range(1, len(name) + 1)]
+    queries = [(q, None) for q in keystrokes]
+    typed = [(q, EntityType.BRAND) for q in keystrokes]
+
+    start = time.perf_counter()
+    graph.get_search_index()
+    print(f"索引构建: {(time.perf_counter() - start) * 1000:.1f}ms  "
+          f"{len(graph.entities)} 实体, {len(keystrokes)} 次按键")
+
+    print(f"{'场景':<22}{'扫描(µs)':>10}{'索引(µs)':>10}{'加速':>8}")
+    cases = [
+        ("全部类型", queries, lambda q, t: graph.search_entities(q, t)),
+        ("按类型(brand)", typed, lambda q, t: graph.search_entities(q, t)),
+        ("全部类型+排序", queries, lambda q, t: graph.search_entities(q, t, rank=True)),
+    ]
+    for label, qs, index_call in cases:
+        before = time_queries(lambda q, t: scan_search(graph, q, t), qs)
+        after = time_queries(index_call, qs)
+        print(f"{label:<22}{before * 1e6:10.1f}{after * 1e6:10.1f}{before / after:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+知识图谱直答基准 — 直答命中率与图谱阶段耗时
+
+  - 样例问题按类别（空间方案 / 风格材料 / 替代品 / 对比 / 价格 / 施工 / 问题 / 闲聊）统计直答命中率
+  - 图谱阶段（实体链接 + 意图匹配 + 图谱查询）平均耗时，命中与未命中分开
+  - --with-kb: 对未命中的问题实际执行向量检索（需要 DashScope API Key），
+    用实测的检索耗时估算直答节省的时间
+
+用法:
+    python tests/bench_graph_answer.py
+    python tests/bench_graph_answer.py --repeat 50 --with-kb
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph
+from backend.knowledge.graph_answer import GraphAnswerer
+
+QUESTIONS = {
+    "空间方案": ["客厅用什么地砖", "卫生间铺什么瓷砖好", "卧室装什么灯", "厨房墙面用什么材料", "客厅吊顶怎么选",
+               "书房推荐什么家具", "阳台地面铺什么", "我家客厅想做北欧风，地面怎么选", "卧室窗帘怎么选"],
+    "风格材料": ["北欧风格用什么材料", "日式风格适合什么家具", "新中式用什么地板", "现代简约风格推荐哪些材料"],
+    "替代品": ["强化地板可以用什么代替", "大理石有什么平替", "乳胶漆可以换成什么", "木地板用什么替代"],
+    "对比": ["实木地板和强化地板哪个好", "木地板和瓷砖有什么区别", "石膏板吊顶和铝扣板吊顶哪个好",
+           "乳胶漆和壁纸哪个好", "岩板还是大理石"],
+    "价格": ["装修要多少钱", "乳胶漆多少钱一桶", "客厅铺地砖大概什么价格", "一百平米全包预算多少"],
+    "施工": ["厨房防水怎么做", "瓷砖铺贴的步骤", "吊顶施工要注意什么", "水电验收怎么验"],
+    "问题": ["墙面开裂怎么办", "卫生间漏水怎么处理", "新房甲醛超标怎么办", "瓷砖空鼓要返工吗"],
+    "闲聊": ["你好", "那卧室呢", "谢谢你的建议", "我刚买了房子，准备下个月开始装修，现在有点迷茫不知道从哪里开始"],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="知识图谱直答基准")
+    parser.add_argument("--repeat", type=int, default=20, help="每个问题的重复次数（取平均耗时）")
+    parser.add_argument("--with-kb", action="store_true", help="对未命中的问题执行向量检索（需要 API Key）")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    graph = DecorationKnowledgeGraph(snapshot_path="")
+    answerer = GraphAnswerer(graph)
+    answerer.answer("客厅用什么地砖")  # 构建链接器
+
+    kb = None
+    if args.with_kb:
+        from backend.core.singleton import get_knowledge_base
+        kb = get_knowledge_base()
+
+    print(f"{'类别':<8}{'命中':>8}{'命中耗时(µs)':>14}{'未命中耗时(µs)':>16}  命中意图")
+    answered_total = 0
+    for category, questions in QUESTIONS.items():
+        hits, hit_us, miss_us, intents = 0, [], [], []
+        for question in questions:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                answer = answerer.answer(question)
+            elapsed = (time.perf_counter() - start) / args.repeat * 1e6
+            if answer:
+                hits += 1
+                hit_us.append(elapsed)
+                intents.append(answer.intent)
+            else:
+                miss_us.append(elapsed)
+                if kb is not None:
+                    start = time.perf_counter()
+                    kb.search_by_user_type(query=question, user_type="both", k=5)
+                    answerer.record_retrieval((time.perf_counter() - start) * 1000)
+        answered_total += hits
+        avg = lambda values: sum(values) / len(values) if values else 0.0
+        print(f"{category:<8}{f'{hits}/{len(questions)}':>8}{avg(hit_us):14.1f}{avg(miss_us):16.1f}  "
+              f"{', '.join(sorted(set(intents)))}")
+
+    total = sum(len(questions) for questions in QUESTIONS.values())
+    print(f"\n命中 {answered_total}/{total} ({answered_total / total:.0%})")
+    if kb is not None:
+        stats = answerer.get_stats()
+        per_hit = stats["avg_retrieval_ms"] - stats["avg_graph_ms"]
+        print(f"向量检索平均 {stats['avg_retrieval_ms']:.1f}ms, 图谱阶段平均 {stats['avg_graph_ms']:.3f}ms, "
+              f"每次命中约节省 {per_hit:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+多跳查询基准 — 手工串联 query_relations vs 路径查询引擎
+
+在完整的预定义图谱上：
+1. 两跳查询「空间 ←适用于− 材料 ←生产商− 品牌 / −可替代− 替代品」，对每个空间执行：
+   - scan:    串联逐条扫描的 query_relations（邻接索引之前的做法）
+   - chained: 串联走邻接索引的 query_relations
+   - engine:  follow_path（清空缓存后的首次查询）
+   - cached:  follow_path（缓存命中）
+2. 随机实体对的最短路径（4 跳以内）：
+   - bfs:     基于 query_relations 的单向广度优先
+   - engine:  双向广度优先（不使用缓存）
+
+用法:
+    python tests/bench_graph_query.py
+    python tests/bench_graph_query.py --rounds 50 --pairs 300
+"""
+import os
+import sys
+import time
+import random
+import argparse
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph, EntityType, RelationType
+from bench_knowledge_graph import ScanGraph
+
+TWO_HOP = [
+    (RelationType.SUITABLE_FOR, "incoming"),
+    ({RelationType.PRODUCED_BY, RelationType.ALTERNATIVE_TO}, "both"),
+]
+
+
+def chained(graph, space):
+    """手工串联：先取适用于该空间的材料，再逐个取品牌与替代品"""
+    paths = []
+    for material, _ in graph.query_relations(space, RelationType.SUITABLE_FOR, "incoming"):
+        for relation_type in (RelationType.PRODUCED_BY, RelationType.ALTERNATIVE_TO):
+            for other, _ in graph.query_relations(material.name, relation_type, "both"):
+                if other.name != space:
+                    paths.append((space, material.name, other.name))
+    return paths
+
+
+def bfs_path(graph, source, target, max_depth=4):
+    start, goal = graph.get_entity(source).id, graph.get_entity(target).id
+    seen = {start: 0}
+    queue = deque([start])
+    while queue:
+        entity_id = queue.popleft()
+        if entity_id == goal or seen[entity_id] == max_depth:
+            if entity_id == goal:
+                return seen[entity_id]
+            continue
+        for neighbor, _ in graph.query_relations(graph.entities[entity_id].name):
+            if neighbor.id not in seen:
+                seen[neighbor.id] = seen[entity_id] + 1
+                queue.append(neighbor.id)
+    return None
+
+
+def timed(func, items, rounds) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            func(item)
+    return (time.perf_counter() - start) / (rounds * len(items))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多跳查询基准")
+    parser.add_argument("--rounds", type=int, default=20, help="两跳查询的轮数")
+    parser.add_argument("--pairs", type=int, default=200, help="最短路径的实体对数")
+    args = parser.parse_args()
+
+    graph = DecorationKnowledgeGraph(snapshot_path="")
+    scan = ScanGraph(snapshot_path="")
+    engine = graph.get_query_engine()
+    spaces = [e.name for e in graph.entities_of_type(EntityType.SPACE)]
+
+    def uncached(space):
+        engine._cache.clear()
+        return graph.follow_path(space, TWO_HOP)
+
+    print(f"两跳查询（{len(spaces)} 个空间 × {args.rounds} 轮，µs/次）")
+    results = {
+        "scan": timed(lambda s: chained(scan, s), spaces, args.rounds),
+        "chained": timed(lambda s: chained(graph, s), spaces, args.rounds),
+        "engine": timed(uncached, spaces, args.rounds),
+        "cached": timed(lambda s: graph.follow_path(s, TWO_HOP), spaces, args.rounds),
+    }
+    for name, seconds in results.items():
+        print(f"  {name:<10}{seconds * 1e6:10.1f}  ({results['scan'] / seconds:6.1f}x vs scan)")
+
+    rng = random.Random(0)
+    names = sorted({graph.entities[r.source_id].name for r in graph.relations})
+    pairs = [(rng.choice(names), rng.choice(names)) for _ in range(args.pairs)]
+
+    def bidirectional(pair):
+        engine._cache.clear()
+        return graph.shortest_path(*pair)
+
+    bfs = timed(lambda p: bfs_path(graph, *p), pairs, 1)
+    bidi = timed(bidirectional, pairs, 1)
+    reachable = sum(1 for p in pairs if graph.shortest_path(*p))
+    print(f"最短路径（{len(pairs)} 对，{reachable} 对可达，µs/次）")
+    print(f"  {'bfs':<10}{bfs * 1e6:10.1f}")
+    print(f"  {'engine':<10}{bidi * 1e6:10.1f}  ({bfs / bidi:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+知识图谱并发读写基准 — 写时复制版本快照
+
+  - 读取: 无写入 / 后台线程持续写入时，读者各查询的平均耗时与出错次数
+  - 写入: 逐条 add_entity / add_relation（每条发布一个版本）与 batch_update（整批发布一次）的耗时
+  - 发布单条写入的耗时：新增实体（写入者重建链接器与搜索索引）/ 只新增关系（沿用上一版本的索引）
+
+用法:
+    python tests/bench_kg_concurrency.py
+    python tests/bench_kg_concurrency.py --items 500 --seconds 3
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph, EntityType, RelationType
+
+QUERIES = {
+    "query_relations": lambda g: g.query_relations("客厅"),
+    "search_entities": lambda g: g.search_entities("地板"),
+    "link_entities": lambda g: g.link_entities("客厅想铺实木地板，北欧风格"),
+    "get_space_solution": lambda g: g.get_space_solution("卧室", "北欧"),
+}
+
+
+def add_items(graph: DecorationKnowledgeGraph, prefix: str, count: int) -> None:
+    for i in range(count):
+        graph.add_entity(f"{prefix}{i}", EntityType.MATERIAL)
+        graph.add_relation(f"{prefix}{i}", "客厅", RelationType.SUITABLE_FOR)
+
+
+def read_loop(graph: DecorationKnowledgeGraph, seconds: float) -> dict:
+    """轮流执行各查询，返回 {查询: (平均µs, 次数, 出错次数)}"""
+    stats = {name: [0.0, 0, 0] for name in QUERIES}
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for name, query in QUERIES.items():
+            start = time.perf_counter()
+            try:
+                query(graph)
+            except Exception:
+                stats[name][2] += 1
+            stats[name][0] += time.perf_counter() - start
+            stats[name][1] += 1
+    return {name: (total / max(n, 1) * 1e6, n, errors) for name, (total, n, errors) in stats.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="知识图谱并发读写基准")
+    parser.add_argument("--items", type=int, default=200, help="写入基准的实体数（每个实体附带一条关系）")
+    parser.add_argument("--seconds", type=float, default=2.0, help="读取基准的持续时间")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    graph = DecorationKnowledgeGraph(snapshot_path="")
+    graph.ensure_loaded()
+    for query in QUERIES.values():
+        query(graph)
+
+    # 读取：无写入 vs 后台持续写入（每 10ms 发布一个小批次）
+    quiet = read_loop(graph, args.seconds)
+    stop = threading.Event()
+    published = []
+
+    def writer():
+        batch = 0
+        while not stop.is_set():
+            with graph.batch_update():
+                add_items(graph, f"并发材料{batch}-", 5)
+            batch += 1
+            time.sleep(0.01)
+        published.append(batch)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    busy = read_loop(graph, args.seconds)
+    stop.set()
+    thread.join()
+
+    print(f"{'查询':<22}{'无写入(µs)':>12}{'并发写入(µs)':>14}{'出错':>6}")
+    for name in QUERIES:
+        print(f"{name:<22}{quiet[name][0]:12.1f}{busy[name][0]:14.1f}{busy[name][2]:6d}")
+    print(f"并发写入期间发布 {published[0]} 个版本")
+
+    # 写入：逐条发布 vs 一次批量发布
+    print(f"\n写入 {args.items} 个实体 + {args.items} 条关系（图谱 {len(graph.entities)} 实体）")
+    start = time.perf_counter()
+    add_items(graph, "逐条材料", args.items)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with graph.batch_update():
+        add_items(graph, "批量材料", args.items)
+    batch = time.perf_counter() - start
+    print(f"逐条发布: {single * 1000:8.1f}ms ({single / args.items / 2 * 1e6:.0f}µs/条)")
+    print(f"批量发布: {batch * 1000:8.1f}ms ({batch / args.items / 2 * 1e6:.0f}µs/条), {single / batch:.0f}x")
+
+    # 单条写入：新增实体时重建派生索引，只新增关系时沿用
+    for label, write in (("add_entity", lambda: graph.add_entity("新材料", EntityType.MATERIAL)),
+                         ("add_relation", lambda: graph.add_relation("新材料", "卧室", RelationType.SUITABLE_FOR))):
+        start = time.perf_counter()
+        write()
+        elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        QUERIES["link_entities"](graph)
+        QUERIES["search_entities"](graph)
+        first = time.perf_counter() - start
+        print(f"单条 {label}: 发布 {elapsed * 1000:.1f}ms, 之后首次链接+搜索 {first * 1e6:.0f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+知识图谱冷加载基准
+
+每次在新的子进程中测量：
+  - import:  导入 backend.knowledge.knowledge_graph
+  - first:   首次访问图谱数据（触发加载）的耗时
+三种加载方式：
+  - snapshot: 快照已存在且与源数据一致，一次读入
+  - source:   不使用快照，从 JSON 源数据逐条构建
+  - rebuild:  快照不存在，从源数据构建并写出快照
+
+用法:
+    python tests/bench_kg_load.py
+    python tests/bench_kg_load.py --runs 10
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph
+imported = time.perf_counter()
+graph = DecorationKnowledgeGraph(snapshot_path=sys.argv[1])
+len(graph.entities)
+loaded = time.perf_counter()
+print(json.dumps({"import": imported - start, "first": loaded - imported,
+                  "source": graph.load_info["source"]}))
+"""
+
+
+def probe(snapshot_path: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE, snapshot_path], cwd=ROOT,
+        capture_output=True, text=True, timeout=120,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="知识图谱冷加载基准")
+    parser.add_argument("--runs", type=int, default=5, help="每种方式的子进程次数（取中位数）")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "kg.snapshot")
+        probe(path)  # 生成快照
+        modes = {
+            "snapshot": lambda: probe(path),
+            "source": lambda: probe(""),
+            "rebuild": lambda: (os.path.exists(path) and os.remove(path), probe(path))[1],
+        }
+
+        print(f"{'方式':<10}{'import(ms)':>12}{'首次访问(ms)':>14}{'合计(ms)':>10}")
+        for name, run in modes.items():
+            samples = [run() for _ in range(args.runs)]
+            assert all(s["source"] == ("snapshot" if name == "snapshot" else "source") for s in samples)
+            imported = statistics.median(s["import"] for s in samples) * 1000
+            first = statistics.median(s["first"] for s in samples) * 1000
+            print(f"{name:<10}{imported:12.1f}{first:14.1f}{imported + first:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
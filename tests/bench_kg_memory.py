@@ -0,0 +1,90 @@
+"""
+知识图谱内存基准 — 每个 worker 进程中图谱占用的内存
+
+每种加载方式（源数据 / 编译快照）在独立子进程中测量：
+  - heap:  加载完成后图谱保留的 Python 堆内存（tracemalloc）
+  - peak:  加载过程中的峰值
+  - load:  加载耗时（不开 tracemalloc 单独计时）
+  - query: query_relations 平均耗时
+可用 --compare 指定另一份代码（如 git worktree 检出的旧版本）做前后对比。
+
+用法:
+    python tests/bench_kg_memory.py
+    git worktree add /tmp/kg_old HEAD~1
+    python tests/bench_kg_memory.py --compare /tmp/kg_old --workers 8
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 子进程中执行：只加载图谱，不引入其他模块，避免干扰测量
+CHILD = r"""
+import gc, json, logging, sys, time, timeit, tracemalloc
+sys.path.insert(0, sys.argv[1])
+logging.disable(logging.CRITICAL)
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph
+
+snapshot_path = sys.argv[2]
+if snapshot_path:
+    DecorationKnowledgeGraph(snapshot_path=snapshot_path).ensure_loaded()
+
+load_ms = []
+for _ in range(5):
+    graph = DecorationKnowledgeGraph(snapshot_path=snapshot_path)
+    start = time.perf_counter()
+    graph.ensure_loaded()
+    load_ms.append((time.perf_counter() - start) * 1000)
+del graph
+gc.collect()
+
+graph = DecorationKnowledgeGraph(snapshot_path=snapshot_path)
+tracemalloc.start()
+graph.ensure_loaded()
+gc.collect()
+heap, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+
+names = ["客厅", "卧室", "木地板", "北欧"]
+query_us = min(timeit.repeat(lambda: [graph.query_relations(n) for n in names],
+                             number=200, repeat=5)) / 200 / len(names) * 1e6
+print(json.dumps({"heap_kb": heap / 1024, "peak_kb": peak / 1024,
+                  "load_ms": min(load_ms), "query_us": query_us}))
+"""
+
+
+def measure(root: str, snapshot_path: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, root, snapshot_path],
+        capture_output=True, text=True, check=True, cwd=root,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="知识图谱内存基准")
+    parser.add_argument("--compare", help="对比的另一份代码目录（如旧版本的 git worktree）")
+    parser.add_argument("--workers", type=int, default=1, help="按 worker 数估算每个节点的总占用")
+    args = parser.parse_args()
+
+    roots = [("当前", ROOT)]
+    if args.compare:
+        roots.insert(0, ("对比", os.path.abspath(args.compare)))
+
+    print(f"{'版本':<6}{'加载方式':<10}{'heap(KB)':>10}{'peak(KB)':>10}{'load(ms)':>10}"
+          f"{'query(µs)':>11}{f'x{args.workers}(MB)':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, root in roots:
+            for mode in ("source", "snapshot"):
+                snapshot_path = os.path.join(tmp, f"{label}.snapshot") if mode == "snapshot" else ""
+                r = measure(root, snapshot_path)
+                print(f"{label:<6}{mode:<10}{r['heap_kb']:10.0f}{r['peak_kb']:10.0f}{r['load_ms']:10.1f}"
+                      f"{r['query_us']:11.1f}{r['heap_kb'] * args.workers / 1024:11.2f}")
+
+
+if __name__ == "__main__":
+    main()
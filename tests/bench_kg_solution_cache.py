@@ -0,0 +1,89 @@
+"""
+知识图谱解决方案缓存基准 — 每次重算 vs 按图谱版本缓存
+
+对 5 个解决方案类查询（空间/风格/照明/智能家居/装修工序）分别计时：
+  - compute: 不经缓存直接计算（装饰器保留的 .uncached 原方法）
+  - hit:     缓存命中（返回共享的只读结果）
+  - copy:    对比项：若命中时返回深拷贝（copy.deepcopy）的开销
+另按 zipf 分布模拟一批重复查询，统计命中率与总耗时。
+
+用法:
+    python tests/bench_kg_solution_cache.py
+    python tests/bench_kg_solution_cache.py --requests 5000
+"""
+import os
+import sys
+import copy
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph
+
+SPACES = ["客厅", "卧室", "厨房", "卫生间", "书房", "餐厅", "阳台", "儿童房"]
+STYLES = ["现代简约", "北欧", "新中式", "日式", "轻奢", "美式", "工业风", "法式"]
+
+
+def per_call(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="知识图谱解决方案缓存基准")
+    parser.add_argument("--repeat", type=int, default=200, help="每个查询的重复次数")
+    parser.add_argument("--requests", type=int, default=2000, help="模拟请求数")
+    args = parser.parse_args()
+
+    graph = DecorationKnowledgeGraph(snapshot_path="")
+    graph.ensure_loaded()
+    cls = DecorationKnowledgeGraph
+
+    cases = [
+        ("get_space_solution", ("客厅", "现代简约")),
+        ("get_style_solution", ("北欧",)),
+        ("get_lighting_recommendation", ("卧室",)),
+        ("get_smart_home_solution", (["客厅", "卧室"],)),
+        ("get_decoration_process", ()),
+    ]
+    print(f"{'查询':<30}{'计算(µs)':>10}{'命中(µs)':>10}{'深拷贝(µs)':>12}{'加速':>8}")
+    for name, call_args in cases:
+        method = getattr(graph, name)
+        uncached = getattr(cls, name).uncached
+        result = method(*call_args)
+        compute = per_call(lambda: uncached(graph, *call_args), args.repeat)
+        hit = per_call(lambda: method(*call_args), args.repeat)
+        deep = per_call(lambda: copy.deepcopy(result), args.repeat)
+        print(f"{name:<30}{compute * 1e6:10.1f}{hit * 1e6:10.2f}{deep * 1e6:12.1f}{compute / hit:7.0f}x")
+
+    # 模拟请求：少数热门组合占大多数
+    rng = random.Random(0)
+    combos = [("get_space_solution", (s, st)) for s in SPACES for st in STYLES]
+    combos += [("get_style_solution", (st,)) for st in STYLES]
+    combos += [("get_lighting_recommendation", (s,)) for s in SPACES]
+    weights = [1 / (rank + 1) for rank in range(len(combos))]
+    requests = rng.choices(combos, weights=weights, k=args.requests)
+
+    fresh = DecorationKnowledgeGraph(snapshot_path="")
+    fresh.ensure_loaded()
+    start = time.perf_counter()
+    for name, call_args in requests:
+        getattr(cls, name).uncached(fresh, *call_args)
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name, call_args in requests:
+        getattr(fresh, name)(*call_args)
+    after = time.perf_counter() - start
+
+    stats = fresh.get_stats()["result_cache"]
+    print(f"\n模拟 {args.requests} 次请求（{len(combos)} 种组合）: "
+          f"重算 {before * 1000:.1f}ms, 缓存 {after * 1000:.1f}ms, 命中率 {stats['hit_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+知识图谱查询基准 — 全量扫描 vs 邻接/类型索引
+
+在完整的预定义图谱上，对每个公开查询方法分别计时：
+  - scan:  与原实现相同，query_relations 逐条扫描 self.relations，按类型取实体时遍历全部实体
+  - index: 当前实现（出边/入边邻接索引 + 实体类型索引）
+
+用法:
+    python tests/bench_knowledge_graph.py
+    python tests/bench_knowledge_graph.py --rounds 200
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph, EntityType
+
+
+class ScanGraph(DecorationKnowledgeGraph):
+    """不使用索引的对照实现（原 query_relations 与按类型遍历）"""
+
+    def query_relations(self, entity_name, relation_type=None, direction="both"):
+        entity_id = self._resolve_entity_id(entity_name)
+        if not entity_id:
+            return []
+
+        results = []
+        for relation in self.relations:
+            if relation_type and relation.relation_type != relation_type:
+                continue
+            if direction in ("outgoing", "both") and relation.source_id == entity_id:
+                target = self.entities.get(relation.target_id)
+                if target:
+                    results.append((target, relation))
+            if direction in ("incoming", "both") and relation.target_id == entity_id:
+                source = self.entities.get(relation.source_id)
+                if source:
+                    results.append((source, relation))
+        return results
+
+    def entities_of_type(self, entity_type):
+        return [e for e in self.entities.values() if e.entity_type == entity_type]
+
+
+def helper_calls(graph: DecorationKnowledgeGraph):
+    """每个公开查询方法的代表性调用（按图谱中的实际空间/风格轮换参数）"""
+    spaces = [e.name for e in graph.entities_of_type(EntityType.SPACE)]
+    styles = [e.name for e in graph.entities_of_type(EntityType.STYLE)]
+    ceilings = [e.name for e in graph.entities_of_type(EntityType.CEILING)]
+    return [
+        ("query_relations", lambda i: graph.query_relations(spaces[i % len(spaces)])),
+        ("find_suitable_materials", lambda i: graph.find_suitable_materials(
+            spaces[i % len(spaces)], styles[i % len(styles)])),
+        ("find_style_materials", lambda i: graph.find_style_materials(styles[i % len(styles)])),
+        ("find_alternatives", lambda i: graph.find_alternatives(ceilings[i % len(ceilings)])),
+        ("find_compatible_styles", lambda i: graph.find_compatible_styles(styles[i % len(styles)])),
+        ("get_space_solution", lambda i: graph.get_space_solution(
+            spaces[i % len(spaces)], styles[i % len(styles)])),
+        ("get_style_solution", lambda i: graph.get_style_solution(styles[i % len(styles)])),
+        ("get_product_comparison", lambda i: graph.get_product_comparison(
+            ceilings[i % len(ceilings)], ceilings[(i + 1) % len(ceilings)])),
+        ("get_lighting_recommendation", lambda i: graph.get_lighting_recommendation(
+            spaces[i % len(spaces)])),
+        ("get_process_sequence", lambda i: graph.get_process_sequence()),
+        ("get_decoration_process", lambda i: graph.get_decoration_process()),
+        ("get_brands_by_category", lambda i: graph.get_brands_by_category("瓷砖")),
+        ("get_smart_home_solution", lambda i: graph.get_smart_home_solution()),
+        ("get_env_standard_info", lambda i: graph.get_env_standard_info()),
+        ("search_entities(type)", lambda i: graph.search_entities("木", EntityType.WOOD_FLOOR)),
+    ]
+
+
+def time_call(func, rounds: int) -> float:
+    func(0)  # 预热
+    start = time.perf_counter()
+    for i in range(rounds):
+        func(i)
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="知识图谱查询基准")
+    parser.add_argument("--rounds", type=int, default=100, help="每个方法的调用次数")
+    args = parser.parse_args()
+
+    indexed = DecorationKnowledgeGraph()
+    scan = ScanGraph()
+    print(f"图谱规模: {len(indexed.entities)} 实体, {len(indexed.relations)} 关系  每项 {args.rounds} 次")
+    print(f"{'方法':<28}{'扫描(µs)':>12}{'索引(µs)':>12}{'加速':>9}")
+
+    for (name, scan_call), (_, index_call) in zip(helper_calls(scan), helper_calls(indexed)):
+        before = time_call(scan_call, args.rounds)
+        after = time_call(index_call, args.rounds)
+        print(f"{name:<28}{before * 1e6:12.1f}{after * 1e6:12.1f}{before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
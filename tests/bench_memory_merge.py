@@ -0,0 +1,110 @@
+"""
+记忆合并性能基准 — 逐对比较 vs MinHash/LSH
+
+用法:
+    python tests/bench_memory_merge.py                  # 默认 10000 条记忆
+    python tests/bench_memory_merge.py --size 2000
+    python tests/bench_memory_merge.py --skip-legacy    # 跳过 O(n²) 旧实现
+"""
+import os
+import sys
+import time
+import random
+import argparse
+from typing import List
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.core.memory import MemoryItem, MemoryType, MemoryCompressor
+
+
+SPACES = ["客厅", "卧室", "厨房", "卫生间", "阳台", "书房", "儿童房"]
+STYLES = ["现代简约", "北欧", "新中式", "轻奢", "日式", "工业风"]
+MATERIALS = ["瓷砖", "木地板", "乳胶漆", "壁纸", "大理石", "防水涂料"]
+TEMPLATES = [
+    "用户想把{space}做成{style}风格，倾向使用{material}，预算约{budget}万",
+    "用户咨询{space}的{material}怎么选，比较关注环保和价格，家里面积{area}平",
+    "用户提到{space}采光不好，希望{style}风格能显得更亮，考虑{material}",
+]
+
+
+def build_memories(size: int, dup_ratio: float = 0.2, seed: int = 42) -> List[MemoryItem]:
+    """生成带近似重复的合成记忆"""
+    rng = random.Random(seed)
+    memories = []
+    for i in range(size):
+        if memories and rng.random() < dup_ratio:
+            base = rng.choice(memories).content
+            text = base + rng.choice(["。", "！", "", "呢"])
+        else:
+            text = rng.choice(TEMPLATES).format(
+                space=rng.choice(SPACES),
+                style=rng.choice(STYLES),
+                material=rng.choice(MATERIALS),
+                budget=rng.randint(5, 80),
+                area=rng.randint(40, 200),
+            )
+        memories.append(MemoryItem(
+            id=f"bench_{i}",
+            content=text,
+            memory_type=MemoryType.LONG_TERM,
+            importance=rng.random(),
+        ))
+    return memories
+
+
+def legacy_merge(memories: List[MemoryItem], threshold: float = 0.8) -> int:
+    """旧实现：逐对比较 + 空格分词重叠率，返回合并后的条目数"""
+    used = set()
+    result = 0
+    for i, mem1 in enumerate(memories):
+        if i in used:
+            continue
+        words1 = set(str(mem1.content).lower().split())
+        for j in range(i + 1, len(memories)):
+            if j in used:
+                continue
+            words2 = set(str(memories[j].content).lower().split())
+            if not words1 or not words2:
+                continue
+            if len(words1 & words2) / max(len(words1), len(words2)) >= threshold:
+                used.add(j)
+        used.add(i)
+        result += 1
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="记忆合并性能基准")
+    parser.add_argument("--size", type=int, default=10000, help="记忆条数")
+    parser.add_argument("--skip-legacy", action="store_true", help="跳过旧实现")
+    args = parser.parse_args()
+
+    memories = build_memories(args.size)
+    print(f"记忆条数: {len(memories)}")
+
+    if not args.skip_legacy:
+        start = time.perf_counter()
+        legacy_count = legacy_merge(memories)
+        elapsed = time.perf_counter() - start
+        print(f"[legacy]   逐对比较: {elapsed:8.3f}s  合并后 {legacy_count} 条")
+
+    compressor = MemoryCompressor()
+
+    start = time.perf_counter()
+    merged = compressor.merge_memories(memories)
+    elapsed = time.perf_counter() - start
+    print(f"[minhash]  首次运行: {elapsed:8.3f}s  合并后 {len(merged)} 条")
+
+    # 模拟下一轮维护：签名全部命中缓存
+    start = time.perf_counter()
+    merged = compressor.merge_memories(memories)
+    elapsed = time.perf_counter() - start
+    print(f"[minhash]  增量运行: {elapsed:8.3f}s  合并后 {len(merged)} 条")
+
+    print(f"签名缓存: {compressor.similarity_index.stats()}")
+
+
+if __name__ == "__main__":
+    main()
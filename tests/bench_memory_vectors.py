@@ -0,0 +1,85 @@
+"""
+长期记忆向量召回延迟基准
+
+使用确定性的随机向量代替真实嵌入模型，只测量索引本身的检索开销。
+
+用法:
+    python tests/bench_memory_vectors.py                     # 1k / 10k / 100k
+    python tests/bench_memory_vectors.py --sizes 1000 10000 --dim 1024
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from backend.core.memory import VectorMemoryIndex
+
+
+class RandomEmbedder:
+    """按文本生成确定性随机向量"""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    def _vector(self, text: str):
+        rng = np.random.default_rng(abs(hash(text)) % (2 ** 32))
+        return rng.standard_normal(self.dim, dtype=np.float32)
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+    def embed_documents(self, texts):
+        return np.stack([self._vector(t) for t in texts])
+
+
+def bench(size: int, dim: int, queries: int = 200, k: int = 5):
+    """构建 size 条向量并测量 top-k 检索延迟"""
+    index = VectorMemoryIndex(storage_dir=tempfile.mkdtemp(), embedder=RandomEmbedder(dim))
+
+    start = time.perf_counter()
+    batch = 1000
+    for offset in range(0, size, batch):
+        index.add_many("bench_user", [
+            (f"m{i}", f"记忆{i}") for i in range(offset, min(size, offset + batch))
+        ])
+    build = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    query_vecs = rng.standard_normal((queries, dim), dtype=np.float32)
+    query_vecs /= np.linalg.norm(query_vecs, axis=1, keepdims=True)
+
+    latencies = []
+    for q in query_vecs:
+        t = time.perf_counter()
+        index.search_vector("bench_user", q, k=k)
+        latencies.append((time.perf_counter() - t) * 1000)
+    latencies.sort()
+
+    start = time.perf_counter()
+    index.flush()
+    flush = time.perf_counter() - start
+
+    p50 = latencies[len(latencies) // 2]
+    p95 = latencies[int(len(latencies) * 0.95)]
+    print(f"{size:>7} 条 dim={dim}: 构建 {build:6.2f}s  检索 p50 {p50:6.2f}ms  "
+          f"p95 {p95:6.2f}ms  落盘 {flush:5.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="长期记忆向量召回延迟基准")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--dim", type=int, default=1024, help="向量维度（text-embedding-v4 默认 1024）")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        bench(size, args.dim)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+规则检测器基准 — 每条消息执行全部关键词检测器的耗时
+
+一次请求中对同一条消息依次执行：
+  - TaskAnalyzer: analyze_complexity / select_reasoning_type / detect_required_tools
+  - StageUnderstanding._keyword_stage_detection
+  - FunctionCallingEngine._detect_tool_intent（含参数提取）
+  - EnhancedAgent: _extract_interests / _detect_decoration_stage / _detect_pain_points
+  - KnowledgeDistiller._get_cluster_key
+每条消息都是新文本（不命中特征缓存），在独立子进程中测量，取多次重复中的最好成绩。
+可用 --compare 指定另一份代码（如 git worktree 检出的旧版本）做前后对比。
+
+用法:
+    python tests/bench_message_features.py
+    git worktree add /tmp/kw_old HEAD~1
+    python tests/bench_message_features.py --compare /tmp/kw_old
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 子进程中执行
+CHILD = r"""
+import json, logging, sys, time
+sys.path.insert(0, sys.argv[1])
+logging.disable(logging.CRITICAL)
+from backend.core.reasoning import TaskAnalyzer
+from backend.core.stage_reasoning import StageUnderstanding
+from backend.core.function_calling import FunctionCallingEngine
+from backend.agents.enhanced_agent import EnhancedAgent
+from backend.framework.learning.knowledge_distill import KnowledgeDistiller
+
+MESSAGES = json.loads(sys.argv[2])
+rounds, repeat = int(sys.argv[3]), int(sys.argv[4])
+understanding = StageUnderstanding()
+engine = FunctionCallingEngine.__new__(FunctionCallingEngine)
+
+def task(q):
+    complexity = TaskAnalyzer.analyze_complexity(q)
+    TaskAnalyzer.select_reasoning_type(q, complexity)
+    TaskAnalyzer.detect_required_tools(q)
+
+DETECTORS = {
+    "task_analyzer": task,
+    "stage_detection": lambda q: understanding._keyword_stage_detection(q, "c_end"),
+    "tool_intent": engine._detect_tool_intent,
+    "agent_profile": lambda q: (EnhancedAgent._extract_interests(None, q),
+                                EnhancedAgent._detect_decoration_stage(None, q),
+                                EnhancedAgent._detect_pain_points(None, q)),
+    "cluster_key": lambda q: KnowledgeDistiller._get_cluster_key(None, q),
+}
+
+best = dict.fromkeys(DETECTORS, float("inf"))
+for k in range(repeat):
+    totals = dict.fromkeys(DETECTORS, 0.0)
+    for r in range(rounds):
+        for i, message in enumerate(MESSAGES):
+            text = f"{message}（{k}-{r}-{i}）"  # 每条都是新文本
+            for name, detect in DETECTORS.items():
+                start = time.perf_counter()
+                detect(text)
+                totals[name] += time.perf_counter() - start
+    for name, total in totals.items():
+        best[name] = min(best[name], total / rounds / len(MESSAGES) * 1e6)
+print(json.dumps(best))
+"""
+
+MESSAGES = [
+    "客厅用什么地砖比较好",
+    "我家100平，预算15万，想做北欧风格，大概要装修多久？",
+    "刚买房还没开始装修，第一步做什么",
+    "买家具花了3万能补多少",
+    "瓷砖5000元贵不贵，性价比怎么样",
+    "实木地板和强化地板哪个好，各有什么优缺点",
+    "水电改造完了，验收标准是什么？墙面开裂怎么办？",
+    "装修公司怎么选，全包半包哪个划算，设计费要多少",
+    "投入5万，收入8万，ROI多少",
+    "店铺转化率低，客户不回复怎么跟进",
+    "新房甲醛超标吗，多久能住",
+    "沙发和窗帘怎么搭配，选什么颜色",
+]
+
+
+def measure(root: str, rounds: int, repeat: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, root, json.dumps(MESSAGES, ensure_ascii=False), str(rounds), str(repeat)],
+        capture_output=True, text=True, check=True, cwd=root,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="规则检测器基准")
+    parser.add_argument("--compare", help="对比的另一份代码目录（如旧版本的 git worktree）")
+    parser.add_argument("--rounds", type=int, default=100, help="每次重复中消息集的轮数")
+    parser.add_argument("--repeat", type=int, default=7, help="重复次数（取最好成绩）")
+    args = parser.parse_args()
+
+    roots = [("当前", ROOT)]
+    if args.compare:
+        roots.insert(0, ("对比", os.path.abspath(args.compare)))
+
+    results = [(label, measure(root, args.rounds, args.repeat)) for label, root in roots]
+    names = list(results[0][1])
+    print(f"{'检测器(µs/条)':<18}" + "".join(f"{label:>10}" for label, _ in results))
+    for name in names:
+        print(f"{name:<18}" + "".join(f"{r[name]:10.1f}" for _, r in results))
+    print(f"{'合计':<18}" + "".join(f"{sum(r.values()):10.1f}" for _, r in results))
+
+
+if __name__ == "__main__":
+    main()
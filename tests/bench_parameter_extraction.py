@@ -0,0 +1,102 @@
+"""
+参数提取基准 — 一次请求中提取消息参数的耗时
+
+一次请求中参数会被多处读取：
+  - FunctionCallingEngine._detect_tool_intent（金额、上下文金额、品类、面积、风格、周期）
+  - EnhancedAgent._check_and_call_tools_fallback（金额、品类、面积）
+  - CEndAgent / BEndAgent 的 process_with_* 预计算（金额、品类、投入、收入）
+每条消息都是新文本（不命中缓存），在独立子进程中测量，取多次重复中的最好成绩。
+可用 --compare 指定另一份代码（如 git worktree 检出的旧版本）做前后对比。
+
+用法:
+    python tests/bench_parameter_extraction.py
+    git worktree add /tmp/params_old HEAD~1
+    python tests/bench_parameter_extraction.py --compare /tmp/params_old
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 子进程中执行
+CHILD = r"""
+import json, logging, sys, time
+sys.path.insert(0, sys.argv[1])
+logging.disable(logging.CRITICAL)
+from backend.core.function_calling import FunctionCallingEngine
+from backend.agents.enhanced_agent import EnhancedAgent
+
+MESSAGES = json.loads(sys.argv[2])
+rounds, repeat = int(sys.argv[3]), int(sys.argv[4])
+engine = FunctionCallingEngine.__new__(FunctionCallingEngine)
+
+try:
+    from backend.core.parameter_extraction import get_parameters
+
+    def request(q):
+        context = {}
+        engine._detect_tool_intent(q, get_parameters(q, context))
+        params = get_parameters(q, context)
+        params.amount(), params.category, params.area
+        params.amount("投入"), params.amount("收入")
+except ImportError:
+    def request(q):
+        engine._detect_tool_intent(q)
+        EnhancedAgent._extract_amount(None, q), EnhancedAgent._extract_category(None, q)
+        EnhancedAgent._extract_area(None, q)
+        EnhancedAgent._extract_amount(None, q, "投入"), EnhancedAgent._extract_amount(None, q, "收入")
+
+best = float("inf")
+for k in range(repeat):
+    total = 0.0
+    for r in range(rounds):
+        for i, message in enumerate(MESSAGES):
+            text = f"{message}（{k}-{r}-{i}）"  # 每条都是新文本
+            start = time.perf_counter()
+            request(text)
+            total += time.perf_counter() - start
+    best = min(best, total / rounds / len(MESSAGES) * 1e6)
+print(json.dumps(best))
+"""
+
+MESSAGES = [
+    "客厅用什么地砖比较好",
+    "我家100平，预算15万，想做北欧风格，大概要装修多久？",
+    "买家具花了3万能补多少",
+    "瓷砖5000元贵不贵，性价比怎么样",
+    "投入5万，收入8万，ROI多少",
+    "近3个月投入12,000元推广，营收6万，回报率怎么样",
+    "90平米的房子铺地板需要多少",
+    "沙发和窗帘怎么搭配，选什么颜色",
+]
+
+
+def measure(root: str, rounds: int, repeat: int) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, root, json.dumps(MESSAGES, ensure_ascii=False), str(rounds), str(repeat)],
+        capture_output=True, text=True, check=True, cwd=root,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="参数提取基准")
+    parser.add_argument("--compare", help="对比的另一份代码目录（如旧版本的 git worktree）")
+    parser.add_argument("--rounds", type=int, default=100, help="每次重复中消息集的轮数")
+    parser.add_argument("--repeat", type=int, default=7, help="重复次数（取最好成绩）")
+    args = parser.parse_args()
+
+    roots = [("当前", ROOT)]
+    if args.compare:
+        roots.insert(0, ("对比", os.path.abspath(args.compare)))
+
+    print(f"{'代码':<8}{'µs/请求':>10}")
+    for label, root in roots:
+        print(f"{label:<8}{measure(root, args.rounds, args.repeat):10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+API 服务压测 — 单进程 vs 多 worker
+
+以子进程方式启动 server.py（不依赖大模型的接口），用 httpx 并发请求，
+输出吞吐量与延迟分位数，并校验 /metrics/requests 汇总的请求数是否覆盖所有 worker。
+
+用法:
+    python tests/bench_server_load.py                       # 对比 WORKERS=1 与 CPU 核数
+    python tests/bench_server_load.py --workers 1 4 --duration 20 --concurrency 64
+"""
+import os
+import sys
+import time
+import socket
+import signal
+import asyncio
+import argparse
+import subprocess
+from typing import List
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 压测请求：健康检查、规则查询、带 JSON 请求体的补贴计算（经过输入校验中间件）
+REQUESTS = [
+    ("GET", "/health", None),
+    ("GET", "/api/v1/merchant/subsidy/rules", None),
+    ("POST", "/api/v1/merchant/subsidy/calc", {"order_amount": 12800, "category": "家具"}),
+]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.update({
+        "ENV": "development",
+        "DEBUG": "false",
+        "WORKERS": str(workers),
+        "API_PORT": str(port),
+        "API_HOST": "127.0.0.1",
+        "PRELOAD": "false",
+        "MEMORY_PERSIST": "false",
+        "WORKER_STATS_INTERVAL": "1",
+    })
+    return subprocess.Popen(
+        [sys.executable, "server.py"], cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(base_url: str, workers: int, timeout: float = 120.0) -> None:
+    """等待所有 worker 完成启动（以汇总快照中的 worker 数为准）"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            stats = httpx.get(base_url + "/metrics/requests", timeout=1).json()
+            if stats.get("worker_count", 1) >= workers:
+                return
+        except (httpx.HTTPError, ValueError):
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("服务启动超时")
+
+
+async def run_load(base_url: str, duration: float, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        async def user(i: int):
+            n = i
+            while time.perf_counter() < deadline:
+                method, path, body = REQUESTS[n % len(REQUESTS)]
+                n += 1
+                start = time.perf_counter()
+                response = await client.request(method, path, json=body)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(user(i) for i in range(concurrency)))
+    return latencies
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0.0
+
+
+def bench(workers: int, duration: float, concurrency: int) -> None:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    proc = start_server(workers, port)
+    try:
+        wait_ready(base_url, workers)
+        asyncio.run(run_load(base_url, 2.0, concurrency))  # 预热
+        latencies = asyncio.run(run_load(base_url, duration, concurrency))
+
+        rps = len(latencies) / duration
+        print(f"[workers={workers}] {len(latencies)} 请求  {rps:8.1f} req/s  "
+              f"p50 {percentile(latencies, 0.5) * 1000:6.1f}ms  "
+              f"p95 {percentile(latencies, 0.95) * 1000:6.1f}ms  "
+              f"p99 {percentile(latencies, 0.99) * 1000:6.1f}ms")
+
+        time.sleep(1.5)  # 等待各 worker 发布快照
+        stats = httpx.get(base_url + "/metrics/requests", timeout=5).json()
+        print(f"             /metrics/requests 汇总: total_requests={stats['total_requests']} "
+              f"worker_count={stats.get('worker_count', 1)}")
+    finally:
+        proc.send_signal(signal.SIGINT)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 服务压测")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, os.cpu_count() or 1}), help="要对比的 worker 数")
+    parser.add_argument("--duration", type=float, default=10.0, help="每轮压测时长（秒）")
+    parser.add_argument("--concurrency", type=int, default=32, help="并发连接数")
+    args = parser.parse_args()
+
+    print(f"CPU 核数: {os.cpu_count()}  并发: {args.concurrency}  时长: {args.duration}s")
+    for workers in args.workers:
+        bench(workers, args.duration, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
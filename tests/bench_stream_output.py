@@ -0,0 +1,117 @@
+"""
+NDJSON 流式输出基准 — 逐 token 帧 vs 快速编码 + answer 帧合并
+
+1. 编码：每个 answer 帧 dict + json.dumps（原实现）对比预渲染前缀 + 快速编码
+2. 流式：模拟模型按固定间隔吐出 token，经 StreamingResponse 以 ASGI 方式发送，
+   统计 send 次数（HTTP 分块数）与进程 CPU 时间，以及首字节延迟
+
+用法:
+    python tests/bench_stream_output.py
+    python tests/bench_stream_output.py --tokens 2000 --interval-ms 2 --window-ms 20
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import StreamingResponse
+
+from backend.core.output_formatter import (
+    ORJSON_AVAILABLE, OutputFormatter, render_answer, coalesce_frames,
+)
+
+TOKENS = ["客厅", "吊顶", "建议", "使用", "石膏板", "，", "轻钢", "龙骨", "更", "稳固", "。", "\n"]
+
+
+def legacy_answer(content: str) -> str:
+    return json.dumps({"type": "answer", "content": content}, ensure_ascii=False) + "\n"
+
+
+def bench_encode(n: int) -> None:
+    tokens = [TOKENS[i % len(TOKENS)] for i in range(n)]
+    formatter = OutputFormatter("bench")
+
+    start = time.perf_counter()
+    for token in tokens:
+        legacy_answer(token)
+    legacy = (time.perf_counter() - start) / n
+
+    start = time.perf_counter()
+    for token in tokens:
+        formatter.answer(token)
+    fast = (time.perf_counter() - start) / n
+
+    print(f"answer 帧编码 (orjson={'是' if ORJSON_AVAILABLE else '否'}): "
+          f"原实现 {legacy * 1e6:.2f} µs/帧  新实现 {fast * 1e6:.2f} µs/帧")
+
+
+async def token_stream(n: int, interval: float, render):
+    for i in range(n):
+        if interval:
+            await asyncio.sleep(interval)
+        yield render(TOKENS[i % len(TOKENS)])
+
+
+async def send_response(stream) -> dict:
+    response = StreamingResponse(stream, media_type="application/x-ndjson")
+    sends = 0
+    first_byte = None
+    start = time.perf_counter()
+    done = asyncio.Event()
+
+    async def receive():
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal sends, first_byte
+        if message["type"] == "http.response.body":
+            if message.get("body"):
+                sends += 1
+                if first_byte is None:
+                    first_byte = time.perf_counter() - start
+            if not message.get("more_body", False):
+                done.set()
+
+    cpu_start = time.process_time()
+    await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+    return {
+        "sends": sends,
+        "cpu_ms": (time.process_time() - cpu_start) * 1000,
+        "first_byte_ms": (first_byte or 0) * 1000,
+    }
+
+
+def bench_stream(n: int, interval_ms: float, window_ms: float) -> None:
+    interval = interval_ms / 1000
+    legacy = asyncio.run(send_response(token_stream(n, interval, legacy_answer)))
+    fast = asyncio.run(send_response(coalesce_frames(
+        token_stream(n, interval, render_answer), window_ms=window_ms,
+    )))
+
+    print(f"流式 {n} token，间隔 {interval_ms}ms，合并窗口 {window_ms}ms:")
+    for name, result in (("逐 token", legacy), ("合并", fast)):
+        print(f"  [{name:>6}] 分块 {result['sends']:6d}  CPU {result['cpu_ms']:8.1f}ms  "
+              f"首字节 {result['first_byte_ms']:6.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NDJSON 流式输出基准")
+    parser.add_argument("--tokens", type=int, default=2000, help="token 数")
+    parser.add_argument("--interval-ms", type=float, nargs="+", default=[0, 2, 10],
+                        help="token 间隔（毫秒），可指定多个")
+    parser.add_argument("--window-ms", type=float, default=20, help="合并窗口（毫秒）")
+    args = parser.parse_args()
+
+    bench_encode(100000)
+    for interval_ms in args.interval_ms:
+        tokens = args.tokens if interval_ms < 5 else args.tokens // 10
+        bench_stream(tokens, interval_ms, args.window_ms)
+
+
+if __name__ == "__main__":
+    main()
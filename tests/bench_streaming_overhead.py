@@ -0,0 +1,161 @@
+"""
+中间件流式响应开销基准 — BaseHTTPMiddleware vs 纯 ASGI
+
+直接以 ASGI 方式调用应用（不经过网络），对一个输出 N 块 NDJSON 的流式接口计时，
+对比三种配置：
+  - none:   不加中间件（基线）
+  - legacy: 与原 server.py 相同的两个 @app.middleware("http") 中间件
+  - asgi:   backend/api/middleware/request_pipeline.py 中的纯 ASGI 中间件
+输出每块的平均耗时以及相对基线的额外开销。
+
+用法:
+    python tests/bench_streaming_overhead.py
+    python tests/bench_streaming_overhead.py --chunks 2000 --rounds 20
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from backend.core.metrics import RequestMetrics
+from backend.core.security import InputSanitizer
+from backend.api.middleware.request_pipeline import (
+    RequestValidationMiddleware,
+    PerformanceMonitoringMiddleware,
+    PreparsedJSONRoute,
+    get_json_body,
+    route_label,
+)
+
+
+def build_app(mode: str, chunks: int) -> FastAPI:
+    app = FastAPI()
+    router = APIRouter(route_class=PreparsedJSONRoute)
+    metrics = RequestMetrics()
+    sanitizer = InputSanitizer()
+
+    @router.post("/chat/stream")
+    async def chat_stream(request: Request):
+        data = await get_json_body(request)
+
+        async def generate():
+            for i in range(chunks):
+                yield json.dumps({"type": "answer", "content": data["message"]},
+                                 ensure_ascii=False) + "\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    app.include_router(router, prefix="/api/v1")
+
+    if mode == "asgi":
+        app.add_middleware(RequestValidationMiddleware, sanitizer=sanitizer)
+        app.add_middleware(PerformanceMonitoringMiddleware, metrics=metrics)
+    elif mode == "legacy":
+        @app.middleware("http")
+        async def validate_request(request: Request, call_next):
+            if request.method == "POST":
+                if "application/json" in request.headers.get("content-type", ""):
+                    body = await request.body()
+                    if body:
+                        data = json.loads(body)
+                        if "message" in data:
+                            result = sanitizer.sanitize(data["message"])
+                            if result["blocked"]:
+                                return JSONResponse(status_code=400, content={"detail": "blocked"})
+            return await call_next(request)
+
+        @app.middleware("http")
+        async def performance_monitoring(request: Request, call_next):
+            request_id = str(uuid.uuid4())[:8]
+            request.state.request_id = request_id
+            start_time = time.time()
+            metrics.increment_active()
+            try:
+                response = await call_next(request)
+                duration = time.time() - start_time
+                metrics.record_request(route_label(request.scope), request.method,
+                                       duration, response.status_code, request_id)
+                response.headers["X-Request-ID"] = request_id
+                response.headers["X-Response-Time"] = f"{duration * 1000:.2f}ms"
+                return response
+            finally:
+                metrics.decrement_active()
+
+    return app
+
+
+async def run_once(app, body: bytes) -> int:
+    """模拟一次请求，返回收到的响应体块数"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "POST", "scheme": "http", "path": "/api/v1/chat/stream",
+        "raw_path": b"/api/v1/chat/stream", "query_string": b"", "root_path": "",
+        "headers": [(b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 8000),
+    }
+    received = False
+    finished = asyncio.Event()
+    count = 0
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal count
+        if message["type"] == "http.response.body":
+            if message.get("body"):
+                count += 1
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    return count
+
+
+async def bench(mode: str, chunks: int, rounds: int) -> float:
+    app = build_app(mode, chunks)
+    body = json.dumps({"message": "客厅吊顶用什么材料好"}, ensure_ascii=False).encode()
+    await run_once(app, body)  # 预热
+
+    total = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        count = await run_once(app, body)
+        total += time.perf_counter() - start
+        assert count == chunks, f"{mode}: 收到 {count} 块，预期 {chunks}"
+    return total / rounds / chunks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="中间件流式响应开销基准")
+    parser.add_argument("--chunks", type=int, default=1000, help="每次响应的块数")
+    parser.add_argument("--rounds", type=int, default=10, help="每种配置的请求次数")
+    args = parser.parse_args()
+
+    print(f"块数: {args.chunks}  轮数: {args.rounds}")
+    results = {}
+    for mode in ("none", "legacy", "asgi"):
+        results[mode] = asyncio.run(bench(mode, args.chunks, args.rounds))
+
+    baseline = results["none"]
+    for mode, per_chunk in results.items():
+        print(f"[{mode:>6}] 每块 {per_chunk * 1e6:7.2f} µs  "
+              f"中间件开销 {(per_chunk - baseline) * 1e6:7.2f} µs/块")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+进程内 Redis 协议替身（测试用）
+
+在本地端口上实现 RESP2 协议的最小子集，供真实的 redis 客户端
+（含连接池、流水线、MULTI/EXEC、redis.asyncio）在测试中直连。
+
+支持命令: HELLO, PING, CLIENT, SELECT, MULTI, EXEC, DISCARD, WATCH, UNWATCH, GET, SET, DEL,
+         EXISTS, EXPIRE, TTL, TYPE, RPUSH, LTRIM, LRANGE, LLEN, KEYS, SCAN
+"""
+import fnmatch
+import socket
+import socketserver
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class _Store:
+    """线程安全的键空间"""
+
+    def __init__(self):
+        self.data: Dict[bytes, object] = {}
+        self.expires: Dict[bytes, float] = {}
+        self.versions: Dict[bytes, int] = {}  # 每次写入递增，供 WATCH 判断
+        self.lock = threading.RLock()
+        self.commands: List[bytes] = []
+
+    def _purge(self, key: bytes):
+        deadline = self.expires.get(key)
+        if deadline is not None and deadline <= time.time():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+
+    def get(self, key: bytes):
+        self._purge(key)
+        return self.data.get(key)
+
+    def keys(self) -> List[bytes]:
+        for key in list(self.data):
+            self._purge(key)
+        return list(self.data)
+
+    def touch(self, key: bytes):
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+
+class _Error(Exception):
+    pass
+
+
+def _encode(value) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, _Error):
+        return b"-" + str(value).encode() + b"\r\n"
+    if isinstance(value, bool):
+        return b":%d\r\n" % int(value)
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, str):
+        return b"+" + value.encode() + b"\r\n"
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(_encode(v) for v in value)
+    if isinstance(value, dict):
+        return b"%%%d\r\n" % len(value) + b"".join(
+            _encode(k) + _encode(v) for k, v in value.items()
+        )
+    raise TypeError(type(value))
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.strip().split()
+        args = []
+        for _ in range(int(line[1:])):
+            size = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(size + 2)[:-2])
+        return args
+
+    def handle(self):
+        store: _Store = self.server.store
+        queued: Optional[List[List[bytes]]] = None
+        watched: Dict[bytes, int] = {}
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            name = args[0].upper()
+            store.commands.append(name)
+
+            if name == b"MULTI":
+                queued = []
+                self.wfile.write(_encode("OK"))
+            elif name == b"EXEC":
+                with store.lock:
+                    if any(store.versions.get(k, 0) != v for k, v in watched.items()):
+                        results = None  # WATCH 的键已被改动，事务放弃
+                    else:
+                        results = [self._execute(store, cmd) for cmd in (queued or [])]
+                queued = None
+                watched = {}
+                self.wfile.write(_encode(results))
+            elif name == b"DISCARD":
+                queued = None
+                watched = {}
+                self.wfile.write(_encode("OK"))
+            elif name == b"WATCH":
+                with store.lock:
+                    watched.update((k, store.versions.get(k, 0)) for k in args[1:])
+                self.wfile.write(_encode("OK"))
+            elif name == b"UNWATCH":
+                watched = {}
+                self.wfile.write(_encode("OK"))
+            elif queued is not None:
+                queued.append(args)
+                self.wfile.write(_encode("QUEUED"))
+            else:
+                with store.lock:
+                    self.wfile.write(_encode(self._execute(store, args)))
+
+    @staticmethod
+    def _list(store: _Store, key: bytes, create: bool = False):
+        value = store.get(key)
+        if value is None:
+            if not create:
+                return []
+            value = []
+            store.data[key] = value
+        if not isinstance(value, list):
+            raise _Error("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+
+    @staticmethod
+    def _index(i: int, n: int) -> int:
+        return i + n if i < 0 else i
+
+    def _execute(self, store: _Store, args: List[bytes]):
+        name, rest = args[0].upper(), args[1:]
+        if name in (b"SET", b"DEL", b"EXPIRE", b"RPUSH", b"LTRIM"):
+            for key in (rest if name == b"DEL" else rest[:1]):
+                store.touch(key)
+        try:
+            if name == b"HELLO":
+                # 仅协商 RESP3 握手；其余回复均为 RESP2/RESP3 通用的类型
+                proto = int(rest[0]) if rest else 2
+                info = {b"server": b"redis", b"version": b"7.2.0", b"proto": proto}
+                if proto >= 3:
+                    return info
+                return [v for pair in info.items() for v in pair]
+            if name == b"PING":
+                return "PONG"
+            if name in (b"CLIENT", b"SELECT"):
+                return "OK"
+            if name == b"GET":
+                value = store.get(rest[0])
+                if isinstance(value, list):
+                    raise _Error("WRONGTYPE Operation against a key holding the wrong kind of value")
+                return value
+            if name == b"SET":
+                store.data[rest[0]] = rest[1]
+                store.expires.pop(rest[0], None)
+                opts = [a.upper() for a in rest[2:]]
+                if b"EX" in opts:
+                    store.expires[rest[0]] = time.time() + int(rest[2 + opts.index(b"EX") + 1])
+                return "OK"
+            if name == b"DEL":
+                count = 0
+                for key in rest:
+                    if store.get(key) is not None:
+                        count += 1
+                    store.data.pop(key, None)
+                    store.expires.pop(key, None)
+                return count
+            if name == b"EXISTS":
+                return sum(1 for key in rest if store.get(key) is not None)
+            if name == b"EXPIRE":
+                if store.get(rest[0]) is None:
+                    return 0
+                store.expires[rest[0]] = time.time() + int(rest[1])
+                return 1
+            if name == b"TTL":
+                if store.get(rest[0]) is None:
+                    return -2
+                deadline = store.expires.get(rest[0])
+                return -1 if deadline is None else max(0, int(round(deadline - time.time())))
+            if name == b"TYPE":
+                value = store.get(rest[0])
+                if value is None:
+                    return "none"
+                return "list" if isinstance(value, list) else "string"
+            if name == b"RPUSH":
+                items = self._list(store, rest[0], create=True)
+                items.extend(rest[1:])
+                return len(items)
+            if name == b"LLEN":
+                return len(self._list(store, rest[0]))
+            if name == b"LRANGE":
+                items = self._list(store, rest[0])
+                n = len(items)
+                start = max(0, self._index(int(rest[1]), n))
+                stop = min(n - 1, self._index(int(rest[2]), n))
+                return items[start:stop + 1]
+            if name == b"LTRIM":
+                items = self._list(store, rest[0])
+                n = len(items)
+                start = max(0, self._index(int(rest[1]), n))
+                stop = min(n - 1, self._index(int(rest[2]), n))
+                items[:] = items[start:stop + 1]
+                if not items:
+                    store.data.pop(rest[0], None)
+                return "OK"
+            if name == b"KEYS":
+                pattern = rest[0].decode()
+                return [k for k in store.keys() if fnmatch.fnmatchcase(k.decode(), pattern)]
+            if name == b"SCAN":
+                pattern = "*"
+                opts = [a.upper() for a in rest]
+                if b"MATCH" in opts:
+                    pattern = rest[opts.index(b"MATCH") + 1].decode()
+                keys = [k for k in store.keys() if fnmatch.fnmatchcase(k.decode(), pattern)]
+                return [b"0", keys]
+            raise _Error(f"ERR unknown command '{name.decode()}'")
+        except _Error as e:
+            return e
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class RedisStandIn:
+    """
+    本地 Redis 协议替身
+
+    用法:
+        with RedisStandIn() as server:
+            client = redis.Redis(host=server.host, port=server.port)
+    """
+
+    def __init__(self):
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.store = _Store()
+        self.host, self.port = self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def commands(self) -> List[bytes]:
+        """收到的命令名（大写），用于断言"""
+        return self._server.store.commands
+
+    def start(self) -> "RedisStandIn":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "RedisStandIn":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.core.cache import (
     LRUCache, CircularBuffer, KnowledgeQueryCache, LLMResponseCache,
+    EmbeddingCache, FrozenDict, freeze, thaw,
     get_cache_manager, get_knowledge_cache, get_llm_cache
 )
 
@@ -143,6 +144,33 @@ class TestCircularBuffer:
         assert len(buffer.get_all()) == 0
 
 
+class TestFreeze:
+    """测试只读结构 freeze/thaw"""
+
+    def test_freeze_nested(self):
+        """测试嵌套结构整体只读"""
+        frozen = freeze({"a": [1, {"b": [2]}], "c": {3}})
+        assert isinstance(frozen, FrozenDict)
+        assert frozen == {"a": (1, {"b": (2,)}), "c": frozenset({3})}
+        for mutate in (lambda: frozen.__setitem__("x", 1), lambda: frozen.pop("a"),
+                       lambda: frozen.update(x=1), lambda: frozen["a"][1].setdefault("y", 0)):
+            with pytest.raises(TypeError):
+                mutate()
+
+    def test_thaw_round_trip(self):
+        """测试 thaw 得到独立的可修改副本，FrozenDict 可序列化与 pickle"""
+        import json
+        import pickle
+        original = {"a": [1, {"b": [2]}], "c": "d"}
+        frozen = freeze(original)
+        assert thaw(frozen) == original
+        copy = thaw(frozen)
+        copy["a"].append(3)
+        assert frozen["a"] == (1, {"b": (2,)})
+        assert json.loads(json.dumps(frozen)) == original
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
 class TestKnowledgeQueryCache:
     """测试 KnowledgeQueryCache 类"""
 
@@ -250,6 +278,42 @@ class TestLLMResponseCache:
         assert cached is None
 
 
+class TestEmbeddingCache:
+    """测试 EmbeddingCache 类"""
+
+    class CountingEmbeddings:
+        model = "fake-embedding"
+
+        def __init__(self):
+            self.embedded = []
+
+        def embed_query(self, text):
+            self.embedded.append(text)
+            return [float(len(text)), 1.0]
+
+        def embed_documents(self, texts):
+            return [self.embed_query(t) for t in texts]
+
+    def test_query_cached(self):
+        """测试相同文本只嵌入一次"""
+        embeddings = self.CountingEmbeddings()
+        cache = EmbeddingCache(embeddings=embeddings)
+
+        assert cache.embed_query("两个孩子") == [4.0, 1.0]
+        assert cache.embed_query("两个孩子") == [4.0, 1.0]
+        assert embeddings.embedded == ["两个孩子"]
+
+    def test_documents_only_embed_missing(self):
+        """测试批量接口只嵌入未命中的文本"""
+        embeddings = self.CountingEmbeddings()
+        cache = EmbeddingCache(embeddings=embeddings)
+        cache.embed_query("a")
+
+        vectors = cache.embed_documents(["a", "bb", "a"])
+        assert vectors == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+        assert embeddings.embedded == ["a", "bb"]
+
+
 class TestCacheManager:
     """测试缓存管理器"""
 
@@ -0,0 +1,147 @@
+"""
+实体链接单元测试
+测试 backend/core/aho_corasick.py 与 backend/knowledge/entity_linker.py
+"""
+import pytest
+import os
+import sys
+import random
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.core.aho_corasick import AhoCorasick
+from backend.knowledge.entity_linker import EntityLinker
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph, EntityType, RelationType
+
+
+@pytest.fixture(scope="module")
+def graph():
+    """完整的预定义图谱（模块内共享，测试只读）"""
+    return DecorationKnowledgeGraph(snapshot_path="")
+
+
+def brute_force(patterns, text):
+    return sorted(
+        (i, i + len(p), p) for p in set(patterns) for i in range(len(text) - len(p) + 1)
+        if text.startswith(p, i)
+    )
+
+
+class TestAhoCorasick:
+    """测试自动机"""
+
+    def test_matches_brute_force(self):
+        """测试随机模式串与文本上结果与暴力匹配一致"""
+        rng = random.Random(42)
+        for _ in range(50):
+            patterns = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(8)]
+            text = "".join(rng.choice("abcd") for _ in range(40))
+            automaton = AhoCorasick()
+            for pattern in patterns:
+                automaton.add(pattern)
+            assert sorted(automaton.iter_matches(text)) == brute_force(patterns, text)
+
+    def test_distinct_values_matches_in(self):
+        """测试 distinct_values 与逐个 `in` 判断结果一致（含相互重叠、互为后缀的模式串）"""
+        rng = random.Random(7)
+        for _ in range(50):
+            patterns = {"".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(8)}
+            text = "".join(rng.choice("abcd") for _ in range(40))
+            automaton = AhoCorasick(ignore_case=False)
+            for pattern in patterns:
+                automaton.add(pattern)
+            assert sorted(automaton.distinct_values(text)) == sorted(p for p in patterns if p in text)
+
+    def test_longest_match_wins(self):
+        """测试重叠时保留最长匹配，等长时保留靠前的"""
+        automaton = AhoCorasick()
+        for pattern in ("木地板", "实木地板", "地板砖", "ab", "bc"):
+            automaton.add(pattern)
+
+        assert automaton.find_longest("实木地板砖") == [(0, 4, "实木地板")]
+        assert automaton.find_longest("abc") == [(0, 2, "ab")]
+        assert automaton.find_longest("木地板和地板砖") == [(0, 3, "木地板"), (4, 7, "地板砖")]
+
+    def test_ignore_case_and_values(self):
+        """测试忽略大小写，匹配返回添加时的值"""
+        automaton = AhoCorasick()
+        assert automaton.add("Dulux", value="多乐士")
+        assert not automaton.add("DULUX", value="多乐士")
+        assert len(automaton) == 1 and "dulux" in automaton
+        assert list(automaton.iter_matches("买dULux")) == [(1, 6, "多乐士")]
+
+    def test_incremental_add(self):
+        """测试构建后新增模式串，下一次匹配时重算一次链接表"""
+        automaton = AhoCorasick()
+        automaton.add("瓷砖")
+        assert automaton.find_longest("大理石瓷砖") == [(3, 5, "瓷砖")]
+        assert automaton.build_count == 1
+
+        automaton.add("大理石")
+        automaton.add("石瓷")
+        assert automaton.build_count == 1
+        assert sorted(automaton.iter_matches("大理石瓷砖")) == [(0, 3, "大理石"), (2, 4, "石瓷"), (3, 5, "瓷砖")]
+        assert automaton.build_count == 2
+
+
+class TestEntityLinker:
+    """测试图谱实体链接"""
+
+    def test_link_names_and_aliases(self, graph):
+        """测试一次找出名称与别名提及，别名解析到实体"""
+        mentions = graph.link_entities("客厅想铺实木地板，现代简约风格，用Dulux乳胶漆还是立邦？")
+        assert [(m.entity.name, m.text) for m in mentions] == [
+            ("客厅", "客厅"), ("实木地板", "实木地板"), ("现代简约", "现代简约"),
+            (graph.get_entity("dulux").name, "Dulux"), ("乳胶漆", "乳胶漆"), ("立邦", "立邦"),
+        ]
+        assert all(m.text == "客厅想铺实木地板，现代简约风格，用Dulux乳胶漆还是立邦？"[m.start:m.end]
+                   for m in mentions)
+
+    def test_ascii_word_boundary(self, graph):
+        """测试英文名称不命中单词内部"""
+        assert graph.get_entity("hay") is not None
+        assert graph.link_entities("shaylo") == []
+        assert [m.text for m in graph.link_entities("HAY的椅子")] == ["HAY"]
+
+    def test_type_filter_before_overlap(self, graph):
+        """测试类型过滤在消解重叠之前进行"""
+        spaces = graph.link_entities("实木地板", entity_types=[EntityType.SPACE])
+        assert all(m.entity.entity_type == EntityType.SPACE for m in spaces)
+        floors = graph.link_entities("客厅铺实木地板", entity_types=[EntityType.WOOD_FLOOR])
+        assert [m.entity.name for m in floors] == ["实木地板"]
+
+    def test_add_entity_updates_linker(self):
+        """测试新增实体后新版本的链接器包含新名称，旧版本的链接器不变，只新增关系时沿用"""
+        kg = DecorationKnowledgeGraph(snapshot_path="")
+        linker = kg.get_entity_linker()
+        assert "云朵沙发" not in {m.entity.name for m in kg.link_entities("想买云朵沙发")}
+
+        kg.add_entity("云朵沙发", EntityType.SOFA, aliases=["Cloud Sofa"])
+        assert kg.get_entity_linker() is not linker
+        assert kg.get_entity_linker() is kg.get_entity_linker()
+        assert [m.entity.name for m in kg.link_entities("想买cloud sofa还是云朵沙发")] == ["云朵沙发", "云朵沙发"]
+        assert "云朵沙发" not in {m.entity.name for m in linker.link("想买云朵沙发")}
+
+        linker = kg.get_entity_linker()
+        kg.add_relation("云朵沙发", "客厅", RelationType.SUITABLE_FOR)
+        assert kg.get_entity_linker() is linker
+
+    def test_new_versions_extend_linker(self):
+        """测试新版本的链接器共享主自动机、新增名称放入小自动机，累计过多时重新编译"""
+        kg = DecorationKnowledgeGraph(snapshot_path="")
+        base = kg.get_entity_linker()
+        kg.add_entity("云朵沙发", EntityType.SOFA, aliases=["Cloud Sofa"])
+        linker = kg.get_entity_linker()
+        assert linker.automaton is base.automaton
+        assert linker.pending_names == ("云朵沙发", "cloud sofa")
+
+        for i in range(EntityLinker.PENDING_LIMIT // 2):
+            kg.add_entity(f"测试沙发{i}", EntityType.SOFA, aliases=[f"sofa-{i}"])
+        linker = kg.get_entity_linker()
+        assert linker.automaton is not base.automaton
+        assert len(linker.pending_names) < EntityLinker.PENDING_LIMIT
+
+        rebuilt = EntityLinker(kg)
+        for text in ("客厅放云朵沙发还是测试沙发12", "sofa-3和SOFA-30哪个好，cloud sofa呢", "测试沙发6实木地板"):
+            assert [m.to_dict() for m in linker.link(text)] == [m.to_dict() for m in rebuilt.link(text)]
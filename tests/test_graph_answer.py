@@ -0,0 +1,101 @@
+"""
+知识图谱直答单元测试
+测试 backend/knowledge/graph_answer.py
+"""
+import pytest
+import os
+import sys
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph, EntityType, PRODUCT_TYPES
+from backend.knowledge.graph_answer import GraphAnswerer
+
+
+@pytest.fixture(scope="module")
+def graph():
+    """完整的预定义图谱（模块内共享，测试只读）"""
+    return DecorationKnowledgeGraph(snapshot_path="")
+
+
+@pytest.fixture
+def answerer(graph):
+    return GraphAnswerer(graph)
+
+
+class TestIntents:
+    """测试意图模板"""
+
+    def test_space_solution(self, answerer):
+        """测试空间 + 分类词只给出对应分类的推荐"""
+        answer = answerer.answer("客厅用什么地砖")
+        assert answer.intent == "space_solution"
+        assert answer.facts[0].startswith("客厅地面推荐: ")
+        assert "瓷砖" in answer.facts[0]
+        assert not any("灯具" in fact for fact in answer.facts)
+
+    def test_space_solution_with_style(self, answerer):
+        """测试带风格时按风格匹配度排序"""
+        answer = answerer.answer("客厅想做北欧风，地面怎么选")
+        assert answer.entities == ["客厅", "北欧"]
+        assert "北欧匹配度" in answer.facts[0].split("、")[0]
+
+    def test_style_materials(self, answerer):
+        """测试风格推荐材料"""
+        answer = answerer.answer("北欧风格用什么材料")
+        assert answer.intent == "style_materials"
+        assert "木地板" in answer.facts[0]
+
+    def test_alternatives(self, answerer):
+        """测试替代品"""
+        answer = answerer.answer("强化地板可以用什么代替")
+        assert answer.intent == "alternatives"
+        assert answer.entities == ["强化复合地板"]
+        assert "实木地板" in answer.facts[0]
+
+    def test_comparison(self, answerer):
+        """测试两个产品对比"""
+        answer = answerer.answer("实木地板和强化地板哪个好")
+        assert answer.intent == "comparison"
+        assert answer.entities == ["实木地板", "强化复合地板"]
+        assert any("可相互替代" in fact for fact in answer.facts)
+
+    @pytest.mark.parametrize("message", [
+        "装修要多少钱",            # 价格
+        "乳胶漆多少钱一桶",        # 价格
+        "厨房防水怎么做",          # 施工做法
+        "那卧室呢",                # 没有意图词
+        "客厅推荐什么风格",        # 问的是风格
+        "儿童房用什么地板",        # 图谱没有对应推荐
+        "我家是三室两厅一百二十平的老房子，客厅想铺木地板，卧室想用壁纸，预算有限怎么选比较好",
+    ])
+    def test_not_confident(self, answerer, message):
+        """测试没有把握时不作答"""
+        assert answerer.answer(message) is None
+
+
+class TestStats:
+    """测试统计"""
+
+    def test_hit_rate_and_saved(self, answerer):
+        answerer.answer("客厅用什么地砖")
+        answerer.answer("装修要多少钱")
+        answerer.record_retrieval(200.0)
+
+        stats = answerer.get_stats()
+        assert stats["requests"] == 2
+        assert stats["answered"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["by_intent"] == {"space_solution": 1}
+        assert stats["avg_retrieval_ms"] == 200.0
+        assert 0 < stats["saved_ms"] <= 200.0
+
+
+def test_product_helpers_use_product_types(graph):
+    """测试推荐类查询覆盖各产品类型（图谱中没有 material 类型的实体）"""
+    assert not graph.entities_of_type(EntityType.MATERIAL)
+    assert EntityType.FLOOR_TILE in PRODUCT_TYPES and EntityType.SPACE not in PRODUCT_TYPES
+    assert graph.find_style_materials("北欧")
+    assert graph.find_alternatives("木地板")
+    assert graph.find_suitable_materials("客厅")
@@ -0,0 +1,176 @@
+"""
+知识图谱多跳查询单元测试
+测试 backend/knowledge/graph_query.py
+"""
+import pytest
+import os
+import sys
+import random
+from collections import deque
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.knowledge.knowledge_graph import DecorationKnowledgeGraph, EntityType, RelationType
+from backend.knowledge.graph_query import PathStep
+
+
+@pytest.fixture(scope="module")
+def graph():
+    """完整的预定义图谱（模块内共享，测试只读）"""
+    return DecorationKnowledgeGraph(snapshot_path="")
+
+
+@pytest.fixture
+def small_graph(monkeypatch):
+    """
+    小图谱：
+        客厅 ←适用于− 瓷砖 ←生产商− 东鹏
+        客厅 ←适用于− 木地板 ←生产商− 大自然
+        木地板 −可替代→ 瓷砖（权重 5）
+        木地板 −属于风格→ 北欧 −兼容→ 日式（权重各 1）
+        瓷砖 −属于风格→ 日式（权重 1）
+    """
+    monkeypatch.setattr(DecorationKnowledgeGraph, "_load_predefined_data", lambda self: None)
+    g = DecorationKnowledgeGraph(snapshot_path="")
+    for name, entity_type in [("客厅", EntityType.SPACE), ("瓷砖", EntityType.FLOOR_TILE),
+                              ("木地板", EntityType.WOOD_FLOOR), ("东鹏", EntityType.BRAND),
+                              ("大自然", EntityType.BRAND), ("北欧", EntityType.STYLE),
+                              ("日式", EntityType.STYLE)]:
+        g.add_entity(name, entity_type)
+    g.add_relation("瓷砖", "客厅", RelationType.SUITABLE_FOR)
+    g.add_relation("木地板", "客厅", RelationType.SUITABLE_FOR)
+    g.add_relation("东鹏", "瓷砖", RelationType.PRODUCED_BY)
+    g.add_relation("大自然", "木地板", RelationType.PRODUCED_BY)
+    g.add_relation("木地板", "瓷砖", RelationType.ALTERNATIVE_TO, weight=5.0)
+    g.add_relation("木地板", "北欧", RelationType.BELONGS_TO_STYLE)
+    g.add_relation("北欧", "日式", RelationType.COMPATIBLE_WITH)
+    g.add_relation("瓷砖", "日式", RelationType.BELONGS_TO_STYLE)
+    return g
+
+
+def bfs_distance(graph, source, target, max_depth):
+    """基于 query_relations 的参照实现：最短跳数"""
+    start = graph.get_entity(source).id
+    goal = graph.get_entity(target).id
+    seen = {start: 0}
+    queue = deque([start])
+    while queue:
+        entity_id = queue.popleft()
+        if entity_id == goal:
+            return seen[entity_id]
+        if seen[entity_id] == max_depth:
+            continue
+        for neighbor, _ in graph.query_relations(graph.entities[entity_id].name):
+            if neighbor.id not in seen:
+                seen[neighbor.id] = seen[entity_id] + 1
+                queue.append(neighbor.id)
+    return None
+
+
+def assert_valid_path(path, direction="both"):
+    """相邻实体确实由对应关系相连"""
+    for i, relation in enumerate(path.relations):
+        a, b = path.entities[i].id, path.entities[i + 1].id
+        forward = (relation.source_id, relation.target_id) == (a, b)
+        backward = (relation.source_id, relation.target_id) == (b, a)
+        assert forward if direction == "outgoing" else backward if direction == "incoming" else forward or backward
+
+
+class TestFollowPath:
+    """测试按关系类型序列展开"""
+
+    def test_typed_two_hop(self, small_graph):
+        """测试 空间 ←适用于− 材料 ←生产商− 品牌"""
+        paths = small_graph.follow_path("客厅", [
+            (RelationType.SUITABLE_FOR, "incoming"),
+            (RelationType.PRODUCED_BY, "incoming", EntityType.BRAND),
+        ])
+        assert [[e.name for e in p.entities] for p in paths] == [["客厅", "瓷砖", "东鹏"], ["客厅", "木地板", "大自然"]]
+        assert all(p.length == 2 for p in paths)
+        for path in paths:
+            assert_valid_path(path, "incoming")
+
+    def test_entity_type_filter_and_limit(self, small_graph):
+        """测试每跳的实体类型过滤与结果数限制"""
+        step = PathStep.of(RelationType.SUITABLE_FOR, "incoming", EntityType.WOOD_FLOOR)
+        assert [p.end.name for p in small_graph.follow_path("客厅", [step])] == ["木地板"]
+        assert len(small_graph.follow_path("客厅", [(RelationType.SUITABLE_FOR, "incoming")], limit=1)) == 1
+        assert small_graph.follow_path("不存在", [RelationType.SUITABLE_FOR]) == []
+
+    def test_no_cycles(self, small_graph):
+        """测试路径内不重复经过同一实体"""
+        paths = small_graph.follow_path("瓷砖", [(None, "both"), (None, "both")])
+        assert paths
+        assert all(len({e.id for e in p.entities}) == len(p.entities) for p in paths)
+
+
+class TestNeighborhood:
+    """测试广度优先邻域"""
+
+    def test_depth_order_and_types(self, small_graph):
+        """测试按距离由近到远、深度限制与类型过滤"""
+        paths = small_graph.neighborhood("东鹏", max_depth=2)
+        # 同一层内先出边后入边
+        assert [p.end.name for p in paths] == ["瓷砖", "客厅", "日式", "木地板"]
+        assert [p.length for p in paths] == [1, 2, 2, 2]
+
+        brands = small_graph.neighborhood("客厅", max_depth=2, entity_types=[EntityType.BRAND])
+        assert [p.end.name for p in brands] == ["东鹏", "大自然"]
+        assert small_graph.neighborhood("客厅", max_depth=2, limit=1)[0].length == 1
+
+
+class TestShortestPath:
+    """测试最短路径"""
+
+    def test_bidirectional_matches_bfs(self, graph):
+        """测试双向广度优先的跳数与单向广度优先一致，路径合法"""
+        rng = random.Random(7)
+        names = sorted({graph.entities[r.source_id].name for r in graph.relations} |
+                       {graph.entities[r.target_id].name for r in graph.relations})
+        for _ in range(60):
+            source, target = rng.choice(names), rng.choice(names)
+            path = graph.shortest_path(source, target, max_depth=4)
+            expected = bfs_distance(graph, source, target, 4)
+            assert (path.length if path else None) == expected, (source, target)
+            if path:
+                assert path.start.name == source and path.end.name == target
+                assert_valid_path(path)
+
+    def test_weighted(self, small_graph):
+        """测试按权重：绕行（3 跳，代价 3）优于直连（1 跳，代价 5），并受跳数限制"""
+        types = [RelationType.ALTERNATIVE_TO, RelationType.BELONGS_TO_STYLE, RelationType.COMPATIBLE_WITH]
+        assert small_graph.shortest_path("木地板", "瓷砖", relation_types=types).length == 1
+
+        path = small_graph.shortest_path("木地板", "瓷砖", relation_types=types, weighted=True)
+        assert [e.name for e in path.entities] == ["木地板", "北欧", "日式", "瓷砖"]
+        assert path.cost == 3.0
+        assert_valid_path(path)
+
+        limited = small_graph.shortest_path("木地板", "瓷砖", max_depth=2, relation_types=types, weighted=True)
+        assert limited.length == 1 and limited.cost == 5.0
+
+    def test_direction_and_unreachable(self, small_graph):
+        """测试方向限制与不可达"""
+        assert small_graph.shortest_path("东鹏", "客厅", direction="outgoing").length == 2
+        assert small_graph.shortest_path("客厅", "东鹏", direction="outgoing") is None
+        assert small_graph.shortest_path("客厅", "东鹏", direction="incoming").length == 2
+        assert small_graph.shortest_path("客厅", "客厅").length == 0
+
+
+class TestQueryCache:
+    """测试查询缓存"""
+
+    def test_hits_and_invalidation(self, small_graph):
+        """测试相同查询命中缓存，新增关系后失效"""
+        engine = small_graph.get_query_engine()
+        steps = [(RelationType.SUITABLE_FOR, "incoming")]
+        first = small_graph.follow_path("客厅", steps)
+        second = small_graph.follow_path("客厅", steps)
+        assert [p.end.name for p in first] == [p.end.name for p in second]
+        assert engine.cache_info()["hits"] == 1
+
+        small_graph.add_entity("岩板", EntityType.STONE)
+        small_graph.add_relation("岩板", "客厅", RelationType.SUITABLE_FOR)
+        assert [p.end.name for p in small_graph.follow_path("客厅", steps)] == ["瓷砖", "木地板", "岩板"]
+        assert engine.cache_info()["hits"] == 1
@@ -0,0 +1,296 @@
+"""
+会话历史存储单元测试
+测试 file_history_store.py 的核心功能
+"""
+import pytest
+import os
+import sys
+import json
+import tempfile
+import shutil
+import threading
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import HumanMessage, AIMessage, message_to_dict
+
+import file_history_store
+from file_history_store import (
+    JSONLChatMessageHistory, RedisListChatMessageHistory, get_history, REDIS_AVAILABLE,
+)
+from tests.redis_standin import RedisStandIn
+
+
+@pytest.fixture
+def temp_dir():
+    """创建临时目录"""
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class TestJSONLChatMessageHistory:
+    """测试 JSONLChatMessageHistory 类"""
+
+    def test_append_and_read(self, temp_dir):
+        """测试追加与读取"""
+        history = JSONLChatMessageHistory("s1", temp_dir)
+        history.add_messages([HumanMessage("卫生间防水怎么做"), AIMessage("先做闭水试验")])
+        history.add_messages([HumanMessage("要做几遍")])
+
+        messages = history.messages
+        assert [m.content for m in messages] == ["卫生间防水怎么做", "先做闭水试验", "要做几遍"]
+        assert isinstance(messages[1], AIMessage)
+
+        with open(history.file_path, encoding="utf-8") as f:
+            assert len(f.readlines()) == 3
+
+    def test_tail_window(self, temp_dir):
+        """测试只读取最近 window 条消息"""
+        history = JSONLChatMessageHistory("s2", temp_dir, window=4)
+        history.READ_BLOCK = 64  # 强制多次反向分块读取
+        for i in range(50):
+            history.add_messages([HumanMessage(f"问题{i}" * 5)])
+
+        assert [m.content for m in history.messages] == [f"问题{i}" * 5 for i in range(46, 50)]
+        assert len(history.get_messages(100)) == 50
+
+    def test_compaction_keeps_recent(self, temp_dir):
+        """测试超过大小后压缩为最近的消息"""
+        history = JSONLChatMessageHistory(
+            "s3", temp_dir, window=5, compact_bytes=1500, keep_messages=10
+        )
+        for i in range(100):
+            history.add_messages([HumanMessage(f"消息{i}")])
+
+        all_messages = history.get_messages(1000)
+        assert len(all_messages) < 100
+        assert all_messages[-1].content == "消息99"
+        assert os.path.getsize(history.file_path) <= 1500 + 200
+
+    def test_migrates_legacy_json(self, temp_dir):
+        """测试迁移旧版 JSON 数组文件"""
+        legacy = [message_to_dict(HumanMessage("旧消息")), message_to_dict(AIMessage("旧回答"))]
+        with open(os.path.join(temp_dir, "legacy"), "w", encoding="utf-8") as f:
+            json.dump(legacy, f)
+
+        history = JSONLChatMessageHistory("legacy", temp_dir)
+        assert [m.content for m in history.messages] == ["旧消息", "旧回答"]
+        assert not os.path.exists(os.path.join(temp_dir, "legacy"))
+
+    def test_clear(self, temp_dir):
+        """测试清空"""
+        history = JSONLChatMessageHistory("s4", temp_dir)
+        history.add_messages([HumanMessage("你好")])
+        history.clear()
+        assert history.messages == []
+
+    def test_get_history_uses_jsonl(self, temp_dir, monkeypatch):
+        """测试 get_history 默认返回 JSONL 历史"""
+        monkeypatch.setattr(file_history_store, "HISTORY_STORAGE_PATH", temp_dir)
+        assert isinstance(get_history("test_session_jsonl"), JSONLChatMessageHistory)
+
+
+class TestAsyncJSONLHistory:
+    """测试 JSONL 历史的异步接口"""
+
+    @pytest.mark.asyncio
+    async def test_async_roundtrip_on_io_pool(self, temp_dir, monkeypatch):
+        """测试异步读写在专用 I/O 线程池中执行"""
+        threads = []
+        original_add = JSONLChatMessageHistory.add_messages
+
+        def recording_add(self, messages):
+            threads.append(threading.current_thread().name)
+            return original_add(self, messages)
+
+        monkeypatch.setattr(JSONLChatMessageHistory, "add_messages", recording_add)
+
+        history = JSONLChatMessageHistory("a1", temp_dir, window=2)
+        await history.aadd_messages([HumanMessage("吊顶用什么材料"), AIMessage("石膏板")])
+        await history.aadd_messages([HumanMessage("多少钱一平")])
+
+        assert [m.content for m in await history.aget_messages()] == ["石膏板", "多少钱一平"]
+        assert threads and all(name.startswith("history-io") for name in threads)
+
+        await history.aclear()
+        assert await history.aget_messages() == []
+
+    @pytest.mark.asyncio
+    async def test_runnable_with_history_uses_async(self, temp_dir, monkeypatch):
+        """测试 RunnableWithMessageHistory 异步调用时走异步接口"""
+        from langchain_core.runnables import RunnableLambda, RunnableWithMessageHistory
+
+        monkeypatch.setattr(file_history_store, "HISTORY_STORAGE_PATH", temp_dir)
+        calls = []
+        original_aget = JSONLChatMessageHistory.aget_messages
+        original_aadd = JSONLChatMessageHistory.aadd_messages
+
+        async def aget(self):
+            calls.append("aget")
+            return await original_aget(self)
+
+        async def aadd(self, messages):
+            calls.append("aadd")
+            await original_aadd(self, messages)
+
+        monkeypatch.setattr(JSONLChatMessageHistory, "aget_messages", aget)
+        monkeypatch.setattr(JSONLChatMessageHistory, "aadd_messages", aadd)
+
+        chain = RunnableWithMessageHistory(
+            RunnableLambda(lambda x: f"收到{len(x['history'])}条历史"),
+            get_history,
+            input_messages_key="input",
+            history_messages_key="history",
+        )
+        config = {"configurable": {"session_id": "a2"}}
+        await chain.ainvoke({"input": "你好"}, config)
+        answer = await chain.ainvoke({"input": "再问一次"}, config)
+
+        assert answer == "收到2条历史"
+        assert calls == ["aget", "aadd", "aget", "aadd"]
+
+
+@pytest.fixture
+def redis_server():
+    """本地 Redis 协议替身"""
+    with RedisStandIn() as server:
+        yield server
+    file_history_store.close_redis_pools()
+
+
+@pytest.mark.skipif(not REDIS_AVAILABLE, reason="redis 未安装")
+class TestRedisListChatMessageHistory:
+    """测试 RedisListChatMessageHistory 类"""
+
+    def _client(self, server):
+        return file_history_store.get_redis_client(server.host, server.port, 0, None)
+
+    def test_append_and_tail(self, redis_server):
+        """测试追加、窗口读取与裁剪"""
+        history = RedisListChatMessageHistory(
+            "r1", self._client(redis_server), window=3, max_messages=5
+        )
+        for i in range(8):
+            history.add_messages([HumanMessage(f"问题{i}"), AIMessage(f"回答{i}")])
+
+        assert [m.content for m in history.messages] == ["回答6", "问题7", "回答7"]
+        assert len(history.get_messages()) == 5
+        info = history.get_session_info()
+        assert info["message_count"] == 5
+        assert 0 < info["ttl_seconds"] <= history.ttl
+
+    def test_single_pipeline_per_turn(self, redis_server):
+        """测试每轮写入只走一个事务流水线，且不做 ping"""
+        history = RedisListChatMessageHistory("r2", self._client(redis_server))
+        history.add_messages([HumanMessage("你好")])
+        del redis_server.commands[:]
+
+        history.add_messages([AIMessage("你好，请问有什么装修问题")])
+        assert redis_server.commands == [b"MULTI", b"RPUSH", b"LTRIM", b"EXPIRE", b"EXEC"]
+
+    def test_shared_pool(self, redis_server):
+        """测试多个历史实例共享同一个连接池"""
+        a = RedisListChatMessageHistory("r3", self._client(redis_server))
+        b = RedisListChatMessageHistory("r4", self._client(redis_server))
+        assert a._redis.connection_pool is b._redis.connection_pool
+
+        a.add_messages([HumanMessage("a")])
+        del redis_server.commands[:]
+        for _ in range(5):
+            b.add_messages([HumanMessage("b")])
+            b.messages
+        # 连接已建立并复用：不再握手，也没有每次请求的 ping
+        assert b"PING" not in redis_server.commands
+        assert b"HELLO" not in redis_server.commands
+
+    def test_migrates_legacy_blob(self, redis_server):
+        """测试兼容旧版整块 JSON 字符串"""
+        client = self._client(redis_server)
+        legacy = [message_to_dict(HumanMessage("旧消息")), message_to_dict(AIMessage("旧回答"))]
+        client.set("chat_history:r5", json.dumps(legacy, ensure_ascii=False))
+
+        history = RedisListChatMessageHistory("r5", client)
+        history.add_messages([HumanMessage("新消息")])
+        assert [m.content for m in history.messages] == ["旧消息", "旧回答", "新消息"]
+        assert client.type("chat_history:r5") == "list"
+
+    def test_migration_is_idempotent_and_retries(self, redis_server):
+        """测试并发转换：键已是列表时不再转换；WATCH 期间键被改动时按新值重试"""
+        client = self._client(redis_server)
+        client.set("chat_history:r10", json.dumps([message_to_dict(HumanMessage("旧消息"))]))
+        history = RedisListChatMessageHistory("r10", client)
+        history.get_messages()
+        history.add_messages([HumanMessage("新消息")])
+        history._migrate_legacy()  # 另一个请求迟到的转换
+        assert [m.content for m in history.messages] == ["旧消息", "新消息"]
+
+        client.set("chat_history:r11", json.dumps([message_to_dict(HumanMessage("旧消息"))]))
+        history = RedisListChatMessageHistory("r11", client)
+        decode = history._legacy_items
+
+        def racing_decode(data):
+            # 第一次读取后，另一个写入者改动了键
+            history._legacy_items = decode
+            client.set("chat_history:r11", json.dumps([message_to_dict(HumanMessage("更新后"))]))
+            return decode(data)
+
+        history._legacy_items = racing_decode
+        history._migrate_legacy()
+        assert [m.content for m in history.messages] == ["更新后"]
+
+    def test_clear(self, redis_server):
+        """测试清空"""
+        history = RedisListChatMessageHistory("r6", self._client(redis_server))
+        history.add_messages([HumanMessage("你好")])
+        history.clear()
+        assert history.messages == []
+
+    def test_get_history_uses_pool(self, redis_server, monkeypatch):
+        """测试 redis 后端下 get_history 返回列表历史"""
+        monkeypatch.setattr(file_history_store, "STORAGE_BACKEND", "redis")
+        monkeypatch.setattr(file_history_store, "REDIS_HOST", redis_server.host)
+        monkeypatch.setattr(file_history_store, "REDIS_PORT", redis_server.port)
+
+        history = get_history("r7")
+        assert isinstance(history, RedisListChatMessageHistory)
+        history.add_messages([HumanMessage("你好")])
+        assert get_history("r7").messages[0].content == "你好"
+
+    @pytest.mark.asyncio
+    async def test_async_roundtrip(self, redis_server):
+        """测试 redis.asyncio 异步读写与单流水线写入"""
+        history = RedisListChatMessageHistory(
+            "r8", self._client(redis_server), window=2, max_messages=3
+        )
+        try:
+            await history.aadd_messages([HumanMessage("问题1"), AIMessage("回答1")])
+            del redis_server.commands[:]
+            await history.aadd_messages([HumanMessage("问题2"), AIMessage("回答2")])
+            assert redis_server.commands == [b"MULTI", b"RPUSH", b"LTRIM", b"EXPIRE", b"EXEC"]
+
+            assert [m.content for m in await history.aget_messages()] == ["问题2", "回答2"]
+            # 同步与异步接口读写同一个列表
+            assert [m.content for m in history.get_messages()] == ["回答1", "问题2", "回答2"]
+
+            await history.aclear()
+            assert await history.aget_messages() == []
+        finally:
+            await file_history_store.aclose_redis_pools()
+
+    @pytest.mark.asyncio
+    async def test_async_migrates_legacy_blob(self, redis_server):
+        """测试异步接口兼容旧版整块 JSON 字符串"""
+        client = self._client(redis_server)
+        client.set("chat_history:r9", json.dumps([message_to_dict(HumanMessage("旧消息"))]))
+
+        history = RedisListChatMessageHistory("r9", client)
+        try:
+            assert [m.content for m in await history.aget_messages()] == ["旧消息"]
+            assert client.type("chat_history:r9") == "list"
+            await history.aadd_messages([HumanMessage("新消息")])
+            await history._amigrate_legacy(history._async_client())
+            assert [m.content for m in await history.aget_messages()] == ["旧消息", "新消息"]
+        finally:
+            await file_history_store.aclose_redis_pools()
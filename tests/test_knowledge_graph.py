@@ -0,0 +1,543 @@
+"""
+知识图谱单元测试
+测试 backend/knowledge/knowledge_graph.py 的索引、查询与编译快照
+"""
+import pytest
+import os
+import sys
+import json
+import shutil
+import dataclasses
+import threading
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.knowledge.knowledge_graph as kg_module
+from backend.knowledge.knowledge_graph import (
+    DecorationKnowledgeGraph,
+    EntityType,
+    PropertyRecord,
+    RelationType,
+)
+from backend.core.cache import thaw
+
+
+@pytest.fixture(scope="module")
+def graph():
+    """完整的预定义图谱（模块内共享，测试只读）"""
+    return DecorationKnowledgeGraph(snapshot_path="")
+
+
+def scan_relations(graph, entity_name, relation_type=None, direction="both"):
+    """逐条扫描的参照实现"""
+    entity_id = graph._resolve_entity_id(entity_name)
+    if not entity_id:
+        return []
+    results = []
+    for relation in graph.relations:
+        if relation_type and relation.relation_type != relation_type:
+            continue
+        if direction in ("outgoing", "both") and relation.source_id == entity_id:
+            results.append((graph.entities[relation.target_id], relation))
+        if direction in ("incoming", "both") and relation.target_id == entity_id:
+            results.append((graph.entities[relation.source_id], relation))
+    return results
+
+
+def empty_graph(monkeypatch) -> DecorationKnowledgeGraph:
+    """不加载预定义数据的空图谱"""
+    monkeypatch.setattr(DecorationKnowledgeGraph, "_load_predefined_data", lambda self: None)
+    return DecorationKnowledgeGraph(snapshot_path="")
+
+
+def fingerprint(graph: DecorationKnowledgeGraph):
+    """图谱的全部数据与索引（含顺序）"""
+    return (
+        [(e.id, e.name, e.entity_type, e.properties, e.aliases) for e in graph.entities.values()],
+        [(r.source_id, r.target_id, r.relation_type, r.weight, r.properties) for r in graph.relations],
+        list(graph._name_to_id.items()),
+        list(graph._alias_to_id.items()),
+        list(graph._type_index.items()),
+        graph._outgoing,
+        graph._incoming,
+    )
+
+
+@pytest.fixture
+def source_files(tmp_path, monkeypatch):
+    """把源数据文件复制到临时目录，测试可修改而不影响仓库中的文件"""
+    entities = tmp_path / "entities.json"
+    relations = tmp_path / "relations.json"
+    shutil.copy(kg_module.ENTITIES_FILE, entities)
+    shutil.copy(kg_module.RELATIONS_FILE, relations)
+    monkeypatch.setattr(kg_module, "ENTITIES_FILE", str(entities))
+    monkeypatch.setattr(kg_module, "RELATIONS_FILE", str(relations))
+    return entities, relations
+
+
+class TestAdjacencyIndex:
+    """测试邻接索引"""
+
+    def test_query_matches_scan(self, graph):
+        """测试索引查询与逐条扫描的结果及顺序一致"""
+        names = {graph.entities[r.source_id].name for r in graph.relations}
+        names |= {graph.entities[r.target_id].name for r in graph.relations}
+        for name in sorted(names):
+            for relation_type in (None, RelationType.SUITABLE_FOR, RelationType.BELONGS_TO_STYLE,
+                                  RelationType.ALTERNATIVE_TO):
+                for direction in ("outgoing", "incoming", "both"):
+                    expected = scan_relations(graph, name, relation_type, direction)
+                    actual = graph.query_relations(name, relation_type, direction)
+                    assert [(e.id, id(r)) for e, r in actual] == \
+                        [(e.id, id(r)) for e, r in expected], (name, relation_type, direction)
+
+    def test_unknown_entity(self, graph):
+        """测试不存在的实体返回空列表"""
+        assert graph.query_relations("不存在的实体") == []
+
+    def test_add_relation_updates_index(self, monkeypatch):
+        """测试 add_relation 维护出边/入边索引，自环先出边后入边"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("客厅", EntityType.SPACE)
+        g.add_entity("木地板", EntityType.MATERIAL, aliases=["实木地板"])
+        g.add_entity("瓷砖", EntityType.MATERIAL)
+
+        assert g.add_relation("木地板", "客厅", RelationType.SUITABLE_FOR)
+        assert g.add_relation("实木地板", "瓷砖", RelationType.ALTERNATIVE_TO)
+        assert g.add_relation("瓷砖", "瓷砖", RelationType.COMPATIBLE_WITH)
+        assert not g.add_relation("木地板", "不存在", RelationType.SUITABLE_FOR)
+
+        incoming = g.query_relations("客厅", RelationType.SUITABLE_FOR, "incoming")
+        assert [e.name for e, _ in incoming] == ["木地板"]
+        assert g.query_relations("客厅", RelationType.SUITABLE_FOR, "outgoing") == []
+
+        both = g.query_relations("瓷砖")
+        assert [(e.name, r.relation_type) for e, r in both] == [
+            ("木地板", RelationType.ALTERNATIVE_TO),
+            ("瓷砖", RelationType.COMPATIBLE_WITH),
+            ("瓷砖", RelationType.COMPATIBLE_WITH),
+        ]
+        assert both == scan_relations(g, "瓷砖")
+
+    def test_entities_of_type(self, monkeypatch):
+        """测试类型索引按添加顺序返回，重复添加不重复计入"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("北欧", EntityType.STYLE)
+        g.add_entity("客厅", EntityType.SPACE)
+        g.add_entity("现代简约", EntityType.STYLE)
+        g.add_entity("北欧", EntityType.STYLE, properties={"keywords": ["原木"]})
+
+        assert [e.name for e in g.entities_of_type(EntityType.STYLE)] == ["北欧", "现代简约"]
+        assert g.entities_of_type(EntityType.BRAND) == []
+
+
+class TestQueryHelpers:
+    """测试查询方法"""
+
+    def test_space_solution(self, graph):
+        """测试空间方案包含该空间适用的产品"""
+        solution = graph.get_space_solution("客厅")
+        expected = {e.name for e, _ in scan_relations(
+            graph, "客厅", RelationType.SUITABLE_FOR, "incoming")}
+        found = {item["name"] for key in ("floor", "wall", "ceiling", "furniture",
+                                          "lighting", "soft_decoration")
+                 for item in solution[key]}
+        assert found and found <= expected
+
+    def test_decoration_process(self, graph):
+        """测试工序按顺序返回，常见问题按阶段归类"""
+        processes = graph.get_decoration_process()
+        orders = [p["order"] if p["order"] is not None else 99 for p in processes]
+        assert orders == sorted(orders)
+        for process in processes:
+            for problem in process["common_problems"]:
+                assert graph.get_entity(problem["name"]).properties.get("stage") == process["name"]
+
+
+class TestSnapshot:
+    """测试源数据文件与编译快照"""
+
+    def test_snapshot_matches_source(self, graph, tmp_path):
+        """测试首次从源数据构建并写出快照，之后读取快照得到完全相同的图谱"""
+        path = str(tmp_path / "cache" / "kg.snapshot")
+        built = DecorationKnowledgeGraph(snapshot_path=path)
+        assert len(built.entities) == len(graph.entities)
+        assert built.load_info["source"] == "source"
+        assert os.path.exists(path)
+
+        loaded = DecorationKnowledgeGraph(snapshot_path=path)
+        assert len(loaded.relations) == len(graph.relations)
+        assert loaded.load_info["source"] == "snapshot"
+        assert fingerprint(loaded) == fingerprint(graph)
+        assert loaded.get_space_solution("客厅", "现代简约") == graph.get_space_solution("客厅", "现代简约")
+
+    def test_rebuild_when_source_changes(self, source_files, tmp_path):
+        """测试源数据文件变化后快照失效并重建"""
+        _, relations_file = source_files
+        path = str(tmp_path / "kg.snapshot")
+        assert DecorationKnowledgeGraph(snapshot_path=path).query_relations(
+            "瓷砖", RelationType.PAIRS_WITH, "outgoing") == []
+
+        relations = json.loads(relations_file.read_text(encoding="utf-8"))
+        relations.append(["瓷砖", "美缝剂", RelationType.PAIRS_WITH.value, {"note": "测试"}])
+        relations_file.write_text(json.dumps(relations, ensure_ascii=False), encoding="utf-8")
+
+        rebuilt = DecorationKnowledgeGraph(snapshot_path=path)
+        assert [e.name for e, _ in rebuilt.query_relations("瓷砖", RelationType.PAIRS_WITH, "outgoing")] == ["美缝剂"]
+        assert rebuilt.get_stats()["load"]["source"] == "source"
+
+        reloaded = DecorationKnowledgeGraph(snapshot_path=path)
+        assert reloaded.get_stats()["load"]["source"] == "snapshot"
+        assert fingerprint(reloaded) == fingerprint(rebuilt)
+
+    def test_corrupt_snapshot_falls_back(self, graph, tmp_path):
+        """测试快照损坏时从源数据重建并覆盖快照"""
+        path = tmp_path / "kg.snapshot"
+        path.write_bytes(b"not a snapshot")
+
+        rebuilt = DecorationKnowledgeGraph(snapshot_path=str(path))
+        assert rebuilt.get_stats()["load"]["source"] == "source"
+        assert fingerprint(rebuilt) == fingerprint(graph)
+        assert DecorationKnowledgeGraph(snapshot_path=str(path)).get_stats()["load"]["source"] == "snapshot"
+
+    def test_lazy_load_on_first_access(self, tmp_path):
+        """测试构造时不加载，首次访问时只加载一次，并发访问看到完整图谱"""
+        kg = DecorationKnowledgeGraph(snapshot_path=str(tmp_path / "kg.snapshot"))
+        assert not kg.loaded
+        assert kg.load_info == {}
+
+        sizes = []
+        threads = [threading.Thread(target=lambda: sizes.append(len(kg.relations))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert kg.loaded
+        assert len(set(sizes)) == 1 and sizes[0] > 0
+        assert kg.get_stats()["load"]["source"] == "source"
+        with pytest.raises(AttributeError):
+            kg.missing_attribute
+
+
+def scan_search(graph, query, entity_type=None, limit=10):
+    """逐个实体、逐个别名做子串判断的参照实现"""
+    query_lower = query.lower()
+    candidates = graph.entities_of_type(entity_type) if entity_type else graph.entities.values()
+    results = [e for e in candidates
+               if query_lower in e.name.lower() or any(query_lower in a.lower() for a in e.aliases)]
+    return results[:limit]
+
+
+class TestSearchIndex:
+    """测试 n-gram 搜索索引"""
+
+    def test_matches_scan(self, graph):
+        """测试各长度子串查询（含类型过滤）与逐个扫描的结果及顺序一致"""
+        queries = {"", "不存在的词", "DULUX", "gb/t", "地板", "砖", "实木复合地板"}
+        for entity in list(graph.entities.values())[::7]:
+            for term in [entity.name, *entity.aliases]:
+                queries.update(term[i:i + n] for n in (1, 2, 3, 5) for i in range(0, len(term), 2))
+        for query in sorted(queries):
+            for entity_type in (None, EntityType.WOOD_FLOOR, EntityType.BRAND):
+                for limit in (3, 1000):
+                    assert graph.search_entities(query, entity_type, limit) == \
+                        scan_search(graph, query, entity_type, limit), (query, entity_type)
+
+    def test_rank_by_match_quality(self, graph):
+        """测试排序：完全匹配 > 前缀匹配 > 包含"""
+        results = graph.search_entities("木地板", rank=True, limit=50)
+        assert results[0].name == "木地板"
+        levels = [0 if e.name == "木地板" else 1 if e.name.startswith("木地板") else 2 for e in results]
+        assert levels == sorted(levels)
+        assert {e.id for e in results} == {e.id for e in scan_search(graph, "木地板", limit=50)}
+
+    def test_add_entity_updates_index(self, monkeypatch):
+        """测试新增实体与补充别名后索引增量更新"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("北欧", EntityType.STYLE)
+        assert g.search_entities("北欧") == [g.get_entity("北欧")]
+
+        g.add_entity("北欧原木", EntityType.STYLE)
+        g.add_entity("北欧", EntityType.STYLE, aliases=["Scandinavian"])
+        assert [e.name for e in g.search_entities("北欧")] == ["北欧", "北欧原木"]
+        assert [e.name for e in g.search_entities("scandi")] == ["北欧"]
+        assert g.search_entities("北欧", EntityType.SPACE) == []
+
+    def test_versions_share_index_incrementally(self, monkeypatch):
+        """测试新版本的索引由上一版本增量派生，旧版本的查询结果不变"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("北欧", EntityType.STYLE)
+        old_snapshot, old_index = g.snapshot, g.get_search_index()
+
+        g.add_entity("北欧原木", EntityType.STYLE)
+        g.add_entity("北欧", EntityType.STYLE, aliases=["Scandinavian"])
+        index = g.get_search_index()
+        assert index is not old_index and index._postings is old_index._postings
+        assert old_index.search("北欧") == [old_snapshot.resolve("北欧")] and old_index.search("scandi") == []
+        assert len(old_index) == 1 and len(index) == 2
+        assert old_index.extend([]) is None  # 共享数据已追加，不能再从旧版本派生
+
+        for i in range(50):
+            g.add_entity(f"风格{i}", EntityType.STYLE, aliases=[f"style{i}"])
+        for query in ("风格1", "style4", "北欧", "格"):
+            assert g.search_entities(query, limit=100) == scan_search(g, query, limit=100)
+
+    def test_suggest_endpoint(self, graph, monkeypatch):
+        """测试实体联想接口"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from backend.api.routes.knowledge import router
+        import backend.knowledge.knowledge_graph as module
+
+        monkeypatch.setattr(module, "_knowledge_graph", graph)
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+
+        response = client.get("/knowledge/graph/suggest", params={"q": "地板", "type": "wood_floor", "limit": 3})
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 3 and all(r["type"] == "wood_floor" for r in results)
+        assert client.get("/knowledge/graph/suggest", params={"q": "x", "type": "nope"}).status_code == 400
+
+
+class TestCompactStorage:
+    """测试紧凑存储：slots 记录、共享键元组的属性表、按列存储的关系表"""
+
+    def test_records_use_slots(self, graph):
+        """测试实体/关系没有实例字典，关系只读且同一下标返回同一个对象"""
+        entity = graph.get_entity("客厅")
+        relation = graph.relations[0]
+        assert not hasattr(entity, "__dict__") and not hasattr(relation, "__dict__")
+        assert graph.relations[0] is relation
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            relation.weight = 2.0
+        assert len(list(graph.relations)) == len(graph.relations) == graph.get_stats()["total_relations"]
+
+    def test_property_records(self, graph):
+        """测试属性表：只读映射，键集合相同的共享键元组，to_dict 可 JSON 序列化"""
+        by_keys = {}
+        for entity in graph.entities.values():
+            properties = entity.properties
+            assert isinstance(properties, PropertyRecord)
+            by_keys.setdefault(tuple(properties), set()).add(id(properties._keys))
+        assert all(len(ids) == 1 for ids in by_keys.values())
+
+        relation = next(r for r in graph.relations if "recommendation" in r.properties)
+        assert relation.properties["recommendation"] == relation.properties.get("recommendation")
+        assert relation.properties.get("不存在", "默认") == "默认"
+        with pytest.raises(KeyError):
+            relation.properties["不存在"]
+        with pytest.raises(TypeError):
+            relation.properties["recommendation"] = "高"
+
+        entity = next(e for e in graph.entities.values() if any(isinstance(v, dict) for v in e.properties.values()))
+        plain = entity.properties.to_dict()
+        assert type(plain) is dict and plain == entity.properties
+        assert json.loads(json.dumps(plain, ensure_ascii=False)) == thaw(plain)
+
+    def test_add_entity_merges_properties(self, monkeypatch):
+        """测试重复添加实体时合并属性，值转换为只读形式"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("北欧", EntityType.STYLE, properties={"keywords": ["原木"], "origin": "北欧"})
+        g.add_entity("北欧", EntityType.STYLE, properties={"keywords": ["原木", "白色"]})
+        assert g.get_entity("北欧").properties.to_dict() == {"keywords": ("原木", "白色"), "origin": "北欧"}
+
+        g.add_entity("客厅", EntityType.SPACE)
+        assert g.add_relation("北欧", "客厅", RelationType.SUITABLE_FOR, weight=0.5,
+                              properties={"recommendation": "高"})
+        relation = g.relations[0]
+        assert (relation.source_id, relation.target_id, relation.weight) == \
+            (g.get_entity("北欧").id, g.get_entity("客厅").id, 0.5)
+        assert relation.properties.to_dict() == {"recommendation": "高"}
+
+
+class TestResultCache:
+    """测试解决方案类查询的版本化缓存"""
+
+    def test_hits_counted_and_shared(self, graph):
+        """测试重复查询命中缓存，返回同一份只读结果"""
+        before = graph.get_stats()["result_cache"]["methods"].get("get_style_solution", {"hits": 0, "misses": 0})
+        first = graph.get_style_solution("北欧")
+        second = graph.get_style_solution("北欧")
+        assert second is first
+        assert thaw(first) == thaw(DecorationKnowledgeGraph.get_style_solution.uncached(graph, "北欧"))
+
+        after = graph.get_stats()["result_cache"]["methods"]["get_style_solution"]
+        assert after["hits"] - before["hits"] >= 1
+        assert after["misses"] - before["misses"] <= 1
+
+    def test_results_are_read_only(self, graph):
+        """测试缓存结果不可被调用方修改，thaw 得到可修改的副本，仍可 JSON 序列化"""
+        solution = graph.get_space_solution("客厅")
+        with pytest.raises(TypeError):
+            solution["floor"] = []
+        with pytest.raises(TypeError):
+            solution["floor"][0]["name"] = "x"
+        with pytest.raises(AttributeError):
+            solution["floor"].append({})
+
+        copy = thaw(solution)
+        copy["floor"].append({"name": "x"})
+        assert len(graph.get_space_solution("客厅")["floor"]) == len(copy["floor"]) - 1
+        assert json.loads(json.dumps(solution, ensure_ascii=False)) == thaw(solution)
+
+    def test_list_arguments(self, graph):
+        """测试列表参数（不可哈希）同样可以缓存"""
+        first = graph.get_smart_home_solution(["客厅", "卧室"])
+        assert graph.get_smart_home_solution(["客厅", "卧室"]) is first
+        assert graph.get_smart_home_solution(["客厅"]) is not first
+
+    def test_invalidated_by_updates(self, monkeypatch):
+        """测试新增实体或关系后版本号递增，旧结果不再命中"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("客厅", EntityType.SPACE)
+        g.add_entity("吸顶灯", EntityType.LIGHTING)
+        version = g.get_stats()["version"]
+        assert g.get_lighting_recommendation("客厅")["recommended_lights"] == ()
+
+        g.add_relation("吸顶灯", "客厅", RelationType.SUITABLE_FOR)
+        assert g.get_stats()["version"] == version + 1
+        assert [item["name"] for item in g.get_lighting_recommendation("客厅")["recommended_lights"]] == ["吸顶灯"]
+        assert g.get_stats()["result_cache"]["methods"]["get_lighting_recommendation"] == {"hits": 0, "misses": 2}
+
+    def test_stats_consistent_under_concurrency(self, monkeypatch):
+        """测试并发查询与读取统计时计数不丢失，读取统计不报错"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("客厅", EntityType.SPACE)
+        errors = []
+
+        def query():
+            for _ in range(200):
+                g.get_lighting_recommendation("客厅")
+                g.get_space_solution("客厅")
+
+        def read_stats():
+            try:
+                for _ in range(200):
+                    g.get_stats()
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=query) for _ in range(4)] + [threading.Thread(target=read_stats)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        methods = g.get_stats()["result_cache"]["methods"]
+        for name in ("get_lighting_recommendation", "get_space_solution"):
+            assert methods[name]["hits"] + methods[name]["misses"] == 800
+
+
+class TestSnapshots:
+    """测试写时复制的版本快照与批量更新"""
+
+    def test_batch_publishes_once(self, monkeypatch):
+        """测试批量更新只发布一个新版本，发布前其他线程看不到其中的写入"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("客厅", EntityType.SPACE)
+        version = g.get_stats()["version"]
+
+        seen = []
+        with g.batch_update():
+            g.add_entity("木地板", EntityType.WOOD_FLOOR)
+            g.add_entity("北欧", EntityType.STYLE)
+            g.add_relation("木地板", "客厅", RelationType.SUITABLE_FOR)
+            g.add_relation("木地板", "北欧", RelationType.BELONGS_TO_STYLE)
+            assert len(g.query_relations("木地板")) == 2  # 写入线程读到草稿
+
+            reader = threading.Thread(target=lambda: seen.append(
+                (len(g.entities), g.get_entity("木地板"), g.query_relations("客厅"))))
+            reader.start()
+            reader.join()
+
+        assert seen == [(1, None, [])]
+        assert g.get_stats()["version"] == version + 1
+        assert [e.name for e, _ in g.query_relations("客厅")] == ["木地板"]
+
+    def test_rollback_on_error(self, monkeypatch):
+        """测试块内抛出异常时整批丢弃"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("客厅", EntityType.SPACE)
+        before = g.snapshot
+
+        with pytest.raises(RuntimeError):
+            with g.batch_update():
+                g.add_entity("瓷砖", EntityType.FLOOR_TILE)
+                g.add_relation("瓷砖", "客厅", RelationType.SUITABLE_FOR)
+                raise RuntimeError("中途失败")
+
+        assert g.snapshot is before
+        assert g.get_entity("瓷砖") is None and len(g.relations) == 0
+        assert g.add_relation("客厅", "不存在", RelationType.SUITABLE_FOR) is False
+        assert g.snapshot is before  # 没有写入时不发布新版本
+
+    def test_published_snapshot_unchanged(self, monkeypatch):
+        """测试已发布的版本不受之后写入影响（含共享的嵌套索引与被更新的实体）"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("客厅", EntityType.SPACE)
+        g.add_entity("瓷砖", EntityType.FLOOR_TILE, properties={"防滑": "是"})
+        g.add_relation("瓷砖", "客厅", RelationType.SUITABLE_FOR)
+
+        with g.read_snapshot() as old:
+            g.add_entity("岩板", EntityType.FLOOR_TILE)
+            g.add_entity("瓷砖", EntityType.FLOOR_TILE, properties={"防滑": "否"}, aliases=["地砖"])
+            g.add_relation("岩板", "客厅", RelationType.SUITABLE_FOR)
+            # 块内仍读取固定的旧版本
+            assert [e.name for e, _ in g.query_relations("客厅")] == ["瓷砖"]
+            assert g.search_entities("地砖") == []
+
+        assert [e.name for e, _ in g.query_relations("客厅")] == ["瓷砖", "岩板"]
+        assert g.get_entity("地砖").properties["防滑"] == "否"
+        assert [len(ids) for ids in old.type_index.values()] == [1, 1]
+        assert old.incoming[g.get_entity("客厅").id][RelationType.SUITABLE_FOR] == [0]
+        assert old.entities[g.get_entity("瓷砖").id].properties["防滑"] == "是"
+
+    def test_concurrent_readers_and_writer(self, monkeypatch):
+        """测试读者遍历图谱时写入者持续发布新版本，读者不报错且每次读到完整的版本"""
+        g = empty_graph(monkeypatch)
+        g.add_entity("客厅", EntityType.SPACE)
+        errors = []
+        done = threading.Event()
+
+        def writer():
+            try:
+                for i in range(60):
+                    with g.batch_update():
+                        for j in range(5):
+                            g.add_entity(f"材料{i}-{j}", EntityType.MATERIAL, aliases=[f"m{i}-{j}"])
+                            g.add_relation(f"材料{i}-{j}", "客厅", RelationType.SUITABLE_FOR)
+            except Exception as e:  # pragma: no cover - 失败时由断言报告
+                errors.append(e)
+            finally:
+                done.set()
+
+        def reader():
+            try:
+                while not done.is_set():
+                    with g.read_snapshot():
+                        entities = [e.name for e in g.entities.values()]
+                        relations = g.query_relations("客厅")
+                        # 同一版本内：每个材料恰有一条关系，搜索与链接结果一致
+                        assert len(relations) == len(entities) - 1
+                        assert len(g.search_entities("材料", limit=1000)) == len(relations)
+                        assert sum(1 for r in g.relations) == len(relations)
+                        if relations:
+                            name = relations[-1][0].name
+                            assert [m.entity.name for m in g.link_entities(f"用{name}")] == [name]
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(3)] + [threading.Thread(target=writer)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(g.query_relations("客厅")) == 300
+        assert g.get_stats()["version"] == 61
@@ -16,7 +16,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from backend.core.memory import (
     MemoryItem, MemoryType, UserProfile,
     InMemoryStore, PersistentMemoryStore, SQLiteMemoryStore,
-    MemoryManager, get_memory_manager
+    MemoryManager, get_memory_manager,
+    MemoryCompressor, MinHashLSH,
+    UserProfileStore, SQLiteProfileStore,
+    VectorMemoryIndex, NUMPY_AVAILABLE,
 )
 
 
@@ -185,6 +188,50 @@ class TestInMemoryStore:
         stats = store.stats()
         assert stats["size"] <= 5
 
+    def test_eviction_picks_lowest_score(self):
+        """测试淘汰评分最低的条目（不限于最旧的条目）"""
+        store = InMemoryStore(max_size=3)
+        now = time.time()
+        store.save(MemoryItem(id="old_important", content="a", memory_type=MemoryType.LONG_TERM,
+                              importance=1.0, timestamp=now - 86400 * 30))
+        store.save(MemoryItem(id="fresh_low", content="b", memory_type=MemoryType.LONG_TERM,
+                              importance=0.0, timestamp=now))
+        store.save(MemoryItem(id="old_low", content="c", memory_type=MemoryType.LONG_TERM,
+                              importance=0.1, timestamp=now - 86400 * 30))
+
+        store.save(MemoryItem(id="new", content="d", memory_type=MemoryType.LONG_TERM))
+        assert "old_low" not in store.store
+
+        store.save(MemoryItem(id="new2", content="e", memory_type=MemoryType.LONG_TERM))
+        assert "fresh_low" not in store.store
+        assert "old_important" in store.store
+
+    def test_eviction_respects_access_and_updates(self):
+        """测试访问次数和外部修改会反映到淘汰顺序"""
+        store = InMemoryStore(max_size=2)
+        a = MemoryItem(id="a", content="a", memory_type=MemoryType.LONG_TERM, importance=0.2)
+        b = MemoryItem(id="b", content="b", memory_type=MemoryType.LONG_TERM, importance=0.3)
+        store.save(a)
+        store.save(b)
+
+        for _ in range(50):
+            store.get("a")
+        # 外部直接调低重要性
+        b.importance = 0.0
+
+        store.save(MemoryItem(id="c", content="c", memory_type=MemoryType.LONG_TERM, importance=0.5))
+        assert set(store.store) == {"a", "c"}
+
+    def test_eviction_index_stays_bounded(self):
+        """测试懒删除的索引条目会被压缩"""
+        store = InMemoryStore(max_size=50)
+        for i in range(2000):
+            store.save(MemoryItem(id=f"item_{i}", content="x", memory_type=MemoryType.SHORT_TERM,
+                                  importance=(i % 10) / 10))
+            store.get(f"item_{i}")
+        assert store.stats()["size"] == 50
+        assert store.stats()["index_entries"] <= 4 * 50 + 64
+
     def test_clear(self):
         """测试清空"""
         store = InMemoryStore()
@@ -258,6 +305,101 @@ class TestPersistentMemoryStore:
         results = store.search("预算")
         assert len(results) >= 1
 
+    def test_journal_appends_only_changes(self, temp_storage_path):
+        """测试文件模式只追加有修改的条目"""
+        store = PersistentMemoryStore(storage_path=temp_storage_path)
+        for i in range(10):
+            store.save(MemoryItem(id=f"j_{i}", content=f"内容{i}", memory_type=MemoryType.LONG_TERM))
+        store.flush()
+        assert store.stats()["journal_entries"] == 10
+
+        store.flush()
+        assert store.stats()["journal_entries"] == 10
+
+        store.get("j_3")
+        store.delete("j_5")
+        store.flush()
+        assert store.stats()["journal_entries"] == 12
+
+        reopened = PersistentMemoryStore(storage_path=temp_storage_path)
+        assert len(reopened.store) == 9
+        assert reopened.store["j_3"].access_count == 1
+        assert "j_5" not in reopened.store
+
+    def test_journal_compaction(self, temp_storage_path):
+        """测试日志压缩为快照"""
+        store = PersistentMemoryStore(storage_path=temp_storage_path)
+        store.JOURNAL_COMPACT_MIN = 5
+        for i in range(3):
+            store.save(MemoryItem(id=f"c_{i}", content="x", memory_type=MemoryType.LONG_TERM))
+        store.flush()
+        for _ in range(4):
+            store.get("c_0")
+            store.flush()
+
+        assert store.stats()["journal_entries"] == 0
+        assert os.path.getsize(store.journal_path) == 0
+
+        reopened = PersistentMemoryStore(storage_path=temp_storage_path)
+        assert len(reopened.store) == 3
+        assert reopened.store["c_0"].access_count == 4
+
+    def test_journal_ignores_torn_tail(self, temp_storage_path):
+        """测试崩溃时写了一半的日志行被忽略"""
+        store = PersistentMemoryStore(storage_path=temp_storage_path)
+        store.save(MemoryItem(id="t_1", content="完整", memory_type=MemoryType.LONG_TERM))
+        store.flush()
+        with open(store.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "put", "item": {"id": "t_2"')
+
+        reopened = PersistentMemoryStore(storage_path=temp_storage_path)
+        assert list(reopened.store) == ["t_1"]
+
+    def test_redis_sync_is_incremental_and_chunked(self, temp_storage_path):
+        """测试 Redis 模式只同步脏键且分块流水线写入"""
+
+        class RecordingPipeline:
+            def __init__(self, owner):
+                self.owner = owner
+                self.commands = []
+
+            def hset(self, key, mapping):
+                self.commands.append(("hset", key))
+
+            def expire(self, key, ttl):
+                self.commands.append(("expire", key))
+
+            def execute(self):
+                self.owner.pipelines.append(self.commands)
+                return []
+
+        class RecordingRedis:
+            def __init__(self):
+                self.pipelines = []
+                self.deleted = []
+
+            def pipeline(self, transaction=True):
+                return RecordingPipeline(self)
+
+            def delete(self, *keys):
+                self.deleted.extend(keys)
+
+        store = PersistentMemoryStore(storage_path=temp_storage_path)
+        store._redis = RecordingRedis()
+        store.REDIS_CHUNK_SIZE = 4
+
+        for i in range(10):
+            store.save(MemoryItem(id=f"r_{i}", content="x", memory_type=MemoryType.LONG_TERM))
+        store.flush()
+        assert [len(p) for p in store._redis.pipelines] == [8, 8, 4]
+
+        store._redis.pipelines.clear()
+        store.get("r_1")
+        store.delete("r_2")
+        store.flush()
+        assert store._redis.pipelines == [[("hset", "memory:r_1"), ("expire", "memory:r_1")]]
+        assert store._redis.deleted == ["memory:r_2"]
+
 
 class TestMemoryManager:
     """测试 MemoryManager 类"""
@@ -606,5 +748,365 @@ class TestMemoryManagerBackends:
         assert len(results) >= 1
 
 
+class TestMinHashLSH:
+    """测试 MinHashLSH 近似重复检测"""
+
+    @staticmethod
+    def _items(texts):
+        return [
+            MemoryItem(id=f"mh_{i}", content=text, memory_type=MemoryType.LONG_TERM)
+            for i, text in enumerate(texts)
+        ]
+
+    def test_chinese_near_duplicates_merged(self):
+        """测试中文近似重复记忆能够合并"""
+        compressor = MemoryCompressor()
+        memories = self._items([
+            "用户喜欢现代简约风格的客厅设计",
+            "预算大约二十万元",
+            "用户喜欢现代简约风格的客厅设计。",
+            "家里有两个孩子",
+        ])
+
+        merged = compressor.merge_memories(memories)
+
+        assert [m.id for m in merged] == ["mh_0", "mh_1", "mh_3"]
+        assert merged[0].metadata["merged_count"] == 2
+
+    def test_dissimilar_not_merged(self):
+        """测试不相似的记忆保持不变"""
+        compressor = MemoryCompressor()
+        memories = self._items(["卫生间防水怎么做", "客厅地砖怎么选", "厨房橱柜推荐"])
+        merged = compressor.merge_memories(memories)
+        assert len(merged) == 3
+
+    def test_is_similar_uses_character_ngrams(self):
+        """测试相似度判断基于字符切片而非空格分词"""
+        compressor = MemoryCompressor()
+        a, b, c = self._items(["北欧风格的卧室", "北欧风格的卧室！", "预算十万"])
+        assert compressor._is_similar(a, b, 0.8)
+        assert not compressor._is_similar(a, c, 0.8)
+
+    def test_signature_cache_is_incremental(self):
+        """测试签名缓存：重复运行只计算变化的记忆"""
+        index = MinHashLSH()
+        memories = self._items([f"记忆内容第{i}条，关于装修材料{i * 7}" for i in range(50)])
+
+        index.find_similar_groups(memories, 0.8)
+        assert index.stats()["cache_misses"] == 50
+
+        memories[0].content = "内容已修改"
+        index.find_similar_groups(memories, 0.8)
+        stats = index.stats()
+        assert stats["cache_misses"] == 51
+        assert stats["cache_hits"] == 49
+
+    def test_groups_cover_all_items(self):
+        """测试分组覆盖所有记忆且不重复"""
+        index = MinHashLSH()
+        memories = self._items(["相同内容"] * 5 + [f"不同内容{i}号" for i in range(5)])
+        groups = index.find_similar_groups(memories, 0.8)
+
+        flat = sorted(idx for group in groups for idx in group)
+        assert flat == list(range(10))
+        assert groups[0] == [0, 1, 2, 3, 4]
+
+    def test_invalid_band_config(self):
+        """测试非法的分段配置"""
+        with pytest.raises(ValueError):
+            MinHashLSH(num_perm=100, bands=32)
+
+    def test_manager_merge_only_touches_merged(self):
+        """测试 MemoryManager 合并时只删除被合并的记忆"""
+        manager = MemoryManager(use_persistence=False, backend="memory")
+        manager.add_to_long_term("u1", "用户喜欢现代简约风格的客厅设计")
+        time.sleep(0.002)
+        manager.add_to_long_term("u1", "用户喜欢现代简约风格的客厅设计。")
+        time.sleep(0.002)
+        manager.add_to_long_term("u1", "家里有两个孩子")
+
+        manager.merge_similar_memories("u1")
+
+        remaining = list(manager.long_term.store.values())
+        assert len(remaining) == 2
+        assert any(m.metadata.get("merged_count") == 2 for m in remaining)
+
+
+class TestSQLiteProfileStore:
+    """测试 SQLiteProfileStore 增量画像存储"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """创建临时目录"""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_roundtrip_and_lazy_load(self, temp_dir):
+        """测试保存后重新打开时懒加载"""
+        db_path = os.path.join(temp_dir, "profiles.db")
+        store = SQLiteProfileStore(db_path, flush_interval=0)
+        profile = store.get_or_create("u1")
+        profile.preferred_styles.append("北欧")
+        profile.update_decoration_stage("设计")
+        profile.record_pain_point("预算", "担心超支", 0.8)
+        store.close()
+
+        reopened = SQLiteProfileStore(db_path, flush_interval=0)
+        assert reopened.stats()["loaded"] == 0
+        loaded = reopened.get("u1")
+        assert loaded.preferred_styles == ["北欧"]
+        assert loaded.decoration_journey.current_stage == "设计"
+        assert loaded.pain_points[0]["type"] == "预算"
+        assert reopened.get("missing") is None
+        reopened.close()
+
+    def test_flush_writes_only_dirty(self, temp_dir):
+        """测试刷盘只写入修改过的画像"""
+        store = SQLiteProfileStore(os.path.join(temp_dir, "profiles.db"), flush_interval=0)
+        for i in range(20):
+            store.get_or_create(f"user_{i}")
+        assert store.flush() == 20
+
+        assert store.flush() == 0
+
+        store.update("user_3", city="杭州")
+        store.get("user_7").update_interest("厨房", 0.2)
+        store.mark_dirty("user_7")
+        assert store.flush() == 2
+        assert store.count() == 20
+        store.close()
+
+    def test_cache_bounded_and_keeps_dirty(self, temp_dir):
+        """测试缓存按 LRU 淘汰已落盘画像，未落盘的画像不淘汰，淘汰后仍可懒加载"""
+        store = SQLiteProfileStore(os.path.join(temp_dir, "profiles.db"), flush_interval=0, cache_size=3)
+        for i in range(5):
+            store.get_or_create(f"user_{i}")
+        assert store.stats()["loaded"] == 5  # 都未落盘
+        assert store.flush() == 5
+
+        store.get("user_0")
+        store.update("user_1", city="杭州")
+        store.get_or_create("user_5")
+        assert set(store._profiles) == {"user_0", "user_1", "user_5"}
+        assert store.flush() == 2
+        assert store.get("user_2") is not None and store.stats()["evictions"] >= 3
+
+        # 画像对象在修改期间被淘汰，标记时传入对象不丢修改
+        profile = store.get("user_3")
+        for i in range(6, 10):
+            store.get_or_create(f"user_{i}")
+        store.flush()
+        assert "user_3" not in store._profiles
+        profile.update_interest("厨房", 0.2)
+        store.mark_dirty("user_3", profile)
+        assert store.flush() == 1
+        store.close()
+
+    def test_concurrent_workers_merge(self, temp_dir):
+        """测试两个进程（两个存储实例）修改同一画像：后写入的一方合并而不覆盖"""
+        db_path = os.path.join(temp_dir, "profiles.db")
+        first = SQLiteProfileStore(db_path, flush_interval=0)
+        first.get_or_create("u1").total_messages = 1
+        first.mark_dirty("u1")
+        first.flush()
+        second = SQLiteProfileStore(db_path, flush_interval=0)
+
+        a, b = first.get("u1"), second.get("u1")
+        a.total_messages += 1
+        a.update_interest("北欧", 0.3)
+        a.record_pain_point("预算", "担心超支")
+        first.mark_dirty("u1")
+        b.total_messages += 2
+        b.update_interest("厨房", 0.2)
+        b.city = "杭州"
+        second.mark_dirty("u1")
+        assert first.flush() == 1 and second.flush() == 1
+        assert second.stats()["merges"] == 1
+
+        merged = SQLiteProfileStore(db_path, flush_interval=0).get("u1")
+        assert merged.total_messages == 4
+        assert merged.interests == {"北欧": 0.3, "厨房": 0.2}
+        assert merged.city == "杭州" and merged.pain_points[0]["type"] == "预算"
+        assert b.total_messages == 4  # 合并结果写回缓存中的对象
+
+        # 两个进程同时创建同一画像
+        first.get_or_create("u2").preferred_styles.append("北欧")
+        second.get_or_create("u2").preferred_styles.append("日式")
+        first.flush()
+        second.flush()
+        assert SQLiteProfileStore(db_path, flush_interval=0).get("u2").preferred_styles == ["北欧", "日式"]
+        first.close()
+        second.close()
+
+    def test_revalidates_clean_profiles(self, temp_dir):
+        """测试未修改的缓存画像过期后重新读取其他进程的写入"""
+        db_path = os.path.join(temp_dir, "profiles.db")
+        writer = SQLiteProfileStore(db_path, flush_interval=0)
+        writer.get_or_create("u1")
+        writer.flush()
+        reader = SQLiteProfileStore(db_path, flush_interval=0, revalidate_interval=0)
+        cached = reader.get("u1")
+
+        writer.update("u1", city="成都")
+        writer.flush()
+        assert reader.get("u1") is cached and cached.city == "成都"
+        assert reader.stats()["reloads"] == 1
+        writer.close()
+        reader.close()
+
+    def test_migrates_legacy_json(self, temp_dir):
+        """测试从旧版 JSON 文件迁移"""
+        json_path = os.path.join(temp_dir, "user_profiles.json")
+        legacy = UserProfileStore(json_path)
+        legacy.update("legacy_user", city="上海", house_area=90.0)
+        legacy.flush()
+
+        store = SQLiteProfileStore(
+            os.path.join(temp_dir, "profiles.db"),
+            flush_interval=0,
+            legacy_json_path=json_path,
+        )
+        assert store.get("legacy_user").city == "上海"
+        assert not os.path.exists(json_path)
+        store.close()
+
+    def test_background_flush(self, temp_dir):
+        """测试后台定时刷盘"""
+        store = SQLiteProfileStore(os.path.join(temp_dir, "profiles.db"), flush_interval=0.05)
+        store.get_or_create("bg_user")
+        time.sleep(0.3)
+        assert store.stats()["pending"] == 0
+        assert store.stats()["rows_written"] >= 1
+        store.close()
+
+    def test_manager_uses_sqlite_profiles(self, temp_dir):
+        """测试 MemoryManager 默认使用增量画像存储"""
+        manager = MemoryManager(storage_dir=temp_dir, backend="sqlite")
+        assert isinstance(manager._profile_store, SQLiteProfileStore)
+        manager.record_interaction("u1", "chat", "你好")
+        manager.shutdown()
+
+        manager = MemoryManager(storage_dir=temp_dir, backend="sqlite")
+        context = manager.get_context_for_query("u1", "s1", "你好")
+        assert context["user_profile"] is not None
+        assert manager.get_or_create_profile("u1").total_messages == 1
+        manager.shutdown()
+
+
+class ConceptEmbedder:
+    """测试用嵌入器：按概念关键词生成向量"""
+
+    CONCEPTS = [
+        ["孩子", "儿童", "小孩"],
+        ["预算", "价格", "费用"],
+        ["北欧", "风格"],
+        ["防水", "卫生间"],
+    ]
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_query(self, text):
+        self.calls += 1
+        return [1.0 if any(w in text for w in words) else 0.0 for words in self.CONCEPTS] + [0.01]
+
+    def embed_documents(self, texts):
+        return [self.embed_query(t) for t in texts]
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="需要 numpy")
+class TestVectorMemoryRecall:
+    """测试长期记忆向量召回"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """创建临时目录"""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_semantic_recall_finds_related_memory(self, temp_dir):
+        """测试语义召回：两个孩子 -> 儿童房安全"""
+        manager = MemoryManager(
+            storage_dir=temp_dir, backend="sqlite",
+            semantic_recall=True, embedder=ConceptEmbedder(),
+        )
+        manager.add_to_long_term("u1", "用户家里有两个孩子")
+        time.sleep(0.002)
+        manager.add_to_long_term("u1", "预算二十万")
+
+        assert manager.search_long_term("u1", "儿童房安全", semantic=False) == []
+        results = manager.search_long_term("u1", "儿童房安全", limit=1)
+        assert [r.content for r in results] == ["用户家里有两个孩子"]
+        manager.shutdown()
+
+    def test_recall_fills_limit_without_recording_access(self, temp_dir):
+        """测试失效向量占用名额时继续召回补足，且补足的条目不计入访问"""
+        manager = MemoryManager(
+            storage_dir=temp_dir, backend="sqlite",
+            semantic_recall=True, embedder=ConceptEmbedder(),
+        )
+        kept = manager.add_to_long_term("u1", "用户家里有两个孩子")
+        time.sleep(0.002)
+        manager.add_to_long_term("u1", "预算二十万")
+        for i in range(3):
+            manager.vector_index.add("u1", f"ghost_{i}", "小孩")
+
+        results = manager.search_long_term("u1", "儿童房", limit=2)
+        assert [r.content for r in results] == ["用户家里有两个孩子", "预算二十万"]
+        assert manager.vector_index.count("u1") == 2
+        assert manager.long_term.peek(kept).access_count == 0
+        manager.shutdown()
+
+    def test_index_bounds_loaded_users(self, temp_dir):
+        """测试内存中的用户数有上限，淘汰前写盘，再次访问时重新加载"""
+        index = VectorMemoryIndex(storage_dir=temp_dir, embedder=ConceptEmbedder(), max_users=2)
+        for i in range(4):
+            index.add(f"u{i}", "a", "两个孩子")
+        stats = index.stats()
+        assert stats["loaded_users"] == 2 and stats["evictions"] == 2
+        assert index.search("u0", "小孩", k=1)[0][0] == "a"
+
+        memory_only = VectorMemoryIndex(embedder=ConceptEmbedder(), max_users=2)
+        for i in range(4):
+            memory_only.add(f"u{i}", "a", "两个孩子")
+        assert memory_only.stats()["loaded_users"] == 4
+
+    def test_index_persist_and_remove(self, temp_dir):
+        """测试向量落盘、懒加载与删除"""
+        embedder = ConceptEmbedder()
+        index = VectorMemoryIndex(storage_dir=temp_dir, embedder=embedder)
+        index.add_many("u1", [("a", "两个孩子"), ("b", "预算"), ("c", "北欧风格")])
+        assert index.flush() == 1
+
+        reopened = VectorMemoryIndex(storage_dir=temp_dir, embedder=embedder)
+        assert reopened.count("u1") == 3
+        assert reopened.search("u1", "小孩", k=1)[0][0] == "a"
+
+        assert reopened.remove("u1", "a")
+        assert reopened.count("u1") == 2
+        assert reopened.search("u1", "费用", k=1)[0][0] == "b"
+        assert not reopened.contains("u1", "a")
+
+    def test_backfill(self, temp_dir):
+        """测试批量补建向量"""
+        manager = MemoryManager(storage_dir=temp_dir, backend="sqlite")
+        for i, text in enumerate(["两个孩子", "预算有限", "卫生间防水"]):
+            manager.add_to_long_term(f"user_{i % 2}", text)
+            time.sleep(0.002)
+        manager.shutdown()
+
+        embedder = ConceptEmbedder()
+        manager = MemoryManager(
+            storage_dir=temp_dir, backend="sqlite",
+            semantic_recall=True, embedder=embedder,
+        )
+        assert manager.backfill_vectors(batch_size=2) == 3
+        assert manager.backfill_vectors() == 0
+        assert manager.vector_index.count("user_0") == 2
+        manager.shutdown()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
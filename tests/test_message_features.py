@@ -0,0 +1,90 @@
+"""
+消息关键词特征单元测试
+测试 backend/core/message_features.py
+"""
+import pytest
+import os
+import sys
+import random
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.core.message_features import KeywordEngine, get_keyword_engine, analyze_message
+
+
+@pytest.fixture
+def engine():
+    engine = KeywordEngine(cache_size=4)
+    engine.register("style", ["现代", "北欧", "中式", "新中式"])
+    engine.register_groups("tool", {"subsidy": ["补贴", "能补多少"], "roi": ["ROI", "回报率"]})
+    return engine
+
+
+class TestKeywordEngine:
+    """测试关键词特征引擎"""
+
+    def test_matched_in_vocabulary_order(self, engine):
+        """测试按词表顺序返回命中（含互相包含的关键词），与逐个 `in` 一致"""
+        features = engine.analyze("新中式和北欧哪个好")
+        assert features.matched("style") == ["北欧", "中式", "新中式"]
+        assert features.first("style") == "北欧"
+        assert features.has("style") and not features.has("tool.roi")
+        assert features.matched("tool.roi") == [] and features.first("tool.roi") is None
+
+    def test_shared_keyword_and_groups(self, engine):
+        """测试同一关键词属于多个词表，分组注册返回命名空间"""
+        assert engine.register_groups("budget", {"subsidy": ["补贴金额", "补贴"]}) == {"subsidy": "budget.subsidy"}
+        features = engine.analyze("补贴金额是多少")
+        assert features.matched("tool.subsidy") == ["补贴"]
+        assert features.matched("budget.subsidy") == ["补贴金额", "补贴"]
+        assert sorted(features.namespaces) == ["budget.subsidy", "tool.subsidy"]
+
+    def test_case_sensitive(self, engine):
+        """测试与 `in` 一样区分大小写"""
+        assert engine.analyze("ROI多少").has("tool.roi")
+        assert not engine.analyze("roi多少").has("tool.roi")
+
+    def test_cache_and_reregister(self, engine):
+        """测试同一消息只扫描一次；重新注册后缓存失效"""
+        engine.analyze("北欧风格")
+        engine.analyze("现代风格")
+        assert engine.analyze("北欧风格").matched("style") == ["北欧"]
+        assert engine.get_stats()["scans"] == 2
+
+        engine.register("style", ["北欧风格"])
+        assert engine.analyze("北欧风格").matched("style") == ["北欧风格"]
+        assert engine.get_stats()["scans"] == 3
+
+    def test_matches_brute_force(self):
+        """测试随机词表与文本上结果与逐个 `in` 一致"""
+        rng = random.Random(42)
+        engine = KeywordEngine()
+        vocabularies = {}
+        for i in range(6):
+            vocabularies[f"ns{i}"] = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(8)]
+            engine.register(f"ns{i}", vocabularies[f"ns{i}"])
+        for _ in range(50):
+            features = engine.analyze("".join(rng.choice("abcd") for _ in range(30)))
+            for namespace, keywords in vocabularies.items():
+                assert features.matched(namespace) == [kw for kw in keywords if kw in features.text]
+
+
+def test_detectors_share_one_scan():
+    """测试一条消息经过各检测器只扫描一次"""
+    from backend.core.reasoning import TaskAnalyzer
+    from backend.core.stage_reasoning import StageUnderstanding
+    from backend.core.function_calling import get_function_calling_engine
+
+    message = "刚买房还没开始装修，100平预算15万要多久"
+    analyze_message("预热")
+    scans = get_keyword_engine().get_stats()["scans"]
+
+    complexity = TaskAnalyzer.analyze_complexity(message)
+    TaskAnalyzer.select_reasoning_type(message, complexity)
+    stage, _ = StageUnderstanding()._keyword_stage_detection(message, "c_end")
+    get_function_calling_engine()._detect_tool_intent(message)
+
+    assert stage == "准备"
+    assert TaskAnalyzer.detect_required_tools(message) == ["decoration_timeline"]
+    assert get_keyword_engine().get_stats()["scans"] == scans + 1
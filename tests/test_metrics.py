@@ -0,0 +1,124 @@
+"""
+请求指标单元测试
+测试 backend/core/metrics.py 的核心功能
+"""
+import pytest
+import os
+import sys
+import random
+import threading
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.core import metrics as metrics_module
+from backend.core.metrics import (
+    BUCKET_BOUNDS,
+    PROMETHEUS_BOUNDS,
+    RequestMetrics,
+    merge_snapshots,
+    quantile_from_buckets,
+    bucket_index,
+    render_prometheus,
+)
+
+
+class TestHistogram:
+    """测试分桶与分位数估算"""
+
+    def test_prometheus_bounds_are_subset(self):
+        """测试 Prometheus 边界均为细粒度桶边界"""
+        assert set(PROMETHEUS_BOUNDS) <= set(BUCKET_BOUNDS)
+
+    def test_quantile_accuracy(self):
+        """测试分位数估算误差在一个桶宽以内"""
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(-3, 1) for _ in range(20000))
+        counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        for v in values:
+            counts[bucket_index(v)] += 1
+
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * len(values))]
+            assert quantile_from_buckets(counts, q) == pytest.approx(exact, rel=0.26)
+
+    def test_empty(self):
+        """测试空直方图"""
+        assert quantile_from_buckets([0] * (len(BUCKET_BOUNDS) + 1), 0.99) == 0.0
+
+
+class TestRequestMetrics:
+    """测试 RequestMetrics 类"""
+
+    def test_stats_by_endpoint_and_status(self):
+        """测试端点统计与状态码类别"""
+        m = RequestMetrics()
+        for _ in range(99):
+            m.record_request("/api/v1/chat/stream", "POST", 0.2, 200)
+        m.record_request("/api/v1/chat/stream", "POST", 3.0, 503)
+        m.record_request("/health", "GET", 0.001, 200)
+
+        stats = m.get_stats()
+        assert stats["total_requests"] == 101
+        assert stats["total_errors"] == 1
+        assert stats["windows"]["1m"]["count"] == 101
+
+        endpoint = stats["endpoint_stats"]["POST:/api/v1/chat/stream"]
+        assert endpoint["count"] == 100
+        assert endpoint["errors"] == 1
+        assert endpoint["status_classes"] == {"2xx": 99, "5xx": 1}
+        assert endpoint["p50_ms"] == pytest.approx(200, rel=0.26)
+        assert endpoint["p99_ms"] == pytest.approx(200, rel=0.26)
+        assert endpoint["max_time_ms"] == pytest.approx(3000)
+
+    def test_sliding_window_expires(self, monkeypatch):
+        """测试滑动窗口只统计最近的时间槽"""
+        clock = [1_000_000.0]
+        monkeypatch.setattr(metrics_module.time, "time", lambda: clock[0])
+
+        m = RequestMetrics()
+        m.record_request("/health", "GET", 2.0, 200)
+        clock[0] += 120  # 2 分钟后：超出 1m 窗口，仍在 5m 窗口内
+        m.record_request("/health", "GET", 0.01, 200)
+
+        stats = m.get_stats()
+        assert stats["windows"]["1m"]["count"] == 1
+        assert stats["windows"]["5m"]["count"] == 2
+
+        clock[0] += 600
+        stats = m.get_stats()
+        assert stats["windows"]["5m"]["count"] == 0
+        assert stats["total_requests"] == 2  # 累计值不随窗口过期
+
+    def test_concurrent_recording(self):
+        """测试多线程并发记录不丢失"""
+        m = RequestMetrics()
+
+        def worker():
+            for _ in range(2000):
+                m.record_request("/health", "GET", 0.003, 200)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert m.get_stats()["total_requests"] == 16000
+
+    def test_merge_and_prometheus(self):
+        """测试快照合并与 Prometheus 输出"""
+        a, b = RequestMetrics(), RequestMetrics()
+        a.record_request("/health", "GET", 0.004, 200)
+        b.record_request("/health", "GET", 0.2, 200)
+        b.record_request('/x"y', "GET", 0.2, 404)
+
+        merged = merge_snapshots([a.snapshot(), b.snapshot()])
+        text = render_prometheus(merged)
+
+        labels = 'method="GET",path="/health",status="2xx"'
+        assert f'decopilot_http_request_duration_seconds_bucket{{{labels},le="0.005"}} 1' in text
+        assert f'decopilot_http_request_duration_seconds_bucket{{{labels},le="0.25"}} 2' in text
+        assert f'decopilot_http_request_duration_seconds_count{{{labels}}} 2' in text
+        assert 'path="/x\\"y"' in text
+        assert "# TYPE decopilot_http_request_duration_seconds histogram" in text
+        assert 'window="1m",quantile="0.95"' in text
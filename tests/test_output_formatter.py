@@ -0,0 +1,159 @@
+"""
+输出格式化器单元测试
+测试 backend/core/output_formatter.py 的 NDJSON 帧渲染与合并
+"""
+import pytest
+import os
+import sys
+import json
+import asyncio
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.core.output_formatter import (
+    OutputFormatter,
+    OutputType,
+    Source,
+    dumps,
+    render_answer,
+    coalesce_frames,
+)
+
+
+async def frames_from(items, delay: float = 0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def parse_chunks(chunks):
+    return [json.loads(line) for chunk in chunks for line in chunk.splitlines() if line]
+
+
+class TestFrameRendering:
+    """测试帧渲染"""
+
+    def test_answer_frame(self):
+        """测试 answer 帧与原格式语义一致"""
+        content = '客厅"吊顶"\n用石膏板\\轻钢龙骨 ✓'
+        frame = OutputFormatter("s1").answer(content)
+        assert frame.endswith("\n")
+        assert json.loads(frame) == {"type": "answer", "content": content}
+
+    def test_format_frame(self):
+        """测试结构化帧只包含 type、data"""
+        formatter = OutputFormatter("s1")
+        frame = formatter.sources([Source("指南", "内容", "c_end", 0.9)])
+        data = json.loads(frame)
+        assert list(data) == ["type", "data"]
+        assert data["type"] == OutputType.SOURCES.value
+        assert data["data"][0]["title"] == "指南"
+
+    def test_thinking_frame(self):
+        """测试思考过程帧"""
+        frame = OutputFormatter("s1").thinking(["步骤一"], "chain_of_thought")
+        assert json.loads(frame) == {
+            "type": "thinking", "content": ["步骤一"], "reasoning_type": "chain_of_thought",
+        }
+
+    def test_dumps_fallback_values(self):
+        """测试非字符串键与超大整数"""
+        assert json.loads(dumps({1: "a"})) == {"1": "a"}
+        assert json.loads(dumps({"n": 2 ** 70})) == {"n": 2 ** 70}
+        assert "中文" in dumps("中文")
+
+
+class TestCoalesceFrames:
+    """测试 answer 帧合并"""
+
+    @pytest.mark.asyncio
+    async def test_burst_merged_into_one_frame(self):
+        """测试首个 answer 立即发送，之后同一窗口内到达的 answer 合并为一帧"""
+        tokens = ["装", "修", '"预算"', "\n", "很重要"]
+        chunks = await collect(coalesce_frames(
+            frames_from([render_answer(t) for t in tokens], delay=0.001), window_ms=200,
+        ))
+        assert [e["content"] for e in parse_chunks(chunks)] == ["装", "".join(tokens[1:])]
+        assert len(chunks) == 2
+
+    @pytest.mark.asyncio
+    async def test_other_frames_keep_order(self):
+        """测试非 answer 帧触发发送且顺序不变"""
+        formatter = OutputFormatter("s1")
+        frames = [
+            formatter.stream_start(),
+            formatter.answer("a"),
+            formatter.answer("b"),
+            formatter.thinking(["t"]),
+            formatter.answer("c"),
+            formatter.answer("d"),
+            formatter.stream_end(),
+        ]
+        chunks = await collect(coalesce_frames(frames_from(frames), window_ms=50))
+        events = parse_chunks(chunks)
+        assert [e["type"] for e in events] == [
+            "stream_start", "answer", "answer", "thinking", "answer", "stream_end",
+        ]
+        # 首个 answer 单独发送，之后的连续 answer 合并
+        assert [e["content"] for e in events if e["type"] == "answer"] == ["a", "b", "cd"]
+
+    @pytest.mark.asyncio
+    async def test_window_expiry_flushes(self):
+        """测试上游停顿超过窗口时不等待下一片段"""
+        async def slow_source():
+            yield render_answer("首字")
+            yield render_answer("先到")
+            await asyncio.sleep(0.3)
+            yield render_answer("后到")
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        received = []
+        async for chunk in coalesce_frames(slow_source(), window_ms=20):
+            received.append((loop.time() - start, chunk))
+
+        events = parse_chunks(chunk for _, chunk in received)
+        assert [e["content"] for e in events] == ["首字", "先到", "后到"]
+        # “先到”在窗口到期时发出，不等待 0.3 秒后的下一片段
+        first_two = [t for t, chunk in received if "先到" in chunk]
+        assert first_two[0] < 0.2
+
+    @pytest.mark.asyncio
+    async def test_size_limit_flushes(self):
+        """测试内容达到大小上限时立即发送"""
+        frames = [render_answer("x" * 10) for _ in range(10)]
+        chunks = await collect(coalesce_frames(frames_from(frames), window_ms=1000, max_bytes=30))
+        assert [len(e["content"]) for e in parse_chunks(chunks)] == [10, 30, 30, 30]
+
+    @pytest.mark.asyncio
+    async def test_zero_window_passthrough(self):
+        """测试窗口为 0 时原样透传"""
+        frames = [render_answer("a"), render_answer("b")]
+        assert await collect(coalesce_frames(frames_from(frames), window_ms=0)) == frames
+
+    @pytest.mark.asyncio
+    async def test_non_string_answer_not_merged(self):
+        """测试非字符串内容的 answer 帧原样透传"""
+        frames = [render_answer("a"), render_answer("b"), render_answer(["list"]), render_answer("c")]
+        chunks = await collect(coalesce_frames(frames_from(frames), window_ms=50))
+        assert [e["content"] for e in parse_chunks(chunks)] == ["a", "b", ["list"], "c"]
+
+    @pytest.mark.asyncio
+    async def test_source_error_propagates(self):
+        """测试上游异常在已缓冲内容发送后抛出"""
+        async def failing_source():
+            yield render_answer("a")
+            yield render_answer("b")
+            raise RuntimeError("boom")
+
+        received = []
+        with pytest.raises(RuntimeError):
+            async for chunk in coalesce_frames(failing_source(), window_ms=50):
+                received.append(chunk)
+        assert [e["content"] for e in parse_chunks(received)] == ["a", "b"]
@@ -0,0 +1,96 @@
+"""
+消息参数提取单元测试
+测试 backend/core/parameter_extraction.py
+"""
+import os
+import sys
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.core.parameter_extraction import (
+    Amount, MessageParameters, extract_parameters, get_parameters, CONTEXT_KEY,
+)
+
+
+class TestMessageParameters:
+    """测试单条消息的参数"""
+
+    def test_amounts_with_unit_and_context(self):
+        """测试金额列表按出现顺序，附带单位与最近的上下文关键词"""
+        params = MessageParameters("上月投入5万，收入80000，其中补贴3000元")
+        assert params.amounts == [
+            Amount(value=50000.0, text="5万", unit="万", start=4, end=6, context="投入"),
+            Amount(value=80000.0, text="80000", unit="", start=9, end=14, context="收入"),
+            Amount(value=3000.0, text="3000元", unit="元", start=19, end=24, context="补贴"),
+        ]
+
+    def test_overlapping_patterns(self):
+        """测试重叠时取优先级高的模式，纯数字不重复计入"""
+        params = MessageParameters("预算12万元，沙发8000块")
+        assert [(a.value, a.unit) for a in params.amounts] == [(120000.0, "万"), (8000.0, "块")]
+        assert params.amount_values == [8000.0, 120000.0]
+
+    def test_wan_shorthand(self):
+        """测试 w/W 作为"万"的简写"""
+        assert MessageParameters("预算15w").amount() == 150000.0
+        params = MessageParameters("补贴能补多少？家电15W")
+        assert params.amount() == 150000.0
+        assert [(a.text, a.unit) for a in params.amounts] == [("15W", "万")]
+
+    def test_context_keyword_window(self):
+        """测试上下文关键词：优先取关键词之后的金额，窗口内没有时回退到全文"""
+        params = MessageParameters("收入8万，投入5万")
+        assert params.amount() == 80000.0
+        assert params.amount("投入") == 50000.0
+        assert params.amount("成本") == 80000.0
+        assert MessageParameters("我的投入不多").amount("投入") is None
+
+    def test_area_category_style_period(self):
+        """测试面积、品类、商品、风格与统计周期"""
+        params = MessageParameters("100M2的房子想要LOFT风，买个电视柜，统计3个月")
+        assert params.area == 100.0
+        assert params.item == "电视柜" and params.category == "家具"
+        assert params.style == "工业风"
+        assert params.period_days == 90
+
+        params = MessageParameters("家电怎么选")
+        assert params.item is None and params.category == "家电"
+        assert params.style == "现代简约" and params.period_days == 30 and params.area is None
+
+
+class TestParameterCache:
+    """测试每条消息只提取一次"""
+
+    def test_same_text_same_object(self):
+        """测试同一文本返回同一个对象，字段只计算一次"""
+        params = extract_parameters("沙发5000元贵不贵")
+        assert extract_parameters("沙发5000元贵不贵") is params
+        assert params.amounts is params.amounts
+
+    def test_get_parameters_uses_context(self):
+        """测试从请求上下文读取参数；上下文中是别的消息时重新提取"""
+        context = {}
+        params = get_parameters("100平预算15万", context)
+        assert context[CONTEXT_KEY] is params
+
+        context[CONTEXT_KEY] = marker = MessageParameters("100平预算15万")
+        assert get_parameters("100平预算15万", context) is marker
+        assert get_parameters("80平", context).area == 80.0
+        assert context[CONTEXT_KEY].text == "80平"
+
+    def test_tool_intent_reads_context_params(self):
+        """测试工具意图检测使用上下文中的参数"""
+        from backend.core.function_calling import FunctionCallingEngine
+
+        engine = FunctionCallingEngine.__new__(FunctionCallingEngine)
+        engine.max_tool_calls = 5
+        engine.registry = None
+        message = "装修多久能完成"
+        params = MessageParameters(message)
+        params.area = 120.0  # 模拟上下文中已有的参数
+
+        detected = engine._detect_tool_intent(message, params)
+        assert detected == [{"name": "decoration_timeline",
+                             "arguments": {"house_area": 120.0, "style": "现代简约"}}]
+        assert engine._detect_tool_intent(message) == []
@@ -0,0 +1,186 @@
+"""
+请求处理管线中间件单元测试
+测试 backend/api/middleware/request_pipeline.py 的核心功能
+"""
+import pytest
+import os
+import sys
+import json
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import APIRouter, FastAPI, File, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from backend.core.metrics import RequestMetrics
+from backend.core.security import InputSanitizer
+from backend.api.middleware.request_pipeline import (
+    RequestValidationMiddleware,
+    PerformanceMonitoringMiddleware,
+    PreparsedJSONRoute,
+    get_json_body,
+)
+
+
+class EchoRequest(BaseModel):
+    message: str
+
+
+def build_app(metrics: RequestMetrics) -> FastAPI:
+    app = FastAPI()
+    router = APIRouter(route_class=PreparsedJSONRoute)
+
+    @router.post("/echo/{name}")
+    async def echo(name: str, body: EchoRequest, request: Request):
+        return {"name": name, "message": body.message,
+                "request_id": request.state.request_id}
+
+    @router.post("/raw")
+    async def raw(request: Request):
+        return {"data": await get_json_body(request)}
+
+    @router.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    @router.get("/stream")
+    async def stream():
+        async def generate():
+            for i in range(5):
+                yield json.dumps({"i": i}) + "\n"
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    app.include_router(router, prefix="/api")
+    app.add_middleware(RequestValidationMiddleware, sanitizer=InputSanitizer())
+    app.add_middleware(PerformanceMonitoringMiddleware, metrics=metrics)
+    return app
+
+
+@pytest.fixture
+def metrics():
+    return RequestMetrics()
+
+
+@pytest.fixture
+def client(metrics):
+    return TestClient(build_app(metrics))
+
+
+@pytest.fixture
+def count_json_loads(monkeypatch):
+    """统计 json.loads 调用次数"""
+    calls = []
+    original = json.loads
+
+    def counting_loads(*args, **kwargs):
+        calls.append(args[0] if args else kwargs.get("s"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(json, "loads", counting_loads)
+    return calls
+
+
+class TestRequestValidationMiddleware:
+    """测试请求验证中间件"""
+
+    def test_json_body_parsed_once(self, client, count_json_loads):
+        """测试 JSON 请求体只解析一次并供路由复用"""
+        response = client.post("/api/echo/alice", json={"message": "客厅怎么装修"})
+        # 读取响应体之前：只有中间件解析过一次请求体
+        assert len(count_json_loads) == 1
+        assert response.status_code == 200
+        assert response.json()["message"] == "客厅怎么装修"
+        assert response.json()["name"] == "alice"
+
+    def test_get_json_body_from_state(self, client, count_json_loads):
+        """测试 get_json_body 直接取中间件解析结果"""
+        response = client.post("/api/raw", json={"order_amount": 12800})
+        assert len(count_json_loads) == 1
+        assert response.json() == {"data": {"order_amount": 12800}}
+
+    def test_blocked_message_returns_400(self, client, metrics):
+        """测试命中安全规则的输入被拒绝"""
+        response = client.post("/api/echo/bob", json={"message": "x" * 5000})
+        assert response.status_code == 400
+        assert "detail" in response.json()
+        assert metrics.get_stats()["endpoint_stats"]
+
+    def test_invalid_json_passes_to_route(self, client):
+        """测试非法 JSON 交由路由返回 422"""
+        response = client.post(
+            "/api/echo/bob", content=b"{not json",
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 422
+
+    def test_multipart_untouched(self, client, count_json_loads):
+        """测试 multipart 上传不被读取或解析"""
+        payload = b"\x00" * 4096
+        response = client.post("/api/upload", files={"file": ("a.bin", payload)})
+        assert response.status_code == 200
+        assert response.json() == {"size": 4096}
+        assert not [c for c in count_json_loads if isinstance(c, bytes) and b"\x00" in c]
+
+
+class TestPerformanceMonitoringMiddleware:
+    """测试性能监控中间件"""
+
+    def test_headers_and_request_id_in_state(self, client):
+        """测试响应头与 request.state.request_id 一致"""
+        response = client.post("/api/echo/carol", json={"message": "你好"})
+        assert response.headers["x-request-id"] == response.json()["request_id"]
+        assert response.headers["x-response-time"].endswith("ms")
+
+    def test_streaming_chunks_passed_through(self, client, metrics):
+        """测试流式响应逐块透传，结束后记录一次指标"""
+        with client.stream("GET", "/api/stream") as response:
+            lines = [json.loads(line) for line in response.iter_lines() if line]
+        assert [line["i"] for line in lines] == list(range(5))
+
+        stats = metrics.get_stats()
+        assert stats["total_requests"] == 1
+        assert stats["active_requests"] == 0
+        assert "GET:/api/stream" in stats["endpoint_stats"]
+
+    def test_route_template_label(self, client, metrics):
+        """测试指标按带前缀的路由模板聚合"""
+        client.post("/api/echo/a", json={"message": "1"})
+        client.post("/api/echo/b", json={"message": "2"})
+        client.get("/api/missing-1")
+        client.get("/api/missing-2")
+
+        endpoints = metrics.get_stats()["endpoint_stats"]
+        assert endpoints["POST:/api/echo/{name}"]["count"] == 2
+        assert endpoints["GET:<unmatched>"]["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_streamed_chunks_not_buffered(self, metrics):
+        """测试 send 调用与下游逐一对应，不合并、不额外缓冲"""
+        chunks = [b"a", b"b", b"c"]
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            for i, chunk in enumerate(chunks):
+                await send({"type": "http.response.body", "body": chunk,
+                            "more_body": i < len(chunks) - 1})
+
+        middleware = PerformanceMonitoringMiddleware(
+            RequestValidationMiddleware(app), metrics=metrics
+        )
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/x", "headers": []}
+        await middleware(scope, receive, send)
+
+        assert [m.get("body") for m in sent[1:]] == chunks
+        assert (b"x-request-id", scope["state"]["request_id"].encode()) in sent[0]["headers"]
+        assert metrics.get_stats()["total_requests"] == 1
@@ -0,0 +1,135 @@
+"""
+服务启动单元测试
+测试 server.py 的导入耗时预算、延迟加载与 backend/core/warmup.py 的预热/就绪逻辑
+"""
+import pytest
+import os
+import sys
+import json
+import asyncio
+import subprocess
+
+# 添加项目路径
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backend.core.warmup import Warmup
+
+
+# import server 的耗时预算（秒）。延迟加载前约 3s，之后约 0.8s（1 vCPU）
+IMPORT_BUDGET_SECONDS = float(os.getenv("IMPORT_BUDGET_SECONDS", "2.0"))
+
+# 不应在导入 server 时加载的重量级模块
+HEAVY_MODULES = [
+    "rag",
+    "chromadb",
+    "langchain_chroma",
+    "dashscope",
+    "backend.core.multimodal",
+    "backend.agents.enhanced_agent",
+    "backend.knowledge.knowledge_graph",
+    "backend.knowledge.multi_collection_kb",
+    "backend.framework.runtime",
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import server
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_server_in_subprocess() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=ROOT,
+        capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestImportTime:
+    """测试 server 模块冷启动"""
+
+    def test_import_budget_and_lazy_modules(self):
+        """测试导入耗时在预算内，且未提前加载重量级模块"""
+        # 取两次中较快的一次，减少机器抖动的影响
+        probes = [import_server_in_subprocess() for _ in range(2)]
+        elapsed = min(p["elapsed"] for p in probes)
+        assert elapsed < IMPORT_BUDGET_SECONDS, f"import server 耗时 {elapsed:.2f}s"
+
+        loaded = set(probes[0]["modules"])
+        assert not [m for m in HEAVY_MODULES if m in loaded]
+
+
+class TestWarmup:
+    """测试预热执行器"""
+
+    def test_run_sync_records_timings_and_errors(self):
+        """测试同步预热记录耗时，失败步骤不影响后续步骤"""
+        calls = []
+        runner = Warmup()
+        runner.add_step("first", lambda: calls.append("first"))
+        runner.add_step("broken", lambda: 1 / 0)
+        runner.add_step("last", lambda: calls.append("last"))
+
+        assert runner.status == Warmup.PENDING
+        timings = runner.run_sync()
+
+        assert calls == ["first", "last"]
+        assert timings["broken"] is None
+        assert timings["first"] is not None
+        assert "division" in runner.get_status()["errors"]["broken"]
+        assert runner.ready
+
+    @pytest.mark.asyncio
+    async def test_async_run_keeps_loop_responsive(self):
+        """测试异步预热期间事件循环仍可处理其他协程"""
+        import threading
+        release = threading.Event()
+        runner = Warmup()
+        runner.add_step("slow", lambda: release.wait(5))
+
+        task = asyncio.create_task(runner.run())
+        await asyncio.sleep(0.05)
+        assert runner.status == Warmup.RUNNING
+        assert not runner.ready
+
+        release.set()
+        await task
+        assert runner.ready
+
+    def test_skip(self):
+        """测试跳过预热直接就绪"""
+        runner = Warmup()
+        runner.add_step("never", lambda: 1 / 0)
+        runner.skip()
+        assert runner.ready
+        assert runner.get_status()["timings_ms"] == {}
+
+
+class TestReadinessEndpoint:
+    """测试 /ready 接口"""
+
+    def test_ready_reflects_warmup(self, monkeypatch):
+        """测试预热完成前返回 503，完成后返回 200"""
+        from fastapi.testclient import TestClient
+        import server
+
+        runner = Warmup()
+        runner.add_step("noop", lambda: None)
+        monkeypatch.setattr(server, "warmup_runner", runner)
+        client = TestClient(server.app)
+
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == Warmup.PENDING
+        assert client.get("/health").status_code == 200
+
+        runner.run_sync()
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["timings_ms"]["noop"] is not None
+        assert response.json()["import_ms"] > 0
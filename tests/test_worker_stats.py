@@ -0,0 +1,93 @@
+"""
+多进程统计汇总单元测试
+测试 backend/core/worker_stats.py 的核心功能
+"""
+import pytest
+import os
+import sys
+import json
+import time
+import tempfile
+import shutil
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.core.metrics import RequestMetrics
+from backend.core.worker_stats import (
+    WorkerStatsPublisher,
+    collect_worker_snapshots,
+    aggregate_request_metrics,
+    aggregate_cache_stats,
+)
+
+
+@pytest.fixture
+def temp_dir():
+    """创建临时目录"""
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class TestWorkerStats:
+    """测试 worker 统计快照与合并"""
+
+    def test_publish_and_collect(self, temp_dir):
+        """测试发布快照、读取与停止时清理"""
+        publisher = WorkerStatsPublisher(temp_dir, lambda: {"value": 1}, interval=60)
+        publisher.start()
+        assert os.path.exists(publisher.path)
+
+        snapshots = collect_worker_snapshots(temp_dir)
+        assert [s["stats"] for s in snapshots] == [{"value": 1}]
+
+        # 当前进程使用实时数据替换快照
+        snapshots = collect_worker_snapshots(temp_dir, current={"value": 2})
+        assert [s["stats"] for s in snapshots] == [{"value": 2}]
+
+        publisher.stop()
+        assert not os.path.exists(publisher.path)
+
+    def test_skips_dead_and_stale_workers(self, temp_dir):
+        """测试忽略已退出和过期的 worker 快照"""
+        dead = os.path.join(temp_dir, "worker-999999999.json")
+        with open(dead, "w") as f:
+            json.dump({"pid": 999999999, "timestamp": time.time(), "stats": {}}, f)
+        stale = os.path.join(temp_dir, f"worker-{os.getppid()}.json")
+        with open(stale, "w") as f:
+            json.dump({"pid": os.getppid(), "timestamp": time.time() - 3600, "stats": {}}, f)
+
+        assert collect_worker_snapshots(temp_dir, max_age=30) == []
+        assert not os.path.exists(dead)
+
+    def test_aggregate_request_metrics(self):
+        """测试按直方图合并多个 worker 的请求指标"""
+        fast, slow = RequestMetrics(), RequestMetrics()
+        for _ in range(90):
+            fast.record_request("/health", "GET", 0.002, 200)
+        for _ in range(10):
+            slow.record_request("/health", "GET", 0.9, 200)
+        slow.record_request("/health", "GET", 0.5, 500)
+
+        merged = aggregate_request_metrics([fast.snapshot(), slow.snapshot()])
+        assert merged["total_requests"] == 101
+        assert merged["total_errors"] == 1
+        # p95 落在慢 worker 的请求上：只有合并直方图才能得到
+        assert 0.5 * 1000 < merged["p95_response_time_ms"] <= 1000
+
+        endpoint = merged["endpoint_stats"]["GET:/health"]
+        assert endpoint["count"] == 101
+        assert endpoint["status_classes"] == {"2xx": 100, "5xx": 1}
+        assert endpoint["min_time_ms"] == pytest.approx(2.0)
+        assert endpoint["max_time_ms"] == pytest.approx(900.0)
+
+    def test_aggregate_cache_stats(self):
+        """测试缓存统计合并与命中率重算"""
+        merged = aggregate_cache_stats([
+            {"llm": {"size": 10, "max_size": 200, "hits": 30, "misses": 10, "hit_rate": 0.75}},
+            {"llm": {"size": 5, "max_size": 200, "hits": 10, "misses": 30, "hit_rate": 0.25}},
+        ])
+        assert merged["llm"]["size"] == 15
+        assert merged["llm"]["hits"] == 40
+        assert merged["llm"]["hit_rate"] == pytest.approx(0.5)